@@ -0,0 +1,28 @@
+"""Add input_fingerprint to predictions for prefill change detection.
+
+Revision ID: a7c2e9d13f58
+Revises: f1b6d8e24a93
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c2e9d13f58"
+down_revision: str | Sequence[str] | None = "f1b6d8e24a93"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the input fingerprint column."""
+    op.add_column("predictions", sa.Column("input_fingerprint", sa.String(64), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop the input fingerprint column."""
+    op.drop_column("predictions", "input_fingerprint")
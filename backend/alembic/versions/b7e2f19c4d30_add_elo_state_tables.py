@@ -0,0 +1,45 @@
+"""Add elo_ratings and elo_state tables for incremental ELO updates.
+
+Revision ID: b7e2f19c4d30
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e2f19c4d30"
+down_revision: str | Sequence[str] | None = "a1b2c3d4e5f6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create per-team raw ratings and the processed-match watermark."""
+    op.create_table(
+        "elo_ratings",
+        sa.Column("team_id", sa.Integer(), nullable=False),
+        sa.Column("rating", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(["team_id"], ["teams.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("team_id"),
+    )
+    op.create_table(
+        "elo_state",
+        sa.Column("key", sa.String(length=50), nullable=False),
+        sa.Column("last_match_date", sa.DateTime(), nullable=True),
+        sa.Column("last_match_id", sa.Integer(), nullable=True),
+        sa.Column("matches_processed", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+    )
+
+
+def downgrade() -> None:
+    """Drop incremental ELO tables."""
+    op.drop_table("elo_state")
+    op.drop_table("elo_ratings")
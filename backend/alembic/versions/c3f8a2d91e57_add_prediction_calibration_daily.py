@@ -0,0 +1,80 @@
+"""Add prediction_calibration_daily summary table for the calibration endpoint.
+
+Revision ID: c3f8a2d91e57
+Revises: b7e2f19c4d30
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3f8a2d91e57"
+down_revision: str | Sequence[str] | None = "b7e2f19c4d30"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the daily calibration summary and backfill it from verified predictions."""
+    op.create_table(
+        "prediction_calibration_daily",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("competition_code", sa.String(length=10), nullable=False),
+        sa.Column("bet_type", sa.String(length=10), nullable=False),
+        sa.Column("bucket", sa.SmallInteger(), nullable=False),
+        sa.Column("predictions", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("correct", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("confidence_sum", sa.Float(), server_default="0", nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("day", "competition_code", "bet_type", "bucket"),
+    )
+
+    # Backfill with the same grouping CalibrationSummaryService.refresh uses
+    op.execute(
+        """
+        INSERT INTO prediction_calibration_daily
+            (day, competition_code, bet_type, bucket, predictions, correct, confidence_sum)
+        SELECT day, competition_code, bet_type,
+               CASE
+                   WHEN confidence >= 0.5 AND confidence < 0.55 THEN 0
+                   WHEN confidence >= 0.55 AND confidence < 0.6 THEN 1
+                   WHEN confidence >= 0.6 AND confidence < 0.65 THEN 2
+                   WHEN confidence >= 0.65 AND confidence < 0.7 THEN 3
+                   WHEN confidence >= 0.7 AND confidence < 0.75 THEN 4
+                   WHEN confidence >= 0.75 AND confidence < 0.8 THEN 5
+                   WHEN confidence >= 0.8 AND confidence < 0.85 THEN 6
+                   WHEN confidence >= 0.85 AND confidence < 1.0 THEN 7
+                   ELSE -1
+               END AS bucket,
+               COUNT(*),
+               SUM(CASE WHEN was_correct THEN 1 ELSE 0 END),
+               SUM(confidence)
+        FROM (
+            SELECT CAST(pr.created_at AS DATE) AS day,
+                   COALESCE(m.competition_code, '') AS competition_code,
+                   CASE p.predicted_outcome
+                       WHEN 'home' THEN 'home_win'
+                       WHEN 'away' THEN 'away_win'
+                       ELSE p.predicted_outcome
+                   END AS bet_type,
+                   COALESCE(NULLIF(p.confidence, 0), 0.5) AS confidence,
+                   pr.was_correct
+            FROM prediction_results pr
+            JOIN predictions p ON p.id = pr.prediction_id
+            JOIN matches m ON m.id = p.match_id
+            WHERE m.status = 'FINISHED'
+                AND m.home_score IS NOT NULL
+                AND m.away_score IS NOT NULL
+        ) AS verified
+        GROUP BY day, competition_code, bet_type, bucket
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the calibration summary table."""
+    op.drop_table("prediction_calibration_daily")
@@ -0,0 +1,55 @@
+"""Add adaptive_weight_records for the adaptive ensemble weight window.
+
+Revision ID: d41e7b9a2c68
+Revises: c3f8a2d91e57
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d41e7b9a2c68"
+down_revision: str | Sequence[str] | None = "c3f8a2d91e57"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the per-model prediction outcome table."""
+    op.create_table(
+        "adaptive_weight_records",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("model_name", sa.String(length=50), nullable=False),
+        sa.Column("match_id", sa.Integer(), nullable=False),
+        sa.Column("prob_home", sa.Float(), nullable=False),
+        sa.Column("prob_draw", sa.Float(), nullable=False),
+        sa.Column("prob_away", sa.Float(), nullable=False),
+        sa.Column("actual_outcome", sa.String(length=10), nullable=False),
+        sa.Column("prediction_date", sa.DateTime(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_adaptive_weight_records_model_match",
+        "adaptive_weight_records",
+        ["model_name", "match_id"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_adaptive_weight_records_prediction_date",
+        "adaptive_weight_records",
+        ["prediction_date"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the adaptive weight records table."""
+    op.drop_index(
+        "ix_adaptive_weight_records_prediction_date", table_name="adaptive_weight_records"
+    )
+    op.drop_index("ix_adaptive_weight_records_model_match", table_name="adaptive_weight_records")
+    op.drop_table("adaptive_weight_records")
@@ -0,0 +1,47 @@
+"""Add team_feature_snapshots feature store.
+
+Revision ID: e5a9c3f70b12
+Revises: d41e7b9a2c68
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a9c3f70b12"
+down_revision: str | Sequence[str] | None = "d41e7b9a2c68"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the versioned per-team feature snapshot table.
+
+    Filled by TeamFeatureStore.update (full replay on first run).
+    """
+    op.create_table(
+        "team_feature_snapshots",
+        sa.Column("feature_version", sa.SmallInteger(), nullable=False),
+        sa.Column("team_id", sa.Integer(), nullable=False),
+        sa.Column("as_of", sa.DateTime(), nullable=False),
+        sa.Column("matches_played", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("attack_strength", sa.Float(), nullable=False),
+        sa.Column("defense_strength", sa.Float(), nullable=False),
+        sa.Column("form", sa.Float(), nullable=False),
+        sa.Column("elo_rating", sa.Float(), nullable=False),
+        sa.Column("xg_for", sa.Float(), nullable=True),
+        sa.Column("xg_against", sa.Float(), nullable=True),
+        sa.Column("state", sa.Text(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(["team_id"], ["teams.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("feature_version", "team_id", "as_of"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the team feature snapshot table."""
+    op.drop_table("team_feature_snapshots")
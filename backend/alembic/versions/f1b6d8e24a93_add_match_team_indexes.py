@@ -0,0 +1,30 @@
+"""Add per-team and updated_at indexes on matches for incremental team stats.
+
+Revision ID: f1b6d8e24a93
+Revises: e5a9c3f70b12
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f1b6d8e24a93"
+down_revision: str | Sequence[str] | None = "e5a9c3f70b12"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index matches by team and by last update."""
+    op.create_index("ix_matches_home_team_date", "matches", ["home_team_id", "match_date"])
+    op.create_index("ix_matches_away_team_date", "matches", ["away_team_id", "match_date"])
+    op.create_index("ix_matches_updated_at", "matches", ["updated_at"])
+
+
+def downgrade() -> None:
+    """Drop the match indexes."""
+    op.drop_index("ix_matches_updated_at", table_name="matches")
+    op.drop_index("ix_matches_away_team_date", table_name="matches")
+    op.drop_index("ix_matches_home_team_date", table_name="matches")
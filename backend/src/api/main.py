@@ -5,7 +5,7 @@ import logging
 import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from datetime import date, timedelta
+from datetime import UTC, date, datetime, timedelta
 from typing import Any
 
 import structlog
@@ -48,7 +48,6 @@ from src.api.routes.sync import (
     _recalculate_all_team_stats,
     _sync_form_from_standings,
     _update_missing_team_countries,
-    _update_team_elo_ratings,
 )
 from src.core.config import settings
 from src.core.exceptions import ParisportifError
@@ -148,7 +147,7 @@ async def _post_sync_maintenance() -> dict[str, int]:
 
     try:
         elo_ratings = await _calculate_proper_elo_ratings()
-        r["elo"] = await _update_team_elo_ratings(elo_ratings)
+        r["elo"] = len(elo_ratings)
     except Exception as e:
         logger.warning(f"[Scheduler] Error calculating ELO: {e}")
         r["elo"] = 0
@@ -268,6 +267,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         if settings.is_production:
             raise
 
+    # Restore the adaptive ensemble weight history
+    try:
+        from src.prediction_engine.adaptive_weights import adaptive_weight_calculator
+        from src.services.adaptive_weights_service import AdaptiveWeightStore
+
+        await AdaptiveWeightStore.load(adaptive_weight_calculator)
+    except Exception as e:
+        logger.warning(f"[AdaptiveWeights] Could not load records: {e}")
+
     # Check API key availability (no values logged)
     groq_key = settings.groq_api_key
     if groq_key:
@@ -332,6 +340,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         replace_existing=True,
     )
 
+    # HuggingFace ML service health, read by the ensemble without blocking requests
+    from src.ml.huggingface_client import HEALTH_PROBE_INTERVAL, probe_hf_ml_service
+
+    scheduler.add_job(
+        probe_hf_ml_service,
+        trigger=IntervalTrigger(seconds=HEALTH_PROBE_INTERVAL),
+        id="hf_ml_health",
+        name="Probe HuggingFace ML service health",
+        replace_existing=True,
+        next_run_time=datetime.now(UTC),
+    )
+
     scheduler.start()
     logger.info(
         "[Scheduler] Started - predictions 1h, football 6h, tennis 3h, NBA 3h, cache 6am UTC"
@@ -340,6 +360,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Run startup prefill in background (delayed 30s to let server accept traffic first)
     asyncio.create_task(_delayed_startup_prefill())
 
+    # Keep this worker's in-process cache in sync with the other workers
+    from src.core.cache import run_cache_invalidation_listener
+
+    cache_listener = asyncio.create_task(run_cache_invalidation_listener())
+
     yield
 
     # Shutdown
@@ -347,6 +372,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         scheduler.shutdown(wait=False)
         logger.info("[Scheduler] Stopped")
 
+    cache_listener.cancel()
+
     # Close shared HTTP client
     from src.core.http_client import close_http_client
 
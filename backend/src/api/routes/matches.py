@@ -4,7 +4,6 @@ All endpoints require authentication.
 Returns HTTP errors (429, 503) when data is unavailable rather than mock data.
 """
 
-import json
 import logging
 from collections.abc import Sequence
 from datetime import UTC, date, datetime, timedelta
@@ -15,7 +14,7 @@ from pydantic import BaseModel
 
 from src.api.schemas import ErrorResponse
 from src.auth import AUTH_RESPONSES, AuthenticatedUser
-from src.core.cache import cache_get, cache_set
+from src.core.cache import cache_get_json, cache_set_json
 from src.core.constants import COMPETITION_NAMES, COMPETITIONS
 from src.core.exceptions import FootballDataAPIError, RateLimitError
 from src.core.messages import api_msg, detect_language_from_header
@@ -489,10 +488,10 @@ async def get_upcoming_matches(
 
     # Check Redis cache (2-minute TTL for upcoming matches)
     redis_key = f"upcoming:{date_from}:{days}:{competition or 'all'}"
-    cached = await cache_get(redis_key)
+    cached = await cache_get_json(redis_key)
     if cached:
         try:
-            return MatchListResponse(**json.loads(cached))
+            return MatchListResponse(**cached)
         except Exception as e:
             logger.debug(f"Invalid Redis cache for upcoming matches: {e}")
 
@@ -551,7 +550,12 @@ async def get_upcoming_matches(
     )
     # Cache in Redis for 2 minutes
     try:
-        await cache_set(redis_key, json.dumps(response.model_dump(mode="json"), default=str), 120)
+        await cache_set_json(
+            redis_key,
+            response.model_dump(mode="json"),
+            120,
+            tags=["matches"] + ([f"competition:{competition}"] if competition else []),
+        )
     except Exception as e:
         logger.debug(f"Failed to cache upcoming matches in Redis: {e}")
     return response
@@ -614,19 +618,16 @@ async def get_live_scores(
     Returns all currently playing matches with scores, minute, and status.
     Results are cached for 30 seconds to reduce API calls.
     """
-    import json
-
     cache_key = f"live_scores:{competition or 'all'}"
 
     # Try Redis cache first (using shared pool)
     try:
-        cached = await cache_get(cache_key)
+        cached = await cache_get_json(cache_key)
         if cached:
-            data = json.loads(cached)
             return LiveScoresResponse(
-                matches=[LiveMatchInfo(**m) for m in data["matches"]],
-                total=data["total"],
-                updated_at=datetime.fromisoformat(data["updated_at"]),
+                matches=[LiveMatchInfo(**m) for m in cached["matches"]],
+                total=cached["total"],
+                updated_at=datetime.fromisoformat(cached["updated_at"]),
                 data_source=DataSourceInfo(
                     source="cache",
                     is_fallback=False,
@@ -713,7 +714,7 @@ async def get_live_scores(
                 "total": len(live_matches),
                 "updated_at": now.isoformat(),
             }
-            await cache_set(cache_key, json.dumps(cache_data, default=str), 30)
+            await cache_set_json(cache_key, cache_data, 30)
         except Exception as e:
             logger.debug(f"Failed to cache live scores: {e}")
 
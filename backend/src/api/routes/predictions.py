@@ -11,21 +11,27 @@ See /src/prediction_engine/ensemble_advanced.py for details.
 
 import json
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Literal, cast
+from datetime import date, datetime, timedelta
+from typing import Any, Literal
 
 from fastapi import APIRouter, HTTPException, Query, Request
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 from src.api.schemas import ErrorResponse
 from src.auth import AUTH_RESPONSES, AuthenticatedUser
-from src.core.cache import cache_get, cache_set
+from src.core.cache import cache_delete, get_or_compute, response_to_cacheable
 from src.core.exceptions import FootballDataAPIError, RateLimitError
 from src.core.messages import api_msg, detect_language_from_header
 from src.core.rate_limit import RATE_LIMITS, limiter
 from src.data.sources.football_data import get_football_data_client
 from src.db.repositories import get_uow
 from src.db.services.prediction_service import PredictionService
+from src.services.calibration_service import (
+    BET_TYPES,
+    CALIBRATION_BUCKETS,
+    CalibrationCell,
+    CalibrationSummaryService,
+)
 
 # Data source type for beta feedback
 DataSourceType = Literal["live_api", "cache", "database"]
@@ -56,28 +62,17 @@ class DataSourceInfo(BaseModel):
 
 # Redis cache TTL for predictions (30 minutes for quick access)
 PREDICTION_CACHE_TTL = 1800  # 30 minutes
+# Redis cache TTL for daily picks
+DAILY_PICKS_CACHE_TTL = 300  # 5 minutes
 
 
-async def _get_prediction_from_redis(match_id: int) -> dict[str, Any] | None:
-    """Get prediction from Redis cache."""
-    try:
-        cache_key = f"prediction:{match_id}"
-        cached = await cache_get(cache_key)
-        if cached:
-            return cast(dict[str, Any], json.loads(cached))
-    except Exception as e:
-        logger.debug(f"Redis cache miss for match {match_id}: {e}")
-    return None
+class _PredictionUnavailableError(Exception):
+    """No stored prediction for the match and none could be generated."""
 
 
-async def _cache_prediction_to_redis(match_id: int, prediction_data: dict[str, Any]) -> None:
-    """Cache prediction to Redis."""
-    try:
-        cache_key = f"prediction:{match_id}"
-        await cache_set(cache_key, json.dumps(prediction_data, default=str), PREDICTION_CACHE_TTL)
-        logger.debug(f"Cached prediction for match {match_id} in Redis")
-    except Exception as e:
-        logger.warning(f"Failed to cache prediction in Redis: {e}")
+def _daily_picks_tags(picks: dict[str, Any]) -> list[str]:
+    """Invalidation tags for cached daily picks: any match, and each picked match."""
+    return ["matches"] + [f"match:{p['prediction']['match_id']}" for p in picks["picks"]]
 
 
 class PredictionProbabilities(BaseModel):
@@ -190,6 +185,29 @@ class CorrectScoreResponse(BaseModel):
     most_likely_prob: float = Field(..., ge=0, le=1, description="Probability of most likely score")
 
 
+class AsianHandicapResponse(BaseModel):
+    """Asian Handicap market response."""
+
+    line: float = Field(..., description="Handicap applied to the home team")
+    home_prob: float = Field(..., ge=0, le=1, description="Probability home covers")
+    away_prob: float = Field(..., ge=0, le=1, description="Probability away covers")
+    home_odds: float | None = Field(None, description="Fair odds for home")
+    away_odds: float | None = Field(None, description="Fair odds for away")
+    recommended: str = Field("home", description="Recommended bet: home or away")
+
+
+class TeamTotalResponse(BaseModel):
+    """Team total goals Over/Under response."""
+
+    team: Literal["home", "away"] = Field(..., description="Team the line applies to")
+    line: float = Field(..., description="Goal line (0.5, 1.5, 2.5)")
+    over_prob: float = Field(..., ge=0, le=1, description="Probability of over")
+    under_prob: float = Field(..., ge=0, le=1, description="Probability of under")
+    over_odds: float | None = Field(None, description="Fair odds for over")
+    under_odds: float | None = Field(None, description="Fair odds for under")
+    recommended: str = Field("over", description="Recommended bet: over or under")
+
+
 class MultiMarketsResponse(BaseModel):
     """Complete multi-markets prediction response."""
 
@@ -202,6 +220,15 @@ class MultiMarketsResponse(BaseModel):
     expected_home_goals: float = Field(..., description="Expected goals for home team")
     expected_away_goals: float = Field(..., description="Expected goals for away team")
     expected_total_goals: float = Field(..., description="Expected total goals")
+    over_under: list[OverUnderResponse] = Field(
+        default_factory=list, description="Over/Under for every goal line (0.5 to 5.5)"
+    )
+    asian_handicap: list[AsianHandicapResponse] = Field(
+        default_factory=list, description="Asian Handicap lines (-2.5 to +2.5)"
+    )
+    team_totals: list[TeamTotalResponse] = Field(
+        default_factory=list, description="Home and away team total goals"
+    )
 
 
 class PredictionResponse(BaseModel):
@@ -378,6 +405,10 @@ def _build_multi_markets_response(mm: dict[str, Any]) -> MultiMarketsResponse:
         expected_home_goals=exp_home,
         expected_away_goals=exp_away,
         expected_total_goals=exp_home + exp_away,
+        # Full line sets are absent from predictions stored before they existed
+        over_under=[_ou(ou, float(ou.get("line", 0.0))) for ou in mm.get("over_under", [])],
+        asian_handicap=[AsianHandicapResponse(**ah) for ah in mm.get("asian_handicap", [])],
+        team_totals=[TeamTotalResponse(**tt) for tt in mm.get("team_totals", [])],
     )
 
 
@@ -393,6 +424,86 @@ def _get_recommended_bet(
     return "draw"
 
 
+async def _build_daily_picks(target_date: date, target_date_str: str) -> DailyPicksResponse:
+    """Best 5 of the stored predictions for a date (see get_daily_picks)."""
+    # Check if we have cached predictions in DB
+    cached_predictions = await PredictionService.get_predictions_for_date_with_details(target_date)
+    if cached_predictions:
+        logger.info(f"Found {len(cached_predictions)} cached predictions for {target_date_str}")
+        # Convert cached predictions to response format
+        all_predictions = []
+        for cached in cached_predictions:
+            comp_code = cached.get("competition_code") or "UNKNOWN"
+            # Map service outcome format to API format
+            # Service returns: home, draw, away
+            # API expects: home_win, draw, away_win
+            recommendation = cached.get("recommendation", "")
+            outcome_map: dict[str, Literal["home_win", "draw", "away_win"]] = {
+                "home": "home_win",
+                "draw": "draw",
+                "away": "away_win",
+                "home_win": "home_win",
+                "away_win": "away_win",
+            }
+            recommended_bet: Literal["home_win", "draw", "away_win"] = outcome_map.get(
+                recommendation, "draw"
+            )
+            # Get cached key_factors/risk_factors if available
+            cached_key_factors = cached.get("key_factors")
+            cached_risk_factors = cached.get("risk_factors")
+            cached_value_score = cached.get("value_score")
+
+            pred = PredictionResponse(
+                match_id=cached["match_id"],
+                home_team=cached.get("home_team") or "Unknown",
+                away_team=cached.get("away_team") or "Unknown",
+                competition=COMPETITION_NAMES.get(comp_code, comp_code),
+                match_date=datetime.fromisoformat(cached["match_date"]),
+                probabilities=PredictionProbabilities(
+                    home_win=cached["home_win_prob"],
+                    draw=cached["draw_prob"],
+                    away_win=cached["away_win_prob"],
+                ),
+                recommended_bet=recommended_bet,
+                confidence=cached["confidence"],
+                value_score=cached_value_score if cached_value_score else 0.10,
+                explanation=cached.get("explanation") or "",
+                key_factors=(
+                    cached_key_factors if cached_key_factors else ["Statistical analysis"]
+                ),
+                risk_factors=cached_risk_factors if cached_risk_factors else ["Cached data"],
+                created_at=datetime.fromisoformat(cached["created_at"]),
+                is_daily_pick=True,
+                # Verification fields from database
+                is_verified=cached.get("is_verified", False),
+                is_correct=cached.get("is_correct"),
+                actual_score=cached.get("actual_score"),
+            )
+            pick_score = pred.confidence * pred.value_score
+            all_predictions.append((pred, pick_score))
+
+        # Sort and return top 5
+        all_predictions.sort(key=lambda x: x[1], reverse=True)
+        daily_picks = [
+            DailyPickResponse(rank=i + 1, prediction=p, pick_score=round(s, 4))
+            for i, (p, s) in enumerate(all_predictions[:5])
+        ]
+        response = DailyPicksResponse(
+            date=target_date_str,
+            picks=daily_picks,
+            total_matches_analyzed=len(cached_predictions),
+        )
+        return response
+
+    # No cached predictions — all predictions are pre-computed by cron
+    logger.info(f"No predictions in DB for {target_date_str}, returning empty picks")
+    return DailyPicksResponse(
+        date=target_date_str,
+        picks=[],
+        total_matches_analyzed=0,
+    )
+
+
 @router.get(
     "/daily",
     response_model=DailyPicksResponse,
@@ -422,102 +533,18 @@ async def get_daily_picks(
         target_date_str = query_date or datetime.now().strftime("%Y-%m-%d")
         target_date = datetime.strptime(target_date_str, "%Y-%m-%d").date()
 
-        # Check Redis cache first (5-minute TTL for daily picks)
-        redis_cache_key = f"daily_picks:{target_date_str}"
-        cached_response = await cache_get(redis_cache_key)
-        if cached_response:
-            try:
-                cached_data = json.loads(cached_response)
-                logger.debug(f"Redis HIT for daily picks {target_date_str}")
-                return DailyPicksResponse(**cached_data)
-            except (json.JSONDecodeError, Exception) as e:
-                logger.warning(f"Invalid Redis cache for daily picks: {e}")
-
-        # Check if we have cached predictions in DB
-        cached_predictions = await PredictionService.get_predictions_for_date_with_details(
-            target_date
-        )
-        if cached_predictions:
-            logger.info(f"Found {len(cached_predictions)} cached predictions for {target_date_str}")
-            # Convert cached predictions to response format
-            all_predictions = []
-            for cached in cached_predictions:
-                comp_code = cached.get("competition_code") or "UNKNOWN"
-                # Map service outcome format to API format
-                # Service returns: home, draw, away
-                # API expects: home_win, draw, away_win
-                recommendation = cached.get("recommendation", "")
-                outcome_map: dict[str, Literal["home_win", "draw", "away_win"]] = {
-                    "home": "home_win",
-                    "draw": "draw",
-                    "away": "away_win",
-                    "home_win": "home_win",
-                    "away_win": "away_win",
-                }
-                recommended_bet: Literal["home_win", "draw", "away_win"] = outcome_map.get(
-                    recommendation, "draw"
-                )
-                # Get cached key_factors/risk_factors if available
-                cached_key_factors = cached.get("key_factors")
-                cached_risk_factors = cached.get("risk_factors")
-                cached_value_score = cached.get("value_score")
-
-                pred = PredictionResponse(
-                    match_id=cached["match_id"],
-                    home_team=cached.get("home_team") or "Unknown",
-                    away_team=cached.get("away_team") or "Unknown",
-                    competition=COMPETITION_NAMES.get(comp_code, comp_code),
-                    match_date=datetime.fromisoformat(cached["match_date"]),
-                    probabilities=PredictionProbabilities(
-                        home_win=cached["home_win_prob"],
-                        draw=cached["draw_prob"],
-                        away_win=cached["away_win_prob"],
-                    ),
-                    recommended_bet=recommended_bet,
-                    confidence=cached["confidence"],
-                    value_score=cached_value_score if cached_value_score else 0.10,
-                    explanation=cached.get("explanation") or "",
-                    key_factors=(
-                        cached_key_factors if cached_key_factors else ["Statistical analysis"]
-                    ),
-                    risk_factors=cached_risk_factors if cached_risk_factors else ["Cached data"],
-                    created_at=datetime.fromisoformat(cached["created_at"]),
-                    is_daily_pick=True,
-                    # Verification fields from database
-                    is_verified=cached.get("is_verified", False),
-                    is_correct=cached.get("is_correct"),
-                    actual_score=cached.get("actual_score"),
-                )
-                pick_score = pred.confidence * pred.value_score
-                all_predictions.append((pred, pick_score))
-
-            # Sort and return top 5
-            all_predictions.sort(key=lambda x: x[1], reverse=True)
-            daily_picks = [
-                DailyPickResponse(rank=i + 1, prediction=p, pick_score=round(s, 4))
-                for i, (p, s) in enumerate(all_predictions[:5])
-            ]
-            response = DailyPicksResponse(
-                date=target_date_str,
-                picks=daily_picks,
-                total_matches_analyzed=len(cached_predictions),
-            )
-            # Cache in Redis for 5 minutes
-            try:
-                await cache_set(
-                    redis_cache_key, json.dumps(response.model_dump(mode="json"), default=str), 300
-                )
-            except Exception as e:
-                logger.debug(f"Failed to cache daily picks in Redis: {e}")
-            return response
-
-        # No cached predictions — all predictions are pre-computed by cron
-        logger.info(f"No predictions in DB for {target_date_str}, returning empty picks")
-        return DailyPicksResponse(
-            date=target_date_str,
-            picks=[],
-            total_matches_analyzed=0,
+        # Redis cache (5-minute TTL); concurrent misses, in any worker, share one build
+        picks = await get_or_compute(
+            f"daily_picks:{target_date_str}",
+            DAILY_PICKS_CACHE_TTL,
+            lambda: _build_daily_picks(target_date, target_date_str),
+            response_to_cacheable,
+            distributed_lock=True,
+            tags=_daily_picks_tags,
         )
+        if isinstance(picks, DailyPicksResponse):
+            return picks
+        return DailyPicksResponse(**picks)
 
     except RateLimitError as e:
         retry_after = e.details.get("retry_after", 60) if e.details else 60
@@ -824,150 +851,85 @@ async def get_calibration(
         - Breakdown by confidence buckets (50-60%, 60-70%, etc.)
         - Performance by competition
     """
-    from sqlalchemy import and_, select
-
-    from src.db.models import Match, PredictionResult
+    # Pre-aggregated per (competition, bet type, confidence bucket)
+    since = (datetime.now() - timedelta(days=days)).date()
+    cells = await CalibrationSummaryService.get_cells(since)
 
-    async with get_uow() as uow:
-        cutoff_date = datetime.now() - timedelta(days=days)
-
-        # Get all verified predictions with their results
-        query = (
-            select(PredictionResult, Match)
-            .join(Match, PredictionResult.match_id == Match.id)
-            .where(
-                and_(
-                    PredictionResult.created_at >= cutoff_date,
-                    Match.status == "FINISHED",
-                )
-            )
+    total_verified = sum(c.predictions for c in cells)
+    if total_verified == 0:
+        raise HTTPException(
+            status_code=404,
+            detail="No verified predictions found for this period",
         )
 
-        result = await uow.session.execute(query)
-        rows = result.all()
-
-        if not rows:
-            raise HTTPException(
-                status_code=404,
-                detail="No verified predictions found for this period",
+    total_correct = sum(c.correct for c in cells)
+    overall_accuracy = total_correct / total_verified
+
+    # Calculate by bet type
+    by_bet_type = []
+    for bet in BET_TYPES:
+        bt_cells = [c for c in cells if c.bet_type == bet]
+        bt_count = sum(c.predictions for c in bt_cells)
+        bt_correct = sum(c.correct for c in bt_cells)
+        bt_conf_sum = sum(c.confidence_sum for c in bt_cells)
+
+        by_bet_type.append(
+            CalibrationByBet(
+                bet_type=bet,
+                total_predictions=bt_count,
+                correct=bt_correct,
+                accuracy=bt_correct / bt_count if bt_count > 0 else 0,
+                avg_confidence=bt_conf_sum / bt_count if bt_count > 0 else 0,
+                buckets=_calculate_buckets(bt_cells),
             )
-
-        # Process predictions
-        predictions_data = []
-        for pred, match in rows:
-            # Determine actual outcome
-            if match.home_score is not None and match.away_score is not None:
-                if match.home_score > match.away_score:
-                    actual_outcome = "home_win"
-                elif match.home_score < match.away_score:
-                    actual_outcome = "away_win"
-                else:
-                    actual_outcome = "draw"
-            else:
-                continue  # Skip if no score
-
-            predicted = pred.predicted_outcome
-            confidence = float(pred.confidence) if pred.confidence else 0.5
-            is_correct = predicted == actual_outcome
-
-            predictions_data.append(
-                {
-                    "predicted": predicted,
-                    "actual": actual_outcome,
-                    "confidence": confidence,
-                    "is_correct": is_correct,
-                    "competition": match.competition_code,
-                }
-            )
-
-        total_verified = len(predictions_data)
-        total_correct = sum(1 for p in predictions_data if p["is_correct"])
-        overall_accuracy = total_correct / total_verified if total_verified > 0 else 0
-
-        # Calculate by bet type
-        bet_types = ["home_win", "draw", "away_win"]
-        by_bet_type = []
-        for bet in bet_types:
-            bt_preds = [p for p in predictions_data if p["predicted"] == bet]
-            bt_correct = sum(1 for p in bt_preds if p["is_correct"])
-            bt_count = len(bt_preds)
-            bt_accuracy = bt_correct / bt_count if bt_count > 0 else 0
-            bt_avg_conf = sum(p["confidence"] for p in bt_preds) / bt_count if bt_count > 0 else 0
-
-            # Buckets for this bet type
-            buckets = _calculate_buckets(bt_preds)
-
-            by_bet_type.append(
-                CalibrationByBet(
-                    bet_type=bet,
-                    total_predictions=bt_count,
-                    correct=bt_correct,
-                    accuracy=bt_accuracy,
-                    avg_confidence=bt_avg_conf,
-                    buckets=buckets,
-                )
-            )
-
-        # Calculate overall confidence buckets
-        overall_buckets = _calculate_buckets(predictions_data)
-
-        # Calculate mean calibration error
-        calibration_errors = []
-        for bucket in overall_buckets:
-            if bucket.count > 0:
-                calibration_errors.append(abs(bucket.overconfidence))
-        mean_calibration_error = (
-            sum(calibration_errors) / len(calibration_errors) if calibration_errors else 0
         )
 
-        # Calculate by competition
-        by_competition: dict[str, dict[str, Any]] = {}
-        competitions = set(p["competition"] for p in predictions_data if p["competition"])
-        for comp in competitions:
-            comp_preds = [p for p in predictions_data if p["competition"] == comp]
-            comp_correct = sum(1 for p in comp_preds if p["is_correct"])
-            comp_count = len(comp_preds)
-            by_competition[comp] = {
-                "total": comp_count,
-                "correct": comp_correct,
-                "accuracy": comp_correct / comp_count if comp_count > 0 else 0,
-                "avg_confidence": (
-                    sum(p["confidence"] for p in comp_preds) / comp_count if comp_count > 0 else 0
-                ),
-            }
+    # Calculate overall confidence buckets
+    overall_buckets = _calculate_buckets(cells)
 
-        return CalibrationResponse(
-            total_verified=total_verified,
-            overall_accuracy=overall_accuracy,
-            overall_calibration_error=mean_calibration_error,
-            by_bet_type=by_bet_type,
-            by_confidence=overall_buckets,
-            by_competition=by_competition,
-            period=f"Last {days} days",
-            generated_at=datetime.now(),
-        )
+    # Calculate mean calibration error
+    calibration_errors = [abs(b.overconfidence) for b in overall_buckets if b.count > 0]
+    mean_calibration_error = (
+        sum(calibration_errors) / len(calibration_errors) if calibration_errors else 0
+    )
 
+    # Calculate by competition
+    by_competition: dict[str, dict[str, Any]] = {}
+    for cell in cells:
+        if not cell.competition_code:
+            continue
+        comp = by_competition.setdefault(
+            cell.competition_code, {"total": 0, "correct": 0, "confidence_sum": 0.0}
+        )
+        comp["total"] += cell.predictions
+        comp["correct"] += cell.correct
+        comp["confidence_sum"] += cell.confidence_sum
+    for comp in by_competition.values():
+        confidence_sum = comp.pop("confidence_sum")
+        comp["accuracy"] = comp["correct"] / comp["total"] if comp["total"] > 0 else 0
+        comp["avg_confidence"] = confidence_sum / comp["total"] if comp["total"] > 0 else 0
+
+    return CalibrationResponse(
+        total_verified=total_verified,
+        overall_accuracy=overall_accuracy,
+        overall_calibration_error=mean_calibration_error,
+        by_bet_type=by_bet_type,
+        by_confidence=overall_buckets,
+        by_competition=by_competition,
+        period=f"Last {days} days",
+        generated_at=datetime.now(),
+    )
 
-def _calculate_buckets(predictions: list[dict[str, Any]]) -> list[CalibrationBucket]:
-    """Calculate calibration buckets for a set of predictions."""
-    bucket_ranges = [
-        (0.50, 0.55, "50-55%"),
-        (0.55, 0.60, "55-60%"),
-        (0.60, 0.65, "60-65%"),
-        (0.65, 0.70, "65-70%"),
-        (0.70, 0.75, "70-75%"),
-        (0.75, 0.80, "75-80%"),
-        (0.80, 0.85, "80-85%"),
-        (0.85, 1.00, "85-100%"),
-    ]
 
+def _calculate_buckets(cells: list[CalibrationCell]) -> list[CalibrationBucket]:
+    """Calculate calibration buckets from aggregated summary cells."""
     buckets = []
-    for low, high, label in bucket_ranges:
-        bucket_preds = [p for p in predictions if low <= p["confidence"] < high]
-        count = len(bucket_preds)
+    for index, (low, high, label) in enumerate(CALIBRATION_BUCKETS):
+        bucket_cells = [c for c in cells if c.bucket == index]
+        count = sum(c.predictions for c in bucket_cells)
         if count > 0:
-            avg_conf = sum(p["confidence"] for p in bucket_preds) / count
-            actual_rate = sum(1 for p in bucket_preds if p["is_correct"]) / count
+            avg_conf = sum(c.confidence_sum for c in bucket_cells) / count
+            actual_rate = sum(c.correct for c in bucket_cells) / count
             overconfidence = avg_conf - actual_rate
         else:
             avg_conf = (low + high) / 2
@@ -993,7 +955,8 @@ async def _generate_prediction_on_demand(
     """Generate a prediction on-demand using the ML ensemble models.
 
     Runs the same 6-model ensemble as the prefill cron, but synchronously
-    for a single match. Saves the result to DB + Redis for future requests.
+    for a single match. Saves the result to DB for future requests (get_prediction
+    caches it in Redis).
 
     Returns None if the match doesn't exist or team data is missing.
     """
@@ -1001,6 +964,8 @@ async def _generate_prediction_on_demand(
 
     from src.db import async_session_factory
     from src.prediction_engine.ensemble_advanced import advanced_ensemble_predictor
+    from src.services.team_feature_store import TeamFeatureStore, to_naive_utc
+    from src.services.team_snapshot_cache import team_snapshot_cache
 
     async with async_session_factory() as session:
         # Fetch match + team stats
@@ -1041,20 +1006,10 @@ async def _generate_prediction_on_demand(
         if not match:
             return None
 
-        # Fetch team stats
-        team_result = await session.execute(
-            sa_text(
-                """
-                SELECT t.id, t.elo_rating, t.avg_goals_scored_home,
-                       t.avg_goals_scored_away,
-                       t.avg_goals_conceded_home, t.avg_goals_conceded_away,
-                       t.form_score, t.rest_days, t.fixture_congestion
-                FROM teams t WHERE t.id IN (:home_id, :away_id)
-            """
-            ),
-            {"home_id": match.home_team_id, "away_id": match.away_team_id},
+        # Fetch team stats (short-TTL process cache, misses read with this session)
+        teams = await team_snapshot_cache.get_many(
+            (match.home_team_id, match.away_team_id), session=session
         )
-        teams = {t.id: t for t in team_result.fetchall()}
 
         home = teams.get(match.home_team_id)
         away = teams.get(match.away_team_id)
@@ -1062,8 +1017,26 @@ async def _generate_prediction_on_demand(
         if not home or not away:
             return None
 
-    # Run 6-model ensemble prediction
-    pred = advanced_ensemble_predictor.predict(
+    # Rest and congestion scores from the team feature store, as in the prefill
+    # (same definitions as model training), else from the teams row
+    try:
+        feature_states = await TeamFeatureStore.get_states((match.home_team_id, match.away_team_id))
+    except Exception as e:
+        logger.warning(f"Team feature store unavailable: {e}")
+        feature_states = {}
+
+    def fatigue(team_id: int, team: Any) -> tuple[float, float]:
+        state = feature_states.get(team_id)
+        if state is None:
+            return float(team.rest_days or 0.5), float(team.fixture_congestion or 0.5)
+        features = state.features(team_id, to_naive_utc(match.match_date or datetime.now()))
+        return features.rest_score, features.congestion_score
+
+    home_rest, home_congestion = fatigue(match.home_team_id, home)
+    away_rest, away_congestion = fatigue(match.away_team_id, away)
+
+    # Run 6-model ensemble prediction (remote ML fallback awaited, never blocking)
+    pred = await advanced_ensemble_predictor.predict_async(
         home_attack=float(home.avg_goals_scored_home or 1.3),
         home_defense=float(home.avg_goals_conceded_home or 1.3),
         away_attack=float(away.avg_goals_scored_away or 1.3),
@@ -1074,10 +1047,10 @@ async def _generate_prediction_on_demand(
         away_team_id=match.away_team_id,
         home_form_score=float(home.form_score or 0.5) * 100,
         away_form_score=float(away.form_score or 0.5) * 100,
-        home_rest_days=float(home.rest_days or 0.5),
-        away_rest_days=float(away.rest_days or 0.5),
-        home_congestion=float(home.fixture_congestion or 0.5),
-        away_congestion=float(away.fixture_congestion or 0.5),
+        home_rest_days=home_rest,
+        away_rest_days=away_rest,
+        home_congestion=home_congestion,
+        away_congestion=away_congestion,
     )
 
     # Determine outcome and confidence
@@ -1111,7 +1084,7 @@ async def _generate_prediction_on_demand(
         confidence=confidence_val,
         recommended_bet=recommended,
         value_score=value_score,
-        explanation=None,
+        explanation="",
         key_factors=[],
         risk_factors=[],
         model_contributions=None,
@@ -1153,12 +1126,6 @@ async def _generate_prediction_on_demand(
     except Exception as e:
         logger.debug(f"Failed to save on-demand prediction to DB: {e}")
 
-    # Cache in Redis
-    try:
-        await _cache_prediction_to_redis(match.id, response.model_dump(mode="json"))
-    except Exception as e:
-        logger.debug(f"Failed to cache on-demand prediction in Redis: {e}")
-
     logger.info(
         f"Generated on-demand prediction for match {match.id} "
         f"({match.home_team} vs {match.away_team})"
@@ -1166,37 +1133,13 @@ async def _generate_prediction_on_demand(
     return response
 
 
-@router.get(
-    "/{match_id}",
-    response_model=PredictionResponse,
-    responses={
-        **AUTH_RESPONSES,
-        404: {"model": ErrorResponse, "description": "Match not found"},
-        500: {"model": ErrorResponse, "description": "Internal server error"},
-    },
-    operation_id="getPrediction",
-)
-@limiter.limit(RATE_LIMITS["predictions"])  # type: ignore[misc]
-async def get_prediction(
-    request: Request,
-    match_id: int,
-    user: AuthenticatedUser,
-    include_model_details: bool = Query(False, description="Include model details"),
-) -> PredictionResponse:
-    """Get detailed prediction for a specific match.
+async def _load_prediction(match_id: int, include_model_details: bool) -> PredictionResponse:
+    """Stored prediction for a match, or one generated on demand.
 
-    Cache strategy: Redis (30min) -> DB (permanent) -> Generate -> Save both
+    Raises:
+        _PredictionUnavailableError: If neither is available
     """
-    # 1. First, check Redis cache (fastest)
-    try:
-        redis_cached = await _get_prediction_from_redis(match_id)
-        if redis_cached:
-            logger.info(f"Redis cache HIT for match {match_id}")
-            return PredictionResponse(**redis_cached)
-    except Exception as e:
-        logger.debug(f"Redis cache check failed: {e}")
-
-    # 2. Check DB cache
+    # 1. Check DB cache
     try:
         cached = await PredictionService.get_prediction(match_id)
         if cached:
@@ -1382,17 +1325,11 @@ async def get_prediction(
                 data_source=DataSourceInfo(source="database"),
             )
 
-            # Also cache in Redis for faster future access
-            try:
-                await _cache_prediction_to_redis(match_id, response.model_dump(mode="json"))
-            except Exception as e:
-                logger.debug(f"Failed to cache prediction {match_id} in Redis: {e}")
-
             return response
     except Exception as e:
         logger.warning(f"DB cache lookup failed for match {match_id}: {e}")
 
-    # 3. No cache hit — generate on-demand using ML models
+    # 2. Not stored — generate on-demand using ML models
     try:
         generated = await _generate_prediction_on_demand(match_id, include_model_details)
         if generated:
@@ -1400,12 +1337,70 @@ async def get_prediction(
     except Exception as e:
         logger.warning(f"On-demand prediction generation failed for match {match_id}: {e}")
 
-    # 4. Could not generate — return 404
-    lang = _detect_language(request)
-    raise HTTPException(
-        status_code=404,
-        detail=api_msg("prediction_not_ready", lang),
-    )
+    raise _PredictionUnavailableError(match_id)
+
+
+async def _get_cached_prediction(match_id: int, include_model_details: bool) -> PredictionResponse:
+    """Prediction through the Redis cache (see _load_prediction for misses).
+
+    Concurrent misses, in any worker, share one DB read or ensemble run.
+    """
+    cache_key = f"prediction:{match_id}"
+    try:
+        prediction = await get_or_compute(
+            cache_key,
+            PREDICTION_CACHE_TTL,
+            lambda: _load_prediction(match_id, include_model_details),
+            response_to_cacheable,
+            distributed_lock=True,
+            tags=["matches", f"match:{match_id}"],
+        )
+    except _PredictionUnavailableError:
+        raise
+    except Exception as e:
+        logger.warning(f"Redis cache failed for match {match_id}, loading without it: {e}")
+        return await _load_prediction(match_id, include_model_details)
+
+    if isinstance(prediction, PredictionResponse):
+        return prediction
+    try:
+        return PredictionResponse(**prediction)
+    except ValidationError as e:
+        # Stored in another format (e.g. by the cache warm-up): replace it
+        logger.debug(f"Invalid Redis cache for match {match_id}: {e}")
+        await cache_delete(cache_key)
+        return await _load_prediction(match_id, include_model_details)
+
+
+@router.get(
+    "/{match_id}",
+    response_model=PredictionResponse,
+    responses={
+        **AUTH_RESPONSES,
+        404: {"model": ErrorResponse, "description": "Match not found"},
+        500: {"model": ErrorResponse, "description": "Internal server error"},
+    },
+    operation_id="getPrediction",
+)
+@limiter.limit(RATE_LIMITS["predictions"])  # type: ignore[misc]
+async def get_prediction(
+    request: Request,
+    match_id: int,
+    user: AuthenticatedUser,
+    include_model_details: bool = Query(False, description="Include model details"),
+) -> PredictionResponse:
+    """Get detailed prediction for a specific match.
+
+    Cache strategy: Redis (30min) -> DB (permanent) -> Generate -> Save both
+    """
+    try:
+        return await _get_cached_prediction(match_id, include_model_details)
+    except _PredictionUnavailableError:
+        lang = _detect_language(request)
+        raise HTTPException(
+            status_code=404,
+            detail=api_msg("prediction_not_ready", lang),
+        )
 
 
 class VerifyPredictionRequest(BaseModel):
@@ -1454,6 +1449,8 @@ async def verify_prediction_endpoint(
             detail=f"No prediction found for match {match_id}",
         )
 
+    await PredictionService.refresh_calibration_summary()
+
     # Map actual_outcome to actual_result format expected by response
     # Service returns: home, draw, away
     # Response expects: home_win, draw, away_win
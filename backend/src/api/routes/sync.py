@@ -26,121 +26,31 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-async def _calculate_proper_elo_ratings() -> dict[int, float]:
+async def _calculate_proper_elo_ratings(full_rebuild: bool = False) -> dict[int, float]:
     """
-    Calculate proper ELO ratings from match history using the real ELO formula.
+    Update ELO ratings from match history using the real ELO formula.
 
-    This processes ALL finished matches in chronological order and applies:
+    Applies only matches finished since the last run (persisted watermark)
+    unless full_rebuild is set, with:
     - Rating difference consideration (expected score)
     - Goal difference multiplier
     - K-factor of 20 with home advantage of 100 points
 
-    Returns dict of team_id -> elo_rating
-    """
-    from src.prediction_engine.models.elo import ELOSystem
-
-    elo_system = ELOSystem(k_factor=20.0, home_advantage=100.0)
-    team_ratings: dict[int, float] = {}  # team_id -> current rating
-
-    try:
-        with get_db_context() as db:
-            # Get all finished matches ordered by date
-            query = text(
-                """
-                SELECT
-                    m.id,
-                    m.home_team_id,
-                    m.away_team_id,
-                    m.home_score,
-                    m.away_score,
-                    m.match_date
-                FROM matches m
-                WHERE m.status = 'FINISHED'
-                    AND m.home_score IS NOT NULL
-                    AND m.away_score IS NOT NULL
-                    AND m.home_team_id IS NOT NULL
-                    AND m.away_team_id IS NOT NULL
-                ORDER BY m.match_date ASC
-            """
-            )
-            result = db.execute(query)
-            matches = result.fetchall()
-
-            logger.info(f"Processing {len(matches)} finished matches for ELO calculation")
-
-            for match in matches:
-                home_id = match.home_team_id
-                away_id = match.away_team_id
-                home_score = match.home_score
-                away_score = match.away_score
-
-                # Initialize teams at 1500 if not seen before
-                if home_id not in team_ratings:
-                    team_ratings[home_id] = 1500.0
-                if away_id not in team_ratings:
-                    team_ratings[away_id] = 1500.0
-
-                # Get current ratings
-                home_rating = team_ratings[home_id]
-                away_rating = team_ratings[away_id]
-
-                # Calculate new ratings using proper ELO formula
-                new_home, new_away = elo_system.update_ratings(
-                    home_rating=home_rating,
-                    away_rating=away_rating,
-                    home_goals=home_score,
-                    away_goals=away_score,
-                )
-
-                # Update ratings
-                team_ratings[home_id] = new_home
-                team_ratings[away_id] = new_away
-
-            logger.info(f"Calculated ELO for {len(team_ratings)} teams")
+    Ratings are written to teams.elo_rating in the same transaction.
+    Failures propagate so callers can report them.
 
-            # Log some sample ratings for verification
-            if team_ratings:
-                sorted_ratings = sorted(team_ratings.items(), key=lambda x: x[1], reverse=True)
-                top_5 = sorted_ratings[:5]
-                bottom_5 = sorted_ratings[-5:]
-                logger.info(f"Top 5 ELO: {top_5}")
-                logger.info(f"Bottom 5 ELO: {bottom_5}")
+    Returns dict of team_id -> elo_rating for the teams that changed
+    """
+    from src.services.elo_service import EloRatingService
 
-    except Exception as e:
-        logger.error(f"Failed to calculate ELO ratings: {e}")
+    result = await EloRatingService.update_ratings(full_rebuild=full_rebuild)
 
-    return team_ratings
+    if result.ratings:
+        sorted_ratings = sorted(result.ratings.items(), key=lambda x: x[1], reverse=True)
+        logger.info(f"Top 5 updated ELO: {sorted_ratings[:5]}")
+        logger.info(f"Bottom 5 updated ELO: {sorted_ratings[-5:]}")
 
-
-async def _update_team_elo_ratings(ratings: dict[int, float]) -> int:
-    """Update team ELO ratings in database."""
-    if not ratings:
-        return 0
-
-    try:
-        with get_db_context() as db:
-            updated = 0
-            for team_id, elo in ratings.items():
-                # Clamp ELO between 1000 and 2500 for sanity
-                clamped_elo = max(1000.0, min(2500.0, elo))
-                query = text(
-                    """
-                    UPDATE teams
-                    SET elo_rating = :elo, updated_at = NOW()
-                    WHERE id = :team_id
-                """
-                )
-                result = db.execute(query, {"team_id": team_id, "elo": clamped_elo})
-                if result.rowcount > 0:
-                    updated += 1
-
-            db.commit()
-            logger.info(f"Updated ELO ratings for {updated} teams")
-            return updated
-
-    except Exception as e:
-        logger.error(f"Failed to update team ELO ratings: {e}")
-        return 0
+    return result.ratings
 
 
 async def _sync_form_from_standings() -> int:
@@ -572,7 +482,7 @@ async def sync_weekly_data(
         elo_updated = 0
         try:
             elo_ratings = await _calculate_proper_elo_ratings()
-            elo_updated = await _update_team_elo_ratings(elo_ratings)
+            elo_updated = len(elo_ratings)
             logger.info(f"Updated ELO ratings for {elo_updated} teams")
         except Exception as e:
             logger.warning(f"Failed to calculate ELO ratings: {e}")
@@ -688,6 +598,29 @@ async def sync_standings_only(user: AdminUser) -> SyncResponse:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/elo", response_model=SyncResponse, responses=ADMIN_RESPONSES)
+async def sync_elo_ratings(
+    user: AdminUser,
+    full_rebuild: bool = Query(False, description="Replay the whole match history"),
+) -> SyncResponse:
+    """Apply newly finished matches to ELO ratings (or rebuild them on demand)."""
+    try:
+        elo_ratings = await _calculate_proper_elo_ratings(full_rebuild=full_rebuild)
+
+        mode = "Rebuilt" if full_rebuild else "Updated"
+        await SyncServiceAsync.log_sync("elo_ratings", "success", len(elo_ratings))
+
+        return SyncResponse(
+            status="success",
+            message=f"{mode} ELO ratings for {len(elo_ratings)} teams",
+        )
+    except Exception as e:
+        error_msg = str(e)
+        logger.error(f"Failed to calculate ELO ratings: {error_msg}")
+        await SyncServiceAsync.log_sync("elo_ratings", "error", 0, error_msg)
+        raise HTTPException(status_code=500, detail=f"ELO sync failed: {error_msg}")
+
+
 @router.get("/status", response_model=DbStatsResponse, responses=ADMIN_RESPONSES)
 async def get_sync_status(user: AdminUser) -> DbStatsResponse:
     """Get database sync status and statistics."""
@@ -786,8 +719,9 @@ async def sync_historical_season(
     # Calculate proper ELO ratings
     elo_updated = 0
     try:
-        elo_ratings = await _calculate_proper_elo_ratings()
-        elo_updated = await _update_team_elo_ratings(elo_ratings)
+        # Past-season matches land behind the watermark: replay everything
+        elo_ratings = await _calculate_proper_elo_ratings(full_rebuild=True)
+        elo_updated = len(elo_ratings)
         logger.info(f"Updated ELO ratings for {elo_updated} teams")
     except Exception as e:
         errors.append(f"ELO calculation failed: {e}")
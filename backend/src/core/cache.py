@@ -2,20 +2,45 @@
 
 Provides decorators and utilities for caching expensive API calls.
 Uses redis-py with async support for non-blocking operations.
+
+JSON values read with cache_get_json (and the decorators) are also kept in
+an in-process L1 cache (LocalCache), so hot keys skip the Redis round trip
+and JSON parsing. Every write or delete publishes the affected keys on a
+Redis channel; run_cache_invalidation_listener evicts them from the L1 of
+the other workers. The L1 is only used while that listener is subscribed.
+
+JSON values are stored in the compact format of src.core.codec (fast JSON,
+compressed above a size threshold, behind a version header) and read through
+a second pool without response decoding. Plain JSON strings written by
+cache_set are still read back by cache_get_json.
+
+Values can be written with tags (Redis sorted sets ``tag:{tag}`` listing the
+keys, scored by their expiry time); cache_invalidate_tags deletes every key
+of the given tags. Tag names used: ``matches`` (any match data),
+``match:{id}`` and ``competition:{code}``.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import fnmatch
 import hashlib
 import json
 import logging
-from collections.abc import Awaitable, Callable
+import math
+import random
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Mapping
 from functools import wraps
 from typing import Any, ParamSpec, TypeVar
 
 import redis.asyncio as aioredis
 from redis.asyncio.connection import ConnectionPool
 
+from src.core.codec import CodecError, decode, encode
 from src.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -26,6 +51,11 @@ P = ParamSpec("P")
 
 # Connection pool for efficient Redis connections
 _pool: ConnectionPool | None = None
+# Client bound to the pool (stateless, safe to share between coroutines)
+_client: aioredis.Redis | None = None
+# Pool and client returning raw bytes, for encoded payloads (src.core.codec)
+_binary_pool: ConnectionPool | None = None
+_binary_client: aioredis.Redis | None = None
 
 
 def get_redis_pool() -> ConnectionPool:
@@ -41,9 +71,171 @@ def get_redis_pool() -> ConnectionPool:
 
 
 async def get_redis_client() -> aioredis.Redis:
-    """Get an async Redis client from the connection pool."""
+    """Get the shared async Redis client for the connection pool."""
+    global _client
     pool = get_redis_pool()
-    return aioredis.Redis(connection_pool=pool)
+    if _client is None or _client.connection_pool is not pool:
+        _client = aioredis.Redis(connection_pool=pool)
+    return _client
+
+
+async def get_redis_binary_client() -> aioredis.Redis:
+    """Get the shared async Redis client that returns values as bytes."""
+    global _binary_pool, _binary_client
+    if _binary_pool is None:
+        _binary_pool = ConnectionPool.from_url(
+            settings.redis_url,
+            max_connections=settings.redis_max_connections,
+        )
+    if _binary_client is None or _binary_client.connection_pool is not _binary_pool:
+        _binary_client = aioredis.Redis(connection_pool=_binary_pool)
+    return _binary_client
+
+
+# Tag sets live at least this long (and at least as long as their longest-lived write)
+TAG_SET_TTL = 86400
+
+
+def _tag_key(tag: str) -> str:
+    return f"tag:{tag}"
+
+
+def _add_tags(pipe: Any, key: str, tags: Iterable[str], ttl: int) -> None:
+    """Queue registering ``key`` under each tag, pruning members that have expired.
+
+    Busy tags are written often enough that their set never expires, so
+    members are scored by expiry and dropped once their key is gone.
+    """
+    now = time.time()
+    for tag in tags:
+        tag_key = _tag_key(tag)
+        pipe.zremrangebyscore(tag_key, "-inf", now)
+        pipe.zadd(tag_key, {key: now + ttl})
+        pipe.expire(tag_key, max(ttl, TAG_SET_TTL))
+
+
+# Channel carrying cache invalidations between workers
+INVALIDATION_CHANNEL = "cache:invalidate"
+# Identifies this process's own invalidation messages
+_WORKER_ID = uuid.uuid4().hex
+
+_MISSING = object()
+
+
+class LocalCache:
+    """In-process LRU of decoded JSON values (L1 in front of Redis).
+
+    Entries expire with their Redis TTL, capped at ``max_ttl``. Values are
+    shared between callers and must not be mutated.
+    """
+
+    def __init__(self, max_entries: int, max_ttl: float):
+        self.max_entries = max_entries
+        self.max_ttl = max_ttl
+        # Set while the invalidation listener is subscribed
+        self.active = False
+        # Bumped on every eviction, so a read racing an invalidation is not stored
+        self.generation = 0
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        """Cached value, or _MISSING."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        if entry[1] <= time.monotonic():
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def set(self, key: str, value: Any, ttl: float, generation: int | None = None) -> None:
+        """Store a value (skipped if an eviction happened since ``generation``)."""
+        if not self.active or ttl <= 0:
+            return
+        if generation is not None and generation != self.generation:
+            return
+        self._entries[key] = (value, time.monotonic() + min(ttl, self.max_ttl))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, keys: Iterable[str]) -> None:
+        self.generation += 1
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def delete_pattern(self, pattern: str) -> None:
+        self.generation += 1
+        for key in [k for k in self._entries if fnmatch.fnmatchcase(k, pattern)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+
+local_cache = LocalCache(settings.cache_l1_max_entries, settings.cache_l1_max_ttl)
+
+
+def _invalidation_message(keys: list[str] | None = None, pattern: str | None = None) -> str:
+    return json.dumps({"origin": _WORKER_ID, "keys": keys, "pattern": pattern})
+
+
+def _apply_invalidation(data: Any) -> None:
+    """Evict the L1 entries named in an invalidation message from another worker."""
+    try:
+        message = json.loads(data)
+    except (TypeError, ValueError):
+        logger.warning(f"Invalid cache invalidation message: {data!r}")
+        local_cache.clear()
+        return
+    if message.get("origin") == _WORKER_ID:
+        return  # Already applied locally
+    if message.get("keys"):
+        local_cache.delete(message["keys"])
+    elif message.get("pattern"):
+        local_cache.delete_pattern(message["pattern"])
+
+
+async def run_cache_invalidation_listener() -> None:
+    """Apply other workers' invalidations to the L1 cache (runs for the app lifetime).
+
+    Uses its own connection, outside the shared pool. The L1 is enabled
+    only while subscribed; it is cleared and disabled whenever the
+    subscription drops, then the listener reconnects with backoff.
+    """
+    if not settings.cache_l1_enabled:
+        return
+
+    backoff = 1.0
+    while True:
+        client = aioredis.Redis.from_url(settings.redis_url, decode_responses=True)
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            local_cache.clear()
+            local_cache.active = True
+            backoff = 1.0
+            logger.info("Cache L1 enabled, listening for invalidations")
+            async for message in pubsub.listen():
+                _apply_invalidation(message.get("data"))
+        except Exception as e:
+            logger.warning(f"Cache invalidation listener disconnected: {e}")
+        finally:
+            local_cache.active = False
+            local_cache.clear()
+            # Close each separately so a failing pubsub close does not leak the client
+            with contextlib.suppress(Exception):
+                await pubsub.aclose()  # type: ignore[no-untyped-call, unused-ignore]
+            with contextlib.suppress(Exception):
+                await client.aclose()
+
+        await asyncio.sleep(backoff)
+        backoff = min(backoff * 2, 60.0)
 
 
 async def cache_get(key: str) -> str | None:
@@ -68,20 +260,27 @@ async def cache_get(key: str) -> str | None:
         return None
 
 
-async def cache_set(key: str, value: str, ttl: int) -> bool:
+async def cache_set(key: str, value: str | bytes, ttl: int, tags: Iterable[str] = ()) -> bool:
     """Set a value in cache with TTL.
 
     Args:
         key: The cache key.
-        value: The value to cache (as string).
+        value: The value to cache (string, or bytes from codec.encode).
         ttl: Time-to-live in seconds.
+        tags: Invalidation tags for the key (see cache_invalidate_tags).
 
     Returns:
         True if successful, False otherwise.
     """
     try:
         client = await get_redis_client()
-        await client.setex(key, ttl, value)
+        pipe = client.pipeline(transaction=False)
+        pipe.setex(key, ttl, value)
+        _add_tags(pipe, key, tags, ttl)
+        if settings.cache_l1_enabled:
+            pipe.publish(INVALIDATION_CHANNEL, _invalidation_message(keys=[key]))
+        await pipe.execute()
+        local_cache.delete([key])
         logger.debug(f"Cache SET: {key} (TTL: {ttl}s)")
         return True
     except aioredis.RedisError as e:
@@ -89,6 +288,133 @@ async def cache_set(key: str, value: str, ttl: int) -> bool:
         return False
 
 
+async def cache_get_many(keys: list[str]) -> list[str | None]:
+    """Get several values in one round trip (MGET).
+
+    Args:
+        keys: The cache keys.
+
+    Returns:
+        The cached values in key order, None for missing keys (all None on error).
+    """
+    if not keys:
+        return []
+    try:
+        client = await get_redis_client()
+        values = await client.mget(keys)
+        hits = sum(1 for v in values if v)
+        logger.debug(f"Cache GET many: {hits}/{len(keys)} hits")
+        return [str(v) if v else None for v in values]
+    except aioredis.RedisError as e:
+        logger.warning(f"Redis MGET error for {len(keys)} keys: {e}")
+        return [None] * len(keys)
+
+
+async def cache_set_many(
+    items: Mapping[str, str | bytes],
+    ttl: int | Mapping[str, int],
+    tags: Mapping[str, Iterable[str]] | None = None,
+) -> bool:
+    """Set several values with TTLs in one pipelined round trip.
+
+    Args:
+        items: Values (strings, or bytes from codec.encode) by cache key.
+        ttl: Time-to-live in seconds, for all keys or per key.
+        tags: Invalidation tags by cache key.
+
+    Returns:
+        True if successful, False otherwise.
+    """
+    if not items:
+        return True
+    try:
+        client = await get_redis_client()
+        pipe = client.pipeline(transaction=False)
+        for key, value in items.items():
+            key_ttl = ttl if isinstance(ttl, int) else ttl[key]
+            pipe.setex(key, key_ttl, value)
+            if tags:
+                _add_tags(pipe, key, tags.get(key, ()), key_ttl)
+        if settings.cache_l1_enabled:
+            pipe.publish(INVALIDATION_CHANNEL, _invalidation_message(keys=list(items)))
+        await pipe.execute()
+        local_cache.delete(items)
+        logger.debug(f"Cache SET many: {len(items)} keys")
+        return True
+    except aioredis.RedisError as e:
+        logger.warning(f"Redis SET many error for {len(items)} keys: {e}")
+        return False
+
+
+async def cache_get_json(key: str) -> Any:
+    """Get a JSON value, from the L1 cache when possible.
+
+    On an L1 miss the value is read from Redis together with its remaining
+    TTL, and kept in L1 for at most that long. Both codec payloads and
+    plain JSON strings are decoded.
+
+    Args:
+        key: The cache key.
+
+    Returns:
+        The decoded value (shared, do not mutate), or None if not found.
+    """
+    if local_cache.active:
+        value = local_cache.get(key)
+        if value is not _MISSING:
+            logger.debug(f"Cache L1 HIT: {key}")
+            return value
+
+    generation = local_cache.generation
+    try:
+        client = await get_redis_binary_client()
+        if local_cache.active:
+            pipe = client.pipeline(transaction=False)
+            pipe.get(key)
+            pipe.pttl(key)
+            raw, ttl_ms = await pipe.execute()
+        else:
+            raw, ttl_ms = await client.get(key), -1
+    except aioredis.RedisError as e:
+        logger.warning(f"Redis GET error for key {key}: {e}")
+        return None
+
+    if not raw:
+        logger.debug(f"Cache MISS: {key}")
+        return None
+    try:
+        value = decode(raw)
+    except CodecError as e:
+        logger.warning(f"Undecodable cache value for {key}: {e}")
+        return None
+
+    logger.debug(f"Cache HIT: {key}")
+    if ttl_ms and ttl_ms > 0:
+        local_cache.set(key, value, ttl_ms / 1000, generation=generation)
+    return value
+
+
+async def cache_set_json(key: str, value: Any, ttl: int, tags: Iterable[str] = ()) -> bool:
+    """Set a JSON value in Redis (and the L1 cache) with TTL, encoded with codec.encode.
+
+    Args:
+        key: The cache key.
+        value: The value to cache (JSON-serializable; other types via str()).
+        ttl: Time-to-live in seconds.
+        tags: Invalidation tags for the key (see cache_invalidate_tags).
+
+    Returns:
+        True if successful, False otherwise.
+    """
+    payload = encode(value)
+    if not await cache_set(key, payload, ttl, tags=tags):
+        return False
+    if local_cache.active:
+        # Store what a reader would decode, not the caller's (mutable) object
+        local_cache.set(key, decode(payload), ttl)
+    return True
+
+
 async def cache_delete(key: str) -> bool:
     """Delete a key from cache.
 
@@ -100,7 +426,12 @@ async def cache_delete(key: str) -> bool:
     """
     try:
         client = await get_redis_client()
-        await client.delete(key)
+        pipe = client.pipeline(transaction=False)
+        pipe.delete(key)
+        if settings.cache_l1_enabled:
+            pipe.publish(INVALIDATION_CHANNEL, _invalidation_message(keys=[key]))
+        await pipe.execute()
+        local_cache.delete([key])
         logger.debug(f"Cache DELETE: {key}")
         return True
     except aioredis.RedisError as e:
@@ -108,6 +439,67 @@ async def cache_delete(key: str) -> bool:
         return False
 
 
+async def cache_delete_many(keys: list[str]) -> int:
+    """Delete several keys in one pipelined round trip.
+
+    Args:
+        keys: The cache keys to delete.
+
+    Returns:
+        Number of keys deleted.
+    """
+    if not keys:
+        return 0
+    try:
+        client = await get_redis_client()
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.delete(key)
+        if settings.cache_l1_enabled:
+            pipe.publish(INVALIDATION_CHANNEL, _invalidation_message(keys=keys))
+        results = await pipe.execute()
+        local_cache.delete(keys)
+        deleted = sum(int(r or 0) for r in results[: len(keys)])
+        logger.debug(f"Cache DELETE many: {deleted}/{len(keys)} keys removed")
+        return deleted
+    except aioredis.RedisError as e:
+        logger.warning(f"Redis DELETE many error for {len(keys)} keys: {e}")
+        return 0
+
+
+async def cache_invalidate_tags(tags: Iterable[str]) -> int:
+    """Delete every key registered under the given tags.
+
+    The tag sets are read and removed in one transaction, so a key tagged
+    meanwhile is kept for the next invalidation rather than lost.
+
+    Args:
+        tags: Tags to invalidate (e.g. "match:42", "competition:PL").
+
+    Returns:
+        Number of keys deleted.
+    """
+    tag_keys = sorted({_tag_key(tag) for tag in tags})
+    if not tag_keys:
+        return 0
+    try:
+        client = await get_redis_client()
+        pipe = client.pipeline(transaction=True)
+        now = time.time()
+        for tag_key in tag_keys:
+            pipe.zrangebyscore(tag_key, now, "+inf")
+            pipe.delete(tag_key)
+        results = await pipe.execute()
+    except aioredis.RedisError as e:
+        logger.warning(f"Redis tag invalidation error for {tag_keys}: {e}")
+        return 0
+
+    keys = sorted({str(key) for members in results[0::2] for key in members})
+    deleted = await cache_delete_many(keys)
+    logger.info(f"Cache invalidate tags {tag_keys}: {deleted} keys removed")
+    return deleted
+
+
 async def cache_delete_pattern(pattern: str) -> int:
     """Delete all keys matching a pattern.
 
@@ -122,6 +514,9 @@ async def cache_delete_pattern(pattern: str) -> int:
         keys: list[str] = []
         async for key in client.scan_iter(match=pattern):
             keys.append(str(key))
+        local_cache.delete_pattern(pattern)
+        if settings.cache_l1_enabled:
+            await client.publish(INVALIDATION_CHANNEL, _invalidation_message(pattern=pattern))
         if keys:
             deleted = await client.delete(*keys)
             logger.info(f"Cache DELETE pattern {pattern}: {deleted} keys removed")
@@ -148,14 +543,216 @@ def generate_cache_key(*args: Any, prefix: str = "cache") -> str:
     return f"{prefix}:{key_hash}"
 
 
+# Stampede protection for the decorators below:
+# - concurrent misses in a worker share one call (single flight),
+# - with distributed_lock, one worker computes while the others wait for its result,
+# - hot entries are refreshed early by one caller (XFetch) while the others
+#   keep getting the current value.
+XFETCH_BETA = 1.0  # > 1 refreshes earlier, 0 disables early refresh
+LOCK_TIMEOUT_MS = 30_000  # Lock expiry, in case its holder dies
+LOCK_WAIT = 5.0  # Seconds a worker waits for another worker's result
+LOCK_POLL_INTERVAL = 0.05
+
+_ENVELOPE_MARK = "__cache_envelope__"
+
+# Compare-and-delete: release the lock only if we still hold it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+_inflight: dict[str, asyncio.Future[Any]] = {}
+
+
+def _envelope(value: Any, delta: float, ttl: int) -> dict[str, Any]:
+    """Cached value plus what XFetch needs: compute time and expiry (epoch seconds)."""
+    return {_ENVELOPE_MARK: 1, "value": value, "delta": delta, "expires_at": time.time() + ttl}
+
+
+def _is_envelope(entry: Any) -> bool:
+    return isinstance(entry, dict) and entry.get(_ENVELOPE_MARK) == 1
+
+
+def _should_refresh_early(entry: dict[str, Any], beta: float) -> bool:
+    """XFetch: recompute with a probability rising as expiry approaches, sooner for slow calls."""
+    if beta <= 0:
+        return False
+    gap = -entry["delta"] * beta * math.log(1.0 - random.random())
+    return bool(time.time() + gap >= entry["expires_at"])
+
+
+async def _acquire_lock(cache_key: str) -> str | None:
+    """Token if this worker may compute the key, None if another worker holds the lock."""
+    token = uuid.uuid4().hex
+    try:
+        client = await get_redis_client()
+        acquired = await client.set(f"lock:{cache_key}", token, nx=True, px=LOCK_TIMEOUT_MS)
+        return token if acquired else None
+    except aioredis.RedisError as e:
+        logger.warning(f"Redis lock error for key {cache_key}: {e}")
+        return token  # Compute without the lock rather than not at all
+
+
+async def _release_lock(cache_key: str, token: str) -> None:
+    try:
+        client = await get_redis_client()
+        await client.eval(  # type: ignore[misc, unused-ignore]
+            _RELEASE_LOCK_SCRIPT, 1, f"lock:{cache_key}", token
+        )
+    except aioredis.RedisError as e:
+        logger.warning(f"Redis lock release error for key {cache_key}: {e}")
+
+
+async def _wait_for_value(cache_key: str) -> Any:
+    """Value stored by the lock holder, or _MISSING after LOCK_WAIT."""
+    deadline = time.monotonic() + LOCK_WAIT
+    while time.monotonic() < deadline:
+        await asyncio.sleep(LOCK_POLL_INTERVAL)
+        entry = await cache_get_json(cache_key)
+        if entry is not None:
+            return entry["value"] if _is_envelope(entry) else entry
+    return _MISSING
+
+
+async def _compute_and_store(
+    cache_key: str,
+    ttl: int,
+    compute: Callable[[], Awaitable[Any]],
+    to_cacheable: Callable[[Any], Any],
+    distributed_lock: bool,
+    stale: Any,
+    tags: Iterable[str] | Callable[[Any], Iterable[str]],
+) -> Any:
+    token: str | None = None
+    if distributed_lock:
+        token = await _acquire_lock(cache_key)
+        if token is None:
+            # Another worker is computing: serve the stale value, or wait for its result
+            if stale is not _MISSING:
+                return stale
+            value = await _wait_for_value(cache_key)
+            if value is not _MISSING:
+                return value
+            logger.debug(f"Gave up waiting for {cache_key}, computing it here")
+
+    try:
+        started = time.monotonic()
+        result = await compute()
+        delta = time.monotonic() - started
+        try:
+            value = to_cacheable(result)
+            await cache_set_json(
+                cache_key,
+                _envelope(value, delta, ttl),
+                ttl,
+                tags=tags(value) if callable(tags) else tags,
+            )
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Failed to serialize result for caching: {e}")
+        return result
+    finally:
+        if token is not None:
+            await _release_lock(cache_key, token)
+
+
+async def get_or_compute(
+    cache_key: str,
+    ttl: int,
+    compute: Callable[[], Awaitable[Any]],
+    to_cacheable: Callable[[Any], Any],
+    distributed_lock: bool = False,
+    beta: float = XFETCH_BETA,
+    tags: Iterable[str] | Callable[[Any], Iterable[str]] = (),
+) -> Any:
+    """Cached value of ``cache_key``, computing it at most once at a time.
+
+    Args:
+        cache_key: The cache key.
+        ttl: Time-to-live in seconds.
+        compute: Produces the value on a miss or early refresh.
+        to_cacheable: Converts the computed result to a JSON-serializable value.
+        distributed_lock: Also coalesce across workers with a Redis lock.
+        beta: XFetch early refresh factor (0 disables early refresh).
+        tags: Invalidation tags for the stored value, or a function of the
+            (cacheable) value returning them.
+
+    Returns:
+        The cached value (decoded JSON), or the computed result.
+    """
+    stale: Any = _MISSING
+    entry = await cache_get_json(cache_key)
+    if entry is not None:
+        if not _is_envelope(entry):
+            return entry  # Stored without envelope (older entry)
+        if not _should_refresh_early(entry, beta):
+            return entry["value"]
+        stale = entry["value"]
+
+    inflight = _inflight.get(cache_key)
+    if inflight is not None:
+        if stale is not _MISSING:
+            return stale
+        try:
+            return await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            if not inflight.cancelled():
+                raise  # This caller was cancelled
+            # The computing caller went away; try again
+            return await get_or_compute(
+                cache_key, ttl, compute, to_cacheable, distributed_lock, beta, tags
+            )
+
+    future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+    # Nobody may be waiting: mark errors as retrieved
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+    _inflight[cache_key] = future
+    try:
+        result = await _compute_and_store(
+            cache_key, ttl, compute, to_cacheable, distributed_lock, stale, tags
+        )
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        if _inflight.get(cache_key) is future:
+            del _inflight[cache_key]
+    future.set_result(result)
+    return result
+
+
+def response_to_cacheable(result: Any) -> Any:
+    """Pydantic models as JSON-compatible dicts, other values unchanged."""
+    if hasattr(result, "model_dump"):
+        return result.model_dump(mode="json")
+    if hasattr(result, "dict"):
+        return result.dict()
+    return result
+
+
 def cached(
-    ttl: int, prefix: str = "cache"
+    ttl: int,
+    prefix: str = "cache",
+    distributed_lock: bool = False,
+    beta: float = XFETCH_BETA,
+    tags: Callable[..., Iterable[str]] | None = None,
 ) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[Any]]]:
     """Decorator to cache async function results in Redis.
 
+    Concurrent misses for the same arguments share a single call, and hot
+    entries are refreshed shortly before they expire (see get_or_compute).
+
     Args:
         ttl: Time-to-live in seconds.
         prefix: Cache key prefix.
+        distributed_lock: Also coalesce misses across workers (Redis lock).
+        beta: Early refresh factor (0 disables early refresh).
+        tags: Called with the function's arguments, returns the invalidation tags
+            of the result (e.g. ``lambda match_id: [f"match:{match_id}"]``).
 
     Usage:
         @cached(ttl=300, prefix="matches")
@@ -169,24 +766,15 @@ def cached(
             # Generate cache key from function name and arguments
             cache_key = generate_cache_key(func.__name__, args, kwargs, prefix=prefix)
 
-            # Try to get from cache
-            cached_value = await cache_get(cache_key)
-            if cached_value is not None:
-                try:
-                    return json.loads(cached_value)
-                except json.JSONDecodeError:
-                    logger.warning(f"Invalid JSON in cache for {cache_key}")
-
-            # Call the function
-            result = await func(*args, **kwargs)
-
-            # Cache the result
-            try:
-                await cache_set(cache_key, json.dumps(result, default=str), ttl)
-            except (TypeError, ValueError) as e:
-                logger.warning(f"Failed to serialize result for caching: {e}")
-
-            return result
+            return await get_or_compute(
+                cache_key,
+                ttl,
+                lambda: func(*args, **kwargs),
+                lambda result: result,
+                distributed_lock=distributed_lock,
+                beta=beta,
+                tags=tags(*args, **kwargs) if tags else (),
+            )
 
         return wrapper
 
@@ -194,7 +782,11 @@ def cached(
 
 
 def cached_response(
-    ttl: int, prefix: str = "api"
+    ttl: int,
+    prefix: str = "api",
+    distributed_lock: bool = False,
+    beta: float = XFETCH_BETA,
+    tags: Callable[..., Iterable[str]] | None = None,
 ) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[Any]]]:
     """Decorator to cache Pydantic response models.
 
@@ -203,6 +795,10 @@ def cached_response(
     Args:
         ttl: Time-to-live in seconds.
         prefix: Cache key prefix.
+        distributed_lock: Also coalesce misses across workers (Redis lock).
+        beta: Early refresh factor (0 disables early refresh).
+        tags: Called with the function's arguments, returns the invalidation tags
+            of the result (e.g. ``lambda match_id: [f"match:{match_id}"]``).
 
     Usage:
         @cached_response(ttl=1800, prefix="predictions")
@@ -233,34 +829,16 @@ def cached_response(
                 func.__name__, tuple(cache_args), cache_kwargs, prefix=prefix
             )
 
-            # Try to get from cache
-            cached_value = await cache_get(cache_key)
-            if cached_value is not None:
-                try:
-                    data = json.loads(cached_value)
-                    # Return cached data as-is (will be Pydantic model dict)
-                    logger.debug(f"Returning cached response for {cache_key}")
-                    return data
-                except json.JSONDecodeError:
-                    logger.warning(f"Invalid JSON in cache for {cache_key}")
-
-            # Call the function
-            result = await func(*args, **kwargs)
-
-            # Cache the result (convert Pydantic model to dict if needed)
-            try:
-                if hasattr(result, "model_dump"):
-                    cache_data = result.model_dump(mode="json")
-                elif hasattr(result, "dict"):
-                    cache_data = result.dict()
-                else:
-                    cache_data = result
-
-                await cache_set(cache_key, json.dumps(cache_data, default=str), ttl)
-            except (TypeError, ValueError) as e:
-                logger.warning(f"Failed to serialize response for caching: {e}")
-
-            return result
+            # Cached data is returned as-is (Pydantic model dict)
+            return await get_or_compute(
+                cache_key,
+                ttl,
+                lambda: func(*args, **kwargs),
+                response_to_cacheable,
+                distributed_lock=distributed_lock,
+                beta=beta,
+                tags=tags(*args, **kwargs) if tags else (),
+            )
 
         return wrapper
 
@@ -276,32 +854,7 @@ async def invalidate_match_cache(match_id: int | None = None) -> int:
     Returns:
         Number of cache entries invalidated.
     """
-    if match_id:
-        pattern = f"matches:*{match_id}*"
-    else:
-        pattern = "matches:*"
-
-    count = await cache_delete_pattern(pattern)
-    pred_pattern = "predictions:*" if not match_id else f"predictions:*{match_id}*"
-    count += await cache_delete_pattern(pred_pattern)
-    return count
-
-
-async def invalidate_standings_cache(competition_code: str | None = None) -> int:
-    """Invalidate standings cache entries.
-
-    Args:
-        competition_code: Specific competition to invalidate, or None for all.
-
-    Returns:
-        Number of cache entries invalidated.
-    """
-    if competition_code:
-        pattern = f"standings:{competition_code}:*"
-    else:
-        pattern = "standings:*"
-
-    return await cache_delete_pattern(pattern)
+    return await cache_invalidate_tags([f"match:{match_id}" if match_id else "matches"])
 
 
 async def health_check() -> bool:
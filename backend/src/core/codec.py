@@ -0,0 +1,170 @@
+"""Serialization of cached payloads.
+
+Values are serialized as JSON with orjson (the stdlib json module handles
+the few values orjson rejects) and compressed once they exceed
+``settings.cache_compress_min_bytes``. Encoded payloads start with a header:
+
+    byte 0  format version (CODEC_VERSION)
+    byte 1  compression (COMPRESSION_NONE, _ZLIB, _ZSTD or _LZ4)
+
+JSON text never starts with a control byte, so payloads written as plain
+JSON strings before this module existed are still decoded, and readers can
+tell old and new formats apart key by key.
+
+zlib is always available; zstd comes with the ``zstandard`` dependency and
+lz4 is used when the ``lz4`` package is installed (``settings.cache_compression``
+= "auto" picks the best one available).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import zlib
+from collections.abc import Callable
+from typing import Any
+
+import orjson
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+)
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+    _zstd_compressor = zstandard.ZstdCompressor(level=3)
+    _zstd_decompressor = zstandard.ZstdDecompressor()
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import lz4.frame
+
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+CODEC_VERSION = 1
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_ZSTD = 2
+COMPRESSION_LZ4 = 3
+
+ZLIB_LEVEL = 1  # Cached JSON compresses well even at the fastest level
+
+
+class CodecError(ValueError):
+    """Raised when a cached payload cannot be decoded."""
+
+
+# Compression id -> (compress, decompress), for the libraries installed here
+_CODECS: dict[int, tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    COMPRESSION_ZLIB: (lambda data: zlib.compress(data, ZLIB_LEVEL), zlib.decompress),
+}
+if ZSTD_AVAILABLE:
+    _CODECS[COMPRESSION_ZSTD] = (_zstd_compressor.compress, _zstd_decompressor.decompress)
+if LZ4_AVAILABLE:
+    _CODECS[COMPRESSION_LZ4] = (lz4.frame.compress, lz4.frame.decompress)
+
+_COMPRESSION_NAMES = {
+    "none": COMPRESSION_NONE,
+    "zlib": COMPRESSION_ZLIB,
+    "zstd": COMPRESSION_ZSTD,
+    "lz4": COMPRESSION_LZ4,
+}
+
+
+def _resolve_compression(name: str) -> int:
+    """Compression id for a setting value, falling back to zlib if unavailable."""
+    if name == "auto":
+        for compression in (COMPRESSION_ZSTD, COMPRESSION_LZ4):
+            if compression in _CODECS:
+                return compression
+        return COMPRESSION_ZLIB
+    compression_id = _COMPRESSION_NAMES.get(name)
+    if compression_id is None:
+        raise ValueError(f"Unknown cache compression: {name}")
+    if compression_id != COMPRESSION_NONE and compression_id not in _CODECS:
+        logger.warning(f"{name} not installed - compressing cached payloads with zlib")
+        return COMPRESSION_ZLIB
+    return compression_id
+
+
+def json_dumps(value: Any) -> bytes:
+    """Serialize a value as UTF-8 JSON; non-JSON types are converted with str()."""
+    try:
+        return orjson.dumps(value, default=str, option=_ORJSON_OPTIONS)
+    except TypeError:
+        # e.g. integers beyond 64 bits, which the stdlib handles
+        return json.dumps(value, default=str).encode()
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse JSON text (bytes or str)."""
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # NaN / Infinity written by the stdlib json module
+        return json.loads(data)
+
+
+def encode(value: Any, compression: str | None = None, min_size: int | None = None) -> bytes:
+    """Encode a value for the cache.
+
+    Args:
+        value: The value to encode (JSON-serializable; other types via str()).
+        compression: "auto", "zstd", "lz4", "zlib" or "none"
+            (default: settings.cache_compression).
+        min_size: Serialized size in bytes from which the payload is compressed
+            (default: settings.cache_compress_min_bytes).
+
+    Returns:
+        The header followed by the (possibly compressed) JSON.
+    """
+    body = json_dumps(value)
+    if min_size is None:
+        min_size = settings.cache_compress_min_bytes
+    compression_id = COMPRESSION_NONE
+    if len(body) >= min_size:
+        compression_id = _resolve_compression(compression or settings.cache_compression)
+        if compression_id != COMPRESSION_NONE:
+            body = _CODECS[compression_id][0](body)
+    return bytes((CODEC_VERSION, compression_id)) + body
+
+
+def decode(data: bytes | str) -> Any:
+    """Decode a cached payload written by encode() or as plain JSON text.
+
+    Raises:
+        CodecError: If the payload is corrupt, of an unknown version, or
+            compressed with a library that is not installed here.
+    """
+    if isinstance(data, str) or not data or data[0] >= 0x20:
+        try:
+            return json_loads(data)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise CodecError(f"Invalid JSON payload: {e}") from e
+
+    if data[0] != CODEC_VERSION or len(data) < 2:
+        raise CodecError(f"Unknown cache payload version: {data[0]}")
+    compression_id = data[1]
+    body = data[2:]
+    if compression_id != COMPRESSION_NONE:
+        codec = _CODECS.get(compression_id)
+        if codec is None:
+            raise CodecError(f"Unsupported cache payload compression: {compression_id}")
+        try:
+            body = codec[1](body)
+        except Exception as e:
+            raise CodecError(f"Corrupt compressed payload: {e}") from e
+    try:
+        return json_loads(body)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise CodecError(f"Invalid JSON payload: {e}") from e
@@ -33,6 +33,13 @@ class Settings(BaseSettings):
     # Redis
     redis_url: str = "redis://localhost:6379"
     redis_max_connections: int = 5
+    # In-process L1 cache in front of Redis (see src.core.cache.LocalCache)
+    cache_l1_enabled: bool = True
+    cache_l1_max_entries: int = 1000
+    cache_l1_max_ttl: int = 300  # seconds, upper bound whatever the Redis TTL
+    # Cached payload encoding (see src.core.codec)
+    cache_compression: str = "auto"  # auto, zstd, lz4, zlib or none
+    cache_compress_min_bytes: int = 1024
 
     # Qdrant (Vector DB for semantic search)
     qdrant_url: str = "http://localhost:6333"  # Or Qdrant Cloud URL
@@ -72,6 +79,8 @@ class Settings(BaseSettings):
     # LLM Settings
     llm_max_adjustment: float = 0.5  # Maximum LLM adjustment factor
     llm_cache_ttl: int = 3600  # 1 hour
+    groq_requests_per_minute: int = 30  # Groq free tier RPM
+    groq_tokens_per_minute: int = 12000  # Groq free tier TPM (70B model)
 
     @property
     def is_production(self) -> bool:
@@ -155,13 +155,13 @@ class RedisCache:
         """Get cached value from Redis or fallback."""
         if await self._check_redis():
             try:
-                from src.core.cache import cache_get
+                from src.core.cache import cache_get_json
 
                 key = self._make_key(endpoint, params)
-                cached = await cache_get(key)
-                if cached:
+                cached = await cache_get_json(key)
+                if cached is not None:
                     logger.debug(f"Redis Cache HIT for {endpoint}")
-                    return json.loads(cached)
+                    return cached
             except Exception as e:
                 logger.warning(f"Redis GET failed: {e}")
         # Fallback to in-memory
@@ -173,10 +173,10 @@ class RedisCache:
         """Cache a value in Redis or fallback."""
         if await self._check_redis():
             try:
-                from src.core.cache import cache_set
+                from src.core.cache import cache_set_json
 
                 key = self._make_key(endpoint, params)
-                await cache_set(key, json.dumps(value, default=str), ttl_seconds)
+                await cache_set_json(key, value, ttl_seconds)
                 logger.debug(f"Redis Cache SET for {endpoint} (TTL: {ttl_seconds}s)")
                 return
             except Exception as e:
@@ -16,21 +16,26 @@ Usage:
 
 from src.db.database import async_session_factory, get_db, get_db_context, get_session, init_db
 from src.db.models import (
+    AdaptiveWeightRecord,
     Base,
     BasketballMatch,
     BasketballTeam,
     CachedData,
     Competition,
+    EloRating,
+    EloState,
     Match,
     MLModel,
     NewsItem,
     NotificationLog,
     Prediction,
+    PredictionCalibrationDaily,
     PredictionResult,
     PushSubscription,
     Standing,
     SyncLog,
     Team,
+    TeamFeatureSnapshot,
     TennisMatch,
     TennisPlayer,
     TennisTournament,
@@ -63,20 +68,25 @@ __all__ = [
     # Base
     "Base",
     # Models
+    "AdaptiveWeightRecord",
     "BasketballMatch",
     "BasketballTeam",
     "CachedData",
     "Competition",
+    "EloRating",
+    "EloState",
     "Match",
     "MLModel",
     "NewsItem",
     "NotificationLog",
     "Prediction",
+    "PredictionCalibrationDaily",
     "PredictionResult",
     "PushSubscription",
     "Standing",
     "SyncLog",
     "Team",
+    "TeamFeatureSnapshot",
     "TennisMatch",
     "TennisPlayer",
     "TennisTournament",
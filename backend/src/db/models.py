@@ -1,17 +1,20 @@
 """SQLAlchemy database models."""
 
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional
 
 from sqlalchemy import (
     Boolean,
+    Date,
     DateTime,
+    Float,
     ForeignKey,
     Index,
     Integer,
     LargeBinary,
     Numeric,
+    SmallInteger,
     String,
     Text,
     func,
@@ -152,6 +155,10 @@ class Match(Base):
         Index("ix_matches_status", "status"),
         Index("ix_matches_date_status", "match_date", "status"),
         Index("ix_matches_competition_date", "competition_code", "match_date"),
+        # Per-team history lookups (incremental team stats)
+        Index("ix_matches_home_team_date", "home_team_id", "match_date"),
+        Index("ix_matches_away_team_date", "away_team_id", "match_date"),
+        Index("ix_matches_updated_at", "updated_at"),
     )
 
     @property
@@ -206,6 +213,9 @@ class Prediction(Base):
     match_context_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
     news_sources: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON array
 
+    # Hash of the prefill inputs (team stats, odds, model/prompt versions)
+    input_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
     created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=func.now(), onupdate=func.now())
 
@@ -404,6 +414,104 @@ class SyncLog(Base):
     __table_args__ = (Index("ix_sync_log_type_date", "sync_type", "started_at"),)
 
 
+class EloRating(Base):
+    """Persisted raw ELO rating per team for incremental updates.
+
+    Unlike teams.elo_rating (clamped, 1 decimal), this keeps the unclamped
+    rating so applying new matches gives the same result as a full replay.
+    """
+
+    __tablename__ = "elo_ratings"
+
+    team_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("teams.id", ondelete="CASCADE"), primary_key=True
+    )
+    rating: Mapped[float] = mapped_column(Float, nullable=False, default=1500.0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=func.now(), onupdate=func.now())
+
+
+class EloState(Base):
+    """Watermark of the last finished match applied to elo_ratings."""
+
+    __tablename__ = "elo_state"
+
+    key: Mapped[str] = mapped_column(String(50), primary_key=True)  # e.g. "football"
+    last_match_date: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    last_match_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    matches_processed: Mapped[int] = mapped_column(Integer, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=func.now(), onupdate=func.now())
+
+
+class PredictionCalibrationDaily(Base):
+    """Verified predictions aggregated per day for the calibration endpoint.
+
+    One row per (verification day, competition, bet type, confidence bucket);
+    rebuilt by CalibrationSummaryService.refresh after verification.
+    """
+
+    __tablename__ = "prediction_calibration_daily"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    competition_code: Mapped[str] = mapped_column(String(10), primary_key=True)  # '' if none
+    bet_type: Mapped[str] = mapped_column(String(10), primary_key=True)  # home_win, draw, away_win
+    bucket: Mapped[int] = mapped_column(SmallInteger, primary_key=True)  # -1 = no bucket
+    predictions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    correct: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    confidence_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=func.now(), onupdate=func.now())
+
+
+class AdaptiveWeightRecord(Base):
+    """Per-model prediction outcome feeding the adaptive ensemble weights.
+
+    Loaded into AdaptiveWeightCalculator at startup so its rolling window
+    survives restarts; appended after post-match verification.
+    """
+
+    __tablename__ = "adaptive_weight_records"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    model_name: Mapped[str] = mapped_column(String(50), nullable=False)  # poisson, elo, ...
+    match_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    prob_home: Mapped[float] = mapped_column(Float, nullable=False)
+    prob_draw: Mapped[float] = mapped_column(Float, nullable=False)
+    prob_away: Mapped[float] = mapped_column(Float, nullable=False)
+    actual_outcome: Mapped[str] = mapped_column(String(10), nullable=False)  # home, draw, away
+    prediction_date: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
+
+    __table_args__ = (
+        Index("ix_adaptive_weight_records_model_match", "model_name", "match_id", unique=True),
+    )
+
+
+class TeamFeatureSnapshot(Base):
+    """Team features after a finished match, one row per team and match.
+
+    ``as_of`` is the date of the team's last applied match; a match on date
+    D reads the latest snapshot with as_of < D. ``state`` holds the rolling
+    window (TeamFeatureState) so rest/congestion can be derived for any
+    later date and updates can continue incrementally.
+    """
+
+    __tablename__ = "team_feature_snapshots"
+
+    feature_version: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    team_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("teams.id", ondelete="CASCADE"), primary_key=True
+    )
+    as_of: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    matches_played: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    attack_strength: Mapped[float] = mapped_column(Float, nullable=False)
+    defense_strength: Mapped[float] = mapped_column(Float, nullable=False)
+    form: Mapped[float] = mapped_column(Float, nullable=False)  # 0-100
+    elo_rating: Mapped[float] = mapped_column(Float, nullable=False)  # Raw, unclamped
+    xg_for: Mapped[float | None] = mapped_column(Float, nullable=True)
+    xg_against: Mapped[float | None] = mapped_column(Float, nullable=True)
+    state: Mapped[str] = mapped_column(Text, nullable=False)  # JSON TeamFeatureState
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=func.now(), onupdate=func.now())
+
+
 class MLModel(Base):
     """Trained machine learning model storage."""
 
@@ -10,21 +10,86 @@ Migration mapping:
 - get_prediction_statistics() -> PredictionService.get_statistics()
 - get_all_predictions_stats() -> PredictionService.get_all_statistics()
 - save_prediction (route format) -> PredictionService.save_prediction_from_api()
+- many predictions (route format) -> PredictionService.save_predictions_bulk()
 """
 
+import json
 import logging
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from typing import Any
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import joinedload
 
+from src.core.cache import cache_delete_many
 from src.db.models import Match, Prediction
 from src.db.repositories import get_uow
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT ... ON CONFLICT statement in save_predictions_bulk
+BULK_SAVE_CHUNK_SIZE = 200
+
+
+def _api_prediction_values(prediction_data: dict[str, Any]) -> dict[str, Any]:
+    """Prediction column values from the route/prefill prediction format."""
+    # Parse probabilities
+    home_prob = Decimal(str(prediction_data.get("home_win_prob", 0)))
+    draw_prob = Decimal(str(prediction_data.get("draw_prob", 0)))
+    away_prob = Decimal(str(prediction_data.get("away_win_prob", 0)))
+    confidence = Decimal(str(prediction_data.get("confidence", 0)))
+
+    # Get recommendation (predicted outcome)
+    recommendation = prediction_data.get("recommendation", "")
+    # Map route format to internal format
+    outcome_map = {
+        "home_win": "home",
+        "draw": "draw",
+        "away_win": "away",
+        "home": "home",
+        "away": "away",
+    }
+    predicted_outcome = outcome_map.get(recommendation, recommendation)
+
+    # If no explicit recommendation, determine from probabilities
+    if not predicted_outcome:
+        if home_prob >= draw_prob and home_prob >= away_prob:
+            predicted_outcome = "home"
+        elif draw_prob >= home_prob and draw_prob >= away_prob:
+            predicted_outcome = "draw"
+        else:
+            predicted_outcome = "away"
+
+    # Prepare optional fields
+    key_factors = prediction_data.get("key_factors")
+    risk_factors = prediction_data.get("risk_factors")
+    value_score = prediction_data.get("value_score")
+    model_details = prediction_data.get("model_details")
+    llm_adjustments = prediction_data.get("llm_adjustments")
+
+    # Prepare match_context_summary and news_sources
+    match_context_summary = prediction_data.get("match_context_summary")
+    news_sources = prediction_data.get("news_sources")
+
+    return {
+        "home_prob": home_prob,
+        "draw_prob": draw_prob,
+        "away_prob": away_prob,
+        "predicted_outcome": predicted_outcome,
+        "confidence": confidence,
+        "explanation": prediction_data.get("explanation"),
+        "key_factors": json.dumps(key_factors) if key_factors is not None else None,
+        "risk_factors": json.dumps(risk_factors) if risk_factors is not None else None,
+        "value_score": Decimal(str(value_score)) if value_score else None,
+        "model_details": json.dumps(model_details) if model_details else None,
+        "llm_adjustments": json.dumps(llm_adjustments) if llm_adjustments else None,
+        "match_context_summary": match_context_summary if match_context_summary else None,
+        "news_sources": json.dumps(news_sources) if news_sources is not None else None,
+        "input_fingerprint": prediction_data.get("input_fingerprint"),
+    }
+
 
 class PredictionService:
     """Service for prediction-related operations."""
@@ -272,12 +337,26 @@ class PredictionService:
                         verified_count += 1
 
                 logger.info(f"Verified {verified_count} predictions")
-                return verified_count
+
+            if verified_count:
+                await PredictionService.refresh_calibration_summary()
+            return verified_count
 
         except Exception as e:
             logger.error(f"Error verifying finished matches: {e}")
             return 0
 
+    @staticmethod
+    async def refresh_calibration_summary() -> None:
+        """Recompute today's calibration summary rows after new verifications."""
+        from src.services.calibration_service import CalibrationSummaryService
+
+        try:
+            # Yesterday too, in case verification ran across midnight
+            await CalibrationSummaryService.refresh(since=date.today() - timedelta(days=1))
+        except Exception as e:
+            logger.warning(f"Calibration summary refresh failed: {e}")
+
     @staticmethod
     async def get_statistics(days: int = 30) -> dict[str, Any]:
         """Calculate prediction performance statistics.
@@ -460,6 +539,7 @@ class PredictionService:
         - home_team, away_team, competition_code, match_date
         - home_win_prob, draw_prob, away_win_prob
         - confidence, recommendation, explanation
+        - input_fingerprint (prefill only; None marks the prediction for recompute)
 
         Args:
             prediction_data: Dict with prediction data from API route.
@@ -486,63 +566,9 @@ class PredictionService:
                     logger.warning(f"Match {match_id} not found, cannot save prediction")
                     return False
 
-                # Parse probabilities
-                home_prob = Decimal(str(prediction_data.get("home_win_prob", 0)))
-                draw_prob = Decimal(str(prediction_data.get("draw_prob", 0)))
-                away_prob = Decimal(str(prediction_data.get("away_win_prob", 0)))
-                confidence = Decimal(str(prediction_data.get("confidence", 0)))
-
-                # Get recommendation (predicted outcome)
-                recommendation = prediction_data.get("recommendation", "")
-                # Map route format to internal format
-                outcome_map = {
-                    "home_win": "home",
-                    "draw": "draw",
-                    "away_win": "away",
-                    "home": "home",
-                    "away": "away",
-                }
-                predicted_outcome = outcome_map.get(recommendation, recommendation)
-
-                # If no explicit recommendation, determine from probabilities
-                if not predicted_outcome:
-                    if home_prob >= draw_prob and home_prob >= away_prob:
-                        predicted_outcome = "home"
-                    elif draw_prob >= home_prob and draw_prob >= away_prob:
-                        predicted_outcome = "draw"
-                    else:
-                        predicted_outcome = "away"
-
-                # Prepare optional fields
-                import json
-
-                key_factors = prediction_data.get("key_factors")
-                risk_factors = prediction_data.get("risk_factors")
-                value_score = prediction_data.get("value_score")
-                model_details = prediction_data.get("model_details")
-                llm_adjustments = prediction_data.get("llm_adjustments")
-
-                # Prepare match_context_summary and news_sources
-                match_context_summary = prediction_data.get("match_context_summary")
-                news_sources = prediction_data.get("news_sources")
-
                 # Upsert the prediction with all LLM-generated content and model details
                 await uow.predictions.upsert(
-                    "match_id",
-                    match.id,
-                    home_prob=home_prob,
-                    draw_prob=draw_prob,
-                    away_prob=away_prob,
-                    predicted_outcome=predicted_outcome,
-                    confidence=confidence,
-                    explanation=prediction_data.get("explanation"),
-                    key_factors=json.dumps(key_factors) if key_factors is not None else None,
-                    risk_factors=json.dumps(risk_factors) if risk_factors is not None else None,
-                    value_score=Decimal(str(value_score)) if value_score else None,
-                    model_details=json.dumps(model_details) if model_details else None,
-                    llm_adjustments=json.dumps(llm_adjustments) if llm_adjustments else None,
-                    match_context_summary=match_context_summary if match_context_summary else None,
-                    news_sources=(json.dumps(news_sources) if news_sources is not None else None),
+                    "match_id", match.id, **_api_prediction_values(prediction_data)
                 )
 
                 await uow.commit()
@@ -553,6 +579,89 @@ class PredictionService:
             logger.error(f"Error saving prediction from API: {e}")
             return False
 
+    @staticmethod
+    async def save_predictions_bulk(predictions: list[dict[str, Any]]) -> int:
+        """Save many predictions in the save_prediction_from_api format at once.
+
+        Resolves all matches (by id, else external_id) in two queries, writes
+        the rows with chunked INSERT ... ON CONFLICT (match_id) DO UPDATE in a
+        single transaction, then drops the cached prediction:{match_id} keys
+        in one pipelined Redis call.
+
+        Args:
+            predictions: Dicts with prediction data, as for save_prediction_from_api.
+
+        Returns:
+            Number of predictions saved (0 on error).
+        """
+        if not predictions:
+            return 0
+
+        try:
+            async with get_uow() as uow:
+                ids = {p["match_id"] for p in predictions if p.get("match_id")}
+                result = await uow.session.execute(select(Match.id).where(Match.id.in_(ids)))
+                known_ids = set(result.scalars().all())
+
+                # Try external_id for ids that are not ours
+                external_ids = {
+                    p["match_external_id"]
+                    for p in predictions
+                    if p.get("match_id") not in known_ids and p.get("match_external_id")
+                }
+                by_external: dict[str, int] = {}
+                if external_ids:
+                    result = await uow.session.execute(
+                        select(Match.external_id, Match.id).where(
+                            Match.external_id.in_(external_ids)
+                        )
+                    )
+                    by_external = {row.external_id: row.id for row in result}
+
+                # One row per match (last payload wins): a statement cannot update a row twice
+                rows: dict[int, dict[str, Any]] = {}
+                for prediction_data in predictions:
+                    match_id = prediction_data.get("match_id")
+                    if match_id not in known_ids:
+                        match_id = by_external.get(prediction_data.get("match_external_id", ""))
+                    if match_id is None:
+                        logger.warning(
+                            f"Match {prediction_data.get('match_id')} not found, "
+                            "cannot save prediction"
+                        )
+                        continue
+                    rows[match_id] = {
+                        "match_id": match_id,
+                        **_api_prediction_values(prediction_data),
+                    }
+
+                values = list(rows.values())
+                for start in range(0, len(values), BULK_SAVE_CHUNK_SIZE):
+                    stmt = pg_insert(Prediction).values(
+                        values[start : start + BULK_SAVE_CHUNK_SIZE]
+                    )
+                    updated = {
+                        column: stmt.excluded[column]
+                        for column in values[0]
+                        if column != "match_id"
+                    }
+                    await uow.session.execute(
+                        stmt.on_conflict_do_update(
+                            index_elements=[Prediction.match_id],
+                            set_={**updated, "updated_at": func.now()},
+                        )
+                    )
+
+                await uow.commit()
+
+            await cache_delete_many([f"prediction:{match_id}" for match_id in rows])
+            logger.info(f"Saved {len(rows)} predictions in bulk")
+            return len(rows)
+
+        except Exception as e:
+            logger.error(f"Error saving predictions in bulk: {e}")
+            return 0
+
     @staticmethod
     async def get_all_statistics(days: int = 30) -> dict[str, Any]:
         """Get statistics for all predictions (including unverified).
@@ -21,6 +21,7 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 from src.core.config import settings
 from src.core.exceptions import LLMError, RateLimitError
 from src.core.http_client import get_http_client
+from src.llm.rate_limiter import groq_rate_limiter
 
 
 class LLMResponse(BaseModel):
@@ -75,6 +76,7 @@ class GroqClient:
 
         Includes:
         - Automatic retry on transient failures
+        - Client-side RPM/TPM pacing (shared groq_rate_limiter)
         - Rate limit detection with backoff
         - Detailed error logging
         - Response validation
@@ -89,6 +91,9 @@ class GroqClient:
         if response_format:
             payload["response_format"] = response_format
 
+        prompt_chars = sum(len(m.get("content") or "") for m in messages)
+        await groq_rate_limiter.acquire(groq_rate_limiter.estimate_tokens(prompt_chars, max_tokens))
+
         client = get_http_client()
         try:
             response = await client.post(
@@ -100,6 +105,10 @@ class GroqClient:
 
             if response.status_code == 429:
                 retry_after = response.headers.get("Retry-After", "unknown")
+                try:
+                    groq_rate_limiter.pause(float(retry_after))
+                except ValueError:
+                    pass
                 raise RateLimitError(
                     "Groq rate limit exceeded - waiting before retry",
                     details={"retry_after": retry_after, "model": model},
@@ -20,7 +20,7 @@ from typing import Any, Literal
 
 from pydantic import BaseModel
 
-from src.core.cache import cache_get, cache_set
+from src.core.cache import cache_get, cache_get_many, cache_set, cache_set_many
 from src.llm.client import GroqClient, get_llm_client
 
 logger = logging.getLogger(__name__)
@@ -217,13 +217,12 @@ class EntityExtractionService:
         batch: list[dict[str, str]],
     ) -> list[ArticleEntities]:
         """Extract entities from a single batch of articles."""
-        # Check cache for each article
+        # Check cache for all articles in one round trip
         cached_results: dict[int, ArticleEntities] = {}
         uncached_indices: list[int] = []
+        cache_keys = [self._cache_key("batch", article) for article in batch]
 
-        for idx, article in enumerate(batch):
-            cache_key = self._cache_key("batch", article)
-            cached = await cache_get(cache_key)
+        for idx, cached in enumerate(await cache_get_many(cache_keys)):
             if cached:
                 try:
                     cached_results[idx] = ArticleEntities.model_validate_json(cached)
@@ -242,11 +241,12 @@ class EntityExtractionService:
 
         # Cache new results
         for idx_offset, result in enumerate(llm_results):
-            original_idx = uncached_indices[idx_offset]
-            cached_results[original_idx] = result
-            cache_key = self._cache_key("batch", batch[original_idx])
-            ttl = self.CACHE_TTL_BATCH if self.llm_client else self.CACHE_TTL_FALLBACK
-            await cache_set(cache_key, result.model_dump_json(), ttl)
+            cached_results[uncached_indices[idx_offset]] = result
+        ttl = self.CACHE_TTL_BATCH if self.llm_client else self.CACHE_TTL_FALLBACK
+        await cache_set_many(
+            {cache_keys[idx]: cached_results[idx].model_dump_json() for idx in uncached_indices},
+            ttl,
+        )
 
         return [cached_results[i] for i in range(len(batch))]
 
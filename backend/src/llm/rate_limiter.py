@@ -0,0 +1,113 @@
+"""Token-bucket rate limiting for Groq requests.
+
+Groq enforces limits per minute on both requests and tokens. Callers used to
+space their calls with fixed ``asyncio.sleep`` pauses, which wastes time
+when calls are sparse and still overruns the token limit with long prompts.
+GroqRateLimiter keeps one bucket per limit; every Groq request takes one
+request and its estimated tokens before it is sent, waiting only as long as
+needed for the buckets to refill. The limiter is shared process-wide, so
+concurrent callers (prefill pipeline, API routes) respect the same budget.
+"""
+
+import asyncio
+import logging
+import time
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Rough prompt size estimate: ~4 characters per token
+CHARS_PER_TOKEN = 4
+
+
+class TokenBucket:
+    """Continuous-refill token bucket (no locking, see GroqRateLimiter)."""
+
+    def __init__(self, capacity: float, per_minute: float):
+        """
+        Initialize the bucket, full.
+
+        Args:
+            capacity: Maximum tokens held (burst size)
+            per_minute: Refill rate
+        """
+        self.capacity = capacity
+        self.rate = per_minute / 60.0
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` tokens are available (0 if available now)."""
+        self._refill(now)
+        amount = min(amount, self.capacity)  # Oversized requests wait for a full bucket
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def take(self, amount: float) -> None:
+        self.tokens -= min(amount, self.capacity)
+
+
+class GroqRateLimiter:
+    """Request and token budget per minute, shared by all Groq calls."""
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        """
+        Initialize the limiter.
+
+        Args:
+            requests_per_minute: Groq request limit (RPM)
+            tokens_per_minute: Groq token limit (TPM), prompt + completion
+        """
+        self.requests = TokenBucket(requests_per_minute, requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute, tokens_per_minute)
+        self._lock = asyncio.Lock()
+        self._paused_until = 0.0
+
+    @staticmethod
+    def estimate_tokens(prompt_chars: int, max_tokens: int) -> int:
+        """Tokens a request may use: estimated prompt tokens plus the completion limit."""
+        return prompt_chars // CHARS_PER_TOKEN + max_tokens
+
+    async def acquire(self, tokens: int) -> float:
+        """
+        Wait until one request and ``tokens`` tokens fit in the budget, then take them.
+
+        Callers are served in arrival order (the lock is held while waiting).
+
+        Returns:
+            Seconds waited
+        """
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                delay = max(
+                    self._paused_until - now,
+                    self.requests.wait_time(1, now),
+                    self.tokens.wait_time(tokens, now),
+                )
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+                waited += delay
+            self.requests.take(1)
+            self.tokens.take(tokens)
+        if waited:
+            logger.debug(f"Groq rate limiter waited {waited:.1f}s")
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for ``seconds`` (e.g. after a 429 with Retry-After)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+groq_rate_limiter = GroqRateLimiter(
+    requests_per_minute=settings.groq_requests_per_minute,
+    tokens_per_minute=settings.groq_tokens_per_minute,
+)
@@ -22,12 +22,24 @@ Usage:
     result = get_ml_prediction(home_team_id=1, away_team_id=2)
 """
 
-from .model_loader import TrainedModelLoader, get_ml_prediction, model_loader
+from .model_loader import (
+    MicroBatcher,
+    TrainedModelLoader,
+    get_ml_prediction,
+    get_ml_prediction_async,
+    get_ml_predictions_batch,
+    ml_batcher,
+    model_loader,
+)
 from .pipeline import ml_pipeline, run_pipeline_now, start_ml_scheduler
 
 __all__ = [
     "get_ml_prediction",
+    "get_ml_prediction_async",
+    "get_ml_predictions_batch",
     "model_loader",
+    "ml_batcher",
+    "MicroBatcher",
     "TrainedModelLoader",
     "ml_pipeline",
     "start_ml_scheduler",
@@ -3,14 +3,24 @@ HuggingFace ML Service Client
 
 Calls the HuggingFace Space for ML predictions instead of loading models locally.
 This reduces memory usage on Render (512MB limit).
+
+Requests go through pooled connections (the shared async client from
+src.core.http_client, or one pooled sync client for worker threads). A
+circuit breaker stops calling the Space after repeated failures, and
+availability comes from a health state refreshed in the background (see the
+scheduler job in src.api.main), so checking it never blocks a request.
 """
 
 import logging
 import os
+import threading
+import time
 from typing import Any
 
 import httpx
 
+from src.core.http_client import get_http_client
+
 logger = logging.getLogger(__name__)
 
 # HuggingFace Space URL
@@ -19,9 +29,98 @@ HF_ML_SERVICE_URL = os.getenv("HF_ML_SERVICE_URL", "https://jdevot244-paris-spor
 # Timeout for ML requests (training can take longer)
 PREDICT_TIMEOUT = 30.0
 TRAIN_TIMEOUT = 300.0  # 5 minutes for training
+HEALTH_TIMEOUT = 10.0
+
+# Rows per POST /predict/batch call (the Space accepts up to its MAX_BATCH_SIZE, 200 by default)
+PREDICT_BATCH_SIZE = 200
+
+# Background health probe interval (seconds)
+HEALTH_PROBE_INTERVAL = 60
 
-# Cache for service availability
-_hf_service_available: bool | None = None
+# Circuit breaker: open after this many consecutive failures, retry after the cool-down
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_RESET_TIMEOUT = 60.0
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a failing service for a cool-down period.
+
+    Closed: calls pass. After ``failure_threshold`` consecutive failures it
+    opens and rejects calls for ``reset_timeout`` seconds; then it is half-open
+    and lets a single trial call through. A success closes it again, a
+    failure reopens it. Thread-safe (the sync client runs in worker threads).
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """'closed', 'open' or 'half_open'."""
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at < self.reset_timeout:
+            return "open"
+        return "half_open"
+
+    def is_open(self) -> bool:
+        """True while calls are rejected (cooling down, or a trial call is running)."""
+        state = self.state
+        return state == "open" or (state == "half_open" and self._trial_in_flight)
+
+    def allow(self) -> bool:
+        """Whether a call may go out now (takes the trial slot when half-open)."""
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "open" or self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.failures >= self.failure_threshold or self.opened_at is not None:
+                if self.opened_at is None:
+                    logger.warning(
+                        f"HuggingFace ML service failing, pausing calls for {self.reset_timeout:.0f}s"
+                    )
+                self.opened_at = time.monotonic()
+
+
+# Pooled sync client for predict_sync (worker threads, scripts)
+_sync_client: httpx.Client | None = None
+_sync_client_lock = threading.Lock()
+
+
+def _get_sync_client() -> httpx.Client:
+    global _sync_client
+    with _sync_client_lock:
+        if _sync_client is None or _sync_client.is_closed:
+            _sync_client = httpx.Client(
+                timeout=httpx.Timeout(PREDICT_TIMEOUT, connect=5.0),
+                limits=httpx.Limits(max_connections=5, max_keepalive_connections=2),
+            )
+        return _sync_client
 
 
 class HuggingFaceMLClient:
@@ -29,27 +128,103 @@ class HuggingFaceMLClient:
 
     def __init__(self, base_url: str = HF_ML_SERVICE_URL):
         self.base_url = base_url.rstrip("/")
+        self.breaker = CircuitBreaker()
+        # None until the first health check
+        self.healthy: bool | None = None
+        self.last_health_check: float | None = None
+        # False once the Space answered /predict/batch with 404 (older deployment)
+        self.batch_supported = True
+
+    def _record_health(self, result: dict) -> dict:
+        self.healthy = result.get("status") == "healthy"
+        self.last_health_check = time.monotonic()
+        if self.healthy:
+            self.breaker.record_success()
+        return result
 
     async def health_check(self) -> dict:
-        """Check if ML service is healthy."""
+        """Check if ML service is healthy (updates the availability state)."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.base_url}/health")
-                return response.json()
+            response = await get_http_client().get(
+                f"{self.base_url}/health", timeout=HEALTH_TIMEOUT
+            )
+            return self._record_health(response.json())
         except Exception as e:
-            logger.error(f"ML service health check failed: {e}")
-            return {"status": "error", "message": str(e)}
+            logger.warning(f"ML service health check failed: {e}")
+            return self._record_health({"status": "error", "message": str(e)})
 
     async def get_models_status(self) -> dict:
         """Get status of loaded models."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.base_url}/models")
-                return response.json()
+            response = await get_http_client().get(
+                f"{self.base_url}/models", timeout=HEALTH_TIMEOUT
+            )
+            return response.json()
         except Exception as e:
             logger.error(f"Failed to get models status: {e}")
             return {"error": str(e)}
 
+    @staticmethod
+    def _predict_payload(
+        home_attack: float,
+        home_defense: float,
+        away_attack: float,
+        away_defense: float,
+        home_elo: float,
+        away_elo: float,
+        home_form: float,
+        away_form: float,
+        home_rest_days: float,
+        away_rest_days: float,
+        home_fixture_congestion: float,
+        away_fixture_congestion: float,
+    ) -> dict[str, float]:
+        return {
+            "home_attack": home_attack,
+            "home_defense": home_defense,
+            "away_attack": away_attack,
+            "away_defense": away_defense,
+            "home_elo": home_elo,
+            "away_elo": away_elo,
+            "home_form": home_form,
+            "away_form": away_form,
+            "home_rest_days": home_rest_days,
+            "away_rest_days": away_rest_days,
+            "home_fixture_congestion": home_fixture_congestion,
+            "away_fixture_congestion": away_fixture_congestion,
+        }
+
+    def _record_response(self, response: httpx.Response) -> None:
+        # Any non-5xx answer means the Space is reachable; this also releases a half-open trial
+        if response.status_code >= 500:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+
+    def _handle_predict_response(self, response: httpx.Response) -> dict[str, Any] | None:
+        self._record_response(response)
+        if response.status_code == 200:
+            return response.json()
+        logger.warning(f"ML prediction failed: {response.status_code}")
+        return None
+
+    def _handle_batch_response(
+        self, response: httpx.Response, size: int
+    ) -> list[dict[str, Any]] | None:
+        if response.status_code in (404, 405):
+            logger.info("HuggingFace ML service has no batch endpoint, predicting per row")
+            self.breaker.record_success()
+            self.batch_supported = False
+            return None
+        predictions = self._handle_predict_response(response)
+        if predictions is None:
+            return None
+        predictions = predictions.get("predictions") or []
+        if len(predictions) != size:
+            logger.warning(f"ML batch prediction returned {len(predictions)} rows for {size}")
+            return None
+        return predictions
+
     async def predict(
         self,
         home_attack: float,
@@ -70,47 +245,86 @@ class HuggingFaceMLClient:
 
         Returns:
             Dict with xgboost, random_forest, and ensemble predictions
-            or None if service is unavailable.
+            or None if service is unavailable (or the circuit is open).
         """
+        if not self.breaker.allow():
+            return None
+
         try:
-            async with httpx.AsyncClient(timeout=PREDICT_TIMEOUT) as client:
-                response = await client.post(
-                    f"{self.base_url}/predict",
-                    json={
-                        "home_attack": home_attack,
-                        "home_defense": home_defense,
-                        "away_attack": away_attack,
-                        "away_defense": away_defense,
-                        "home_elo": home_elo,
-                        "away_elo": away_elo,
-                        "home_form": home_form,
-                        "away_form": away_form,
-                        "home_rest_days": home_rest_days,
-                        "away_rest_days": away_rest_days,
-                        "home_fixture_congestion": home_fixture_congestion,
-                        "away_fixture_congestion": away_fixture_congestion,
-                    },
-                )
-
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    logger.warning(f"ML prediction failed: {response.status_code}")
-                    return None
+            response = await get_http_client().post(
+                f"{self.base_url}/predict",
+                json=self._predict_payload(
+                    home_attack,
+                    home_defense,
+                    away_attack,
+                    away_defense,
+                    home_elo,
+                    away_elo,
+                    home_form,
+                    away_form,
+                    home_rest_days,
+                    away_rest_days,
+                    home_fixture_congestion,
+                    away_fixture_congestion,
+                ),
+                timeout=PREDICT_TIMEOUT,
+            )
+            return self._handle_predict_response(response)
 
         except httpx.TimeoutException:
             logger.warning("ML prediction timed out")
+            self.breaker.record_failure()
             return None
         except Exception as e:
             logger.error(f"ML prediction error: {e}")
+            self.breaker.record_failure()
             return None
 
+    async def _predict_chunk(self, rows: list[dict[str, float]]) -> list[dict[str, Any]] | None:
+        if not self.breaker.allow():
+            return None
+        try:
+            response = await get_http_client().post(
+                f"{self.base_url}/predict/batch", json={"rows": rows}, timeout=PREDICT_TIMEOUT
+            )
+            return self._handle_batch_response(response, len(rows))
+        except httpx.TimeoutException:
+            logger.warning("ML batch prediction timed out")
+            self.breaker.record_failure()
+            return None
+        except Exception as e:
+            logger.error(f"ML batch prediction error: {e}")
+            self.breaker.record_failure()
+            return None
+
+    async def predict_batch(self, rows: list[dict[str, float]]) -> list[dict[str, Any] | None]:
+        """
+        Get ML predictions for many matches, PREDICT_BATCH_SIZE rows per call.
+
+        Args:
+            rows: predict() keyword arguments per match (missing optional
+                features take the Space defaults)
+
+        Returns:
+            One result per row, in order: the predict() dict (xgboost,
+            random_forest, ensemble) or None where the call failed.
+        """
+        results: list[dict[str, Any] | None] = []
+        for start in range(0, len(rows), PREDICT_BATCH_SIZE):
+            chunk = rows[start : start + PREDICT_BATCH_SIZE]
+            predictions = await self._predict_chunk(chunk) if self.batch_supported else None
+            if predictions is None and not self.batch_supported:
+                predictions = [await self.predict(**row) for row in chunk]
+            results.extend(predictions or [None] * len(chunk))
+        return results
+
     async def trigger_training(self) -> dict:
         """Trigger auto-training on HuggingFace service."""
         try:
-            async with httpx.AsyncClient(timeout=TRAIN_TIMEOUT) as client:
-                response = await client.post(f"{self.base_url}/train/auto")
-                return response.json()
+            response = await get_http_client().post(
+                f"{self.base_url}/train/auto", timeout=TRAIN_TIMEOUT
+            )
+            return response.json()
         except Exception as e:
             logger.error(f"Failed to trigger training: {e}")
             return {"status": "error", "message": str(e)}
@@ -118,9 +332,10 @@ class HuggingFaceMLClient:
     async def get_training_status(self) -> dict:
         """Get current training status."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.base_url}/train/status")
-                return response.json()
+            response = await get_http_client().get(
+                f"{self.base_url}/train/status", timeout=HEALTH_TIMEOUT
+            )
+            return response.json()
         except Exception as e:
             logger.error(f"Failed to get training status: {e}")
             return {"status": "error", "message": str(e)}
@@ -141,79 +356,101 @@ class HuggingFaceMLClient:
         away_fixture_congestion: float = 0.0,
     ) -> dict[str, Any] | None:
         """
-        Synchronous version of predict for use in non-async contexts.
+        Blocking version of predict for worker threads and scripts.
+
+        Do not call it on the event loop; async code uses predict().
 
         Returns:
             Dict with xgboost, random_forest, and ensemble predictions
-            or None if service is unavailable.
+            or None if service is unavailable (or the circuit is open).
         """
-        global _hf_service_available
-
-        # Skip if we know service is down
-        if _hf_service_available is False:
+        if not self.breaker.allow():
             return None
 
         try:
-            with httpx.Client(timeout=PREDICT_TIMEOUT) as client:
-                response = client.post(
-                    f"{self.base_url}/predict",
-                    json={
-                        "home_attack": home_attack,
-                        "home_defense": home_defense,
-                        "away_attack": away_attack,
-                        "away_defense": away_defense,
-                        "home_elo": home_elo,
-                        "away_elo": away_elo,
-                        "home_form": home_form,
-                        "away_form": away_form,
-                        "home_rest_days": home_rest_days,
-                        "away_rest_days": away_rest_days,
-                        "home_fixture_congestion": home_fixture_congestion,
-                        "away_fixture_congestion": away_fixture_congestion,
-                    },
-                )
-
-                if response.status_code == 200:
-                    _hf_service_available = True
-                    return response.json()
-                else:
-                    logger.warning(f"ML prediction failed: {response.status_code}")
-                    return None
+            response = _get_sync_client().post(
+                f"{self.base_url}/predict",
+                json=self._predict_payload(
+                    home_attack,
+                    home_defense,
+                    away_attack,
+                    away_defense,
+                    home_elo,
+                    away_elo,
+                    home_form,
+                    away_form,
+                    home_rest_days,
+                    away_rest_days,
+                    home_fixture_congestion,
+                    away_fixture_congestion,
+                ),
+            )
+            return self._handle_predict_response(response)
 
         except httpx.TimeoutException:
             logger.warning("ML prediction timed out")
+            self.breaker.record_failure()
             return None
         except httpx.ConnectError:
             logger.warning("HuggingFace ML service unavailable")
-            _hf_service_available = False
+            self.breaker.record_failure()
+            self.healthy = False
             return None
         except Exception as e:
             logger.error(f"ML prediction error: {e}")
+            self.breaker.record_failure()
             return None
 
-    def health_check_sync(self) -> dict:
-        """Synchronous health check."""
-        global _hf_service_available
+    def _predict_chunk_sync(self, rows: list[dict[str, float]]) -> list[dict[str, Any]] | None:
+        if not self.breaker.allow():
+            return None
+        try:
+            response = _get_sync_client().post(
+                f"{self.base_url}/predict/batch", json={"rows": rows}
+            )
+            return self._handle_batch_response(response, len(rows))
+        except httpx.TimeoutException:
+            logger.warning("ML batch prediction timed out")
+            self.breaker.record_failure()
+            return None
+        except httpx.ConnectError:
+            logger.warning("HuggingFace ML service unavailable")
+            self.breaker.record_failure()
+            self.healthy = False
+            return None
+        except Exception as e:
+            logger.error(f"ML batch prediction error: {e}")
+            self.breaker.record_failure()
+            return None
+
+    def predict_batch_sync(self, rows: list[dict[str, float]]) -> list[dict[str, Any] | None]:
+        """Blocking version of predict_batch for worker threads and scripts."""
+        results: list[dict[str, Any] | None] = []
+        for start in range(0, len(rows), PREDICT_BATCH_SIZE):
+            chunk = rows[start : start + PREDICT_BATCH_SIZE]
+            predictions = self._predict_chunk_sync(chunk) if self.batch_supported else None
+            if predictions is None and not self.batch_supported:
+                predictions = [self.predict_sync(**row) for row in chunk]
+            results.extend(predictions or [None] * len(chunk))
+        return results
 
+    def health_check_sync(self) -> dict:
+        """Blocking health check (scripts); the app refreshes health in the background."""
         try:
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(f"{self.base_url}/health")
-                result = response.json()
-                _hf_service_available = result.get("status") == "healthy"
-                return result
+            response = _get_sync_client().get(f"{self.base_url}/health", timeout=HEALTH_TIMEOUT)
+            return self._record_health(response.json())
         except Exception as e:
-            _hf_service_available = False
             logger.error(f"ML service health check failed: {e}")
-            return {"status": "error", "message": str(e)}
+            return self._record_health({"status": "error", "message": str(e)})
 
     def is_available(self) -> bool:
-        """Check if HuggingFace ML service is available."""
-        global _hf_service_available
-
-        if _hf_service_available is None:
-            self.health_check_sync()
+        """
+        Whether the HuggingFace ML service can be called now.
 
-        return _hf_service_available or False
+        Reads the last health check and the circuit breaker, without any
+        network call; False until a health check has succeeded.
+        """
+        return self.healthy is True and not self.breaker.is_open()
 
 
 # Singleton instance
@@ -228,6 +465,16 @@ def get_hf_ml_client() -> HuggingFaceMLClient:
     return _client
 
 
+async def probe_hf_ml_service() -> bool:
+    """Refresh the HuggingFace service health state (scheduled background job)."""
+    client = get_hf_ml_client()
+    was_healthy = client.healthy
+    await client.health_check()
+    if client.healthy != was_healthy:
+        logger.info(f"HuggingFace ML service {'healthy' if client.healthy else 'unavailable'}")
+    return bool(client.healthy)
+
+
 async def get_ml_prediction_from_hf(
     home_attack: float, home_defense: float, away_attack: float, away_defense: float, **kwargs
 ) -> dict[str, float] | None:
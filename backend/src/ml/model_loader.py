@@ -6,15 +6,24 @@ Provides a unified interface for predictions.
 Supports two feature sets:
 - Legacy (7 features): attack/defense/form/h2h
 - Extended (19 features): + fatigue + interaction features
+
+Async callers go through get_ml_prediction_async: concurrent requests are
+micro-batched (MicroBatcher) into one predict_proba call per model, run in a
+worker thread so the event loop is never blocked.
 """
 
+import asyncio
+import hashlib
 import logging
+import os
 import pickle
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
+from src.prediction_engine.team_features import average_goals, form_score
+
 logger = logging.getLogger(__name__)
 
 # Feature set versions
@@ -24,6 +33,12 @@ FEATURE_SET_EXTENDED = 19
 ML_DIR = Path(__file__).parent
 MODELS_DIR = ML_DIR / "trained_models"
 
+# Micro-batching of async predictions: a batch runs when it is full or
+# ML_BATCH_MAX_WAIT seconds after its first request
+ML_MICRO_BATCHING = os.getenv("ML_MICRO_BATCHING", "true").lower() != "false"
+ML_BATCH_MAX_SIZE = 64
+ML_BATCH_MAX_WAIT = 0.005
+
 
 class TrainedModelLoader:
     """Loads and manages trained ML models."""
@@ -45,6 +60,7 @@ class TrainedModelLoader:
         self.xgb_model: Any = None
         self.rf_model: Any = None
         self.feature_state: Any = None
+        self.model_version = "untrained"
         self._load_models()
         TrainedModelLoader._initialized = True
 
@@ -80,6 +96,18 @@ class TrainedModelLoader:
             except Exception as e:
                 logger.warning(f"Failed to load feature state: {e}")
 
+        self.model_version = self._files_version((xgb_path, rf_path, fe_path))
+
+    @staticmethod
+    def _files_version(paths: tuple[Path, ...]) -> str:
+        """Short identifier of the model files on disk (name, size, mtime); changes on retrain."""
+        stamps = [
+            f"{p.name}:{p.stat().st_size}:{p.stat().st_mtime_ns}" for p in paths if p.exists()
+        ]
+        if not stamps:
+            return "untrained"
+        return hashlib.sha256("|".join(stamps).encode()).hexdigest()[:12]
+
     def reload_models(self) -> None:
         """Reload models from disk (useful after retraining)."""
         TrainedModelLoader._initialized = False
@@ -111,23 +139,11 @@ class TrainedModelLoader:
         if not goals_scored:
             return None
 
-        # Calculate attack/defense strength
-        recent_scored = goals_scored[-10:] if goals_scored else []
-        recent_conceded = goals_conceded[-10:] if goals_conceded else []
-        recent_results = results[-5:] if results else []
-
-        attack = sum(recent_scored) / len(recent_scored) if recent_scored else 1.3
-        defense = sum(recent_conceded) / len(recent_conceded) if recent_conceded else 1.3
-
-        # Form calculation
-        form_points = sum(3 if r == 0 else (1 if r == 1 else 0) for r in recent_results)
-        max_points = len(recent_results) * 3
-        form = (form_points / max_points * 100) if max_points > 0 else 50
-
+        # Same definitions as training (src.prediction_engine.team_features)
         return {
-            "attack_strength": attack,
-            "defense_strength": defense,
-            "form": form,
+            "attack_strength": average_goals(goals_scored),
+            "defense_strength": average_goals(goals_conceded),
+            "form": form_score(results),
             "matches_played": len(goals_scored),
         }
 
@@ -195,6 +211,85 @@ class TrainedModelLoader:
         Returns:
             Feature array sized for the loaded model
         """
+        row = self._feature_row(
+            home_team_id,
+            away_team_id,
+            home_attack,
+            home_defense,
+            away_attack,
+            away_defense,
+            home_form,
+            away_form,
+            home_rest_days,
+            home_congestion,
+            away_rest_days,
+            away_congestion,
+            self._get_expected_feature_count(),
+        )
+        return np.array([row])
+
+    def create_features_batch(
+        self,
+        home_team_ids: list[int],
+        away_team_ids: list[int],
+        home_attack: np.ndarray,
+        home_defense: np.ndarray,
+        away_attack: np.ndarray,
+        away_defense: np.ndarray,
+        home_form: np.ndarray,
+        away_form: np.ndarray,
+        home_rest_days: np.ndarray,
+        home_congestion: np.ndarray,
+        away_rest_days: np.ndarray,
+        away_congestion: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Create a stacked feature matrix, one row per match.
+
+        Same per-row logic as create_features; the expected feature count is
+        resolved once for the whole batch.
+
+        Returns:
+            Feature matrix of shape (N, feature_count)
+        """
+        expected_features = self._get_expected_feature_count()
+        rows = [
+            self._feature_row(
+                home_team_ids[i],
+                away_team_ids[i],
+                float(home_attack[i]),
+                float(home_defense[i]),
+                float(away_attack[i]),
+                float(away_defense[i]),
+                float(home_form[i]),
+                float(away_form[i]),
+                float(home_rest_days[i]),
+                float(home_congestion[i]),
+                float(away_rest_days[i]),
+                float(away_congestion[i]),
+                expected_features,
+            )
+            for i in range(len(home_team_ids))
+        ]
+        return np.array(rows, dtype=np.float64).reshape(len(rows), expected_features)
+
+    def _feature_row(
+        self,
+        home_team_id: int,
+        away_team_id: int,
+        home_attack: float,
+        home_defense: float,
+        away_attack: float,
+        away_defense: float,
+        home_form: float,
+        away_form: float,
+        home_rest_days: float,
+        home_congestion: float,
+        away_rest_days: float,
+        away_congestion: float,
+        expected_features: int,
+    ) -> list[float]:
+        """Build a single feature row (legacy or extended layout)."""
         # Try to use historical data
         if self.feature_state:
             home_stats = self.get_team_stats(home_team_id)
@@ -226,9 +321,6 @@ class TrainedModelLoader:
         home_form_norm = home_form / 100.0
         away_form_norm = away_form / 100.0
 
-        # Check which feature set the model expects
-        expected_features = self._get_expected_feature_count()
-
         if expected_features >= FEATURE_SET_EXTENDED:
             # Extended feature set (19 features)
             # Base features (7)
@@ -265,65 +357,18 @@ class TrainedModelLoader:
                 away_attack * away_fatigue_combined,  # away_attack_fatigue
             ]
 
-            return np.array([base + fatigue + interactions])
-
-        else:
-            # Legacy feature set (7 features)
-            return np.array(
-                [
-                    [
-                        home_attack,
-                        home_defense,
-                        away_attack,
-                        away_defense,
-                        home_form_norm,
-                        away_form_norm,
-                        h2h,
-                    ]
-                ]
-            )
-
-    def predict_xgboost(self, features: np.ndarray) -> tuple[np.ndarray, float] | None:
-        """
-        Make prediction with XGBoost model.
-
-        Args:
-            features: Feature vector
-
-        Returns:
-            Tuple of (probabilities, confidence) or None
-        """
-        if self.xgb_model is None:
-            return None
-
-        try:
-            probs = self.xgb_model.predict_proba(features)[0]
-            confidence = float(max(probs))
-            return probs, confidence
-        except Exception as e:
-            logger.error(f"XGBoost prediction failed: {e}")
-            return None
-
-    def predict_random_forest(self, features: np.ndarray) -> tuple[np.ndarray, float] | None:
-        """
-        Make prediction with Random Forest model.
-
-        Args:
-            features: Feature vector
-
-        Returns:
-            Tuple of (probabilities, confidence) or None
-        """
-        if self.rf_model is None:
-            return None
+            return base + fatigue + interactions
 
-        try:
-            probs = self.rf_model.predict_proba(features)[0]
-            confidence = float(max(probs))
-            return probs, confidence
-        except Exception as e:
-            logger.error(f"Random Forest prediction failed: {e}")
-            return None
+        # Legacy feature set (7 features)
+        return [
+            home_attack,
+            home_defense,
+            away_attack,
+            away_defense,
+            home_form_norm,
+            away_form_norm,
+            h2h,
+        ]
 
     def predict_ensemble(
         self,
@@ -349,62 +394,237 @@ class TrainedModelLoader:
         Returns:
             Dictionary with probabilities and metadata
         """
-        features = self.create_features(
-            home_team_id,
-            away_team_id,
+        return self.predict_ensemble_batch(
+            [home_team_id],
+            [away_team_id],
+            home_attack=np.array([home_attack]),
+            home_defense=np.array([home_defense]),
+            away_attack=np.array([away_attack]),
+            away_defense=np.array([away_defense]),
+            home_form=np.array([home_form]),
+            away_form=np.array([away_form]),
+            xgb_weight=xgb_weight,
+            rf_weight=rf_weight,
+            home_rest_days=np.array([home_rest_days]),
+            home_congestion=np.array([home_congestion]),
+            away_rest_days=np.array([away_rest_days]),
+            away_congestion=np.array([away_congestion]),
+        )[0]
+
+    def _predict_proba_batch(
+        self, model: Any, features: np.ndarray, name: str
+    ) -> np.ndarray | None:
+        """Run predict_proba once on a stacked feature matrix. Returns (N, 3) or None."""
+        if model is None:
+            return None
+
+        try:
+            return np.asarray(model.predict_proba(features), dtype=np.float64)
+        except Exception as e:
+            logger.error(f"{name} batch prediction failed: {e}")
+            return None
+
+    def predict_ensemble_batch(
+        self,
+        home_team_ids: list[int],
+        away_team_ids: list[int],
+        home_attack: np.ndarray,
+        home_defense: np.ndarray,
+        away_attack: np.ndarray,
+        away_defense: np.ndarray,
+        home_form: np.ndarray,
+        away_form: np.ndarray,
+        xgb_weight: float = 0.7,
+        rf_weight: float = 0.3,
+        home_rest_days: np.ndarray | None = None,
+        home_congestion: np.ndarray | None = None,
+        away_rest_days: np.ndarray | None = None,
+        away_congestion: np.ndarray | None = None,
+    ) -> list[dict[str, Any] | None]:
+        """
+        Ensemble predictions for many matches with one predict_proba call per model.
+
+        Both models have a large fixed per-call cost, so stacking the feature
+        rows is much cheaper than calling predict_ensemble in a loop.
+
+        Returns:
+            One result dict per match (same shape as predict_ensemble), in input order
+        """
+        n = len(home_team_ids)
+        if n == 0:
+            return []
+
+        default_fatigue = np.full(n, 0.5)
+        features = self.create_features_batch(
+            home_team_ids,
+            away_team_ids,
             home_attack,
             home_defense,
             away_attack,
             away_defense,
             home_form,
             away_form,
-            home_rest_days,
-            home_congestion,
-            away_rest_days,
-            away_congestion,
+            home_rest_days if home_rest_days is not None else default_fatigue,
+            home_congestion if home_congestion is not None else default_fatigue,
+            away_rest_days if away_rest_days is not None else default_fatigue,
+            away_congestion if away_congestion is not None else default_fatigue,
         )
 
-        xgb_result = self.predict_xgboost(features)
-        rf_result = self.predict_random_forest(features)
+        xgb_probs = self._predict_proba_batch(self.xgb_model, features, "XGBoost")
+        rf_probs = self._predict_proba_batch(self.rf_model, features, "Random Forest")
 
-        if xgb_result is None and rf_result is None:
-            return None
+        if xgb_probs is None and rf_probs is None:
+            return [None] * n
 
         # Combine predictions
-        if xgb_result is not None and rf_result is not None:
-            xgb_probs, xgb_conf = xgb_result
-            rf_probs, rf_conf = rf_result
-
-            # Weighted average
+        if xgb_probs is not None and rf_probs is not None:
             combined_probs = xgb_probs * xgb_weight + rf_probs * rf_weight
-            combined_probs = combined_probs / combined_probs.sum()  # Normalize
+            combined_probs = combined_probs / combined_probs.sum(axis=1, keepdims=True)
 
-            confidence = xgb_conf * xgb_weight + rf_conf * rf_weight
+            confidence = xgb_probs.max(axis=1) * xgb_weight + rf_probs.max(axis=1) * rf_weight
             model_used = "ensemble"
 
-        elif xgb_result is not None:
-            combined_probs, confidence = xgb_result
+        elif xgb_probs is not None:
+            combined_probs = xgb_probs
+            confidence = xgb_probs.max(axis=1)
             model_used = "xgboost"
 
         else:
-            assert rf_result is not None  # Guaranteed by earlier None check
-            combined_probs, confidence = rf_result
+            assert rf_probs is not None  # Guaranteed by earlier None check
+            combined_probs = rf_probs
+            confidence = rf_probs.max(axis=1)
             model_used = "random_forest"
 
-        return {
-            "home_win": float(combined_probs[0]),
-            "draw": float(combined_probs[1]),
-            "away_win": float(combined_probs[2]),
-            "confidence": float(confidence),
-            "model_used": model_used,
-            "is_trained_model": True,
-            "feature_count": self._get_expected_feature_count(),
-            "uses_fatigue_features": self._get_expected_feature_count() >= FEATURE_SET_EXTENDED,
+        feature_count = features.shape[1]
+        return [
+            {
+                "home_win": float(combined_probs[i, 0]),
+                "draw": float(combined_probs[i, 1]),
+                "away_win": float(combined_probs[i, 2]),
+                "confidence": float(confidence[i]),
+                "model_used": model_used,
+                "is_trained_model": True,
+                "feature_count": feature_count,
+                "uses_fatigue_features": feature_count >= FEATURE_SET_EXTENDED,
+            }
+            for i in range(n)
+        ]
+
+
+class MicroBatcher:
+    """
+    Groups concurrent async predictions into one predict_ensemble_batch call.
+
+    Requests queue up for at most ``max_wait`` seconds (or until
+    ``max_batch_size`` are waiting); the batch then runs in a worker thread
+    and each caller gets its own row back. Both models have a large fixed
+    per-call cost, so a burst of on-demand predictions costs about as much
+    as a single one.
+    """
+
+    def __init__(
+        self,
+        loader: TrainedModelLoader,
+        max_batch_size: int = ML_BATCH_MAX_SIZE,
+        max_wait: float = ML_BATCH_MAX_WAIT,
+    ):
+        self.loader = loader
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._pending: list[tuple[dict[str, Any], asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def predict(
+        self,
+        home_team_id: int,
+        away_team_id: int,
+        home_attack: float = 1.3,
+        home_defense: float = 1.3,
+        away_attack: float = 1.3,
+        away_defense: float = 1.3,
+        home_form: float = 50.0,
+        away_form: float = 50.0,
+        home_rest_days: float = 0.5,
+        home_congestion: float = 0.5,
+        away_rest_days: float = 0.5,
+        away_congestion: float = 0.5,
+    ) -> dict[str, Any] | None:
+        """Same result as TrainedModelLoader.predict_ensemble, computed in a shared batch."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Fresh state per event loop (futures and timers are bound to it)
+            self._pending = []
+            self._timer = None
+            self._loop = loop
+
+        future = loop.create_future()
+        row = {
+            "home_team_id": home_team_id,
+            "away_team_id": away_team_id,
+            "home_attack": home_attack,
+            "home_defense": home_defense,
+            "away_attack": away_attack,
+            "away_defense": away_defense,
+            "home_form": home_form,
+            "away_form": away_form,
+            "home_rest_days": home_rest_days,
+            "home_congestion": home_congestion,
+            "away_rest_days": away_rest_days,
+            "away_congestion": away_congestion,
         }
+        self._pending.append((row, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[dict[str, Any], asyncio.Future]]) -> None:
+        rows = [row for row, _ in batch]
+        try:
+            results = await asyncio.to_thread(self._predict_rows, rows)
+        except Exception as e:
+            logger.error(f"ML micro-batch of {len(rows)} failed: {e}")
+            results = [None] * len(rows)
+        for (_, future), result in zip(batch, results):
+            if not future.done():  # The caller may have been cancelled
+                future.set_result(result)
+
+    def _predict_rows(self, rows: list[dict[str, Any]]) -> list[dict[str, Any] | None]:
+        def column(key: str) -> np.ndarray:
+            return np.array([row[key] for row in rows], dtype=np.float64)
+
+        return self.loader.predict_ensemble_batch(
+            [row["home_team_id"] for row in rows],
+            [row["away_team_id"] for row in rows],
+            home_attack=column("home_attack"),
+            home_defense=column("home_defense"),
+            away_attack=column("away_attack"),
+            away_defense=column("away_defense"),
+            home_form=column("home_form"),
+            away_form=column("away_form"),
+            home_rest_days=column("home_rest_days"),
+            home_congestion=column("home_congestion"),
+            away_rest_days=column("away_rest_days"),
+            away_congestion=column("away_congestion"),
+        )
 
 
 # Global instance
 model_loader = TrainedModelLoader()
+ml_batcher = MicroBatcher(model_loader)
 
 
 def get_ml_prediction(
@@ -445,3 +665,83 @@ def get_ml_prediction(
         away_rest_days=away_rest_days,
         away_congestion=away_congestion,
     )
+
+
+def get_ml_predictions_batch(
+    home_team_ids: list[int],
+    away_team_ids: list[int],
+    home_attack: np.ndarray,
+    home_defense: np.ndarray,
+    away_attack: np.ndarray,
+    away_defense: np.ndarray,
+    home_form: np.ndarray,
+    away_form: np.ndarray,
+    home_rest_days: np.ndarray | None = None,
+    home_congestion: np.ndarray | None = None,
+    away_rest_days: np.ndarray | None = None,
+    away_congestion: np.ndarray | None = None,
+) -> list[dict[str, Any] | None]:
+    """
+    Batch counterpart of get_ml_prediction.
+
+    Returns a list of None if no trained models are available.
+    """
+    if not model_loader.is_trained():
+        return [None] * len(home_team_ids)
+
+    return model_loader.predict_ensemble_batch(
+        home_team_ids,
+        away_team_ids,
+        home_attack,
+        home_defense,
+        away_attack,
+        away_defense,
+        home_form,
+        away_form,
+        home_rest_days=home_rest_days,
+        home_congestion=home_congestion,
+        away_rest_days=away_rest_days,
+        away_congestion=away_congestion,
+    )
+
+
+async def get_ml_prediction_async(
+    home_team_id: int,
+    away_team_id: int,
+    home_attack: float = 1.3,
+    home_defense: float = 1.3,
+    away_attack: float = 1.3,
+    away_defense: float = 1.3,
+    home_form: float = 50.0,
+    away_form: float = 50.0,
+    home_rest_days: float = 0.5,
+    home_congestion: float = 0.5,
+    away_rest_days: float = 0.5,
+    away_congestion: float = 0.5,
+) -> dict[str, Any] | None:
+    """
+    get_ml_prediction for async code, off the event loop.
+
+    Concurrent calls share micro-batches unless ML_MICRO_BATCHING is disabled,
+    in which case each call runs alone in a worker thread.
+    """
+    if not model_loader.is_trained():
+        return None
+
+    features = {
+        "home_attack": home_attack,
+        "home_defense": home_defense,
+        "away_attack": away_attack,
+        "away_defense": away_defense,
+        "home_form": home_form,
+        "away_form": away_form,
+        "home_rest_days": home_rest_days,
+        "home_congestion": home_congestion,
+        "away_rest_days": away_rest_days,
+        "away_congestion": away_congestion,
+    }
+    if ML_MICRO_BATCHING:
+        return await ml_batcher.predict(home_team_id, away_team_id, **features)
+    return await asyncio.to_thread(
+        model_loader.predict_ensemble, home_team_id, away_team_id, **features
+    )
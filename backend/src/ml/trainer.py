@@ -14,6 +14,8 @@ from typing import Any
 
 import numpy as np
 
+from src.prediction_engine.team_features import average_goals, form_score
+
 logger = logging.getLogger(__name__)
 
 # Paths
@@ -57,28 +59,15 @@ class FeatureEngineer:
         Returns:
             Form score 0-100
         """
-        if not results:
-            return 50.0  # Neutral form
-
-        recent = results[-last_n:]
-        # Points: win=3, draw=1, loss=0
-        points = sum(3 if r == 0 else (1 if r == 1 else 0) for r in recent)
-        max_points = len(recent) * 3
-        return (points / max_points) * 100 if max_points > 0 else 50.0
+        return form_score(results, last_n)
 
     def calculate_attack_strength(self, goals_scored: list[int], last_n: int = 10) -> float:
         """Calculate attack strength from recent goals scored."""
-        if not goals_scored:
-            return 1.3  # League average
-        recent = goals_scored[-last_n:]
-        return sum(recent) / len(recent) if recent else 1.3
+        return average_goals(goals_scored, last_n)
 
     def calculate_defense_strength(self, goals_conceded: list[int], last_n: int = 10) -> float:
         """Calculate defense strength from recent goals conceded."""
-        if not goals_conceded:
-            return 1.3  # League average
-        recent = goals_conceded[-last_n:]
-        return sum(recent) / len(recent) if recent else 1.3
+        return average_goals(goals_conceded, last_n)
 
     def calculate_h2h(self, team1_id: int, team2_id: int) -> float:
         """
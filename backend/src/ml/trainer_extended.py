@@ -16,6 +16,14 @@ from typing import Any
 
 import numpy as np
 
+from src.prediction_engine.team_features import (
+    CONGESTION_WINDOW_DAYS,
+    average_goals,
+    congestion_score,
+    form_score,
+    rest_days_score,
+)
+
 logger = logging.getLogger(__name__)
 
 # Paths
@@ -36,7 +44,7 @@ class ExtendedFeatureEngineer:
     """Creates extended ML features including fatigue metrics."""
 
     # Congestion window for calculating fixture density
-    CONGESTION_WINDOW_DAYS = 14
+    CONGESTION_WINDOW_DAYS = CONGESTION_WINDOW_DAYS
 
     def __init__(self) -> None:
         """Initialize feature engineering with team history tracking."""
@@ -60,26 +68,15 @@ class ExtendedFeatureEngineer:
 
     def calculate_form(self, results: list[int], last_n: int = 5) -> float:
         """Calculate team form from recent results (0-100)."""
-        if not results:
-            return 50.0
-        recent = results[-last_n:]
-        points = sum(3 if r == 0 else (1 if r == 1 else 0) for r in recent)
-        max_points = len(recent) * 3
-        return (points / max_points) * 100 if max_points > 0 else 50.0
+        return form_score(results, last_n)
 
     def calculate_attack_strength(self, goals_scored: list[int], last_n: int = 10) -> float:
         """Calculate attack strength from recent goals scored."""
-        if not goals_scored:
-            return 1.3
-        recent = goals_scored[-last_n:]
-        return sum(recent) / len(recent) if recent else 1.3
+        return average_goals(goals_scored, last_n)
 
     def calculate_defense_strength(self, goals_conceded: list[int], last_n: int = 10) -> float:
         """Calculate defense strength from recent goals conceded."""
-        if not goals_conceded:
-            return 1.3
-        recent = goals_conceded[-last_n:]
-        return sum(recent) / len(recent) if recent else 1.3
+        return average_goals(goals_conceded, last_n)
 
     def calculate_h2h(self, team1_id: int, team2_id: int) -> float:
         """Calculate head-to-head advantage (0-1, 0.5 = neutral)."""
@@ -110,22 +107,8 @@ class ExtendedFeatureEngineer:
         if not past_matches:
             return 0.5
 
-        last_match = max(past_matches)
-        rest_days = (match_date - last_match).days
-
-        # Normalize: 0-2 days = fatigued, 5+ days = well rested
-        if rest_days <= 2:
-            return 0.2  # Very fatigued
-        elif rest_days <= 3:
-            return 0.4
-        elif rest_days <= 4:
-            return 0.6
-        elif rest_days <= optimal_rest:
-            return 0.8
-        elif rest_days <= max_rest:
-            return 1.0  # Well rested
-        else:
-            return 0.9  # Too long without match (slight negative)
+        rest_days = (match_date - max(past_matches)).days
+        return rest_days_score(rest_days, optimal_rest, max_rest)
 
     def calculate_congestion_score(self, team_id: int, match_date: datetime) -> float:
         """
@@ -141,18 +124,7 @@ class ExtendedFeatureEngineer:
         # Count matches in the window before this date
         window_start = match_date - timedelta(days=self.CONGESTION_WINDOW_DAYS)
         matches_in_window = sum(1 for d in dates if window_start <= d < match_date)
-
-        # Normalize: 0-1 matches = light, 5+ = very congested
-        if matches_in_window <= 1:
-            return 1.0
-        elif matches_in_window == 2:
-            return 0.8
-        elif matches_in_window == 3:
-            return 0.6
-        elif matches_in_window == 4:
-            return 0.4
-        else:
-            return 0.2  # Very congested
+        return congestion_score(matches_in_window)
 
     def create_features(
         self, home_team_id: int, away_team_id: int, match_date: datetime | None = None
@@ -9,6 +9,13 @@ Algorithm:
 3. Apply minimum weight constraint to prevent any model from being ignored
 4. Update weights daily or on-demand
 
+Records are kept per model in time-sorted NumPy buffers with running sums of
+correct predictions, Brier score and log loss over the rolling window, so
+recording an outcome and reading a model's metrics are O(1); records leaving
+the window are subtracted as the window start advances (amortized).
+New records are queued for persistence (drain_pending); the table and
+startup load live in src.services.adaptive_weights_service.
+
 Parameters:
 - rolling_window: Number of days to consider (default 30)
 - temperature: Controls weight distribution (lower = more extreme, default 0.5)
@@ -39,6 +46,26 @@ DEFAULT_WEIGHTS: dict[ModelName, float] = {
     "random_forest": 0.0,  # Optional model
 }
 
+# Model tracked for each ModelContribution name stored in prediction
+# model_details (the advanced ensemble's display names). The basic ensemble's
+# xgboost slot holds the ML model, whichever variant served it. Dixon-Coles
+# and Advanced ELO have no basic ensemble counterpart and are not tracked.
+CONTRIBUTION_MODEL_NAMES: dict[str, ModelName] = {
+    "Poisson": "poisson",
+    "Basic ELO": "elo",
+    "ML Local (xgboost)": "xgboost",
+    "ML Local (random_forest)": "random_forest",
+    "ML Local (ensemble)": "xgboost",
+    "ML (HuggingFace)": "xgboost",
+}
+
+
+def model_name_for_contribution(name: str) -> ModelName | None:
+    """Tracked model for a contribution name, or None if it is not tracked."""
+    if name in DEFAULT_WEIGHTS:
+        return name  # type: ignore[return-value]
+    return CONTRIBUTION_MODEL_NAMES.get(name)
+
 
 @dataclass
 class ModelPredictionRecord:
@@ -106,6 +133,177 @@ class AdaptiveWeights:
         }
 
 
+OUTCOME_INDEX: dict[str, int] = {"home": 0, "draw": 1, "away": 2}
+OUTCOMES: list[Literal["home", "draw", "away"]] = ["home", "draw", "away"]
+
+# Initial capacity of a model buffer (doubles when full)
+_INITIAL_CAPACITY = 64
+
+
+class _ModelRecordBuffer:
+    """
+    Time-sorted records of one model with running sums over the rolling window.
+
+    Records live in parallel NumPy arrays between ``_head`` (oldest stored)
+    and ``_tail``. ``_window_start`` is the first record inside the rolling
+    window; the sums cover [_window_start, _tail). The window only moves
+    forward, so records that fall out of it are subtracted once. Dropping
+    old records advances ``_head`` and compacts the arrays when more than
+    half of the capacity is dead space.
+    """
+
+    def __init__(self) -> None:
+        self._timestamps = np.empty(_INITIAL_CAPACITY)  # POSIX seconds
+        self._match_ids = np.empty(_INITIAL_CAPACITY, dtype=np.int64)
+        self._probs = np.empty((_INITIAL_CAPACITY, 3))
+        self._actual = np.empty(_INITIAL_CAPACITY, dtype=np.int8)
+        self._correct = np.empty(_INITIAL_CAPACITY)  # 1.0 / 0.0
+        self._brier = np.empty(_INITIAL_CAPACITY)
+        self._log_loss = np.empty(_INITIAL_CAPACITY)
+
+        self._head = 0
+        self._tail = 0
+        self._window_start = 0
+
+        self.correct_sum = 0.0
+        self.brier_sum = 0.0
+        self.log_loss_sum = 0.0
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    @property
+    def window_count(self) -> int:
+        return self._tail - self._window_start
+
+    def _columns(self) -> list[np.ndarray]:
+        return [
+            self._timestamps,
+            self._match_ids,
+            self._probs,
+            self._actual,
+            self._correct,
+            self._brier,
+            self._log_loss,
+        ]
+
+    def _reserve_slot(self) -> None:
+        """Make room for one more record at the tail (compact or grow)."""
+        capacity = len(self._timestamps)
+        if self._tail < capacity:
+            return
+
+        live = slice(self._head, self._tail)
+        new_capacity = capacity if self._head > capacity // 2 else capacity * 2
+        (
+            self._timestamps,
+            self._match_ids,
+            self._probs,
+            self._actual,
+            self._correct,
+            self._brier,
+            self._log_loss,
+        ) = [self._resized(column[live], new_capacity) for column in self._columns()]
+
+        self._window_start -= self._head
+        self._tail -= self._head
+        self._head = 0
+
+    @staticmethod
+    def _resized(values: np.ndarray, capacity: int) -> np.ndarray:
+        out = np.empty((capacity, *values.shape[1:]), dtype=values.dtype)
+        out[: len(values)] = values
+        return out
+
+    def append(
+        self,
+        timestamp: float,
+        match_id: int,
+        probs: tuple[float, float, float],
+        actual_idx: int,
+    ) -> None:
+        """Add a record, keeping time order; O(1) when records arrive in order."""
+        self._reserve_slot()
+
+        correct = 1.0 if int(np.argmax(probs)) == actual_idx else 0.0
+        # Mean squared error over the three outcomes, log loss of the actual outcome
+        brier = sum((p - (1.0 if i == actual_idx else 0.0)) ** 2 for i, p in enumerate(probs)) / 3
+        log_loss = -float(np.log(max(probs[actual_idx], 1e-10)))
+
+        # Position keeping timestamps sorted (ties after existing records)
+        pos = self._tail
+        if self._tail > self._head and timestamp < self._timestamps[self._tail - 1]:
+            pos = self._head + int(
+                np.searchsorted(self._timestamps[self._head : self._tail], timestamp, "right")
+            )
+            for column in self._columns():
+                column[pos + 1 : self._tail + 1] = column[pos : self._tail].copy()
+
+        self._timestamps[pos] = timestamp
+        self._match_ids[pos] = match_id
+        self._probs[pos] = probs
+        self._actual[pos] = actual_idx
+        self._correct[pos] = correct
+        self._brier[pos] = brier
+        self._log_loss[pos] = log_loss
+        self._tail += 1
+
+        if pos >= self._window_start:
+            self.correct_sum += correct
+            self.brier_sum += brier
+            self.log_loss_sum += log_loss
+        else:
+            # Older than the window already expired: stored, never counted
+            self._window_start += 1
+
+    def _remove_from_window(self, start: int, stop: int) -> None:
+        self.correct_sum -= float(self._correct[start:stop].sum())
+        self.brier_sum -= float(self._brier[start:stop].sum())
+        self.log_loss_sum -= float(self._log_loss[start:stop].sum())
+        if self._tail == stop:
+            # Window empty: reset to avoid carrying float drift
+            self.correct_sum = self.brier_sum = self.log_loss_sum = 0.0
+
+    def _first_at_or_after(self, cutoff: float, start: int) -> int:
+        return start + int(np.searchsorted(self._timestamps[start : self._tail], cutoff, "left"))
+
+    def expire(self, cutoff: float) -> None:
+        """Advance the window start past records older than cutoff."""
+        new_start = self._first_at_or_after(cutoff, self._window_start)
+        if new_start > self._window_start:
+            self._remove_from_window(self._window_start, new_start)
+            self._window_start = new_start
+
+    def drop_before(self, cutoff: float) -> int:
+        """Forget stored records older than cutoff; returns how many."""
+        new_head = self._first_at_or_after(cutoff, self._head)
+        removed = new_head - self._head
+        if new_head > self._window_start:
+            self._remove_from_window(self._window_start, new_head)
+            self._window_start = new_head
+        self._head = new_head
+        return removed
+
+    def period(self) -> tuple[float, float]:
+        """(oldest, newest) timestamp in the window."""
+        return float(self._timestamps[self._window_start]), float(self._timestamps[self._tail - 1])
+
+    def records(self, model_name: str, window_only: bool) -> list[ModelPredictionRecord]:
+        """Materialize stored records (inspection and export only)."""
+        start = self._window_start if window_only else self._head
+        return [
+            ModelPredictionRecord(
+                model_name=model_name,
+                match_id=int(self._match_ids[i]),
+                predicted_outcome=OUTCOMES[int(np.argmax(self._probs[i]))],
+                actual_outcome=OUTCOMES[int(self._actual[i])],
+                predicted_probs=tuple(float(p) for p in self._probs[i]),  # type: ignore[arg-type]
+                prediction_date=datetime.fromtimestamp(float(self._timestamps[i])),
+            )
+            for i in range(start, self._tail)
+        ]
+
+
 class AdaptiveWeightCalculator:
     """
     Calculates adaptive ensemble weights based on recent model performance.
@@ -136,8 +334,10 @@ class AdaptiveWeightCalculator:
         self.min_weight = max(0.01, min(0.20, min_weight))  # Clamp to reasonable range
         self.default_weights = default_weights or dict(DEFAULT_WEIGHTS)
 
-        # In-memory storage for prediction records
-        self._records: list[ModelPredictionRecord] = []
+        # Per-model record buffers with rolling-window sums
+        self._buffers: dict[str, _ModelRecordBuffer] = {}
+        # Records not yet persisted (see drain_pending)
+        self._pending: list[dict] = []
         self._cached_weights: AdaptiveWeights | None = None
         self._cache_valid_until: datetime | None = None
 
@@ -159,29 +359,54 @@ class AdaptiveWeightCalculator:
             actual_outcome: The actual match result
             prediction_date: When the prediction was made (defaults to now)
         """
-        # Determine predicted outcome from probabilities
-        outcomes: list[Literal["home", "draw", "away"]] = ["home", "draw", "away"]
-        predicted_idx = int(np.argmax(predicted_probs))
-        predicted_outcome = outcomes[predicted_idx]
-
-        record = ModelPredictionRecord(
-            model_name=model_name,
-            match_id=match_id,
-            predicted_outcome=predicted_outcome,
-            actual_outcome=actual_outcome,
-            predicted_probs=predicted_probs,
-            prediction_date=prediction_date or datetime.now(),
+        prediction_date = prediction_date or datetime.now()
+        self._append(model_name, match_id, predicted_probs, actual_outcome, prediction_date)
+        self._pending.append(
+            {
+                "model_name": model_name,
+                "match_id": match_id,
+                "predicted_probs": list(predicted_probs),
+                "actual_outcome": actual_outcome,
+                "prediction_date": prediction_date,
+            }
         )
-
-        self._records.append(record)
         self._invalidate_cache()
 
         logger.debug(
             f"Recorded prediction for {model_name}: "
-            f"predicted={predicted_outcome}, actual={actual_outcome}, "
-            f"correct={record.was_correct}"
+            f"predicted={OUTCOMES[int(np.argmax(predicted_probs))]}, actual={actual_outcome}"
         )
 
+    def _append(
+        self,
+        model_name: str,
+        match_id: int,
+        predicted_probs: tuple[float, float, float],
+        actual_outcome: str,
+        prediction_date: datetime,
+    ) -> None:
+        """Add a record to its model buffer (raises KeyError on unknown outcome)."""
+        actual_idx = OUTCOME_INDEX[actual_outcome]
+        probs = (float(predicted_probs[0]), float(predicted_probs[1]), float(predicted_probs[2]))
+
+        buffer = self._buffers.get(model_name)
+        if buffer is None:
+            buffer = self._buffers[model_name] = _ModelRecordBuffer()
+        buffer.append(prediction_date.timestamp(), match_id, probs, actual_idx)
+
+    def __len__(self) -> int:
+        """Number of stored records across all models."""
+        return sum(len(buffer) for buffer in self._buffers.values())
+
+    def drain_pending(self) -> list[dict]:
+        """
+        Take the records recorded since the last drain, for persistence.
+
+        Imported records are not included (they already come from storage).
+        """
+        pending, self._pending = self._pending, []
+        return pending
+
     def record_batch(
         self,
         records: list[dict],
@@ -216,17 +441,31 @@ class AdaptiveWeightCalculator:
         """Invalidate cached weights."""
         self._cache_valid_until = None
 
-    def _get_records_in_window(self, model_name: str | None = None) -> list[ModelPredictionRecord]:
-        """Get records within the rolling window."""
+    def _expire_window(self, buffer: _ModelRecordBuffer) -> None:
+        """Move a buffer's window start to the current rolling-window cutoff."""
         cutoff = datetime.now() - timedelta(days=self.rolling_window_days)
+        buffer.expire(cutoff.timestamp())
 
-        records = [r for r in self._records if r.prediction_date >= cutoff]
-
-        if model_name:
-            records = [r for r in records if r.model_name == model_name]
-
+    def _get_records_in_window(self, model_name: str | None = None) -> list[ModelPredictionRecord]:
+        """Get records within the rolling window (materialized, for inspection)."""
+        names = [model_name] if model_name else list(self._buffers)
+        records = []
+        for name in names:
+            buffer = self._buffers.get(name)
+            if buffer is not None:
+                self._expire_window(buffer)
+                records.extend(buffer.records(name, window_only=True))
         return records
 
+    def _models_with_data(self) -> list[str]:
+        """Models with at least one record in the rolling window."""
+        models = []
+        for name, buffer in self._buffers.items():
+            self._expire_window(buffer)
+            if buffer.window_count:
+                models.append(name)
+        return models
+
     def calculate_model_metrics(self, model_name: str) -> ModelPerformanceMetrics | None:
         """
         Calculate performance metrics for a specific model.
@@ -237,45 +476,26 @@ class AdaptiveWeightCalculator:
         Returns:
             ModelPerformanceMetrics or None if not enough data
         """
-        records = self._get_records_in_window(model_name)
+        buffer = self._buffers.get(model_name)
+        if buffer is None:
+            return None
 
-        if len(records) < 5:
+        self._expire_window(buffer)
+        n = buffer.window_count
+        if n < 5:
             return None
 
-        # Calculate accuracy
-        correct = sum(1 for r in records if r.was_correct)
-        accuracy = correct / len(records)
-
-        # Calculate Brier score (mean squared error of probabilities)
-        brier_scores = []
-        for r in records:
-            outcome_idx = ["home", "draw", "away"].index(r.actual_outcome)
-            # One-hot encode actual outcome
-            actual = [0.0, 0.0, 0.0]
-            actual[outcome_idx] = 1.0
-            # MSE between predicted probs and actual
-            mse = sum((p - a) ** 2 for p, a in zip(r.predicted_probs, actual)) / 3
-            brier_scores.append(mse)
-        brier_score = float(np.mean(brier_scores))
-
-        # Calculate log loss
-        log_losses = []
-        for r in records:
-            outcome_idx = ["home", "draw", "away"].index(r.actual_outcome)
-            prob = max(r.predicted_probs[outcome_idx], 1e-10)  # Avoid log(0)
-            log_losses.append(-np.log(prob))
-        log_loss = float(np.mean(log_losses))
-
-        dates = [r.prediction_date for r in records]
+        # Accuracy, Brier score (MSE of probabilities) and log loss from running sums
+        period_start, period_end = buffer.period()
 
         return ModelPerformanceMetrics(
             model_name=model_name,
-            accuracy=accuracy,
-            brier_score=brier_score,
-            log_loss=log_loss,
-            n_predictions=len(records),
-            period_start=min(dates),
-            period_end=max(dates),
+            accuracy=buffer.correct_sum / n,
+            brier_score=buffer.brier_sum / n,
+            log_loss=buffer.log_loss_sum / n,
+            n_predictions=n,
+            period_start=datetime.fromtimestamp(period_start),
+            period_end=datetime.fromtimestamp(period_end),
         )
 
     def calculate_weights(
@@ -306,7 +526,7 @@ class AdaptiveWeightCalculator:
 
         # Get all model names with data
         if models is None:
-            models = list(set(r.model_name for r in self._get_records_in_window()))
+            models = self._models_with_data()
 
         if not models:
             # No data - use default weights
@@ -440,10 +660,7 @@ class AdaptiveWeightCalculator:
         days = days_to_keep or (self.rolling_window_days * 2)
         cutoff = datetime.now() - timedelta(days=days)
 
-        original_count = len(self._records)
-        self._records = [r for r in self._records if r.prediction_date >= cutoff]
-
-        removed = original_count - len(self._records)
+        removed = sum(buffer.drop_before(cutoff.timestamp()) for buffer in self._buffers.values())
         if removed > 0:
             self._invalidate_cache()
             logger.info(f"Removed {removed} old prediction records")
@@ -462,7 +679,8 @@ class AdaptiveWeightCalculator:
                 "prediction_date": r.prediction_date.isoformat(),
                 "was_correct": r.was_correct,
             }
-            for r in self._records
+            for name, buffer in self._buffers.items()
+            for r in buffer.records(name, window_only=False)
         ]
 
     def import_records(self, records: list[dict]) -> int:
@@ -478,19 +696,16 @@ class AdaptiveWeightCalculator:
         count = 0
         for rec in records:
             try:
-                self._records.append(
-                    ModelPredictionRecord(
-                        model_name=rec["model_name"],
-                        match_id=rec["match_id"],
-                        predicted_outcome=rec["predicted_outcome"],
-                        actual_outcome=rec["actual_outcome"],
-                        predicted_probs=tuple(rec["predicted_probs"]),  # type: ignore
-                        prediction_date=(
-                            datetime.fromisoformat(rec["prediction_date"])
-                            if isinstance(rec["prediction_date"], str)
-                            else rec["prediction_date"]
-                        ),
-                    )
+                self._append(
+                    model_name=rec["model_name"],
+                    match_id=rec["match_id"],
+                    predicted_probs=tuple(rec["predicted_probs"]),  # type: ignore
+                    actual_outcome=rec["actual_outcome"],
+                    prediction_date=(
+                        datetime.fromisoformat(rec["prediction_date"])
+                        if isinstance(rec["prediction_date"], str)
+                        else rec["prediction_date"]
+                    ),
                 )
                 count += 1
             except (KeyError, TypeError, ValueError) as e:
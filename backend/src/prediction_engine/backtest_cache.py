@@ -0,0 +1,181 @@
+"""Content-addressed disk cache for walk-forward backtests.
+
+Entries are pickled to ``<cache_dir>/<sha256>.pkl`` where the hash covers
+everything the entry depends on (match data, window dates, configuration,
+model parameters), so an unchanged fold is found again by recomputing its
+key and nothing has to be invalidated explicitly.
+
+Two kinds of entries are stored by WalkForwardBacktest:
+- fold results (fold metrics + predictions), keyed by the train/test
+  matches and the full backtest configuration
+- trained XGBoost models, keyed by the training matches and model
+  parameters only, so changing evaluation settings (min_confidence,
+  betting_threshold) reuses the models
+
+The cache is bounded by total file size; evict() removes the least
+recently used entries (file mtime, refreshed on every hit) first.
+
+Entries are unpickled, so the directory must be private: the default is a
+per-user directory created with mode 0o700, and a directory owned by
+another user or writable by group/others is refused.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import time
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate every existing entry (e.g. when metric definitions change)
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "paris-sportif" / "backtests"
+)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+
+# Temp files older than this were left by a killed writer (evict() removes them)
+STALE_TMP_SECONDS = 3600
+
+
+def _update_hash(digest: Any, part: Any) -> None:
+    """Feed a value into the digest with an unambiguous, order-preserving encoding."""
+    if isinstance(part, (list, tuple)):
+        digest.update(b"[")
+        for item in part:
+            _update_hash(digest, item)
+        digest.update(b"]")
+    elif isinstance(part, dict):
+        _update_hash(digest, sorted(part.items()))
+    elif is_dataclass(part) and not isinstance(part, type):
+        # Flat dataclasses (MatchData): one repr of all field values
+        values = tuple(getattr(part, f.name) for f in fields(part))
+        digest.update(type(part).__name__.encode())
+        digest.update(repr(values).encode())
+    else:
+        digest.update(repr(part).encode())
+    digest.update(b"\x1f")
+
+
+class BacktestCache:
+    """Size-bounded, content-addressed pickle cache."""
+
+    def __init__(
+        self,
+        cache_dir: str | Path = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the entries (created if missing)
+            max_bytes: Total size above which evict() removes old entries
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self._check_private()
+
+    def _check_private(self) -> None:
+        """Refuse a directory other users could plant pickles in."""
+        if not hasattr(os, "getuid"):
+            return  # No POSIX ownership (Windows)
+        stat = self.cache_dir.stat()
+        if stat.st_uid != os.getuid():
+            raise PermissionError(f"Backtest cache dir {self.cache_dir} is owned by another user")
+        if stat.st_mode & 0o022:
+            raise PermissionError(
+                f"Backtest cache dir {self.cache_dir} is writable by group or others"
+            )
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """Content hash of the given parts (lists, dicts, dataclasses, scalars)."""
+        digest = hashlib.sha256()
+        _update_hash(digest, (CACHE_VERSION, parts))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def get(self, key: str) -> Any | None:
+        """Load an entry, or None if it is missing or unreadable."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+            os.utime(path)  # Mark as recently used for eviction
+            return value
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Dropping unreadable backtest cache entry {key}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store an entry atomically (write to a temp file, then rename)."""
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, self._path(key))
+        except Exception:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def size_bytes(self) -> int:
+        """Total size of all entries."""
+        return sum(path.stat().st_size for path in self.cache_dir.glob("*.pkl"))
+
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until the cache fits in max_bytes.
+
+        Returns:
+            Number of entries removed
+        """
+        entries = []
+        for path in self.cache_dir.glob("*.pkl"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.info(f"Evicted {removed} backtest cache entries")
+        self._remove_tmp_files(older_than=STALE_TMP_SECONDS)
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry (and any leftover temp files)."""
+        for path in self.cache_dir.glob("*.pkl"):
+            path.unlink(missing_ok=True)
+        self._remove_tmp_files(older_than=0)
+
+    def _remove_tmp_files(self, older_than: float) -> None:
+        """Delete temp files of writers that died before the rename."""
+        cutoff = time.time() - older_than
+        for path in self.cache_dir.glob("*.tmp"):
+            try:
+                if path.stat().st_mtime <= cutoff:
+                    path.unlink(missing_ok=True)
+            except FileNotFoundError:
+                continue
@@ -8,14 +8,19 @@ This module provides:
 """
 
 import logging
-from dataclasses import dataclass, field
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields, replace
 from datetime import date, timedelta
-from typing import Any, Literal
+from types import SimpleNamespace
+from typing import Literal
 
 import numpy as np
 
+from src.prediction_engine.backtest_cache import BacktestCache
 from src.prediction_engine.ensemble import EnsemblePredictor, LLMAdjustments
 from src.prediction_engine.feature_engineering import FeatureEngineer
+from src.prediction_engine.models.elo_replay import EloReplayKernel, build_match_array
 from src.prediction_engine.models.xgboost_model import XGBoostModel
 
 logger = logging.getLogger(__name__)
@@ -84,6 +89,19 @@ class WalkForwardFold:
     metrics: BacktestMetrics
 
 
+@dataclass(frozen=True)
+class FoldWindow:
+    """Date range of one fold and its index ranges in the date-sorted matches."""
+
+    fold_number: int
+    train_start: date
+    train_end: date
+    test_start: date
+    test_end: date
+    train_slice: slice
+    test_slice: slice
+
+
 @dataclass
 class BacktestResults:
     """Complete backtesting results."""
@@ -137,6 +155,75 @@ class MatchData:
     odds_away: float | None = None
 
 
+@dataclass
+class BacktestPredictions:
+    """
+    Columnar set of backtest predictions.
+
+    One array per field instead of one dict per prediction, so metrics are
+    computed with NumPy reductions and large backtests stay compact.
+    """
+
+    match_ids: np.ndarray  # (N,) object
+    match_dates: np.ndarray  # (N,) datetime64[D]
+    probs: np.ndarray  # (N, 3) home/draw/away probabilities
+    actual: np.ndarray  # (N,) int8 outcome index: 0=home, 1=draw, 2=away
+    confidence: np.ndarray  # (N,)
+    model_agreement: np.ndarray  # (N,)
+    odds: np.ndarray  # (N, 3) home/draw/away odds, NaN when missing
+
+    @classmethod
+    def from_columns(
+        cls,
+        match_ids: list[str],
+        match_dates: list[date],
+        probs: list[tuple[float, float, float]],
+        actual: list[int],
+        confidence: list[float],
+        model_agreement: list[float],
+        odds: list[tuple[float | None, float | None, float | None]],
+    ) -> "BacktestPredictions":
+        """Build from per-field lists (missing odds as None)."""
+        return cls(
+            match_ids=np.array(match_ids, dtype=object),
+            match_dates=np.array(match_dates, dtype="datetime64[D]"),
+            probs=np.array(probs, dtype=np.float64).reshape(-1, 3),
+            actual=np.array(actual, dtype=np.int8),
+            confidence=np.array(confidence, dtype=np.float64),
+            model_agreement=np.array(model_agreement, dtype=np.float64),
+            odds=np.array(odds, dtype=np.float64).reshape(-1, 3),
+        )
+
+    @classmethod
+    def concat(cls, parts: list["BacktestPredictions"]) -> "BacktestPredictions":
+        """Concatenate prediction sets in order."""
+        if not parts:
+            return cls.from_columns([], [], [], [], [], [], [])
+        return cls(
+            **{
+                f.name: np.concatenate([getattr(part, f.name) for part in parts])
+                for f in fields(cls)
+            }
+        )
+
+    def __len__(self) -> int:
+        return len(self.actual)
+
+    def select(self, mask: np.ndarray) -> "BacktestPredictions":
+        """Subset of predictions where mask is True."""
+        return BacktestPredictions(**{f.name: getattr(self, f.name)[mask] for f in fields(self)})
+
+    @property
+    def predicted(self) -> np.ndarray:
+        """Predicted outcome index (most likely outcome)."""
+        return np.argmax(self.probs, axis=1)
+
+    @property
+    def actual_one_hot(self) -> np.ndarray:
+        """Actual outcome as (N, 3) indicator rows."""
+        return np.eye(3)[self.actual]
+
+
 class WalkForwardBacktest:
     """
     Walk-forward backtesting framework.
@@ -156,6 +243,8 @@ class WalkForwardBacktest:
         min_confidence: float = 0.0,
         betting_threshold: float = 0.55,
         n_calibration_bins: int = 10,
+        n_workers: int = 1,
+        cache: BacktestCache | None = None,
     ):
         """
         Initialize backtesting framework.
@@ -166,12 +255,16 @@ class WalkForwardBacktest:
             min_confidence: Minimum confidence to include in metrics
             betting_threshold: Probability threshold for simulated betting
             n_calibration_bins: Number of bins for calibration analysis
+            n_workers: Processes used to run folds in parallel (1 = sequential)
+            cache: Disk cache for fold results and trained models (None = off)
         """
         self.train_window_days = train_window_days
         self.test_window_days = test_window_days
         self.min_confidence = min_confidence
         self.betting_threshold = betting_threshold
         self.n_calibration_bins = n_calibration_bins
+        self.n_workers = max(1, n_workers)
+        self.cache = cache
 
     def run(
         self,
@@ -195,7 +288,7 @@ class WalkForwardBacktest:
             return self._empty_results()
 
         # Sort matches by date
-        sorted_matches = sorted(matches, key=lambda m: m.match_date)
+        sorted_matches = self._fill_pre_match_elo(sorted(matches, key=lambda m: m.match_date))
         min_date = sorted_matches[0].match_date
         max_date = sorted_matches[-1].match_date
 
@@ -212,57 +305,58 @@ class WalkForwardBacktest:
             )
             return self._empty_results()
 
-        folds: list[WalkForwardFold] = []
-        all_predictions: list[dict[str, Any]] = []
-
-        # Walk forward through time
-        current_test_start = min_date + timedelta(days=self.train_window_days)
-        fold_number = 0
-
-        while current_test_start + timedelta(days=self.test_window_days) <= max_date:
-            fold_number += 1
-            train_start = current_test_start - timedelta(days=self.train_window_days)
-            train_end = current_test_start - timedelta(days=1)
-            test_start = current_test_start
-            test_end = current_test_start + timedelta(days=self.test_window_days - 1)
-
-            # Get train and test matches
-            train_matches = [m for m in sorted_matches if train_start <= m.match_date <= train_end]
-            test_matches = [m for m in sorted_matches if test_start <= m.match_date <= test_end]
-
-            if not train_matches or not test_matches:
-                current_test_start += timedelta(days=self.test_window_days)
-                continue
-
-            logger.debug(
-                f"Fold {fold_number}: Train [{train_start} to {train_end}] ({len(train_matches)} matches), "
-                f"Test [{test_start} to {test_end}] ({len(test_matches)} matches)"
+        # Folds are independent: each trains on its own window, so they can run
+        # in any order (or process) as long as results are merged in fold order
+        match_dates = [m.match_date for m in sorted_matches]
+        windows = self._plan_folds(match_dates)
+
+        results_by_fold: dict[int, tuple[WalkForwardFold, BacktestPredictions]] = {}
+        fold_keys: dict[int, str] = {}
+        if self.cache is not None:
+            for i, window in enumerate(windows):
+                fold_keys[i] = self._fold_cache_key(
+                    window, sorted_matches, use_llm_adjustments, retrain_ml
+                )
+                cached = self.cache.get(fold_keys[i])
+                if cached is not None:
+                    results_by_fold[i] = cached
+
+        pending = [i for i in range(len(windows)) if i not in results_by_fold]
+        tasks = [
+            (
+                self,
+                windows[i],
+                sorted_matches[windows[i].train_slice],
+                sorted_matches[windows[i].test_slice],
+                use_llm_adjustments,
+                retrain_ml,
             )
-
-            # Train models on training data
-            predictor = self._train_predictor(train_matches, retrain_ml)
-
-            # Make predictions on test data
-            fold_predictions = self._make_predictions(predictor, test_matches, use_llm_adjustments)
-            all_predictions.extend(fold_predictions)
-
-            # Calculate fold metrics
-            fold_metrics = self._calculate_metrics(fold_predictions)
-
-            fold = WalkForwardFold(
-                fold_number=fold_number,
-                train_start=train_start,
-                train_end=train_end,
-                test_start=test_start,
-                test_end=test_end,
-                train_size=len(train_matches),
-                test_size=len(test_matches),
-                metrics=fold_metrics,
+            for i in pending
+        ]
+
+        if self.n_workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.n_workers, len(tasks))) as executor:
+                computed = list(executor.map(_run_fold_task, tasks))
+        else:
+            computed = [_run_fold_task(task) for task in tasks]
+
+        for i, result in zip(pending, computed, strict=True):
+            results_by_fold[i] = result
+            if self.cache is not None:
+                self.cache.set(fold_keys[i], result)
+
+        if self.cache is not None:
+            logger.info(
+                f"Backtest cache: reused {len(windows) - len(pending)} folds, "
+                f"computed {len(pending)}"
             )
-            folds.append(fold)
+            self.cache.evict()
 
-            # Move to next fold
-            current_test_start += timedelta(days=self.test_window_days)
+        fold_results = [results_by_fold[i] for i in range(len(windows))]
+        folds = [fold for fold, _ in fold_results]
+        all_predictions = BacktestPredictions.concat(
+            [fold_predictions for _, fold_predictions in fold_results]
+        )
 
         # Calculate overall metrics
         overall_metrics = self._calculate_metrics(all_predictions)
@@ -282,6 +376,109 @@ class WalkForwardBacktest:
             betting_threshold=self.betting_threshold,
         )
 
+    def _plan_folds(self, match_dates: list[date]) -> list[FoldWindow]:
+        """
+        Compute fold windows by bisecting the sorted match dates.
+
+        Windows without training or test matches are skipped but still
+        consume a fold number.
+        """
+        fold_windows = []
+        max_date = match_dates[-1]
+        current_test_start = match_dates[0] + timedelta(days=self.train_window_days)
+        fold_number = 0
+
+        while current_test_start + timedelta(days=self.test_window_days) <= max_date:
+            fold_number += 1
+            train_start = current_test_start - timedelta(days=self.train_window_days)
+            train_end = current_test_start - timedelta(days=1)
+            test_start = current_test_start
+            test_end = current_test_start + timedelta(days=self.test_window_days - 1)
+
+            train_slice = slice(
+                bisect_left(match_dates, train_start), bisect_right(match_dates, train_end)
+            )
+            test_slice = slice(
+                bisect_left(match_dates, test_start), bisect_right(match_dates, test_end)
+            )
+
+            if train_slice.stop > train_slice.start and test_slice.stop > test_slice.start:
+                fold_windows.append(
+                    FoldWindow(
+                        fold_number=fold_number,
+                        train_start=train_start,
+                        train_end=train_end,
+                        test_start=test_start,
+                        test_end=test_end,
+                        train_slice=train_slice,
+                        test_slice=test_slice,
+                    )
+                )
+
+            current_test_start += timedelta(days=self.test_window_days)
+
+        return fold_windows
+
+    def _fold_cache_key(
+        self,
+        window: FoldWindow,
+        sorted_matches: list[MatchData],
+        use_llm_adjustments: bool,
+        retrain_ml: bool,
+    ) -> str:
+        """Cache key of a fold: its matches, dates and everything that affects results."""
+        config = {
+            "train_window_days": self.train_window_days,
+            "test_window_days": self.test_window_days,
+            "min_confidence": self.min_confidence,
+            "betting_threshold": self.betting_threshold,
+            "n_calibration_bins": self.n_calibration_bins,
+            "use_llm_adjustments": use_llm_adjustments,
+            "retrain_ml": retrain_ml,
+            "xgboost_params": XGBoostModel.DEFAULT_PARAMS,
+        }
+        return BacktestCache.key(
+            "fold",
+            config,
+            (window.fold_number, window.train_start, window.train_end),
+            (window.test_start, window.test_end),
+            sorted_matches[window.train_slice],
+            sorted_matches[window.test_slice],
+        )
+
+    def _run_fold(
+        self,
+        window: FoldWindow,
+        train_matches: list[MatchData],
+        test_matches: list[MatchData],
+        use_llm_adjustments: bool,
+        retrain_ml: bool,
+    ) -> tuple[WalkForwardFold, BacktestPredictions]:
+        """Train on one fold's window and evaluate on its test matches."""
+        logger.debug(
+            f"Fold {window.fold_number}: Train [{window.train_start} to {window.train_end}] "
+            f"({len(train_matches)} matches), Test [{window.test_start} to {window.test_end}] "
+            f"({len(test_matches)} matches)"
+        )
+
+        # Train models on training data
+        predictor = self._train_predictor(train_matches, retrain_ml)
+
+        # Make predictions on test data
+        fold_predictions = self._make_predictions(predictor, test_matches, use_llm_adjustments)
+
+        fold = WalkForwardFold(
+            fold_number=window.fold_number,
+            train_start=window.train_start,
+            train_end=window.train_end,
+            test_start=window.test_start,
+            test_end=window.test_end,
+            train_size=len(train_matches),
+            test_size=len(test_matches),
+            metrics=self._calculate_metrics(fold_predictions),
+        )
+        return fold, fold_predictions
+
     def _train_predictor(
         self,
         train_matches: list[MatchData],
@@ -291,6 +488,16 @@ class WalkForwardBacktest:
         predictor = EnsemblePredictor()
 
         if retrain_ml and len(train_matches) >= 50:
+            # Models depend on the training matches only, so they are cached
+            # separately from fold results and survive evaluation changes
+            model_key = None
+            if self.cache is not None:
+                model_key = BacktestCache.key("xgboost", XGBoostModel.DEFAULT_PARAMS, train_matches)
+                cached_model = self.cache.get(model_key)
+                if cached_model is not None:
+                    predictor.xgboost_model = cached_model
+                    return predictor
+
             # Prepare training data for XGBoost
             X, y = self._prepare_training_data(train_matches)
 
@@ -300,13 +507,11 @@ class WalkForwardBacktest:
                     xgboost_model = XGBoostModel()
                     xgboost_model.train(X, y)
                     predictor.xgboost_model = xgboost_model
+                    if model_key is not None:
+                        self.cache.set(model_key, xgboost_model)
                 except Exception as e:
                     logger.warning(f"Failed to train XGBoost: {e}")
 
-            # Update ELO ratings based on historical results
-            for match in train_matches:
-                self._update_elo_from_match(predictor.elo, match)
-
         return predictor
 
     def _prepare_training_data(
@@ -332,26 +537,56 @@ class WalkForwardBacktest:
 
         return np.array(features), np.array(labels)
 
-    def _update_elo_from_match(self, elo_system: Any, match: MatchData) -> None:
-        """Update ELO ratings based on match result."""
-        try:
-            elo_system.update_ratings(
-                home_team=match.home_team,
-                away_team=match.away_team,
-                home_goals=match.home_goals,
-                away_goals=match.away_goals,
+    def _fill_pre_match_elo(self, sorted_matches: list[MatchData]) -> list[MatchData]:
+        """
+        Fill missing home_elo/away_elo with pre-match ratings from one replay.
+
+        The whole (date-sorted) history goes through the ELO replay kernel
+        once, so every match gets the ratings both teams had before kick-off
+        without leaking its own result. Ratings already set are kept.
+        """
+        if all(m.home_elo is not None and m.away_elo is not None for m in sorted_matches):
+            return sorted_matches
+
+        rows = (
+            SimpleNamespace(
+                match_date=m.match_date,
+                home_team_id=m.home_team,
+                away_team_id=m.away_team,
+                home_score=m.home_goals,
+                away_score=m.away_goals,
             )
-        except Exception as e:
-            logger.debug(f"ELO update failed (non-critical): {e}")
+            for m in sorted_matches
+        )
+        match_array, team_ids = build_match_array(rows)
+        replay = EloReplayKernel().replay(match_array, team_ids)
+        pre_home = replay.pre_home.tolist()
+        pre_away = replay.pre_away.tolist()
+
+        # build_match_array sorts stably by date, so row i is sorted_matches[i]
+        return [
+            replace(
+                m,
+                home_elo=m.home_elo if m.home_elo is not None else pre_home[i],
+                away_elo=m.away_elo if m.away_elo is not None else pre_away[i],
+            )
+            for i, m in enumerate(sorted_matches)
+        ]
 
     def _make_predictions(
         self,
         predictor: EnsemblePredictor,
         test_matches: list[MatchData],
         use_llm_adjustments: bool,
-    ) -> list[dict[str, Any]]:
+    ) -> BacktestPredictions:
         """Make predictions on test matches."""
-        predictions = []
+        match_ids: list[str] = []
+        match_dates: list[date] = []
+        probs: list[tuple[float, float, float]] = []
+        actual: list[int] = []
+        confidence: list[float] = []
+        agreement: list[float] = []
+        odds: list[tuple[float | None, float | None, float | None]] = []
 
         # Default ELO rating if not available
         DEFAULT_ELO = 1500.0
@@ -373,117 +608,55 @@ class WalkForwardBacktest:
                     away_elo=away_elo,
                     llm_adjustments=LLMAdjustments() if not use_llm_adjustments else None,
                 )
-
-                # Determine predicted outcome
-                probs = [pred.home_win_prob, pred.draw_prob, pred.away_win_prob]
-                outcomes = ["home", "draw", "away"]
-                predicted_outcome = outcomes[np.argmax(probs)]
-
-                # Determine actual outcome
-                if match.home_goals > match.away_goals:
-                    actual_outcome = "home"
-                elif match.home_goals < match.away_goals:
-                    actual_outcome = "away"
-                else:
-                    actual_outcome = "draw"
-
-                predictions.append(
-                    {
-                        "match_id": match.match_id,
-                        "match_date": match.match_date,
-                        "home_team": match.home_team,
-                        "away_team": match.away_team,
-                        "prob_home": pred.home_win_prob,
-                        "prob_draw": pred.draw_prob,
-                        "prob_away": pred.away_win_prob,
-                        "predicted": predicted_outcome,
-                        "actual": actual_outcome,
-                        "confidence": pred.confidence,
-                        "model_agreement": pred.model_agreement,
-                        "odds_home": match.odds_home,
-                        "odds_draw": match.odds_draw,
-                        "odds_away": match.odds_away,
-                    }
-                )
-
             except Exception as e:
                 logger.warning(f"Failed to predict match {match.match_id}: {e}")
                 continue
 
-        return predictions
+            # Actual outcome index (0=home, 1=draw, 2=away)
+            if match.home_goals > match.away_goals:
+                actual.append(0)
+            elif match.home_goals < match.away_goals:
+                actual.append(2)
+            else:
+                actual.append(1)
+
+            match_ids.append(match.match_id)
+            match_dates.append(match.match_date)
+            probs.append((pred.home_win_prob, pred.draw_prob, pred.away_win_prob))
+            confidence.append(pred.confidence)
+            agreement.append(pred.model_agreement)
+            odds.append((match.odds_home, match.odds_draw, match.odds_away))
 
-    def _calculate_metrics(
-        self,
-        predictions: list[dict[str, Any]],
-    ) -> BacktestMetrics:
+        return BacktestPredictions.from_columns(
+            match_ids, match_dates, probs, actual, confidence, agreement, odds
+        )
+
+    def _calculate_metrics(self, predictions: BacktestPredictions) -> BacktestMetrics:
         """Calculate comprehensive metrics from predictions."""
-        if not predictions:
+        if not len(predictions):
             return BacktestMetrics()
 
         # Filter by minimum confidence
-        filtered = [p for p in predictions if p.get("confidence", 0) >= self.min_confidence]
+        filtered = predictions.select(predictions.confidence >= self.min_confidence)
 
-        if not filtered:
+        if not len(filtered):
             return BacktestMetrics()
 
-        # Basic accuracy
-        correct = sum(1 for p in filtered if p["predicted"] == p["actual"])
-        accuracy = correct / len(filtered)
-
-        # Per-outcome accuracy
-        home_preds = [p for p in filtered if p["actual"] == "home"]
-        draw_preds = [p for p in filtered if p["actual"] == "draw"]
-        away_preds = [p for p in filtered if p["actual"] == "away"]
-
-        home_accuracy = (
-            sum(1 for p in home_preds if p["predicted"] == "home") / len(home_preds)
-            if home_preds
-            else 0.0
-        )
-        draw_accuracy = (
-            sum(1 for p in draw_preds if p["predicted"] == "draw") / len(draw_preds)
-            if draw_preds
-            else 0.0
+        hits = filtered.predicted == filtered.actual
+        squared_errors = (filtered.probs - filtered.actual_one_hot) ** 2
+
+        # Per-outcome accuracy: share of matches with that result predicted correctly
+        outcome_counts = np.bincount(filtered.actual, minlength=3)
+        outcome_hits = np.bincount(filtered.actual[hits], minlength=3)
+        outcome_accuracy = np.divide(
+            outcome_hits,
+            outcome_counts,
+            out=np.zeros(3),
+            where=outcome_counts > 0,
         )
-        away_accuracy = (
-            sum(1 for p in away_preds if p["predicted"] == "away") / len(away_preds)
-            if away_preds
-            else 0.0
-        )
-
-        # Brier score (lower is better, 0 = perfect)
-        brier_scores = []
-        home_brier_scores = []
-        draw_brier_scores = []
-        away_brier_scores = []
-
-        for p in filtered:
-            actual_probs = [
-                1.0 if p["actual"] == "home" else 0.0,
-                1.0 if p["actual"] == "draw" else 0.0,
-                1.0 if p["actual"] == "away" else 0.0,
-            ]
-            predicted_probs = [p["prob_home"], p["prob_draw"], p["prob_away"]]
-
-            # Multi-class Brier score
-            brier = sum((pred - actual) ** 2 for pred, actual in zip(predicted_probs, actual_probs))
-            brier_scores.append(brier)
-
-            # Per-outcome Brier
-            home_brier_scores.append((p["prob_home"] - actual_probs[0]) ** 2)
-            draw_brier_scores.append((p["prob_draw"] - actual_probs[1]) ** 2)
-            away_brier_scores.append((p["prob_away"] - actual_probs[2]) ** 2)
-
-        brier_score = np.mean(brier_scores)
-        home_brier = np.mean(home_brier_scores)
-        draw_brier = np.mean(draw_brier_scores)
-        away_brier = np.mean(away_brier_scores)
 
-        # Log loss
-        log_loss_val = self._calculate_log_loss(filtered)
-
-        # Ranked Probability Score
-        rps = self._calculate_rps(filtered)
+        # Brier score (lower is better, 0 = perfect): multi-class and per outcome
+        outcome_brier = squared_errors.mean(axis=0)
 
         # Calibration
         calibration_error, calibration_bins = self._calculate_calibration(filtered)
@@ -491,17 +664,13 @@ class WalkForwardBacktest:
         # ROI (if odds available)
         roi_metrics = self._calculate_roi(filtered)
 
-        # Model agreement and confidence
-        avg_agreement = np.mean([p.get("model_agreement", 0) for p in filtered])
-        avg_confidence = np.mean([p.get("confidence", 0) for p in filtered])
-
         return BacktestMetrics(
-            accuracy=accuracy,
+            accuracy=float(hits.mean()),
             total_predictions=len(filtered),
-            correct_predictions=correct,
-            brier_score=brier_score,
-            log_loss=log_loss_val,
-            rps=rps,
+            correct_predictions=int(hits.sum()),
+            brier_score=float(squared_errors.sum(axis=1).mean()),
+            log_loss=self._calculate_log_loss(filtered),
+            rps=self._calculate_rps(filtered),
             calibration_error=calibration_error,
             calibration_bins=calibration_bins,
             roi=roi_metrics["roi"],
@@ -509,148 +678,99 @@ class WalkForwardBacktest:
             total_stake=roi_metrics["stake"],
             win_rate=roi_metrics["win_rate"],
             avg_odds=roi_metrics["avg_odds"],
-            home_accuracy=home_accuracy,
-            draw_accuracy=draw_accuracy,
-            away_accuracy=away_accuracy,
-            home_brier=home_brier,
-            draw_brier=draw_brier,
-            away_brier=away_brier,
-            avg_model_agreement=avg_agreement,
-            avg_confidence=avg_confidence,
+            home_accuracy=float(outcome_accuracy[0]),
+            draw_accuracy=float(outcome_accuracy[1]),
+            away_accuracy=float(outcome_accuracy[2]),
+            home_brier=float(outcome_brier[0]),
+            draw_brier=float(outcome_brier[1]),
+            away_brier=float(outcome_brier[2]),
+            avg_model_agreement=float(filtered.model_agreement.mean()),
+            avg_confidence=float(filtered.confidence.mean()),
         )
 
-    def _calculate_log_loss(self, predictions: list[dict[str, Any]]) -> float:
+    def _calculate_log_loss(self, predictions: BacktestPredictions) -> float:
         """Calculate multi-class log loss."""
-        eps = 1e-15
-        log_loss_sum = 0.0
-
-        for p in predictions:
-            actual = p["actual"]
-            if actual == "home":
-                prob = np.clip(p["prob_home"], eps, 1 - eps)
-            elif actual == "draw":
-                prob = np.clip(p["prob_draw"], eps, 1 - eps)
-            else:
-                prob = np.clip(p["prob_away"], eps, 1 - eps)
+        if not len(predictions):
+            return 0.0
 
-            log_loss_sum -= np.log(prob)
-
-        return log_loss_sum / len(predictions) if predictions else 0.0
+        eps = 1e-15
+        prob_actual = predictions.probs[np.arange(len(predictions)), predictions.actual]
+        return float(-np.log(np.clip(prob_actual, eps, 1 - eps)).mean())
 
-    def _calculate_rps(self, predictions: list[dict[str, Any]]) -> float:
+    def _calculate_rps(self, predictions: BacktestPredictions) -> float:
         """Calculate Ranked Probability Score (ordinal metric)."""
-        rps_sum = 0.0
-
-        for p in predictions:
-            # Cumulative probabilities
-            pred_cum = np.cumsum([p["prob_home"], p["prob_draw"], p["prob_away"]])
+        if not len(predictions):
+            return 0.0
 
-            # Actual cumulative
-            actual_idx = {"home": 0, "draw": 1, "away": 2}[p["actual"]]
-            actual_cum = np.array([1.0 if i >= actual_idx else 0.0 for i in range(3)])
-
-            # RPS
-            rps = np.mean((pred_cum - actual_cum) ** 2)
-            rps_sum += rps
-
-        return rps_sum / len(predictions) if predictions else 0.0
+        pred_cum = np.cumsum(predictions.probs, axis=1)
+        actual_cum = np.cumsum(predictions.actual_one_hot, axis=1)
+        return float(((pred_cum - actual_cum) ** 2).mean())
 
     def _calculate_calibration(
         self,
-        predictions: list[dict[str, Any]],
+        predictions: BacktestPredictions,
     ) -> tuple[float, list[CalibrationBin]]:
         """Calculate Expected Calibration Error and calibration bins."""
-        bins: list[CalibrationBin] = []
-        bin_width = 1.0 / self.n_calibration_bins
-
-        # Use home win probability for calibration analysis
-        for i in range(self.n_calibration_bins):
-            bin_start = i * bin_width
-            bin_end = (i + 1) * bin_width
-
-            # Get predictions in this bin (for home win probability)
-            in_bin = [p for p in predictions if bin_start <= p["prob_home"] < bin_end]
-
-            if in_bin:
-                mean_pred = np.mean([p["prob_home"] for p in in_bin])
-                actual_rate = np.mean([1.0 if p["actual"] == "home" else 0.0 for p in in_bin])
-
-                bins.append(
-                    CalibrationBin(
-                        bin_start=bin_start,
-                        bin_end=bin_end,
-                        predicted_prob=mean_pred,
-                        actual_rate=actual_rate,
-                        count=len(in_bin),
-                    )
-                )
+        n_bins = self.n_calibration_bins
+        bin_width = 1.0 / n_bins
+        edges = np.arange(n_bins + 1) * bin_width
+
+        # Use home win probability for calibration analysis; bins are [start, end)
+        prob_home = predictions.probs[:, 0]
+        bin_index = np.searchsorted(edges, prob_home, side="right") - 1
+        in_range = (bin_index >= 0) & (bin_index < n_bins)
+        bin_index = bin_index[in_range]
+
+        counts = np.bincount(bin_index, minlength=n_bins)
+        prob_sums = np.bincount(bin_index, weights=prob_home[in_range], minlength=n_bins)
+        home_wins = np.bincount(
+            bin_index, weights=(predictions.actual[in_range] == 0), minlength=n_bins
+        )
+
+        bins = [
+            CalibrationBin(
+                bin_start=i * bin_width,
+                bin_end=(i + 1) * bin_width,
+                predicted_prob=float(prob_sums[i] / counts[i]),
+                actual_rate=float(home_wins[i] / counts[i]),
+                count=int(counts[i]),
+            )
+            for i in np.flatnonzero(counts).tolist()
+        ]
 
         # Calculate ECE (weighted by bin size)
-        ece = 0.0
-        total = sum(b.count for b in bins)
-        if total > 0:
-            for b in bins:
-                ece += (b.count / total) * abs(b.predicted_prob - b.actual_rate)
+        total = int(counts.sum())
+        ece = sum((b.count / total) * abs(b.predicted_prob - b.actual_rate) for b in bins)
 
-        return ece, bins
+        return float(ece), bins
 
-    def _calculate_roi(
-        self,
-        predictions: list[dict[str, Any]],
-    ) -> dict[str, float]:
+    def _calculate_roi(self, predictions: BacktestPredictions) -> dict[str, float]:
         """Calculate ROI metrics for simulated betting."""
-        total_stake = 0.0
-        total_return = 0.0
-        wins = 0
-        odds_sum = 0.0
-        bets_placed = 0
-
-        for p in predictions:
-            # Check if we have odds
-            odds_map = {
-                "home": p.get("odds_home"),
-                "draw": p.get("odds_draw"),
-                "away": p.get("odds_away"),
-            }
-            prob_map = {
-                "home": p["prob_home"],
-                "draw": p["prob_draw"],
-                "away": p["prob_away"],
-            }
-
-            # Find best value bet
-            best_outcome = None
-            best_value = 0.0
-
-            for outcome in ["home", "draw", "away"]:
-                odds = odds_map.get(outcome)
-                prob = prob_map.get(outcome, 0)
+        odds = predictions.odds
 
-                if odds and prob >= self.betting_threshold:
-                    implied_prob = 1.0 / odds
-                    value = prob - implied_prob
+        # Value of each outcome with odds and enough probability; bet the best
+        # positive value per match (first outcome wins ties), unit stake
+        eligible = np.isfinite(odds) & (odds > 0) & (predictions.probs >= self.betting_threshold)
+        value = np.full(odds.shape, -np.inf)
+        np.subtract(predictions.probs, 1.0 / odds, out=value, where=eligible)
 
-                    if value > best_value:
-                        best_value = value
-                        best_outcome = outcome
+        best = np.argmax(value, axis=1)
+        rows = np.arange(len(predictions))
+        placed = value[rows, best] > 0
 
-            # Place bet if value found
-            if best_outcome:
-                stake = 1.0  # Unit stake
-                total_stake += stake
-                odds = odds_map[best_outcome]
-                odds_sum += odds
-                bets_placed += 1
+        bet_odds = odds[rows, best][placed]
+        won = predictions.actual[placed] == best[placed]
 
-                if p["actual"] == best_outcome:
-                    total_return += stake * odds
-                    wins += 1
+        bets_placed = int(placed.sum())
+        total_stake = float(bets_placed)
+        total_return = float(bet_odds[won].sum())
+        wins = int(won.sum())
 
         # Calculate ROI
         profit = total_return - total_stake
         roi = (profit / total_stake * 100) if total_stake > 0 else 0.0
         win_rate = (wins / bets_placed * 100) if bets_placed > 0 else 0.0
-        avg_odds = (odds_sum / bets_placed) if bets_placed > 0 else 0.0
+        avg_odds = float(bet_odds.mean()) if bets_placed > 0 else 0.0
 
         return {
             "roi": roi,
@@ -662,43 +782,27 @@ class WalkForwardBacktest:
 
     def _calculate_rolling_metrics(
         self,
-        predictions: list[dict[str, Any]],
+        predictions: BacktestPredictions,
         metric: Literal["accuracy", "brier"] = "accuracy",
         window_size: int = 50,
     ) -> list[tuple[date, float]]:
-        """Calculate rolling metrics over time."""
+        """Calculate rolling metrics over time from cumulative sums."""
         if len(predictions) < window_size:
             return []
 
         # Sort by date
-        sorted_preds = sorted(predictions, key=lambda p: p["match_date"])
-        results: list[tuple[date, float]] = []
-
-        for i in range(window_size, len(sorted_preds) + 1):
-            window = sorted_preds[i - window_size : i]
-            end_date = window[-1]["match_date"]
-
-            if metric == "accuracy":
-                correct = sum(1 for p in window if p["predicted"] == p["actual"])
-                value = correct / len(window)
-            else:  # brier
-                brier_sum = 0.0
-                for p in window:
-                    actual_probs = [
-                        1.0 if p["actual"] == "home" else 0.0,
-                        1.0 if p["actual"] == "draw" else 0.0,
-                        1.0 if p["actual"] == "away" else 0.0,
-                    ]
-                    predicted_probs = [p["prob_home"], p["prob_draw"], p["prob_away"]]
-                    brier = sum(
-                        (pred - actual) ** 2 for pred, actual in zip(predicted_probs, actual_probs)
-                    )
-                    brier_sum += brier
-                value = brier_sum / len(window)
+        order = np.argsort(predictions.match_dates, kind="stable")
+        if metric == "accuracy":
+            values = (predictions.predicted == predictions.actual)[order].astype(np.float64)
+        else:  # brier
+            values = ((predictions.probs - predictions.actual_one_hot) ** 2).sum(axis=1)[order]
 
-            results.append((end_date, value))
+        # Window i covers values[i - window_size + 1 .. i]
+        cumulative = np.concatenate(([0.0], np.cumsum(values)))
+        window_means = (cumulative[window_size:] - cumulative[:-window_size]) / window_size
+        end_dates = predictions.match_dates[order][window_size - 1 :].astype(object)
 
-        return results
+        return list(zip(end_dates.tolist(), window_means.tolist(), strict=True))
 
     def _empty_results(self) -> BacktestResults:
         """Return empty results for edge cases."""
@@ -711,6 +815,14 @@ class WalkForwardBacktest:
         )
 
 
+def _run_fold_task(
+    task: tuple[WalkForwardBacktest, FoldWindow, list[MatchData], list[MatchData], bool, bool],
+) -> tuple[WalkForwardFold, BacktestPredictions]:
+    """Module-level fold runner so folds can be pickled to worker processes."""
+    backtest, *args = task
+    return backtest._run_fold(*args)
+
+
 def format_backtest_report(results: BacktestResults) -> str:
     """Format backtest results as a human-readable report."""
     m = results.overall_metrics
@@ -18,6 +18,7 @@ import numpy as np
 from src.prediction_engine.adaptive_weights import (
     AdaptiveWeightCalculator,
     AdaptiveWeights,
+    adaptive_weight_calculator,
 )
 from src.prediction_engine.models.elo import ELOSystem
 from src.prediction_engine.models.poisson import PoissonModel
@@ -673,5 +674,5 @@ class EnsemblePredictor:
         )
 
 
-# Default instance
-ensemble_predictor = EnsemblePredictor()
+# Default instance, sharing the persisted adaptive weight history
+ensemble_predictor = EnsemblePredictor(adaptive_weight_calculator=adaptive_weight_calculator)
@@ -14,7 +14,7 @@ This ensemble uses adaptive weighting based on data availability and match conte
 
 import logging
 from dataclasses import dataclass
-from typing import Literal
+from typing import Any, Literal
 
 import numpy as np
 
@@ -27,7 +27,12 @@ logger = logging.getLogger(__name__)
 
 # Try to import local ML model loader (faster, no network dependency)
 try:
-    from src.ml.model_loader import get_ml_prediction, model_loader
+    from src.ml.model_loader import (
+        get_ml_prediction,
+        get_ml_prediction_async,
+        get_ml_predictions_batch,
+        model_loader,
+    )
 
     LOCAL_ML_AVAILABLE = model_loader.is_trained()
     if LOCAL_ML_AVAILABLE:
@@ -394,6 +399,180 @@ class AdvancedEnsemblePredictor:
 
         return float(np.clip(agreement, 0.0, 1.0))
 
+    def _base_weights(self, ml_available: bool) -> tuple[float, float, float, float]:
+        """Statistical model weights: (dixon_coles, advanced_elo, poisson, basic_elo)."""
+        if ml_available:
+            return (
+                self.WEIGHT_DIXON_COLES,
+                self.WEIGHT_ADVANCED_ELO,
+                self.WEIGHT_POISSON,
+                self.WEIGHT_BASIC_ELO,
+            )
+        return (
+            self.WEIGHT_DIXON_COLES_NO_ML,
+            self.WEIGHT_ADVANCED_ELO_NO_ML,
+            self.WEIGHT_POISSON_NO_ML,
+            self.WEIGHT_BASIC_ELO_NO_ML,
+        )
+
+    def _combine_predictions(
+        self,
+        predictions: list[tuple[float, float, float]],
+        weights_list: list[float],
+        contributions: list[ModelContribution],
+        llm_adjustments: AdvancedLLMAdjustments | None,
+        odds_home: float | None,
+        odds_draw: float | None,
+        odds_away: float | None,
+        expected_home_goals: float,
+        expected_away_goals: float,
+    ) -> AdvancedEnsemblePrediction:
+        """
+        Combine component model outputs into the final prediction.
+
+        Shared by predict() and predict_batch() so both paths produce
+        identical results for the same inputs.
+        """
+        # Calculate model agreement
+        model_agreement = self._calculate_model_agreement(predictions, weights_list)
+
+        # Calibrate probabilities using confidence scores
+        confidences = [c.confidence for c in contributions]
+        home_prob, draw_prob, away_prob, avg_confidence = self._calibrate_probabilities(
+            predictions, confidences
+        )
+
+        # Apply LLM adjustments if available
+        if llm_adjustments:
+            home_prob, draw_prob, away_prob = self._apply_llm_adjustments(
+                home_prob, draw_prob, away_prob, llm_adjustments
+            )
+
+        # Determine recommended bet
+        probs = {"home": home_prob, "draw": draw_prob, "away": away_prob}
+        recommended_bet = max(probs, key=probs.get)  # type: ignore
+
+        # Calculate confidence
+        confidence = self._calculate_confidence(home_prob, draw_prob, away_prob, model_agreement)
+
+        # Calculate uncertainty
+        entropy = -sum(p * np.log(p + 1e-10) for p in [home_prob, draw_prob, away_prob])
+        uncertainty = entropy / np.log(3)  # Normalize to [0, 1]
+
+        # Calibration score (how well distributed probabilities are)
+        calibration = 1.0 - uncertainty * 0.3  # Account for entropy
+
+        # Calculate value if odds available
+        value_score = None
+        if recommended_bet == "home" and odds_home:
+            value_score = self._calculate_value(home_prob, odds_home)
+        elif recommended_bet == "draw" and odds_draw:
+            value_score = self._calculate_value(draw_prob, odds_draw)
+        elif recommended_bet == "away" and odds_away:
+            value_score = self._calculate_value(away_prob, odds_away)
+
+        return AdvancedEnsemblePrediction(
+            home_win_prob=home_prob,
+            draw_prob=draw_prob,
+            away_win_prob=away_prob,
+            recommended_bet=recommended_bet,  # type: ignore
+            confidence=confidence,
+            calibration_score=calibration,
+            value_score=value_score,
+            model_contributions=contributions,
+            llm_adjustments=llm_adjustments,
+            expected_home_goals=expected_home_goals,
+            expected_away_goals=expected_away_goals,
+            model_agreement=model_agreement,
+            uncertainty=uncertainty,
+        )
+
+    @staticmethod
+    def _hf_features(
+        home_attack: float,
+        home_defense: float,
+        away_attack: float,
+        away_defense: float,
+        home_elo: float,
+        away_elo: float,
+        home_form_score: float = 50.0,
+        away_form_score: float = 50.0,
+        home_rest_days: float = 0.5,
+        away_rest_days: float = 0.5,
+        home_congestion: float = 0.5,
+        away_congestion: float = 0.5,
+        **_ignored: Any,
+    ) -> dict[str, float]:
+        """HuggingFace /predict inputs from predict() arguments (form 0-1, rest in days)."""
+        return {
+            "home_attack": home_attack,
+            "home_defense": home_defense,
+            "away_attack": away_attack,
+            "away_defense": away_defense,
+            "home_elo": home_elo,
+            "away_elo": away_elo,
+            "home_form": home_form_score / 100.0,
+            "away_form": away_form_score / 100.0,
+            "home_rest_days": home_rest_days * 7.0,
+            "away_rest_days": away_rest_days * 7.0,
+            "home_fixture_congestion": home_congestion,
+            "away_fixture_congestion": away_congestion,
+        }
+
+    @staticmethod
+    def _local_ml_features(
+        home_attack: float,
+        home_defense: float,
+        away_attack: float,
+        away_defense: float,
+        home_team_id: int | None = None,
+        away_team_id: int | None = None,
+        home_form_score: float = 50.0,
+        away_form_score: float = 50.0,
+        home_rest_days: float = 0.5,
+        home_congestion: float = 0.5,
+        away_rest_days: float = 0.5,
+        away_congestion: float = 0.5,
+        **_ignored: Any,
+    ) -> dict[str, Any]:
+        """get_ml_prediction inputs from predict() arguments."""
+        return {
+            "home_team_id": home_team_id,
+            "away_team_id": away_team_id,
+            "home_attack": home_attack,
+            "home_defense": home_defense,
+            "away_attack": away_attack,
+            "away_defense": away_defense,
+            "home_form": home_form_score,
+            "away_form": away_form_score,
+            "home_rest_days": home_rest_days,
+            "home_congestion": home_congestion,
+            "away_rest_days": away_rest_days,
+            "away_congestion": away_congestion,
+        }
+
+    async def predict_async(self, **kwargs: Any) -> AdvancedEnsemblePrediction:
+        """
+        predict() for async code (same arguments).
+
+        The local ML models run in shared micro-batches off the event loop
+        (see src.ml.model_loader.MicroBatcher), and the HuggingFace fallback is
+        awaited on the pooled async client, behind its circuit breaker; the
+        rest of the ensemble is cheap CPU work.
+        """
+        local: dict[str, Any] | None = None
+        remote: dict[str, Any] | None = None
+        hf_client = get_hf_ml_client() if HF_ML_AVAILABLE else None
+        if LOCAL_ML_AVAILABLE:
+            try:
+                local = await get_ml_prediction_async(**self._local_ml_features(**kwargs))
+            except Exception as e:
+                logger.warning(f"Local ML prediction failed: {e}")
+        # HuggingFace fallback when the local models are missing or returned nothing
+        if not local and hf_client is not None and hf_client.is_available():
+            remote = await hf_client.predict(**self._hf_features(**kwargs))
+        return self.predict(**kwargs, local_ml_result=local or {}, remote_ml_result=remote or {})
+
     def predict(
         self,
         # Team stats for Poisson/Dixon-Coles
@@ -431,10 +610,16 @@ class AdvancedEnsemblePredictor:
         home_congestion: float = 0.5,
         away_rest_days: float = 0.5,
         away_congestion: float = 0.5,
+        # ML results fetched by predict_async ({} if that call failed)
+        local_ml_result: dict[str, Any] | None = None,
+        remote_ml_result: dict[str, Any] | None = None,
     ) -> AdvancedEnsemblePrediction:
         """
         Make advanced ensemble prediction.
 
+        When the local ML models are unavailable, the HuggingFace fallback
+        here is a blocking HTTP call; async code uses predict_async instead.
+
         Args:
             home_attack, home_defense, away_attack, away_defense: Team stats
             home_elo, away_elo: ELO ratings
@@ -443,6 +628,8 @@ class AdvancedEnsemblePredictor:
             time_weight: Time weight for Dixon-Coles (0-1)
             llm_adjustments: LLM-derived adjustments
             odds_home, odds_draw, odds_away: Bookmaker odds
+            local_ml_result: Local ML result already computed (None = compute here)
+            remote_ml_result: HuggingFace response already fetched (None = fetch here)
 
         Returns:
             AdvancedEnsemblePrediction with combined probabilities
@@ -456,16 +643,9 @@ class AdvancedEnsemblePredictor:
         ml_available = hf_client is not None and hf_client.is_available()
 
         # Determine weights based on ML availability
-        if ml_available:
-            dc_base_weight = self.WEIGHT_DIXON_COLES
-            elo_adv_weight = self.WEIGHT_ADVANCED_ELO
-            poisson_weight = self.WEIGHT_POISSON
-            basic_elo_weight = self.WEIGHT_BASIC_ELO
-        else:
-            dc_base_weight = self.WEIGHT_DIXON_COLES_NO_ML
-            elo_adv_weight = self.WEIGHT_ADVANCED_ELO_NO_ML
-            poisson_weight = self.WEIGHT_POISSON_NO_ML
-            basic_elo_weight = self.WEIGHT_BASIC_ELO_NO_ML
+        dc_base_weight, elo_adv_weight, poisson_weight, basic_elo_weight = self._base_weights(
+            ml_available
+        )
 
         # 1. Dixon-Coles Model (Primary)
         # Check if xG data is available and meaningful
@@ -597,20 +777,21 @@ class AdvancedEnsemblePredictor:
         # Try local ML models first (faster, no network dependency)
         if LOCAL_ML_AVAILABLE and not ml_added:
             try:
-                local_ml_result = get_ml_prediction(
-                    home_team_id=home_team_id,
-                    away_team_id=away_team_id,
-                    home_attack=home_attack,
-                    home_defense=home_defense,
-                    away_attack=away_attack,
-                    away_defense=away_defense,
-                    home_form=home_form_score,
-                    away_form=away_form_score,
-                    home_rest_days=home_rest_days,
-                    home_congestion=home_congestion,
-                    away_rest_days=away_rest_days,
-                    away_congestion=away_congestion,
-                )
+                if local_ml_result is None:
+                    local_ml_result = get_ml_prediction(
+                        home_team_id=home_team_id,
+                        away_team_id=away_team_id,
+                        home_attack=home_attack,
+                        home_defense=home_defense,
+                        away_attack=away_attack,
+                        away_defense=away_defense,
+                        home_form=home_form_score,
+                        away_form=away_form_score,
+                        home_rest_days=home_rest_days,
+                        home_congestion=home_congestion,
+                        away_rest_days=away_rest_days,
+                        away_congestion=away_congestion,
+                    )
 
                 if local_ml_result:
                     predictions.append(
@@ -642,20 +823,24 @@ class AdvancedEnsemblePredictor:
         # Fallback to HuggingFace ML service if local not available
         if ml_available and hf_client is not None and not ml_added:
             try:
-                ml_result = hf_client.predict_sync(
-                    home_attack=home_attack,
-                    home_defense=home_defense,
-                    away_attack=away_attack,
-                    away_defense=away_defense,
-                    home_elo=home_elo,
-                    away_elo=away_elo,
-                    home_form=home_form_score / 100.0,
-                    away_form=away_form_score / 100.0,
-                    home_rest_days=home_rest_days * 7.0,
-                    away_rest_days=away_rest_days * 7.0,
-                    home_fixture_congestion=home_congestion,
-                    away_fixture_congestion=away_congestion,
-                )
+                ml_result = remote_ml_result
+                if ml_result is None:
+                    ml_result = hf_client.predict_sync(
+                        **self._hf_features(
+                            home_attack,
+                            home_defense,
+                            away_attack,
+                            away_defense,
+                            home_elo,
+                            away_elo,
+                            home_form_score,
+                            away_form_score,
+                            home_rest_days,
+                            away_rest_days,
+                            home_congestion,
+                            away_congestion,
+                        )
+                    )
 
                 if ml_result and "ensemble" in ml_result:
                     ensemble = ml_result["ensemble"]
@@ -683,63 +868,265 @@ class AdvancedEnsemblePredictor:
             except Exception as e:
                 logger.warning(f"HuggingFace ML prediction failed: {e}")
 
-        # Calculate model agreement
-        model_agreement = self._calculate_model_agreement(predictions, weights_list)
+        return self._combine_predictions(
+            predictions=predictions,
+            weights_list=weights_list,
+            contributions=contributions,
+            llm_adjustments=llm_adjustments,
+            odds_home=odds_home,
+            odds_draw=odds_draw,
+            odds_away=odds_away,
+            expected_home_goals=dc_pred.expected_home_goals,
+            expected_away_goals=dc_pred.expected_away_goals,
+        )
 
-        # Calibrate probabilities using confidence scores
-        confidences = [c.confidence for c in contributions]
-        home_prob, draw_prob, away_prob, avg_confidence = self._calibrate_probabilities(
-            predictions, confidences
+    def predict_batch(
+        self,
+        # Team stats for Poisson/Dixon-Coles, shape (N,)
+        home_attack: np.ndarray,
+        home_defense: np.ndarray,
+        away_attack: np.ndarray,
+        away_defense: np.ndarray,
+        # ELO ratings, shape (N,)
+        home_elo: np.ndarray,
+        away_elo: np.ndarray,
+        # Optional xG data, shape (N,); rows with any value <= 0 or NaN use goals instead
+        home_xg_for: np.ndarray | None = None,
+        home_xg_against: np.ndarray | None = None,
+        away_xg_for: np.ndarray | None = None,
+        away_xg_against: np.ndarray | None = None,
+        # Recent form per match for Advanced ELO
+        home_recent_form: list[list[Literal["W", "D", "L"]] | None] | None = None,
+        away_recent_form: list[list[Literal["W", "D", "L"]] | None] | None = None,
+        # Time weight for Dixon-Coles, scalar or shape (N,)
+        time_weight: np.ndarray | float = 1.0,
+        # LLM adjustments per match
+        llm_adjustments: list[AdvancedLLMAdjustments | None] | None = None,
+        # Bookmaker odds, shape (N,); NaN for missing
+        odds_home: np.ndarray | None = None,
+        odds_draw: np.ndarray | None = None,
+        odds_away: np.ndarray | None = None,
+        # Team IDs for ML models
+        home_team_ids: list[int | None] | None = None,
+        away_team_ids: list[int | None] | None = None,
+        # Form scores for ML (0-100), scalar or shape (N,)
+        home_form_score: np.ndarray | float = 50.0,
+        away_form_score: np.ndarray | float = 50.0,
+        # Fatigue scores for extended ML features, scalar or shape (N,)
+        home_rest_days: np.ndarray | float = 0.5,
+        home_congestion: np.ndarray | float = 0.5,
+        away_rest_days: np.ndarray | float = 0.5,
+        away_congestion: np.ndarray | float = 0.5,
+    ) -> list[AdvancedEnsemblePrediction]:
+        """
+        Make advanced ensemble predictions for many matches at once.
+
+        Takes the same inputs as predict() in columnar form. Every statistical
+        component runs vectorized over the batch and the local ML models are
+        called once on a stacked feature matrix. Results match predict() row
+        by row and are returned in input order.
+
+        Returns:
+            List of AdvancedEnsemblePrediction, one per input row
+        """
+        home_attack = np.asarray(home_attack, dtype=np.float64)
+        n = len(home_attack)
+        if n == 0:
+            return []
+
+        def column(values: np.ndarray | float) -> np.ndarray:
+            return np.broadcast_to(np.asarray(values, dtype=np.float64), (n,))
+
+        def optional(values: np.ndarray | None, i: int) -> float | None:
+            if values is None:
+                return None
+            value = float(values[i])
+            return None if np.isnan(value) else value
+
+        home_defense = column(home_defense)
+        away_attack = column(away_attack)
+        away_defense = column(away_defense)
+        home_elo = column(home_elo)
+        away_elo = column(away_elo)
+        home_form_score = column(home_form_score)
+        away_form_score = column(away_form_score)
+        home_rest_days = column(home_rest_days)
+        home_congestion = column(home_congestion)
+        away_rest_days = column(away_rest_days)
+        away_congestion = column(away_congestion)
+        home_ids = home_team_ids if home_team_ids is not None else [None] * n
+        away_ids = away_team_ids if away_team_ids is not None else [None] * n
+
+        hf_client = get_hf_ml_client() if HF_ML_AVAILABLE else None
+        ml_available = hf_client is not None and hf_client.is_available()
+        dc_base_weight, elo_adv_weight, poisson_weight, basic_elo_weight = self._base_weights(
+            ml_available
         )
 
-        # Apply LLM adjustments if available
-        if llm_adjustments:
-            home_prob, draw_prob, away_prob = self._apply_llm_adjustments(
-                home_prob, draw_prob, away_prob, llm_adjustments
-            )
+        # 1. Dixon-Coles, using xG where all four values are meaningful
+        xg_columns = [home_xg_for, home_xg_against, away_xg_for, away_xg_against]
+        if all(x is not None for x in xg_columns):
+            xg = [np.nan_to_num(column(x), nan=0.0) for x in xg_columns]  # type: ignore[arg-type]
+            has_xg = (xg[0] > 0) & (xg[1] > 0) & (xg[2] > 0) & (xg[3] > 0)
+        else:
+            xg = [np.zeros(n)] * 4
+            has_xg = np.zeros(n, dtype=bool)
+
+        lambdas_home, lambdas_away = self.dixon_coles.calculate_expected_goals_batch(
+            np.where(has_xg, xg[0], home_attack),
+            np.where(has_xg, xg[1], home_defense),
+            np.where(has_xg, xg[2], away_attack),
+            np.where(has_xg, xg[3], away_defense),
+            time_weight,
+        )
+        dc = self.dixon_coles.predict_batch(lambdas_home, lambdas_away)
+        dc_weights = np.where(has_xg, dc_base_weight * 1.25, dc_base_weight)
 
-        # Determine recommended bet
-        probs = {"home": home_prob, "draw": draw_prob, "away": away_prob}
-        recommended_bet = max(probs, key=probs.get)  # type: ignore
+        # 2. Advanced ELO, 3. Poisson, 4. Basic ELO
+        adv_elo = self.advanced_elo.predict_batch(
+            home_elo, away_elo, home_recent_form, away_recent_form
+        )
+        poisson = self.poisson.predict_batch(home_attack, home_defense, away_attack, away_defense)
+        elo_home, elo_draw, elo_away = self.elo.calculate_outcome_probabilities_batch(
+            home_elo, away_elo
+        )
 
-        # Calculate confidence
-        confidence = self._calculate_confidence(home_prob, draw_prob, away_prob, model_agreement)
+        # 5. ML models: one stacked call to the local models, HuggingFace batches as fallback
+        ml_results: list[dict[str, Any] | None] = [None] * n
+        ml_names: list[str] = [""] * n
+        if LOCAL_ML_AVAILABLE:
+            try:
+                local_results = get_ml_predictions_batch(
+                    home_ids,
+                    away_ids,
+                    home_attack,
+                    home_defense,
+                    away_attack,
+                    away_defense,
+                    home_form_score,
+                    away_form_score,
+                    home_rest_days=home_rest_days,
+                    home_congestion=home_congestion,
+                    away_rest_days=away_rest_days,
+                    away_congestion=away_congestion,
+                )
+                for i, result in enumerate(local_results):
+                    if result:
+                        ml_results[i] = result
+                        ml_names[i] = f"ML Local ({result.get('model_used', 'ensemble')})"
+                logger.info(
+                    f"ML predictions added from LOCAL models for {sum(1 for r in ml_results if r)}/{n} matches"
+                )
+            except Exception as e:
+                logger.warning(f"Local ML batch prediction failed: {e}")
 
-        # Calculate uncertainty
-        entropy = -sum(p * np.log(p + 1e-10) for p in [home_prob, draw_prob, away_prob])
-        uncertainty = entropy / np.log(3)  # Normalize to [0, 1]
+        if ml_available and hf_client is not None:
+            pending = [i for i in range(n) if ml_results[i] is None]
+            try:
+                hf_results = hf_client.predict_batch_sync(
+                    [
+                        self._hf_features(
+                            float(home_attack[i]),
+                            float(home_defense[i]),
+                            float(away_attack[i]),
+                            float(away_defense[i]),
+                            float(home_elo[i]),
+                            float(away_elo[i]),
+                            float(home_form_score[i]),
+                            float(away_form_score[i]),
+                            float(home_rest_days[i]),
+                            float(away_rest_days[i]),
+                            float(home_congestion[i]),
+                            float(away_congestion[i]),
+                        )
+                        for i in pending
+                    ]
+                )
+                for i, hf_result in zip(pending, hf_results):
+                    if hf_result and "ensemble" in hf_result:
+                        ml_results[i] = {
+                            **hf_result["ensemble"],
+                            "confidence": hf_result.get("confidence", 0.7),
+                        }
+                        ml_names[i] = "ML (HuggingFace)"
+            except Exception as e:
+                logger.warning(f"HuggingFace ML batch prediction failed: {e}")
+
+        # Combine per match (cheap: only a handful of scalars per row)
+        ml_weight = self.WEIGHT_XGBOOST + self.WEIGHT_RANDOM_FOREST
+        results: list[AdvancedEnsemblePrediction] = []
+        for i in range(n):
+            components = [
+                ("Dixon-Coles", dc.home_win_probs, dc.draw_probs, dc.away_win_probs),
+                (
+                    "Advanced ELO",
+                    adv_elo.home_win_probs,
+                    adv_elo.draw_probs,
+                    adv_elo.away_win_probs,
+                ),
+                ("Poisson", poisson.home_win_probs, poisson.draw_probs, poisson.away_win_probs),
+                ("Basic ELO", elo_home, elo_draw, elo_away),
+            ]
+            # (weight used for combining, weight reported in contributions, confidence)
+            component_weights = [
+                (float(dc_weights[i]), float(dc_weights[i]), 0.8),
+                (elo_adv_weight, self.WEIGHT_ADVANCED_ELO, float(adv_elo.confidences[i])),
+                (poisson_weight, self.WEIGHT_POISSON, 0.7),
+                (basic_elo_weight, basic_elo_weight, 0.65),
+            ]
 
-        # Calibration score (how well distributed probabilities are)
-        calibration = 1.0 - uncertainty * 0.3  # Account for entropy
+            predictions: list[tuple[float, float, float]] = []
+            weights_list: list[float] = []
+            contributions: list[ModelContribution] = []
+            for (name, home_p, draw_p, away_p), (weight, reported, conf) in zip(
+                components, component_weights
+            ):
+                probs = (float(home_p[i]), float(draw_p[i]), float(away_p[i]))
+                predictions.append(probs)
+                weights_list.append(weight)
+                contributions.append(
+                    ModelContribution(
+                        name=name,
+                        home_prob=probs[0],
+                        draw_prob=probs[1],
+                        away_prob=probs[2],
+                        weight=reported,
+                        confidence=conf,
+                    )
+                )
 
-        # Calculate value if odds available
-        value_score = None
-        if recommended_bet == "home" and odds_home:
-            value_score = self._calculate_value(home_prob, odds_home)
-        elif recommended_bet == "draw" and odds_draw:
-            value_score = self._calculate_value(draw_prob, odds_draw)
-        elif recommended_bet == "away" and odds_away:
-            value_score = self._calculate_value(away_prob, odds_away)
+            ml_result = ml_results[i]
+            if ml_result is not None:
+                predictions.append(
+                    (ml_result["home_win"], ml_result["draw"], ml_result["away_win"])
+                )
+                weights_list.append(ml_weight)
+                contributions.append(
+                    ModelContribution(
+                        name=ml_names[i],
+                        home_prob=ml_result["home_win"],
+                        draw_prob=ml_result["draw"],
+                        away_prob=ml_result["away_win"],
+                        weight=ml_weight,
+                        confidence=ml_result.get("confidence", 0.7),
+                    )
+                )
 
-        # Expected goals
-        exp_home = dc_pred.expected_home_goals
-        exp_away = dc_pred.expected_away_goals
+            results.append(
+                self._combine_predictions(
+                    predictions=predictions,
+                    weights_list=weights_list,
+                    contributions=contributions,
+                    llm_adjustments=llm_adjustments[i] if llm_adjustments else None,
+                    odds_home=optional(odds_home, i),
+                    odds_draw=optional(odds_draw, i),
+                    odds_away=optional(odds_away, i),
+                    expected_home_goals=float(dc.expected_home_goals[i]),
+                    expected_away_goals=float(dc.expected_away_goals[i]),
+                )
+            )
 
-        return AdvancedEnsemblePrediction(
-            home_win_prob=home_prob,
-            draw_prob=draw_prob,
-            away_win_prob=away_prob,
-            recommended_bet=recommended_bet,  # type: ignore
-            confidence=confidence,
-            calibration_score=calibration,
-            value_score=value_score,
-            model_contributions=contributions,
-            llm_adjustments=llm_adjustments,
-            expected_home_goals=exp_home,
-            expected_away_goals=exp_away,
-            model_agreement=model_agreement,
-            uncertainty=uncertainty,
-        )
+        return results
 
 
 # Default instance
@@ -17,18 +17,12 @@ from typing import Any
 
 import numpy as np
 
-# Lazy import scipy to reduce memory at startup (512MB limit on Render)
-_poisson = None
-
-
-def _get_poisson():
-    """Lazy load scipy.stats.poisson to reduce memory usage."""
-    global _poisson
-    if _poisson is None:
-        from scipy.stats import poisson as scipy_poisson
-
-        _poisson = scipy_poisson
-    return _poisson
+from src.prediction_engine.score_distribution import (
+    get_score_distribution,
+    get_score_distributions,
+    outcome_probabilities,
+    score_matrices,
+)
 
 
 @dataclass
@@ -44,6 +38,21 @@ class DixonColesPrediction:
     score_probabilities: dict[tuple[int, int], float]
 
 
+@dataclass
+class DixonColesBatchPrediction:
+    """Dixon-Coles predictions for a batch of fixtures (one row per match)."""
+
+    home_win_probs: np.ndarray  # (N,)
+    draw_probs: np.ndarray  # (N,)
+    away_win_probs: np.ndarray  # (N,)
+    expected_home_goals: np.ndarray  # (N,)
+    expected_away_goals: np.ndarray  # (N,)
+    score_matrices: np.ndarray  # (N, MAX_GOALS + 1, MAX_GOALS + 1), [home_goals, away_goals]
+
+    def __len__(self) -> int:
+        return len(self.home_win_probs)
+
+
 class DixonColesModel:
     """
     Dixon-Coles model for football predictions.
@@ -86,45 +95,6 @@ class DixonColesModel:
         self.time_decay_xi = time_decay_xi
         self.rho = rho  # Negative values mean low scores are more likely
 
-    def _bias_correction(
-        self,
-        home_goals: int,
-        away_goals: int,
-        lambda_home: float,
-        lambda_away: float,
-    ) -> float:
-        """
-        Apply Dixon-Coles bias correction for low scores.
-
-        Corrects for the fact that 0-0, 1-1, 1-0, and 0-1 are more likely
-        than standard Poisson predicts.
-
-        Args:
-            home_goals: Home team goals in this scenario
-            away_goals: Away team goals in this scenario
-            lambda_home: Expected goals for home team
-            lambda_away: Expected goals for away team
-
-        Returns:
-            Correction factor (1.0 = no correction)
-        """
-        # Improved correction with bounds checking
-        if home_goals == 0 and away_goals == 0:
-            correction = 1 - lambda_home * lambda_away * self.rho
-        elif home_goals == 0 and away_goals == 1:
-            correction = 1 - lambda_home * self.rho
-        elif home_goals == 1 and away_goals == 0:
-            correction = 1 - lambda_away * self.rho
-        elif home_goals == 1 and away_goals == 1:
-            correction = 1 + lambda_home * lambda_away * self.rho
-        else:
-            correction = 1.0
-
-        # Ensure correction factor stays reasonable (between 0.5 and 1.5)
-        # This prevents extreme adjustments
-        correction = float(np.clip(correction, 0.5, 1.5))
-        return correction
-
     def calculate_expected_goals(
         self,
         home_attack: float,
@@ -196,6 +166,51 @@ class DixonColesModel:
 
         return expected_home, expected_away
 
+    def calculate_expected_goals_batch(
+        self,
+        home_attack: np.ndarray,
+        home_defense: np.ndarray,
+        away_attack: np.ndarray,
+        away_defense: np.ndarray,
+        time_weight: np.ndarray | float = 1.0,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized calculate_expected_goals over arrays of team stats.
+
+        Args:
+            home_attack: Home teams' avg goals scored at home, shape (N,)
+            home_defense: Home teams' avg goals conceded at home, shape (N,)
+            away_attack: Away teams' avg goals scored away, shape (N,)
+            away_defense: Away teams' avg goals conceded away, shape (N,)
+            time_weight: Time weight factor, scalar or shape (N,)
+
+        Returns:
+            Tuple of (expected_home_goals, expected_away_goals) arrays
+        """
+        league_avg_per_team = self.league_avg_goals / 2
+        if league_avg_per_team <= 0:
+            league_avg_per_team = 1.375  # Default fallback
+
+        scale = league_avg_per_team + 0.1  # Same smoothing as the scalar version
+        safe_time_weight = np.clip(np.asarray(time_weight, dtype=np.float64), 0.5, 1.0)
+
+        expected_home = (
+            (np.asarray(home_attack, dtype=np.float64) / scale)
+            * (np.asarray(away_defense, dtype=np.float64) / scale)
+            * league_avg_per_team
+            * self.home_advantage
+            * safe_time_weight
+        )
+        expected_away = (
+            (np.asarray(away_attack, dtype=np.float64) / scale)
+            * (np.asarray(home_defense, dtype=np.float64) / scale)
+            * league_avg_per_team
+            * safe_time_weight
+            / 1.05
+        )
+
+        return np.clip(expected_home, 0.3, 5.0), np.clip(expected_away, 0.3, 5.0)
+
     def predict(
         self,
         home_attack: float,
@@ -217,49 +232,14 @@ class DixonColesModel:
         Returns:
             DixonColesPrediction with probabilities
         """
-        # Lazy load scipy to reduce memory at startup
-        poisson = _get_poisson()
-
         # Calculate expected goals
         lambda_home, lambda_away = self.calculate_expected_goals(
             home_attack, home_defense, away_attack, away_defense, time_weight
         )
 
-        # Build score probability matrix with bias correction
-        score_probs: dict[tuple[int, int], float] = {}
-        home_win_prob = 0.0
-        draw_prob = 0.0
-        away_win_prob = 0.0
-
-        for home_goals in range(self.MAX_GOALS + 1):
-            for away_goals in range(self.MAX_GOALS + 1):
-                # Base Poisson probabilities
-                base_prob = poisson.pmf(home_goals, lambda_home) * poisson.pmf(
-                    away_goals, lambda_away
-                )
-
-                # Apply Dixon-Coles bias correction
-                correction = self._bias_correction(home_goals, away_goals, lambda_home, lambda_away)
-                prob = base_prob * correction
-
-                score_probs[(home_goals, away_goals)] = prob
-
-                if home_goals > away_goals:
-                    home_win_prob += prob
-                elif home_goals < away_goals:
-                    away_win_prob += prob
-                else:
-                    draw_prob += prob
-
-        # Find most likely score
-        most_likely = max(score_probs, key=score_probs.get)  # type: ignore
-
-        # Normalize probabilities
-        total = home_win_prob + draw_prob + away_win_prob
-        if total > 0:
-            home_win_prob /= total
-            draw_prob /= total
-            away_win_prob /= total
+        # Shared (cached) score grid, derived from the plain Poisson grid
+        distribution = get_score_distribution(lambda_home, lambda_away, self.rho, self.MAX_GOALS)
+        home_win_prob, draw_prob, away_win_prob = distribution.outcome_probabilities
 
         return DixonColesPrediction(
             home_win_prob=home_win_prob,
@@ -267,8 +247,75 @@ class DixonColesModel:
             away_win_prob=away_win_prob,
             expected_home_goals=lambda_home,
             expected_away_goals=lambda_away,
-            most_likely_score=most_likely,
-            score_probabilities=score_probs,
+            most_likely_score=distribution.most_likely_score,
+            score_probabilities=dict(distribution.score_probabilities),
+        )
+
+    def score_matrix(self, lambda_home: float, lambda_away: float) -> np.ndarray:
+        """
+        Bias-corrected score probability grid for a single fixture.
+
+        Args:
+            lambda_home: Expected goals for home team
+            lambda_away: Expected goals for away team
+
+        Returns:
+            Array of shape (MAX_GOALS + 1, MAX_GOALS + 1) indexed [home_goals, away_goals]
+        """
+        return self.score_matrices(np.array([lambda_home]), np.array([lambda_away]))[0]
+
+    def score_matrices(self, lambdas_home: np.ndarray, lambdas_away: np.ndarray) -> np.ndarray:
+        """
+        Bias-corrected score probability grids for many fixtures at once.
+
+        The independent Poisson grid is an outer product of the two marginal
+        PMFs; the Dixon-Coles correction only touches the four low-score cells
+        (0-0, 0-1, 1-0, 1-1), so it is applied to that 2x2 corner only.
+
+        Args:
+            lambdas_home: Expected home goals, shape (N,)
+            lambdas_away: Expected away goals, shape (N,)
+
+        Returns:
+            Array of shape (N, MAX_GOALS + 1, MAX_GOALS + 1)
+        """
+        return score_matrices(lambdas_home, lambdas_away, self.rho, self.MAX_GOALS)
+
+    def predict_batch(
+        self,
+        lambdas_home: np.ndarray,
+        lambdas_away: np.ndarray,
+    ) -> DixonColesBatchPrediction:
+        """
+        Predict a whole set of fixtures (e.g. a matchday) in one call.
+
+        Unlike predict(), this takes expected goals directly so callers can
+        compute lambdas however they like (see calculate_expected_goals_batch).
+        Grids are built from the same quantized lambdas as predict() and are
+        stored in the shared score-distribution cache for later market pricing.
+
+        Args:
+            lambdas_home: Expected home goals, shape (N,)
+            lambdas_away: Expected away goals, shape (N,)
+
+        Returns:
+            DixonColesBatchPrediction with (N,) outcome vectors and (N, G, G) grids
+        """
+        lambdas_home = np.asarray(lambdas_home, dtype=np.float64)
+        lambdas_away = np.asarray(lambdas_away, dtype=np.float64)
+        if lambdas_home.shape != lambdas_away.shape or lambdas_home.ndim != 1:
+            raise ValueError("lambdas_home and lambdas_away must be 1-D arrays of equal length")
+
+        matrices, _ = get_score_distributions(lambdas_home, lambdas_away, self.rho, self.MAX_GOALS)
+        home_win, draw, away_win = outcome_probabilities(matrices)
+
+        return DixonColesBatchPrediction(
+            home_win_probs=home_win,
+            draw_probs=draw,
+            away_win_probs=away_win,
+            expected_home_goals=lambdas_home,
+            expected_away_goals=lambdas_away,
+            score_matrices=matrices,
         )
 
     def predict_with_xg(
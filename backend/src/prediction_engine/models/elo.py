@@ -139,6 +139,38 @@ class ELOSystem:
             away_win_prob / total,
         )
 
+    def calculate_outcome_probabilities_batch(
+        self,
+        home_ratings: np.ndarray,
+        away_ratings: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized calculate_outcome_probabilities over arrays of ratings.
+
+        Args:
+            home_ratings: Home teams' ELO ratings, shape (N,)
+            away_ratings: Away teams' ELO ratings, shape (N,)
+
+        Returns:
+            Tuple of (home_win_probs, draw_probs, away_win_probs) arrays
+        """
+        home_ratings = np.asarray(home_ratings, dtype=np.float64)
+        away_ratings = np.asarray(away_ratings, dtype=np.float64)
+
+        exp_home = 1 / (1 + 10 ** ((away_ratings - (home_ratings + self.home_advantage)) / 400))
+
+        rating_diff = np.abs(home_ratings + self.home_advantage - away_ratings)
+        base_draw_prob = 0.27
+        draw_reduction = base_draw_prob * np.minimum(0.75, np.maximum(0, rating_diff / 1200))
+        draw_prob = np.maximum(0.08, base_draw_prob - draw_reduction)
+
+        remaining_prob = 1 - draw_prob
+        home_win_prob = exp_home * remaining_prob
+        away_win_prob = (1 - exp_home) * remaining_prob
+
+        total = home_win_prob + draw_prob + away_win_prob
+        return home_win_prob / total, draw_prob / total, away_win_prob / total
+
     def actual_score(
         self,
         result: Literal["home", "draw", "away"],
@@ -29,6 +29,21 @@ class AdvancedELOPrediction:
     confidence: float
 
 
+@dataclass
+class AdvancedELOBatchPrediction:
+    """Advanced ELO predictions for a batch of fixtures (one row per match)."""
+
+    home_win_probs: np.ndarray  # (N,)
+    draw_probs: np.ndarray  # (N,)
+    away_win_probs: np.ndarray  # (N,)
+    home_performance_ratings: np.ndarray  # (N,)
+    away_performance_ratings: np.ndarray  # (N,)
+    confidences: np.ndarray  # (N,)
+
+    def __len__(self) -> int:
+        return len(self.home_win_probs)
+
+
 class AdvancedELOSystem:
     """
     Advanced ELO Rating System for football.
@@ -190,6 +205,47 @@ class AdvancedELOSystem:
             away_win_prob / total,
         )
 
+    def calculate_outcome_probabilities_batch(
+        self,
+        home_ratings: np.ndarray,
+        away_ratings: np.ndarray,
+        home_performance: np.ndarray | float = 0.0,
+        away_performance: np.ndarray | float = 0.0,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized calculate_outcome_probabilities over arrays of ratings.
+
+        Args:
+            home_ratings: Home teams' ELO ratings, shape (N,)
+            away_ratings: Away teams' ELO ratings, shape (N,)
+            home_performance: Home teams' recent performance adjustments
+            away_performance: Away teams' recent performance adjustments
+
+        Returns:
+            Tuple of (home_win_probs, draw_probs, away_win_probs) arrays
+        """
+        adjusted_home = np.asarray(home_ratings, dtype=np.float64) + (
+            np.asarray(home_performance, dtype=np.float64) * 50
+        )
+        adjusted_away = np.asarray(away_ratings, dtype=np.float64) + (
+            np.asarray(away_performance, dtype=np.float64) * 50
+        )
+
+        exp_home = 1.0 / (
+            1.0 + 10.0 ** ((adjusted_away - (adjusted_home + self.home_advantage)) / 400.0)
+        )
+
+        rating_diff = np.abs((adjusted_home + self.home_advantage) - adjusted_away)
+        draw_reduction = np.minimum(0.15, rating_diff / 1200)
+        draw_prob = np.maximum(0.08, self.draw_factor - draw_reduction)
+
+        remaining_prob = 1.0 - draw_prob
+        home_win_prob = exp_home * remaining_prob
+        away_win_prob = (1.0 - exp_home) * remaining_prob
+
+        total = home_win_prob + draw_prob + away_win_prob
+        return home_win_prob / total, draw_prob / total, away_win_prob / total
+
     def actual_score(
         self,
         result: Literal["home", "draw", "away"],
@@ -400,6 +456,66 @@ class AdvancedELOSystem:
             confidence=confidence,
         )
 
+    def predict_batch(
+        self,
+        home_ratings: np.ndarray,
+        away_ratings: np.ndarray,
+        home_recent_forms: list[list[Literal["W", "D", "L"]] | None] | None = None,
+        away_recent_forms: list[list[Literal["W", "D", "L"]] | None] | None = None,
+    ) -> AdvancedELOBatchPrediction:
+        """
+        Predict many fixtures at once.
+
+        Performance ratings are computed per team (short W/D/L lists); the
+        rating arithmetic and confidence are vectorized over the batch.
+
+        Args:
+            home_ratings: Home teams' ELO ratings, shape (N,)
+            away_ratings: Away teams' ELO ratings, shape (N,)
+            home_recent_forms: Recent home team results per match (or None)
+            away_recent_forms: Recent away team results per match (or None)
+
+        Returns:
+            AdvancedELOBatchPrediction with (N,) arrays
+        """
+        home_ratings = np.asarray(home_ratings, dtype=np.float64)
+        away_ratings = np.asarray(away_ratings, dtype=np.float64)
+        n = len(home_ratings)
+
+        home_perf = np.array(
+            [
+                self.recent_performance_rating(form) if form else 0.0
+                for form in (home_recent_forms or [None] * n)
+            ],
+            dtype=np.float64,
+        )
+        away_perf = np.array(
+            [
+                self.recent_performance_rating(form) if form else 0.0
+                for form in (away_recent_forms or [None] * n)
+            ],
+            dtype=np.float64,
+        )
+
+        home_prob, draw_prob, away_prob = self.calculate_outcome_probabilities_batch(
+            home_ratings, away_ratings, home_perf, away_perf
+        )
+
+        # Same confidence formula as predict()
+        rating_diff = np.abs((home_ratings + home_perf * 50) - (away_ratings + away_perf * 50))
+        max_prob = np.maximum(np.maximum(home_prob, draw_prob), away_prob)
+        confidence = 0.55 + (max_prob - 0.33) * 0.4 + np.minimum(0.2, rating_diff / 1000)
+        confidence = np.minimum(0.95, np.maximum(0.5, confidence))
+
+        return AdvancedELOBatchPrediction(
+            home_win_probs=home_prob,
+            draw_probs=draw_prob,
+            away_win_probs=away_prob,
+            home_performance_ratings=home_perf,
+            away_performance_ratings=away_perf,
+            confidences=confidence,
+        )
+
 
 # Default instance
 advanced_elo_system = AdvancedELOSystem()
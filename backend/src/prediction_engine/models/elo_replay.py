@@ -0,0 +1,278 @@
+"""Array-backed ELO replay kernel.
+
+Replaying the match history through ELOSystem.update_ratings costs a method
+call and several dict lookups per match. This kernel maps team ids to dense
+indices, keeps ratings in a float64 array and walks a pre-sorted structured
+array of matches, recording every team's pre- and post-match rating so that
+ratings at any date can be read back without replaying.
+
+The update rule is exactly ELOSystem.update_ratings (logistic expected score
+with home advantage, K scaled by the goal-difference multiplier).
+
+Usage:
+    matches, team_ids = build_match_array(rows)
+    replay = EloReplayKernel(k_factor=20.0, home_advantage=100.0).replay(matches, team_ids)
+    replay.ratings_at(date(2025, 1, 1))  # {team_id: rating} before that date
+
+    # Many (K, home advantage) variants in one pass
+    sweep = EloReplayKernel.sweep(matches, team_ids, [15, 20, 30], [60, 100, 100])
+"""
+
+from collections.abc import Hashable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+
+import numpy as np
+
+# One row per finished match, sorted by date (ties keep input order)
+MATCH_DTYPE = np.dtype(
+    [
+        ("date", "datetime64[s]"),
+        ("home", np.int32),  # Dense team index
+        ("away", np.int32),
+        ("home_goals", np.int16),
+        ("away_goals", np.int16),
+    ]
+)
+
+INITIAL_RATING = 1500.0
+
+
+def build_match_array(rows: Iterable[Any]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Build the kernel's match array from finished-match rows.
+
+    Args:
+        rows: Objects with match_date, home_team_id, away_team_id,
+            home_score and away_score (DB rows or similar). Team ids can be
+            any hashable (ints, team names).
+
+    Returns:
+        Tuple of (matches structured array sorted by date, team_ids array
+        where team_ids[i] is the id for dense index i)
+    """
+    index: dict[Hashable, int] = {}
+    dates, home, away, home_goals, away_goals = [], [], [], [], []
+    for row in rows:
+        dates.append(row.match_date)
+        home.append(index.setdefault(row.home_team_id, len(index)))
+        away.append(index.setdefault(row.away_team_id, len(index)))
+        home_goals.append(row.home_score)
+        away_goals.append(row.away_score)
+
+    matches = np.empty(len(dates), dtype=MATCH_DTYPE)
+    matches["date"] = np.array(dates, dtype="datetime64[s]")
+    matches["home"] = home
+    matches["away"] = away
+    matches["home_goals"] = home_goals
+    matches["away_goals"] = away_goals
+    matches = matches[np.argsort(matches["date"], kind="stable")]
+    return matches, np.array(list(index), dtype=object)
+
+
+def _match_constants(matches: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Per-match actual home score and goal-difference multiplier (vectorized)."""
+    home_goals = matches["home_goals"].astype(np.int64)
+    away_goals = matches["away_goals"].astype(np.int64)
+
+    actual_home = np.where(
+        home_goals > away_goals, 1.0, np.where(home_goals < away_goals, 0.0, 0.5)
+    )
+    goal_diff = np.abs(home_goals - away_goals)
+    gd_mult = np.where(goal_diff <= 1, 1.0, np.where(goal_diff == 2, 1.5, (11 + goal_diff) / 8))
+    return actual_home, gd_mult
+
+
+def _to_datetime64(when: date | datetime | np.datetime64) -> np.datetime64:
+    return np.datetime64(when, "s")
+
+
+@dataclass
+class EloReplay:
+    """Result of a single-parameter replay."""
+
+    team_ids: np.ndarray  # (T,) dense index -> team id
+    dates: np.ndarray  # (N,) match dates, sorted
+    home: np.ndarray  # (N,) dense home index
+    away: np.ndarray  # (N,) dense away index
+    pre_home: np.ndarray  # (N,) home rating before the match
+    pre_away: np.ndarray  # (N,) away rating before the match
+    post_home: np.ndarray  # (N,) home rating after the match
+    post_away: np.ndarray  # (N,) away rating after the match
+    initial_ratings: np.ndarray  # (T,) ratings before the first match
+    final_ratings: np.ndarray  # (T,) ratings after the last match
+
+    def ratings(self) -> dict[Any, float]:
+        """Final ratings by team id."""
+        return dict(zip(self.team_ids.tolist(), self.final_ratings.tolist()))
+
+    def ratings_at(self, when: date | datetime | np.datetime64) -> dict[Any, float]:
+        """
+        Ratings of every team before any match played at or after ``when``.
+
+        Reads the last post-match rating of each team from the replay log,
+        so no replay is needed.
+        """
+        played = int(np.searchsorted(self.dates, _to_datetime64(when), side="left"))
+        ratings = self.initial_ratings.copy()
+        if played:
+            # Interleave home/away updates in match order; keep each team's last one
+            teams = np.column_stack([self.home[:played], self.away[:played]]).ravel()
+            values = np.column_stack([self.post_home[:played], self.post_away[:played]]).ravel()
+            last = np.full(len(ratings), -1)
+            np.maximum.at(last, teams, np.arange(len(teams)))
+            seen = last >= 0
+            ratings[seen] = values[last[seen]]
+        return dict(zip(self.team_ids.tolist(), ratings.tolist()))
+
+
+@dataclass
+class EloSweep:
+    """Result of replaying several (K, home advantage) variants at once."""
+
+    team_ids: np.ndarray  # (T,)
+    k_factors: np.ndarray  # (V,)
+    home_advantages: np.ndarray  # (V,)
+    expected_home: np.ndarray  # (N, V) pre-match expected home score per variant
+    final_ratings: np.ndarray  # (V, T)
+
+
+class EloReplayKernel:
+    """Replay finished matches into ELO ratings using dense arrays."""
+
+    def __init__(
+        self,
+        k_factor: float = 20.0,
+        home_advantage: float = 100.0,
+        initial_rating: float = INITIAL_RATING,
+    ):
+        """
+        Initialize the kernel.
+
+        Args:
+            k_factor: How much ratings change per match
+            home_advantage: ELO points advantage for home team
+            initial_rating: Rating of teams without a prior rating
+        """
+        self.k_factor = k_factor
+        self.home_advantage = home_advantage
+        self.initial_rating = initial_rating
+
+    def _initial(self, team_ids: np.ndarray, initial_ratings: dict[Any, float] | None) -> list:
+        if not initial_ratings:
+            return [self.initial_rating] * len(team_ids)
+        return [initial_ratings.get(t, self.initial_rating) for t in team_ids.tolist()]
+
+    def replay(
+        self,
+        matches: np.ndarray,
+        team_ids: np.ndarray,
+        initial_ratings: dict[Any, float] | None = None,
+    ) -> EloReplay:
+        """
+        Replay matches in order and record pre/post-match ratings.
+
+        Args:
+            matches: Structured array with MATCH_DTYPE, sorted by date
+            team_ids: Dense index -> team id (from build_match_array)
+            initial_ratings: Starting ratings by team id (e.g. persisted
+                ratings for an incremental run); others start at initial_rating
+
+        Returns:
+            EloReplay with the rating log and final ratings
+        """
+        actual_home, gd_mult = _match_constants(matches)
+        k_mult = (self.k_factor * gd_mult).tolist()
+        actual = actual_home.tolist()
+        home = matches["home"].tolist()
+        away = matches["away"].tolist()
+        home_advantage = self.home_advantage
+
+        initial = self._initial(team_ids, initial_ratings)
+        ratings = list(initial)
+        n = len(home)
+        pre_home = [0.0] * n
+        pre_away = [0.0] * n
+        post_home = [0.0] * n
+        post_away = [0.0] * n
+
+        # Sequential by nature; plain lists are the fastest scalar containers
+        for i in range(n):
+            h = home[i]
+            a = away[i]
+            rating_home = ratings[h]
+            rating_away = ratings[a]
+            expected = 1 / (1 + 10 ** ((rating_away - rating_home - home_advantage) / 400))
+            change = k_mult[i] * (actual[i] - expected)
+
+            pre_home[i] = rating_home
+            pre_away[i] = rating_away
+            ratings[h] = post_home[i] = rating_home + change
+            ratings[a] = post_away[i] = rating_away - change
+
+        return EloReplay(
+            team_ids=team_ids,
+            dates=matches["date"],
+            home=matches["home"],
+            away=matches["away"],
+            pre_home=np.array(pre_home),
+            pre_away=np.array(pre_away),
+            post_home=np.array(post_home),
+            post_away=np.array(post_away),
+            initial_ratings=np.array(initial, dtype=np.float64),
+            final_ratings=np.array(ratings, dtype=np.float64),
+        )
+
+    @staticmethod
+    def sweep(
+        matches: np.ndarray,
+        team_ids: np.ndarray,
+        k_factors: Sequence[float],
+        home_advantages: Sequence[float],
+        initial_rating: float = INITIAL_RATING,
+    ) -> EloSweep:
+        """
+        Replay many (K, home advantage) variants in a single pass.
+
+        Ratings are a (T, V) matrix, so each match updates every variant
+        with one vector operation.
+
+        Args:
+            matches: Structured array with MATCH_DTYPE, sorted by date
+            team_ids: Dense index -> team id
+            k_factors: K-factor per variant, shape (V,)
+            home_advantages: Home advantage per variant, shape (V,)
+            initial_rating: Starting rating for every team
+
+        Returns:
+            EloSweep with per-variant pre-match expected scores and final ratings
+        """
+        k_factors = np.asarray(k_factors, dtype=np.float64)
+        home_advantages = np.asarray(home_advantages, dtype=np.float64)
+        if k_factors.shape != home_advantages.shape or k_factors.ndim != 1:
+            raise ValueError("k_factors and home_advantages must be 1-D arrays of equal length")
+
+        actual_home, gd_mult = _match_constants(matches)
+        home = matches["home"]
+        away = matches["away"]
+
+        ratings = np.full((len(team_ids), len(k_factors)), initial_rating)
+        expected_home = np.empty((len(matches), len(k_factors)))
+
+        for i in range(len(matches)):
+            h = home[i]
+            a = away[i]
+            expected = 1 / (1 + 10 ** ((ratings[a] - ratings[h] - home_advantages) / 400))
+            change = k_factors * gd_mult[i] * (actual_home[i] - expected)
+            expected_home[i] = expected
+            ratings[h] += change
+            ratings[a] -= change
+
+        return EloSweep(
+            team_ids=team_ids,
+            k_factors=k_factors,
+            home_advantages=home_advantages,
+            expected_home=expected_home,
+            final_ratings=ratings.T.copy(),
+        )
@@ -10,18 +10,11 @@ from dataclasses import dataclass
 
 import numpy as np
 
-# Lazy import scipy to reduce memory at startup (512MB limit on Render)
-_poisson = None
-
-
-def _get_poisson():
-    """Lazy load scipy.stats.poisson to reduce memory usage."""
-    global _poisson
-    if _poisson is None:
-        from scipy.stats import poisson as scipy_poisson
-
-        _poisson = scipy_poisson
-    return _poisson
+from src.prediction_engine.score_distribution import (
+    get_score_distribution,
+    get_score_distributions,
+    outcome_probabilities,
+)
 
 
 @dataclass
@@ -37,6 +30,21 @@ class PoissonPrediction:
     score_probabilities: dict[tuple[int, int], float]
 
 
+@dataclass
+class PoissonBatchPrediction:
+    """Poisson predictions for a batch of fixtures (one row per match)."""
+
+    home_win_probs: np.ndarray  # (N,)
+    draw_probs: np.ndarray  # (N,)
+    away_win_probs: np.ndarray  # (N,)
+    expected_home_goals: np.ndarray  # (N,)
+    expected_away_goals: np.ndarray  # (N,)
+    score_matrices: np.ndarray  # (N, MAX_GOALS + 1, MAX_GOALS + 1), [home_goals, away_goals]
+
+    def __len__(self) -> int:
+        return len(self.home_win_probs)
+
+
 class PoissonModel:
     """
     Poisson distribution model for football predictions.
@@ -155,42 +163,14 @@ class PoissonModel:
         Returns:
             PoissonPrediction with probabilities and expected scores
         """
-        # Lazy load scipy to reduce memory at startup
-        poisson = _get_poisson()
-
         # Calculate expected goals
         exp_home, exp_away = self.calculate_expected_goals(
             home_attack, home_defense, away_attack, away_defense
         )
 
-        # Build score probability matrix
-        score_probs: dict[tuple[int, int], float] = {}
-        home_win_prob = 0.0
-        draw_prob = 0.0
-        away_win_prob = 0.0
-
-        for home_goals in range(self.MAX_GOALS + 1):
-            for away_goals in range(self.MAX_GOALS + 1):
-                # P(home_goals) × P(away_goals)
-                prob = poisson.pmf(home_goals, exp_home) * poisson.pmf(away_goals, exp_away)
-                score_probs[(home_goals, away_goals)] = prob
-
-                if home_goals > away_goals:
-                    home_win_prob += prob
-                elif home_goals < away_goals:
-                    away_win_prob += prob
-                else:
-                    draw_prob += prob
-
-        # Find most likely score
-        most_likely = max(score_probs, key=score_probs.get)  # type: ignore
-
-        # Normalize probabilities (they should sum to ~1 already)
-        total = home_win_prob + draw_prob + away_win_prob
-        if total > 0:
-            home_win_prob /= total
-            draw_prob /= total
-            away_win_prob /= total
+        # Shared (cached) score grid, also read by Dixon-Coles and multi-markets
+        distribution = get_score_distribution(exp_home, exp_away, 0.0, self.MAX_GOALS)
+        home_win_prob, draw_prob, away_win_prob = distribution.outcome_probabilities
 
         return PoissonPrediction(
             home_win_prob=home_win_prob,
@@ -198,8 +178,61 @@ class PoissonModel:
             away_win_prob=away_win_prob,
             expected_home_goals=exp_home,
             expected_away_goals=exp_away,
-            most_likely_score=most_likely,
-            score_probabilities=score_probs,
+            most_likely_score=distribution.most_likely_score,
+            score_probabilities=dict(distribution.score_probabilities),
+        )
+
+    def predict_batch(
+        self,
+        home_attack: np.ndarray,
+        home_defense: np.ndarray,
+        away_attack: np.ndarray,
+        away_defense: np.ndarray,
+    ) -> PoissonBatchPrediction:
+        """
+        Predict many fixtures at once from columnar team stats.
+
+        Args:
+            home_attack: Home teams' avg goals scored at home, shape (N,)
+            home_defense: Home teams' avg goals conceded at home, shape (N,)
+            away_attack: Away teams' avg goals scored away, shape (N,)
+            away_defense: Away teams' avg goals conceded away, shape (N,)
+
+        Returns:
+            PoissonBatchPrediction with (N,) outcome vectors and (N, G, G) grids
+        """
+        league_avg_per_team = self.league_avg_goals / 2
+        if league_avg_per_team <= 0:
+            league_avg_per_team = 1.375  # Default fallback
+
+        scale = league_avg_per_team + 0.1  # Same smoothing as calculate_expected_goals
+        exp_home = np.clip(
+            (np.asarray(home_attack, dtype=np.float64) / scale)
+            * (np.asarray(away_defense, dtype=np.float64) / scale)
+            * league_avg_per_team
+            * self.home_advantage,
+            0.3,
+            5.0,
+        )
+        exp_away = np.clip(
+            (np.asarray(away_attack, dtype=np.float64) / scale)
+            * (np.asarray(home_defense, dtype=np.float64) / scale)
+            * league_avg_per_team
+            / 1.05,
+            0.3,
+            5.0,
+        )
+
+        matrices, _ = get_score_distributions(exp_home, exp_away, 0.0, self.MAX_GOALS)
+        home_win, draw, away_win = outcome_probabilities(matrices)
+
+        return PoissonBatchPrediction(
+            home_win_probs=home_win,
+            draw_probs=draw,
+            away_win_probs=away_win,
+            expected_home_goals=exp_home,
+            expected_away_goals=exp_away,
+            score_matrices=matrices,
         )
 
     def predict_with_xg(
@@ -244,18 +277,8 @@ class PoissonModel:
         Returns:
             Tuple of (over_prob, under_prob)
         """
-        poisson = _get_poisson()
-        over_prob = 0.0
-
-        for home_goals in range(self.MAX_GOALS + 1):
-            for away_goals in range(self.MAX_GOALS + 1):
-                if home_goals + away_goals > line:
-                    prob = poisson.pmf(home_goals, expected_home) * poisson.pmf(
-                        away_goals, expected_away
-                    )
-                    over_prob += prob
-
-        return over_prob, 1 - over_prob
+        distribution = get_score_distribution(expected_home, expected_away, 0.0, self.MAX_GOALS)
+        return distribution.over_under(line)
 
     def btts_probability(
         self,
@@ -272,10 +295,9 @@ class PoissonModel:
         Returns:
             Probability that both teams score
         """
-        poisson = _get_poisson()
         # P(home >= 1) × P(away >= 1)
-        home_scores = 1 - poisson.pmf(0, expected_home)
-        away_scores = 1 - poisson.pmf(0, expected_away)
+        home_scores = 1 - np.exp(-expected_home)
+        away_scores = 1 - np.exp(-expected_away)
 
         return float(home_scores * away_scores)
 
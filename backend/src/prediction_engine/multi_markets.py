@@ -1,20 +1,41 @@
 """Multi-markets prediction module.
 
 Calculates probabilities for various betting markets:
-- Over/Under (1.5, 2.5, 3.5 goals)
+- Over/Under (0.5 to 5.5 goals)
 - BTTS (Both Teams To Score)
 - Double Chance (1X, X2, 12)
 - Correct Score (top probabilities)
-
-Uses Poisson distribution for goal-based markets.
+- Asian Handicap (half and whole lines, push excluded)
+- Team totals (home/away over/under)
+
+Goal-based markets are read from the shared score distribution
+(see score_distribution.py), the same cached grid the Poisson and
+Dixon-Coles models use. Pricing is columnar: price_markets() takes a stack
+of grids and computes every market for every fixture in one NumPy pass
+(anti-diagonal sums for totals, diagonal sums for goal difference, then
+cumulative sums per line).
 """
 
 import logging
-import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from src.prediction_engine.score_distribution import (
+    get_score_distribution,
+    get_score_distributions,
+    outcome_probabilities,
+    split_line,
+)
 
 logger = logging.getLogger(__name__)
 
+# Lines priced for every fixture
+OVER_UNDER_LINES = (0.5, 1.5, 2.5, 3.5, 4.5, 5.5)
+ASIAN_HANDICAP_LINES = (-2.5, -2.0, -1.5, -1.0, -0.5, 0.0, 0.5, 1.0, 1.5, 2.0, 2.5)
+TEAM_TOTAL_LINES = (0.5, 1.5, 2.5)
+CORRECT_SCORE_TOP_N = 6
+
 
 @dataclass
 class OverUnderPrediction:
@@ -65,6 +86,31 @@ class CorrectScorePrediction:
     most_likely_prob: float
 
 
+@dataclass
+class AsianHandicapPrediction:
+    """Asian Handicap market prediction (push excluded and renormalized)."""
+
+    line: float  # Handicap applied to the home team (e.g. -0.5)
+    home_prob: float
+    away_prob: float
+    home_odds: float | None = None
+    away_odds: float | None = None
+    recommended: str = "home"  # "home" or "away"
+
+
+@dataclass
+class TeamTotalPrediction:
+    """Team total goals Over/Under prediction."""
+
+    team: str  # "home" or "away"
+    line: float
+    over_prob: float
+    under_prob: float
+    over_odds: float | None = None
+    under_odds: float | None = None
+    recommended: str = "over"  # "over" or "under"
+
+
 @dataclass
 class MultiMarketsPrediction:
     """Complete multi-markets prediction."""
@@ -88,101 +134,126 @@ class MultiMarketsPrediction:
     expected_away_goals: float
     expected_total_goals: float
 
-
-def _poisson_prob(k: int, lambda_val: float) -> float:
-    """Calculate Poisson probability P(X = k) = (λ^k * e^-λ) / k!"""
-    if lambda_val <= 0:
-        return 1.0 if k == 0 else 0.0
-    return (math.pow(lambda_val, k) * math.exp(-lambda_val)) / math.factorial(k)
+    # Full line sets (OVER_UNDER_LINES, ASIAN_HANDICAP_LINES, TEAM_TOTAL_LINES)
+    over_under: list[OverUnderPrediction] = field(default_factory=list)
+    asian_handicap: list[AsianHandicapPrediction] = field(default_factory=list)
+    team_totals: list[TeamTotalPrediction] = field(default_factory=list)
 
 
-def _calculate_score_matrix(
-    home_goals_exp: float,
-    away_goals_exp: float,
-    max_goals: int = 7,
-) -> list[list[float]]:
+@dataclass
+class MarketPrices:
+    """Raw market probabilities for a batch of fixtures (one row per match)."""
+
+    home_win: np.ndarray  # (N,)
+    draw: np.ndarray  # (N,)
+    away_win: np.ndarray  # (N,)
+    over: np.ndarray  # (N, len(OVER_UNDER_LINES))
+    under: np.ndarray  # (N, len(OVER_UNDER_LINES))
+    btts_yes: np.ndarray  # (N,)
+    handicap_home: np.ndarray  # (N, len(ASIAN_HANDICAP_LINES))
+    handicap_away: np.ndarray  # (N, len(ASIAN_HANDICAP_LINES))
+    home_over: np.ndarray  # (N, len(TEAM_TOTAL_LINES))
+    away_over: np.ndarray  # (N, len(TEAM_TOTAL_LINES))
+    top_scores: np.ndarray  # (N, top_n, 2) as (home_goals, away_goals)
+    top_score_probs: np.ndarray  # (N, top_n)
+
+    def __len__(self) -> int:
+        return len(self.home_win)
+
+
+def price_markets(matrices: np.ndarray, top_n: int = CORRECT_SCORE_TOP_N) -> MarketPrices:
     """
-    Calculate probability matrix for all score combinations.
+    Price every market for a stack of score grids in one vectorized pass.
+
+    Totals come from anti-diagonal sums and goal difference from diagonal
+    sums (both as one matmul against a 0/1 projection), then each line is a
+    lookup into the cumulative sum.
 
-    Returns a matrix where matrix[home][away] = probability of that score.
+    Args:
+        matrices: Score grids of shape (N, G, G) indexed [home_goals, away_goals]
+        top_n: Number of correct scores to return per fixture
+
+    Returns:
+        MarketPrices with one row per fixture
     """
-    matrix = []
-    for home in range(max_goals + 1):
-        row = []
-        for away in range(max_goals + 1):
-            prob = _poisson_prob(home, home_goals_exp) * _poisson_prob(away, away_goals_exp)
-            row.append(prob)
-        matrix.append(row)
-    return matrix
-
-
-def _calculate_over_under(
-    score_matrix: list[list[float]],
-    line: float,
-) -> OverUnderPrediction:
-    """Calculate Over/Under probabilities from score matrix."""
-    max_goals = len(score_matrix) - 1
-    over_prob = 0.0
-    under_prob = 0.0
-
-    for home in range(max_goals + 1):
-        for away in range(max_goals + 1):
-            total = home + away
-            prob = score_matrix[home][away]
-            if total > line:
-                over_prob += prob
-            elif total < line:
-                under_prob += prob
-            # Exactly on the line would be push (we ignore for simplicity)
-
-    # Normalize
-    total_prob = over_prob + under_prob
-    if total_prob > 0:
-        over_prob = over_prob / total_prob
-        under_prob = under_prob / total_prob
-    else:
-        over_prob = 0.5
-        under_prob = 0.5
-
-    recommended = "over" if over_prob > under_prob else "under"
+    matrices = np.asarray(matrices, dtype=np.float64)
+    n, size, _ = matrices.shape
+    flat = matrices.reshape(n, size * size)
+
+    total = flat.sum(axis=1)
+    safe_total = np.where(total > 0, total, 1.0)
+
+    home_goals, away_goals = np.divmod(np.arange(size * size), size)
+    span = 2 * size - 1
+
+    # Total goals (anti-diagonals) and goal difference (diagonals, offset by size - 1)
+    total_projection = np.zeros((size * size, span))
+    total_projection[np.arange(size * size), home_goals + away_goals] = 1.0
+    diff_projection = np.zeros((size * size, span))
+    diff_projection[np.arange(size * size), home_goals - away_goals + size - 1] = 1.0
+
+    total_cdf = np.cumsum(flat @ total_projection, axis=1)
+    diff_cdf = np.cumsum(flat @ diff_projection, axis=1)
+
+    over, under = split_line(total_cdf, total, np.array(OVER_UNDER_LINES))
+
+    # Home covers handicap h when diff + h > 0, i.e. diff > -h
+    handicap_lines = np.array(ASIAN_HANDICAP_LINES)
+    handicap_home, handicap_away = split_line(diff_cdf, total, size - 1 - handicap_lines)
+
+    team_lines = np.array(TEAM_TOTAL_LINES)
+    home_over, _ = split_line(np.cumsum(matrices.sum(axis=2), axis=1), total, team_lines)
+    away_over, _ = split_line(np.cumsum(matrices.sum(axis=1), axis=1), total, team_lines)
+
+    btts_yes = matrices[:, 1:, 1:].sum(axis=(1, 2)) / safe_total
+
+    home_win, draw, away_win = outcome_probabilities(matrices)
+
+    # Stable sort keeps row-major order between equal probabilities
+    order = np.argsort(-flat, axis=1, kind="stable")[:, :top_n]
+    top_scores = np.stack([home_goals[order], away_goals[order]], axis=-1)
+    top_score_probs = np.take_along_axis(flat, order, axis=1)
+
+    return MarketPrices(
+        home_win=home_win,
+        draw=draw,
+        away_win=away_win,
+        over=over,
+        under=under,
+        btts_yes=btts_yes,
+        handicap_home=handicap_home,
+        handicap_away=handicap_away,
+        home_over=home_over,
+        away_over=away_over,
+        top_scores=top_scores,
+        top_score_probs=top_score_probs,
+    )
+
 
+def _calculate_over_under(line: float, over_prob: float, under_prob: float) -> OverUnderPrediction:
+    """Build an Over/Under prediction with fair odds."""
+    over_prob = round(over_prob, 4)
+    under_prob = round(under_prob, 4)
     return OverUnderPrediction(
         line=line,
-        over_prob=round(over_prob, 4),
-        under_prob=round(under_prob, 4),
-        recommended=recommended,
+        over_prob=over_prob,
+        under_prob=under_prob,
+        over_odds=_estimate_fair_odds(over_prob),
+        under_odds=_estimate_fair_odds(under_prob),
+        recommended="over" if over_prob > under_prob else "under",
     )
 
 
-def _calculate_btts(score_matrix: list[list[float]]) -> BTTSPrediction:
-    """Calculate Both Teams To Score probabilities."""
-    max_goals = len(score_matrix) - 1
-    yes_prob = 0.0
-    no_prob = 0.0
-
-    for home in range(max_goals + 1):
-        for away in range(max_goals + 1):
-            prob = score_matrix[home][away]
-            if home > 0 and away > 0:
-                yes_prob += prob
-            else:
-                no_prob += prob
-
-    # Normalize
-    total = yes_prob + no_prob
-    if total > 0:
-        yes_prob = yes_prob / total
-        no_prob = no_prob / total
-    else:
-        yes_prob = 0.5
-        no_prob = 0.5
-
-    recommended = "yes" if yes_prob > no_prob else "no"
-
+def _calculate_btts(yes_prob: float) -> BTTSPrediction:
+    """Build a Both Teams To Score prediction with fair odds."""
+    yes = round(yes_prob, 4)
+    no = round(1.0 - yes_prob, 4)
     return BTTSPrediction(
-        yes_prob=round(yes_prob, 4),
-        no_prob=round(no_prob, 4),
-        recommended=recommended,
+        yes_prob=yes,
+        no_prob=no,
+        yes_odds=_estimate_fair_odds(yes),
+        no_odds=_estimate_fair_odds(no),
+        recommended="yes" if yes > no else "no",
     )
 
 
@@ -216,32 +287,20 @@ def _calculate_double_chance(
 
 
 def _calculate_correct_score(
-    score_matrix: list[list[float]],
-    top_n: int = 6,
+    top_scores: np.ndarray,
+    top_score_probs: np.ndarray,
 ) -> CorrectScorePrediction:
-    """Calculate top N most likely correct scores."""
-    max_goals = len(score_matrix) - 1
-
-    # Build list of (score, probability)
-    scores = []
-    for home in range(max_goals + 1):
-        for away in range(max_goals + 1):
-            score_str = f"{home}-{away}"
-            prob = score_matrix[home][away]
-            scores.append((score_str, prob))
-
-    # Sort by probability descending
-    scores.sort(key=lambda x: x[1], reverse=True)
-
-    # Take top N
-    top_scores = {score: round(prob, 4) for score, prob in scores[:top_n]}
-    most_likely = scores[0][0]
-    most_likely_prob = round(scores[0][1], 4)
+    """Build the correct score prediction from one fixture's top-N scores."""
+    scores = {
+        f"{int(home)}-{int(away)}": round(float(prob), 4)
+        for (home, away), prob in zip(top_scores, top_score_probs)
+    }
+    home, away = top_scores[0]
 
     return CorrectScorePrediction(
-        scores=top_scores,
-        most_likely=most_likely,
-        most_likely_prob=most_likely_prob,
+        scores=scores,
+        most_likely=f"{int(home)}-{int(away)}",
+        most_likely_prob=round(float(top_score_probs[0]), 4),
     )
 
 
@@ -267,9 +326,82 @@ class MultiMarketsPredictor:
     Multi-markets prediction calculator.
 
     Uses expected goals (from Poisson/Dixon-Coles) to calculate
-    probabilities for various betting markets.
+    probabilities for various betting markets. Pass the Dixon-Coles rho to
+    price goal markets off the same grid as the Dixon-Coles 1X2.
     """
 
+    def _build_prediction(
+        self,
+        prices: MarketPrices,
+        row: int,
+        exp_home: float,
+        exp_away: float,
+        home_win_prob: float,
+        draw_prob: float,
+        away_win_prob: float,
+    ) -> MultiMarketsPrediction:
+        """Turn one row of MarketPrices into the MultiMarketsPrediction dataclasses."""
+        over_under = [
+            _calculate_over_under(line, float(prices.over[row, i]), float(prices.under[row, i]))
+            for i, line in enumerate(OVER_UNDER_LINES)
+        ]
+        by_line = {ou.line: ou for ou in over_under}
+
+        asian_handicap = []
+        for i, line in enumerate(ASIAN_HANDICAP_LINES):
+            home_prob = round(float(prices.handicap_home[row, i]), 4)
+            away_prob = round(float(prices.handicap_away[row, i]), 4)
+            asian_handicap.append(
+                AsianHandicapPrediction(
+                    line=line,
+                    home_prob=home_prob,
+                    away_prob=away_prob,
+                    home_odds=_estimate_fair_odds(home_prob),
+                    away_odds=_estimate_fair_odds(away_prob),
+                    recommended="home" if home_prob > away_prob else "away",
+                )
+            )
+
+        team_totals = []
+        for team, team_over in (("home", prices.home_over), ("away", prices.away_over)):
+            for i, line in enumerate(TEAM_TOTAL_LINES):
+                over_prob = round(float(team_over[row, i]), 4)
+                under_prob = round(1.0 - float(team_over[row, i]), 4)
+                team_totals.append(
+                    TeamTotalPrediction(
+                        team=team,
+                        line=line,
+                        over_prob=over_prob,
+                        under_prob=under_prob,
+                        over_odds=_estimate_fair_odds(over_prob),
+                        under_odds=_estimate_fair_odds(under_prob),
+                        recommended="over" if over_prob > under_prob else "under",
+                    )
+                )
+
+        # Double Chance follows the 1X2 passed in (the displayed probabilities)
+        double_chance = _calculate_double_chance(home_win_prob, draw_prob, away_win_prob)
+        double_chance.home_or_draw_odds = _estimate_fair_odds(double_chance.home_or_draw_prob)
+        double_chance.away_or_draw_odds = _estimate_fair_odds(double_chance.away_or_draw_prob)
+        double_chance.home_or_away_odds = _estimate_fair_odds(double_chance.home_or_away_prob)
+
+        return MultiMarketsPrediction(
+            over_under_15=by_line[1.5],
+            over_under_25=by_line[2.5],
+            over_under_35=by_line[3.5],
+            btts=_calculate_btts(float(prices.btts_yes[row])),
+            double_chance=double_chance,
+            correct_score=_calculate_correct_score(
+                prices.top_scores[row], prices.top_score_probs[row]
+            ),
+            expected_home_goals=round(exp_home, 2),
+            expected_away_goals=round(exp_away, 2),
+            expected_total_goals=round(exp_home + exp_away, 2),
+            over_under=over_under,
+            asian_handicap=asian_handicap,
+            team_totals=team_totals,
+        )
+
     def predict(
         self,
         expected_home_goals: float,
@@ -282,6 +414,7 @@ class MultiMarketsPredictor:
         odds_under_25: float | None = None,
         odds_btts_yes: float | None = None,
         odds_btts_no: float | None = None,
+        rho: float = 0.0,
     ) -> MultiMarketsPrediction:
         """
         Calculate multi-markets predictions.
@@ -293,6 +426,7 @@ class MultiMarketsPredictor:
             draw_prob: Probability of draw (1X2)
             away_win_prob: Probability of away win (1X2)
             odds_*: Optional bookmaker odds for value calculation
+            rho: Dixon-Coles low-score correlation (0 = independent Poisson)
 
         Returns:
             MultiMarketsPrediction with all market predictions
@@ -301,67 +435,79 @@ class MultiMarketsPredictor:
         exp_home = max(0.1, min(5.0, expected_home_goals))
         exp_away = max(0.1, min(5.0, expected_away_goals))
 
-        # Calculate score matrix
-        score_matrix = _calculate_score_matrix(exp_home, exp_away)
-
-        # Over/Under markets
-        ou_15 = _calculate_over_under(score_matrix, 1.5)
-        ou_25 = _calculate_over_under(score_matrix, 2.5)
-        ou_35 = _calculate_over_under(score_matrix, 3.5)
+        # Shared (cached) score distribution
+        distribution = get_score_distribution(exp_home, exp_away, rho)
+        prices = price_markets(distribution.matrix[None])
+        prediction = self._build_prediction(
+            prices, 0, exp_home, exp_away, home_win_prob, draw_prob, away_win_prob
+        )
 
-        # Add odds and value if available
+        # Bookmaker odds replace fair odds where available
+        ou_25 = prediction.over_under_25
         if odds_over_25:
             ou_25.over_odds = odds_over_25
             ou_25.over_value = _calculate_value(ou_25.over_prob, odds_over_25)
-        else:
-            ou_25.over_odds = _estimate_fair_odds(ou_25.over_prob)
-
         if odds_under_25:
             ou_25.under_odds = odds_under_25
             ou_25.under_value = _calculate_value(ou_25.under_prob, odds_under_25)
-        else:
-            ou_25.under_odds = _estimate_fair_odds(ou_25.under_prob)
-
-        # Estimate odds for other O/U lines
-        ou_15.over_odds = _estimate_fair_odds(ou_15.over_prob)
-        ou_15.under_odds = _estimate_fair_odds(ou_15.under_prob)
-        ou_35.over_odds = _estimate_fair_odds(ou_35.over_prob)
-        ou_35.under_odds = _estimate_fair_odds(ou_35.under_prob)
 
-        # BTTS
-        btts = _calculate_btts(score_matrix)
+        btts = prediction.btts
         if odds_btts_yes:
             btts.yes_odds = odds_btts_yes
             btts.yes_value = _calculate_value(btts.yes_prob, odds_btts_yes)
-        else:
-            btts.yes_odds = _estimate_fair_odds(btts.yes_prob)
-
         if odds_btts_no:
             btts.no_odds = odds_btts_no
             btts.no_value = _calculate_value(btts.no_prob, odds_btts_no)
-        else:
-            btts.no_odds = _estimate_fair_odds(btts.no_prob)
 
-        # Double Chance
-        double_chance = _calculate_double_chance(home_win_prob, draw_prob, away_win_prob)
-        double_chance.home_or_draw_odds = _estimate_fair_odds(double_chance.home_or_draw_prob)
-        double_chance.away_or_draw_odds = _estimate_fair_odds(double_chance.away_or_draw_prob)
-        double_chance.home_or_away_odds = _estimate_fair_odds(double_chance.home_or_away_prob)
+        return prediction
 
-        # Correct Score
-        correct_score = _calculate_correct_score(score_matrix)
+    def predict_batch(
+        self,
+        expected_home_goals: np.ndarray,
+        expected_away_goals: np.ndarray,
+        home_win_probs: np.ndarray,
+        draw_probs: np.ndarray,
+        away_win_probs: np.ndarray,
+        rho: float = 0.0,
+    ) -> list[MultiMarketsPrediction]:
+        """
+        Calculate multi-markets predictions for many fixtures at once.
 
-        return MultiMarketsPrediction(
-            over_under_15=ou_15,
-            over_under_25=ou_25,
-            over_under_35=ou_35,
-            btts=btts,
-            double_chance=double_chance,
-            correct_score=correct_score,
-            expected_home_goals=round(exp_home, 2),
-            expected_away_goals=round(exp_away, 2),
-            expected_total_goals=round(exp_home + exp_away, 2),
-        )
+        Builds all grids and prices all markets in one vectorized pass; only
+        the final dataclass construction is per fixture. Matches
+        predict() row by row (without bookmaker odds).
+
+        Args:
+            expected_home_goals: Expected goals for home teams, shape (N,)
+            expected_away_goals: Expected goals for away teams, shape (N,)
+            home_win_probs: Home win probabilities (1X2), shape (N,)
+            draw_probs: Draw probabilities (1X2), shape (N,)
+            away_win_probs: Away win probabilities (1X2), shape (N,)
+            rho: Dixon-Coles low-score correlation (0 = independent Poisson)
+
+        Returns:
+            List of MultiMarketsPrediction, one per fixture
+        """
+        exp_home = np.clip(np.asarray(expected_home_goals, dtype=np.float64), 0.1, 5.0)
+        exp_away = np.clip(np.asarray(expected_away_goals, dtype=np.float64), 0.1, 5.0)
+        if len(exp_home) == 0:
+            return []
+
+        matrices, _ = get_score_distributions(exp_home, exp_away, rho)
+        prices = price_markets(matrices)
+
+        return [
+            self._build_prediction(
+                prices,
+                i,
+                float(exp_home[i]),
+                float(exp_away[i]),
+                float(home_win_probs[i]),
+                float(draw_probs[i]),
+                float(away_win_probs[i]),
+            )
+            for i in range(len(prices))
+        ]
 
 
 # Default instance
@@ -378,6 +524,7 @@ def get_multi_markets_prediction(
     odds_under_25: float | None = None,
     odds_btts_yes: float | None = None,
     odds_btts_no: float | None = None,
+    rho: float = 0.0,
 ) -> MultiMarketsPrediction:
     """Convenience function to get multi-markets prediction."""
     return multi_markets_predictor.predict(
@@ -390,4 +537,24 @@ def get_multi_markets_prediction(
         odds_under_25=odds_under_25,
         odds_btts_yes=odds_btts_yes,
         odds_btts_no=odds_btts_no,
+        rho=rho,
+    )
+
+
+def get_multi_markets_predictions_batch(
+    expected_home_goals: np.ndarray,
+    expected_away_goals: np.ndarray,
+    home_win_probs: np.ndarray,
+    draw_probs: np.ndarray,
+    away_win_probs: np.ndarray,
+    rho: float = 0.0,
+) -> list[MultiMarketsPrediction]:
+    """Convenience function to get multi-markets predictions for a batch."""
+    return multi_markets_predictor.predict_batch(
+        expected_home_goals=expected_home_goals,
+        expected_away_goals=expected_away_goals,
+        home_win_probs=home_win_probs,
+        draw_probs=draw_probs,
+        away_win_probs=away_win_probs,
+        rho=rho,
     )
@@ -0,0 +1,338 @@
+"""Shared score distribution for goal-based models and markets.
+
+Poisson, Dixon-Coles and the multi-markets calculator all need the same
+goal grid for a fixture. This module builds it once per
+(lambda_home, lambda_away, rho) and keeps it in a bounded in-process LRU,
+so every consumer reads identical probabilities:
+
+- 1X2 from the lower triangle / diagonal / upper triangle
+- Over/Under from the cumulative total-goals distribution (anti-diagonal sums)
+- BTTS, correct score and the other markets from multi_markets.price_markets,
+  with the same line splitting (split_line)
+
+Lambdas are quantized before lookup (QUANTIZE_DECIMALS) so near-identical
+inputs share one entry; the grid is computed from the quantized values.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+
+# Highest goal count per team kept in the grid
+DEFAULT_MAX_GOALS = 8
+
+# Lambda/rho rounding used for the cache key (1e-4 goals)
+QUANTIZE_DECIMALS = 4
+
+# Bounded LRU size (~1KB per entry)
+CACHE_MAX_ENTRIES = 2048
+
+
+def poisson_pmf_matrix(lambdas: np.ndarray, max_goals: int) -> np.ndarray:
+    """
+    Poisson PMF for goals 0..max_goals, one row per lambda.
+
+    Computed in log space with a log-factorial table so the whole grid is a
+    single NumPy expression (no scipy import, no per-cell calls).
+
+    Args:
+        lambdas: Array of expected goals, shape (N,)
+        max_goals: Highest goal count to include
+
+    Returns:
+        Array of shape (N, max_goals + 1)
+    """
+    goals = np.arange(max_goals + 1, dtype=np.float64)
+    log_factorials = np.concatenate(([0.0], np.cumsum(np.log(goals[1:]))))
+    lambdas = np.asarray(lambdas, dtype=np.float64)[:, None]
+    # lambda == 0 puts all the mass on 0 goals (0 * log(0) would be NaN)
+    positive = lambdas > 0
+    log_lambdas = np.log(np.where(positive, lambdas, 1.0))
+    log_pmf = np.where(positive, goals * log_lambdas, np.where(goals == 0, 0.0, -np.inf))
+    return np.exp(log_pmf - lambdas - log_factorials)
+
+
+def low_score_correction(
+    lambdas_home: np.ndarray,
+    lambdas_away: np.ndarray,
+    rho: float,
+) -> np.ndarray:
+    """
+    Dixon-Coles correction factors for the 0-0, 0-1, 1-0 and 1-1 cells.
+
+    Args:
+        lambdas_home: Expected home goals, shape (N,)
+        lambdas_away: Expected away goals, shape (N,)
+        rho: Dixon-Coles correlation parameter
+
+    Returns:
+        Array of shape (N, 2, 2) indexed [home_goals, away_goals], clipped to [0.5, 1.5]
+    """
+    lambdas_home = np.asarray(lambdas_home, dtype=np.float64)
+    lambdas_away = np.asarray(lambdas_away, dtype=np.float64)
+    lambda_product = lambdas_home * lambdas_away
+
+    correction = np.empty((len(lambdas_home), 2, 2))
+    correction[:, 0, 0] = 1 - lambda_product * rho
+    correction[:, 0, 1] = 1 - lambdas_home * rho
+    correction[:, 1, 0] = 1 - lambdas_away * rho
+    correction[:, 1, 1] = 1 + lambda_product * rho
+    return np.clip(correction, 0.5, 1.5)
+
+
+def score_matrices(
+    lambdas_home: np.ndarray,
+    lambdas_away: np.ndarray,
+    rho: float = 0.0,
+    max_goals: int = DEFAULT_MAX_GOALS,
+) -> np.ndarray:
+    """
+    Score probability grids for many fixtures at once.
+
+    The independent Poisson grid is an outer product of the two marginal
+    PMFs; a non-zero rho applies the Dixon-Coles correction to the 2x2
+    low-score corner only.
+
+    Returns:
+        Array of shape (N, max_goals + 1, max_goals + 1) indexed [home_goals, away_goals]
+    """
+    lambdas_home = np.asarray(lambdas_home, dtype=np.float64)
+    lambdas_away = np.asarray(lambdas_away, dtype=np.float64)
+
+    home_pmf = poisson_pmf_matrix(lambdas_home, max_goals)
+    away_pmf = poisson_pmf_matrix(lambdas_away, max_goals)
+    matrices = home_pmf[:, :, None] * away_pmf[:, None, :]
+
+    if rho != 0.0:
+        matrices[:, :2, :2] *= low_score_correction(lambdas_home, lambdas_away, rho)
+
+    return matrices
+
+
+def outcome_probabilities(matrices: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Normalized (home, draw, away) probabilities from a stack of score grids.
+
+    Args:
+        matrices: Score grids of shape (N, G, G) indexed [home_goals, away_goals]
+
+    Returns:
+        Tuple of (home_win, draw, away_win) arrays of shape (N,)
+    """
+    home_win = np.tril(matrices, k=-1).sum(axis=(1, 2))
+    draw = np.trace(matrices, axis1=1, axis2=2)
+    away_win = np.triu(matrices, k=1).sum(axis=(1, 2))
+
+    total = home_win + draw + away_win
+    total = np.where(total > 0, total, 1.0)
+    return home_win / total, draw / total, away_win / total
+
+
+def split_line(
+    cdf: np.ndarray, total: np.ndarray, thresholds: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Mass strictly above and strictly below each threshold from a CDF.
+
+    Values exactly on a threshold (push) are excluded and the remaining mass
+    is renormalized; shared by every line market (totals, handicaps).
+
+    Args:
+        cdf: Cumulative distribution over values 0..K-1, shape (N, K)
+        total: Grid mass per row, shape (N,)
+        thresholds: Lines in value units, shape (L,)
+
+    Returns:
+        Tuple of (above, below) arrays of shape (N, L), renormalized without push
+    """
+    last = cdf.shape[1] - 1
+    below_idx = np.ceil(thresholds).astype(int) - 1  # highest value strictly below
+    upto_idx = np.floor(thresholds).astype(int)  # highest value not above
+
+    padded = np.concatenate([np.zeros((len(cdf), 1)), cdf], axis=1)  # padded[:, 0] = P(<0)
+    below = padded[:, np.clip(below_idx, -1, last) + 1]
+    above = total[:, None] - padded[:, np.clip(upto_idx, -1, last) + 1]
+
+    decided = above + below
+    safe = np.where(decided > 0, decided, 1.0)
+    above = np.where(decided > 0, above / safe, 0.5)
+    below = np.where(decided > 0, below / safe, 0.5)
+    return above, below
+
+
+def quantize(value: float) -> float:
+    """Round a lambda or rho to the cache key resolution."""
+    return round(float(value), QUANTIZE_DECIMALS)
+
+
+@dataclass(frozen=True, eq=False)
+class ScoreDistribution:
+    """
+    Goal grid for one fixture and every market derived from it.
+
+    Derived values are computed lazily and memoized on the instance, so a
+    cached distribution answers repeated market queries without recomputing.
+    """
+
+    lambda_home: float
+    lambda_away: float
+    rho: float
+    matrix: np.ndarray  # (G, G) indexed [home_goals, away_goals]
+
+    @cached_property
+    def total(self) -> float:
+        """Probability mass covered by the truncated grid."""
+        return float(self.matrix.sum())
+
+    @cached_property
+    def outcome_probabilities(self) -> tuple[float, float, float]:
+        """Normalized (home_win, draw, away_win) probabilities."""
+        home, draw, away = outcome_probabilities(self.matrix[None])
+        return float(home[0]), float(draw[0]), float(away[0])
+
+    @cached_property
+    def total_goals_pmf(self) -> np.ndarray:
+        """P(home + away = k) for k = 0..2G-2 (anti-diagonal sums)."""
+        size = self.matrix.shape[0]
+        goals = np.add.outer(np.arange(size), np.arange(size)).ravel()
+        return np.bincount(goals, weights=self.matrix.ravel(), minlength=2 * size - 1)
+
+    @cached_property
+    def total_goals_cdf(self) -> np.ndarray:
+        """P(home + away <= k), cumulative sum of total_goals_pmf."""
+        return np.cumsum(self.total_goals_pmf)
+
+    @cached_property
+    def most_likely_score(self) -> tuple[int, int]:
+        """Most likely scoreline (first maximum in row-major order)."""
+        home, away = np.unravel_index(int(np.argmax(self.matrix)), self.matrix.shape)
+        return int(home), int(away)
+
+    @cached_property
+    def score_probabilities(self) -> dict[tuple[int, int], float]:
+        """Every scoreline in the grid as {(home, away): probability}."""
+        size = self.matrix.shape[0]
+        flat = self.matrix.ravel().tolist()
+        return {(h, a): flat[h * size + a] for h in range(size) for a in range(size)}
+
+    def over_under(self, line: float) -> tuple[float, float]:
+        """
+        Over/Under probabilities for a total goals line.
+
+        Totals exactly on the line (push) are excluded and the remaining
+        mass is renormalized.
+
+        Returns:
+            Tuple of (over_prob, under_prob)
+        """
+        over, under = split_line(
+            self.total_goals_cdf[None], np.array([self.total]), np.array([line])
+        )
+        return float(over[0, 0]), float(under[0, 0])
+
+
+# Bounded LRU of distributions keyed by (lambda_home, lambda_away, rho, max_goals)
+_distribution_cache: OrderedDict[tuple[float, float, float, int], ScoreDistribution] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cache_get(key: tuple[float, float, float, int]) -> ScoreDistribution | None:
+    with _cache_lock:
+        distribution = _distribution_cache.get(key)
+        if distribution is not None:
+            _distribution_cache.move_to_end(key)
+        return distribution
+
+
+def _cache_put(key: tuple[float, float, float, int], distribution: ScoreDistribution) -> None:
+    with _cache_lock:
+        _distribution_cache[key] = distribution
+        _distribution_cache.move_to_end(key)
+        while len(_distribution_cache) > CACHE_MAX_ENTRIES:
+            _distribution_cache.popitem(last=False)
+
+
+def clear_score_distribution_cache() -> None:
+    """Drop all cached distributions (tests, parameter changes)."""
+    with _cache_lock:
+        _distribution_cache.clear()
+
+
+def get_score_distribution(
+    lambda_home: float,
+    lambda_away: float,
+    rho: float = 0.0,
+    max_goals: int = DEFAULT_MAX_GOALS,
+) -> ScoreDistribution:
+    """
+    Get the (cached) score distribution for a fixture.
+
+    A Dixon-Coles distribution (rho != 0) is derived from the cached
+    independent Poisson grid, so Poisson and Dixon-Coles share that work.
+
+    Args:
+        lambda_home: Expected home goals
+        lambda_away: Expected away goals
+        rho: Dixon-Coles correlation parameter (0 = plain Poisson)
+        max_goals: Highest goal count per team in the grid
+
+    Returns:
+        ScoreDistribution (shared instance; treat as read-only)
+    """
+    key = (quantize(lambda_home), quantize(lambda_away), quantize(rho), max_goals)
+    distribution = _cache_get(key)
+    if distribution is not None:
+        return distribution
+
+    lambda_home_q, lambda_away_q, rho_q, _ = key
+    if rho_q == 0.0:
+        matrix = score_matrices(
+            np.array([lambda_home_q]), np.array([lambda_away_q]), 0.0, max_goals
+        )[0]
+    else:
+        base = get_score_distribution(lambda_home_q, lambda_away_q, 0.0, max_goals)
+        matrix = base.matrix.copy()
+        matrix[:2, :2] *= low_score_correction(
+            np.array([lambda_home_q]), np.array([lambda_away_q]), rho_q
+        )[0]
+
+    matrix.setflags(write=False)
+    distribution = ScoreDistribution(lambda_home_q, lambda_away_q, rho_q, matrix)
+    _cache_put(key, distribution)
+    return distribution
+
+
+def get_score_distributions(
+    lambdas_home: np.ndarray,
+    lambdas_away: np.ndarray,
+    rho: float = 0.0,
+    max_goals: int = DEFAULT_MAX_GOALS,
+) -> tuple[np.ndarray, list[ScoreDistribution]]:
+    """
+    Batch counterpart of get_score_distribution.
+
+    Computes all grids in one vectorized pass from the quantized lambdas and
+    stores each in the cache, so later per-fixture consumers (e.g. the
+    multi-markets calculator) hit it.
+
+    Returns:
+        Tuple of (stacked grids of shape (N, G, G), list of ScoreDistribution)
+    """
+    lambdas_home_q = np.round(np.asarray(lambdas_home, dtype=np.float64), QUANTIZE_DECIMALS)
+    lambdas_away_q = np.round(np.asarray(lambdas_away, dtype=np.float64), QUANTIZE_DECIMALS)
+    rho_q = quantize(rho)
+
+    matrices = score_matrices(lambdas_home_q, lambdas_away_q, rho_q, max_goals)
+    matrices.setflags(write=False)
+
+    distributions = []
+    for i in range(len(matrices)):
+        key = (float(lambdas_home_q[i]), float(lambdas_away_q[i]), rho_q, max_goals)
+        distribution = ScoreDistribution(key[0], key[1], rho_q, matrices[i])
+        _cache_put(key, distribution)
+        distributions.append(distribution)
+
+    return matrices, distributions
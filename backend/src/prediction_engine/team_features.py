@@ -0,0 +1,261 @@
+"""Per-team features shared by training and serving.
+
+Attack/defense strength, form, rest and congestion scores used to be
+computed separately by the trainers (ml/trainer.py, ml/trainer_extended.py),
+by TrainedModelLoader at inference time and by the prefill SQL, with
+slightly different definitions. This module is the single definition:
+
+- the trainers delegate their per-team calculations to the functions below
+- TeamFeatureTracker replays matches into per-team rolling state, which the
+  team feature store (src.services.team_feature_store) persists as
+  versioned snapshots and serves back to prediction code
+
+Every value is computed from matches played strictly before the date asked
+for, so a snapshot read at serving time equals the value the trainers
+computed for the same team and date.
+
+Bump FEATURE_VERSION when a definition changes; the store keeps snapshots
+per version.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+from src.prediction_engine.models.elo import ELOSystem
+
+FEATURE_VERSION = 1
+
+FORM_WINDOW = 5  # Matches used for form
+STRENGTH_WINDOW = 10  # Matches used for attack/defense and xG averages
+CONGESTION_WINDOW_DAYS = 14
+CONGESTION_MAX_MATCHES = 5  # congestion_score is flat from here on
+
+LEAGUE_AVERAGE_GOALS = 1.3
+NEUTRAL_FORM = 50.0
+NEUTRAL_SCORE = 0.5
+INITIAL_ELO = 1500.0
+
+# Result codes from the team's point of view
+WIN, DRAW, LOSS = 0, 1, 2
+
+
+def form_score(results: Sequence[int], last_n: int = FORM_WINDOW) -> float:
+    """
+    Form from recent results (0=win, 1=draw, 2=loss).
+
+    Returns:
+        Points percentage 0-100 (50 without history)
+    """
+    if not results:
+        return NEUTRAL_FORM
+    recent = results[-last_n:]
+    points = sum(3 if r == WIN else (1 if r == DRAW else 0) for r in recent)
+    return points / (len(recent) * 3) * 100
+
+
+def average_goals(goals: Sequence[int | float], last_n: int = STRENGTH_WINDOW) -> float:
+    """Average of the last ``last_n`` values (league average without history)."""
+    if not goals:
+        return LEAGUE_AVERAGE_GOALS
+    recent = goals[-last_n:]
+    return sum(recent) / len(recent)
+
+
+def rest_days_score(rest_days: int | None, optimal_rest: int = 5, max_rest: int = 14) -> float:
+    """
+    Rest score from the days since the previous match.
+
+    Returns:
+        Score 0-1 (0=fatigued, 1=well-rested, 0.5 without history)
+    """
+    if rest_days is None:
+        return NEUTRAL_SCORE
+    if rest_days <= 2:
+        return 0.2  # Very fatigued
+    elif rest_days <= 3:
+        return 0.4
+    elif rest_days <= 4:
+        return 0.6
+    elif rest_days <= optimal_rest:
+        return 0.8
+    elif rest_days <= max_rest:
+        return 1.0  # Well rested
+    else:
+        return 0.9  # Too long without match (slight negative)
+
+
+def congestion_score(matches_in_window: int | None) -> float:
+    """
+    Fixture congestion score from matches in the previous CONGESTION_WINDOW_DAYS.
+
+    Returns:
+        Score 0-1 (0=congested, 1=light schedule, 0.5 without history)
+    """
+    if matches_in_window is None:
+        return NEUTRAL_SCORE
+    if matches_in_window <= 1:
+        return 1.0
+    elif matches_in_window == 2:
+        return 0.8
+    elif matches_in_window == 3:
+        return 0.6
+    elif matches_in_window == 4:
+        return 0.4
+    else:
+        return 0.2  # Very congested
+
+
+@dataclass
+class TeamFeatures:
+    """Features of one team for a match played on ``as_of``."""
+
+    team_id: int
+    as_of: datetime
+    matches_played: int
+    attack_strength: float  # Avg goals scored, last STRENGTH_WINDOW matches
+    defense_strength: float  # Avg goals conceded (lower is better)
+    form: float  # 0-100
+    rest_days: int | None  # Days since previous match (None without history)
+    rest_score: float  # 0-1, 1 = well rested
+    congestion_score: float  # 0-1, 1 = light schedule
+    elo_rating: float  # Raw (unclamped) ELO
+    xg_for: float | None  # Avg xG for, None if no xG data
+    xg_against: float | None
+
+
+@dataclass
+class TeamFeatureState:
+    """Rolling per-team state; holds exactly what the features need."""
+
+    goals_scored: list[int] = field(default_factory=list)  # Last STRENGTH_WINDOW
+    goals_conceded: list[int] = field(default_factory=list)
+    results: list[int] = field(default_factory=list)  # Last FORM_WINDOW
+    match_dates: list[datetime] = field(default_factory=list)  # Last CONGESTION_MAX_MATCHES
+    xg_for: list[float] = field(default_factory=list)  # Last STRENGTH_WINDOW with xG
+    xg_against: list[float] = field(default_factory=list)
+    elo_rating: float = INITIAL_ELO
+    matches_played: int = 0
+
+    def add_match(
+        self,
+        goals_for: int,
+        goals_against: int,
+        match_date: datetime,
+        xg_for: float | None = None,
+        xg_against: float | None = None,
+    ) -> None:
+        """Append a finished match (call in date order)."""
+        result = WIN if goals_for > goals_against else (LOSS if goals_for < goals_against else DRAW)
+        self.goals_scored = (self.goals_scored + [goals_for])[-STRENGTH_WINDOW:]
+        self.goals_conceded = (self.goals_conceded + [goals_against])[-STRENGTH_WINDOW:]
+        self.results = (self.results + [result])[-FORM_WINDOW:]
+        self.match_dates = (self.match_dates + [match_date])[-CONGESTION_MAX_MATCHES:]
+        if xg_for is not None and xg_against is not None:
+            self.xg_for = (self.xg_for + [float(xg_for)])[-STRENGTH_WINDOW:]
+            self.xg_against = (self.xg_against + [float(xg_against)])[-STRENGTH_WINDOW:]
+        self.matches_played += 1
+
+    @property
+    def last_match_date(self) -> datetime | None:
+        return self.match_dates[-1] if self.match_dates else None
+
+    def features(self, team_id: int, as_of: datetime) -> TeamFeatures:
+        """Features for a match on ``as_of`` (only matches before it count)."""
+        past = [d for d in self.match_dates if d < as_of]
+        rest_days = (as_of - past[-1]).days if past else None
+        window_start = as_of - timedelta(days=CONGESTION_WINDOW_DAYS)
+        in_window = sum(1 for d in past if d >= window_start) if past else None
+
+        return TeamFeatures(
+            team_id=team_id,
+            as_of=as_of,
+            matches_played=self.matches_played,
+            attack_strength=average_goals(self.goals_scored),
+            defense_strength=average_goals(self.goals_conceded),
+            form=form_score(self.results),
+            rest_days=rest_days,
+            rest_score=rest_days_score(rest_days),
+            congestion_score=congestion_score(in_window),
+            elo_rating=self.elo_rating,
+            xg_for=average_goals(self.xg_for) if self.xg_for else None,
+            xg_against=average_goals(self.xg_against) if self.xg_against else None,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form (dates as ISO strings)."""
+        return {
+            "goals_scored": self.goals_scored,
+            "goals_conceded": self.goals_conceded,
+            "results": self.results,
+            "match_dates": [d.isoformat() for d in self.match_dates],
+            "xg_for": self.xg_for,
+            "xg_against": self.xg_against,
+            "elo_rating": self.elo_rating,
+            "matches_played": self.matches_played,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TeamFeatureState":
+        return cls(
+            goals_scored=list(data.get("goals_scored", [])),
+            goals_conceded=list(data.get("goals_conceded", [])),
+            results=list(data.get("results", [])),
+            match_dates=[datetime.fromisoformat(d) for d in data.get("match_dates", [])],
+            xg_for=list(data.get("xg_for", [])),
+            xg_against=list(data.get("xg_against", [])),
+            elo_rating=float(data.get("elo_rating", INITIAL_ELO)),
+            matches_played=int(data.get("matches_played", 0)),
+        )
+
+
+class TeamFeatureTracker:
+    """Replays finished matches into per-team rolling state."""
+
+    def __init__(
+        self,
+        states: dict[int, TeamFeatureState] | None = None,
+        elo_system: ELOSystem | None = None,
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            states: Starting state per team (e.g. latest stored snapshots)
+            elo_system: ELO update rule (default K=20, home advantage 100,
+                as EloRatingService)
+        """
+        self.states: dict[int, TeamFeatureState] = states if states is not None else {}
+        self.elo_system = elo_system or ELOSystem(k_factor=20.0, home_advantage=100.0)
+
+    def state(self, team_id: int) -> TeamFeatureState:
+        """State of a team (empty state if it has not played)."""
+        state = self.states.get(team_id)
+        if state is None:
+            state = self.states[team_id] = TeamFeatureState()
+        return state
+
+    def update(
+        self,
+        home_team_id: int,
+        away_team_id: int,
+        home_goals: int,
+        away_goals: int,
+        match_date: datetime,
+        home_xg: float | None = None,
+        away_xg: float | None = None,
+    ) -> None:
+        """Apply a finished match (call in date order)."""
+        home = self.state(home_team_id)
+        away = self.state(away_team_id)
+
+        home.elo_rating, away.elo_rating = self.elo_system.update_ratings(
+            home.elo_rating, away.elo_rating, home_goals, away_goals
+        )
+        home.add_match(home_goals, away_goals, match_date, home_xg, away_xg)
+        away.add_match(away_goals, home_goals, match_date, away_xg, home_xg)
+
+    def features(self, team_id: int, as_of: datetime) -> TeamFeatures:
+        """Features of a team for a match on ``as_of``."""
+        return self.state(team_id).features(team_id, as_of)
@@ -0,0 +1,127 @@
+"""Persistence for the adaptive ensemble weight history.
+
+AdaptiveWeightCalculator keeps its rolling window in memory, so it used to
+start empty after every restart and fall back to the static weights until
+enough matches were verified again. Per-model outcomes are now stored in
+``adaptive_weight_records``: the calculator is loaded at startup and the
+records it collects after post-match verification are flushed in one
+set-based INSERT.
+"""
+
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from src.db import async_session_factory
+from src.prediction_engine.adaptive_weights import DEFAULT_WEIGHTS, AdaptiveWeightCalculator
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveWeightStore:
+    """Loads and saves AdaptiveWeightCalculator records."""
+
+    @staticmethod
+    async def save(records: list[dict]) -> int:
+        """
+        Insert records, ignoring (model, match) pairs already stored.
+
+        Args:
+            records: Record dictionaries as returned by drain_pending()
+
+        Returns:
+            Number of rows inserted
+        """
+        if not records:
+            return 0
+
+        async with async_session_factory() as session:
+            result = await session.execute(
+                text(
+                    """
+                    INSERT INTO adaptive_weight_records
+                        (model_name, match_id, prob_home, prob_draw, prob_away,
+                         actual_outcome, prediction_date, created_at)
+                    SELECT v.model_name, v.match_id, v.prob_home, v.prob_draw, v.prob_away,
+                           v.actual_outcome, v.prediction_date, NOW()
+                    FROM unnest(
+                        CAST(:model_names AS varchar[]),
+                        CAST(:match_ids AS integer[]),
+                        CAST(:prob_home AS double precision[]),
+                        CAST(:prob_draw AS double precision[]),
+                        CAST(:prob_away AS double precision[]),
+                        CAST(:actual AS varchar[]),
+                        CAST(:dates AS timestamp[])
+                    ) AS v(model_name, match_id, prob_home, prob_draw, prob_away,
+                           actual_outcome, prediction_date)
+                    ON CONFLICT (model_name, match_id) DO NOTHING
+                """
+                ),
+                {
+                    "model_names": [r["model_name"] for r in records],
+                    "match_ids": [r["match_id"] for r in records],
+                    "prob_home": [float(r["predicted_probs"][0]) for r in records],
+                    "prob_draw": [float(r["predicted_probs"][1]) for r in records],
+                    "prob_away": [float(r["predicted_probs"][2]) for r in records],
+                    "actual": [r["actual_outcome"] for r in records],
+                    "dates": [r["prediction_date"] for r in records],
+                },
+            )
+            await session.commit()
+
+        return result.rowcount or 0
+
+    @staticmethod
+    async def load(calculator: AdaptiveWeightCalculator) -> int:
+        """
+        Import stored records young enough to matter into the calculator.
+
+        Loads two rolling windows, the same horizon clear_old_records keeps,
+        for the models the ensemble weights.
+
+        Returns:
+            Number of records imported
+        """
+        since = datetime.now() - timedelta(days=calculator.rolling_window_days * 2)
+
+        async with async_session_factory() as session:
+            result = await session.execute(
+                text(
+                    """
+                    SELECT model_name, match_id, prob_home, prob_draw, prob_away,
+                           actual_outcome, prediction_date
+                    FROM adaptive_weight_records
+                    WHERE prediction_date >= :since
+                      AND model_name = ANY(:models)
+                    ORDER BY prediction_date ASC
+                """
+                ),
+                {"since": since, "models": list(DEFAULT_WEIGHTS)},
+            )
+            rows = result.fetchall()
+
+        count = calculator.import_records(
+            [
+                {
+                    "model_name": row.model_name,
+                    "match_id": row.match_id,
+                    "predicted_probs": (row.prob_home, row.prob_draw, row.prob_away),
+                    "actual_outcome": row.actual_outcome,
+                    "prediction_date": row.prediction_date,
+                }
+                for row in rows
+            ]
+        )
+        logger.info(f"Loaded {count} adaptive weight records")
+        return count
+
+    @staticmethod
+    async def flush(calculator: AdaptiveWeightCalculator) -> int:
+        """
+        Save the records recorded since the last flush.
+
+        Returns:
+            Number of rows inserted
+        """
+        return await AdaptiveWeightStore.save(calculator.drain_pending())
@@ -8,13 +8,17 @@ This service runs daily at 6am to pre-calculate:
 
 The cached data is stored in PostgreSQL/Supabase and served from there
 instead of calculating in real-time on each API request.
+
+The data column is text, so entries are stored as JSON (serialized with
+src.core.codec, which uses orjson) and left to PostgreSQL's
+own TOAST compression rather than compressed here.
 """
 
-import json
 import logging
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+from src.core.codec import json_dumps, json_loads
 from src.data.sources.football_data import COMPETITIONS, get_football_data_client
 from src.db.repositories import get_uow
 from src.db.services import MatchService, PredictionService
@@ -45,7 +49,7 @@ async def get_cached_data(cache_key: str) -> dict[str, Any] | None:
         cached = result.scalar_one_or_none()
 
         if cached and cached.data:
-            return json.loads(cached.data)
+            return json_loads(cached.data)
         return None
 
 
@@ -62,7 +66,7 @@ async def set_cached_data(
         from src.db.models import CachedData
 
         expires_at = datetime.now(UTC) + timedelta(hours=ttl_hours)
-        json_data = json.dumps(data, default=str)
+        json_data = json_dumps(data).decode()
         now = datetime.now(UTC)
 
         # Delete existing entry if any
@@ -0,0 +1,172 @@
+"""Daily calibration summary for verified predictions.
+
+The /predictions/calibration endpoint used to load every verified
+prediction of the period into Python and filter it once per bet type,
+confidence bucket and competition. Verified predictions are now grouped
+in SQL into ``prediction_calibration_daily``: one row per
+(verification day, competition, bet type, confidence bucket) holding the
+count, the number correct and the sum of confidences. The endpoint sums
+those rows for its period, so its cost depends on the number of buckets,
+not on the number of predictions.
+
+The summary is refreshed after predictions are verified; a refresh
+recomputes whole days, so it is idempotent.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import text
+
+from src.db import async_session_factory
+
+logger = logging.getLogger(__name__)
+
+# Confidence buckets as (low, high, label), low inclusive and high exclusive
+CALIBRATION_BUCKETS: list[tuple[float, float, str]] = [
+    (0.50, 0.55, "50-55%"),
+    (0.55, 0.60, "55-60%"),
+    (0.60, 0.65, "60-65%"),
+    (0.65, 0.70, "65-70%"),
+    (0.70, 0.75, "70-75%"),
+    (0.75, 0.80, "75-80%"),
+    (0.80, 0.85, "80-85%"),
+    (0.85, 1.00, "85-100%"),
+]
+
+# Bucket index for confidences outside every bucket (< 50% or 100%)
+NO_BUCKET = -1
+
+BET_TYPES = ["home_win", "draw", "away_win"]
+
+
+def bucket_case_sql(column: str) -> str:
+    """SQL CASE mapping a confidence column to its CALIBRATION_BUCKETS index."""
+    whens = " ".join(
+        f"WHEN {column} >= {low} AND {column} < {high} THEN {index}"
+        for index, (low, high, _) in enumerate(CALIBRATION_BUCKETS)
+    )
+    return f"CASE {whens} ELSE {NO_BUCKET} END"
+
+
+# Verified predictions grouped per day, competition, bet type and bucket.
+# Missing/zero confidence counts as 0.5, as in the per-prediction code it replaces.
+_SUMMARY_SELECT = f"""
+    SELECT day, competition_code, bet_type, {bucket_case_sql("confidence")} AS bucket,
+           COUNT(*) AS predictions,
+           SUM(CASE WHEN was_correct THEN 1 ELSE 0 END) AS correct,
+           SUM(confidence) AS confidence_sum
+    FROM (
+        SELECT CAST(pr.created_at AS DATE) AS day,
+               COALESCE(m.competition_code, '') AS competition_code,
+               CASE p.predicted_outcome
+                   WHEN 'home' THEN 'home_win'
+                   WHEN 'away' THEN 'away_win'
+                   ELSE p.predicted_outcome
+               END AS bet_type,
+               COALESCE(NULLIF(p.confidence, 0), 0.5) AS confidence,
+               pr.was_correct
+        FROM prediction_results pr
+        JOIN predictions p ON p.id = pr.prediction_id
+        JOIN matches m ON m.id = p.match_id
+        WHERE m.status = 'FINISHED'
+            AND m.home_score IS NOT NULL
+            AND m.away_score IS NOT NULL
+            {{since_filter}}
+    ) AS verified
+    GROUP BY day, competition_code, bet_type, bucket
+"""
+
+
+@dataclass
+class CalibrationCell:
+    """Aggregated verified predictions for one competition, bet type and bucket."""
+
+    competition_code: str  # '' when the match has no competition
+    bet_type: str
+    bucket: int  # Index into CALIBRATION_BUCKETS, NO_BUCKET if outside
+    predictions: int
+    correct: int
+    confidence_sum: float
+
+
+class CalibrationSummaryService:
+    """Maintains and reads prediction_calibration_daily."""
+
+    @staticmethod
+    async def refresh(since: date | None = None) -> int:
+        """
+        Recompute the summary for verification days on or after ``since``.
+
+        Args:
+            since: First day to recompute (None = rebuild the whole table)
+
+        Returns:
+            Number of summary rows written
+        """
+        since_filter = "AND pr.created_at >= :since" if since else ""
+        day_filter = "WHERE day >= :since" if since else ""
+
+        async with async_session_factory() as session:
+            await session.execute(
+                text(f"DELETE FROM prediction_calibration_daily {day_filter}"),
+                {"since": since},
+            )
+            result = await session.execute(
+                text(
+                    f"""
+                    INSERT INTO prediction_calibration_daily
+                        (day, competition_code, bet_type, bucket,
+                         predictions, correct, confidence_sum, updated_at)
+                    SELECT day, competition_code, bet_type, bucket,
+                           predictions, correct, confidence_sum, NOW()
+                    FROM ({_SUMMARY_SELECT.format(since_filter=since_filter)}) AS summary
+                    ON CONFLICT (day, competition_code, bet_type, bucket) DO UPDATE SET
+                        predictions = EXCLUDED.predictions,
+                        correct = EXCLUDED.correct,
+                        confidence_sum = EXCLUDED.confidence_sum,
+                        updated_at = EXCLUDED.updated_at
+                """
+                ),
+                {"since": since},
+            )
+            await session.commit()
+
+        rows = result.rowcount or 0
+        logger.info(f"Refreshed calibration summary since {since or 'the beginning'}: {rows} rows")
+        return rows
+
+    @staticmethod
+    async def get_cells(since: date) -> list[CalibrationCell]:
+        """
+        Summed summary rows for verification days on or after ``since``.
+
+        Returns at most competitions x bet types x buckets rows.
+        """
+        async with async_session_factory() as session:
+            result = await session.execute(
+                text(
+                    """
+                    SELECT competition_code, bet_type, bucket,
+                           SUM(predictions) AS predictions,
+                           SUM(correct) AS correct,
+                           SUM(confidence_sum) AS confidence_sum
+                    FROM prediction_calibration_daily
+                    WHERE day >= :since
+                    GROUP BY competition_code, bet_type, bucket
+                """
+                ),
+                {"since": since},
+            )
+            return [
+                CalibrationCell(
+                    competition_code=row.competition_code,
+                    bet_type=row.bet_type,
+                    bucket=int(row.bucket),
+                    predictions=int(row.predictions),
+                    correct=int(row.correct),
+                    confidence_sum=float(row.confidence_sum),
+                )
+                for row in result.fetchall()
+            ]
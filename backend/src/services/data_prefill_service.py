@@ -24,6 +24,12 @@ from src.db import async_session_factory
 
 logger = logging.getLogger(__name__)
 
+# Concurrent matches per prefill stage (Groq pacing is left to groq_rate_limiter)
+_PREFILL_IO_CONCURRENCY = 8
+_PREFILL_LLM_CONCURRENCY = 4
+# Enriched predictions are written in bulk, this many per save (one at a time)
+_PREFILL_SAVE_BATCH_SIZE = 25
+
 
 @asynccontextmanager
 async def get_async_session():
@@ -38,8 +44,13 @@ async def log_sync_operation(
     records_synced: int = 0,
     error_message: str | None = None,
     triggered_by: str = "startup",
+    started_at: datetime | None = None,
 ) -> int:
-    """Log a sync operation to the sync_log table."""
+    """Log a sync operation to the sync_log table.
+
+    ``started_at`` defaults to now; pass the run start (see sync_watermark)
+    for operations whose successful runs serve as an incremental watermark.
+    """
     async with get_async_session() as session:
         result = await session.execute(
             text(
@@ -51,7 +62,7 @@ async def log_sync_operation(
                 )
                 VALUES (
                     :sync_type, :status, :records_synced,
-                    NOW(), NOW(),
+                    COALESCE(CAST(:started_at AS timestamp), NOW()), NOW(),
                     :error_message, :triggered_by
                 )
                 RETURNING id
@@ -63,6 +74,7 @@ async def log_sync_operation(
                 "records_synced": records_synced,
                 "error_message": error_message,
                 "triggered_by": triggered_by,
+                "started_at": started_at,
             },
         )
         await session.commit()
@@ -70,6 +82,51 @@ async def log_sync_operation(
         return row[0] if row else 0
 
 
+async def sync_watermark(sync_type: str) -> tuple[datetime, datetime | None]:
+    """Current database time and the start of the last successful run of a sync type.
+
+    Both come from the database clock, like the updated_at columns they are
+    compared with. Log the run with ``started_at`` set to the returned time.
+
+    Returns:
+        Tuple of (now, last successful run start or None)
+    """
+    async with get_async_session() as session:
+        result = await session.execute(
+            text(
+                """
+                SELECT LOCALTIMESTAMP AS now,
+                       (SELECT MAX(started_at) FROM sync_log
+                        WHERE sync_type = :sync_type AND status = 'success') AS last_success
+            """
+            ),
+            {"sync_type": sync_type},
+        )
+        row = result.fetchone()
+        return row.now, row.last_success
+
+
+_NEWS_SUMMARY_PROMPT = """\
+Tu es un analyste football expert. Résume le contexte d'actualité \
+pour le match {home_team} vs {away_team}.
+
+PROBABILITÉS DU MODÈLE STATISTIQUE:
+- Victoire {home_team}: {home_win_prob:.0%}
+- Match nul: {draw_prob:.0%}
+- Victoire {away_team}: {away_win_prob:.0%}
+
+ACTUALITÉS RÉCENTES (derniers 7 jours):
+{headlines_str}
+
+CONSIGNES:
+1. Résume en 8-10 lignes max les éléments d'actualité pertinents pour ce match
+2. Donne ton avis d'expert sur l'impact de ces actualités sur le pronostic
+3. Identifie les facteurs d'influence clés basés sur l'actu (blessures, forme, mercato, etc.)
+4. IMPORTANT: Réponds UNIQUEMENT en français, même si les titres sont en anglais
+5. Pas de titre, pas de bullet points, juste du texte fluide
+6. Sois factuel et concis (max 200 mots)"""
+
+
 async def generate_match_news_summary(
     home_team: str,
     away_team: str,
@@ -133,25 +190,14 @@ async def generate_match_news_summary(
         headlines_str = "\n".join(headlines[:20])
 
         # 3. Call LLM
-        prompt = f"""\
-Tu es un analyste football expert. Résume le contexte d'actualité \
-pour le match {home_team} vs {away_team}.
-
-PROBABILITÉS DU MODÈLE STATISTIQUE:
-- Victoire {home_team}: {home_win_prob:.0%}
-- Match nul: {draw_prob:.0%}
-- Victoire {away_team}: {away_win_prob:.0%}
-
-ACTUALITÉS RÉCENTES (derniers 7 jours):
-{headlines_str}
-
-CONSIGNES:
-1. Résume en 8-10 lignes max les éléments d'actualité pertinents pour ce match
-2. Donne ton avis d'expert sur l'impact de ces actualités sur le pronostic
-3. Identifie les facteurs d'influence clés basés sur l'actu (blessures, forme, mercato, etc.)
-4. IMPORTANT: Réponds UNIQUEMENT en français, même si les titres sont en anglais
-5. Pas de titre, pas de bullet points, juste du texte fluide
-6. Sois factuel et concis (max 200 mots)"""
+        prompt = _NEWS_SUMMARY_PROMPT.format(
+            home_team=home_team,
+            away_team=away_team,
+            home_win_prob=home_win_prob,
+            draw_prob=draw_prob,
+            away_win_prob=away_win_prob,
+            headlines_str=headlines_str,
+        )
 
         llm = get_llm_client()
         summary = await llm.complete(
@@ -229,6 +275,62 @@ def _calculate_match_importance(
     }
 
 
+def _predict_ensemble_batch(
+    predictor: Any,
+    batch: list[tuple[Any, Any, Any]],
+    feature_states: dict[int, Any] | None = None,
+) -> list[Any]:
+    """Run the advanced ensemble on (match, home_team, away_team) rows in one batch call.
+
+    Applies the same per-field defaults the per-match predict() call used.
+    Rest and congestion scores come from the team feature store states when
+    available (same definitions as model training), else from the teams row.
+    """
+    import numpy as np
+
+    from src.services.team_feature_store import to_naive_utc
+
+    def column(rows: list[Any], field: str, default: float, scale: float = 1.0) -> np.ndarray:
+        return np.array(
+            [float(getattr(r, field) or default) * scale for r in rows], dtype=np.float64
+        )
+
+    matches = [m for m, _, _ in batch]
+    homes = [h for _, h, _ in batch]
+    aways = [a for _, _, a in batch]
+
+    def fatigue(side: str, field: str, fallback: np.ndarray) -> np.ndarray:
+        values = fallback.copy()
+        for i, match in enumerate(matches):
+            team_id = getattr(match, f"{side}_team_id")
+            state = (feature_states or {}).get(team_id)
+            if state is not None:
+                features = state.features(team_id, to_naive_utc(match.match_date))
+                values[i] = getattr(features, field)
+        return values
+
+    return predictor.predict_batch(
+        home_attack=column(homes, "avg_goals_scored_home", 1.3),
+        home_defense=column(homes, "avg_goals_conceded_home", 1.3),
+        away_attack=column(aways, "avg_goals_scored_away", 1.3),
+        away_defense=column(aways, "avg_goals_conceded_away", 1.3),
+        home_elo=column(homes, "elo_rating", 1500),
+        away_elo=column(aways, "elo_rating", 1500),
+        home_team_ids=[m.home_team_id for m in matches],
+        away_team_ids=[m.away_team_id for m in matches],
+        home_form_score=column(homes, "form_score", 0.5, scale=100),
+        away_form_score=column(aways, "form_score", 0.5, scale=100),
+        home_rest_days=fatigue("home", "rest_score", column(homes, "rest_days", 0.5)),
+        away_rest_days=fatigue("away", "rest_score", column(aways, "rest_days", 0.5)),
+        home_congestion=fatigue(
+            "home", "congestion_score", column(homes, "fixture_congestion", 0.5)
+        ),
+        away_congestion=fatigue(
+            "away", "congestion_score", column(aways, "fixture_congestion", 0.5)
+        ),
+    )
+
+
 def _serialize_model_details(
     pred: Any,
     home_stats: Any,
@@ -349,12 +451,99 @@ async def _generate_llm_analysis(
     return None, None, None
 
 
+# Teams row columns the ensemble reads (rest/congestion come from the feature store)
+_FINGERPRINT_TEAM_FIELDS = (
+    "elo_rating",
+    "avg_goals_scored_home",
+    "avg_goals_conceded_home",
+    "avg_goals_scored_away",
+    "avg_goals_conceded_away",
+    "form_score",
+)
+
+# Bump when prefill output changes for the same inputs (ensemble combination,
+# model_details layout, value score) so every stored prediction is recomputed once
+PREDICTION_PIPELINE_VERSION = 1
+
+
+def _prefill_model_version() -> str:
+    """Pipeline, team feature and trained model file versions."""
+    from src.prediction_engine.team_features import FEATURE_VERSION
+
+    try:
+        from src.ml.model_loader import model_loader
+
+        trained = model_loader.model_version
+    except ImportError:
+        trained = "unavailable"
+    return f"{PREDICTION_PIPELINE_VERSION}:{FEATURE_VERSION}:{trained}"
+
+
+def _prefill_prompt_version() -> str:
+    """Hash of the prompt templates the prefill sends to the LLM."""
+    from src.llm.prompts import MATCH_EXPLANATION_PROMPT, SYSTEM_FOOTBALL_ANALYST
+
+    templates = (SYSTEM_FOOTBALL_ANALYST, MATCH_EXPLANATION_PROMPT, _NEWS_SUMMARY_PROMPT)
+    return hashlib.sha256("\x00".join(templates).encode()).hexdigest()[:12]
+
+
+def _prediction_input_fingerprint(
+    match: Any,
+    home: Any,
+    away: Any,
+    feature_states: dict[int, Any],
+    model_version: str,
+    prompt_version: str,
+) -> str:
+    """Hash of everything a prefilled prediction is computed from.
+
+    Covers both teams' ELO, goal averages and form, the feature store
+    rest/congestion scores for the match date, the match odds, kickoff and
+    competition, and the model and prompt versions. An unchanged fingerprint
+    means recomputing would reproduce the stored numbers and prompts, so the
+    prefill skips the match.
+
+    The teams row's rest_days/fixture_congestion are recomputed from NOW()
+    every day, so they are only hashed for teams without a feature state.
+    """
+    from src.services.team_feature_store import to_naive_utc
+
+    def team(row: Any) -> list[Any]:
+        return [getattr(row, field, None) for field in _FINGERPRINT_TEAM_FIELDS]
+
+    def fatigue(team_id: int, row: Any) -> list[Any]:
+        state = feature_states.get(team_id)
+        if state is None:
+            return [getattr(row, "rest_days", None), getattr(row, "fixture_congestion", None)]
+        features = state.features(team_id, to_naive_utc(match.match_date))
+        return [features.rest_score, features.congestion_score]
+
+    payload = [
+        model_version,
+        prompt_version,
+        str(match.match_date),
+        match.competition_code,
+        [match.odds_home, match.odds_draw, match.odds_away],
+        team(home),
+        team(away),
+        fatigue(match.home_team_id, home),
+        fatigue(match.away_team_id, away),
+    ]
+    return hashlib.sha256(json.dumps(payload, default=str).encode()).hexdigest()
+
+
 class DataPrefillService:
     """Service for automatic data prefilling and enrichment."""
 
     @staticmethod
-    async def fill_all_team_data() -> dict[str, int]:
-        """Fill all team data fields. Returns counts of updated fields."""
+    async def fill_all_team_data(since: datetime | None = None) -> dict[str, int]:
+        """Fill all team data fields. Returns counts of updated fields.
+
+        Args:
+            since: Watermark of the previous successful run (sync_log). Only
+                teams with a finished match updated since then are recomputed,
+                using the per-team match indexes. None recomputes every team.
+        """
         results = {
             "country": 0,
             "form": 0,
@@ -364,109 +553,193 @@ class DataPrefillService:
         }
 
         async with get_async_session() as session:
-            # 1. Fill country from competition
-            country_result = await session.execute(
-                text(
-                    """
-                WITH team_leagues AS (
-                    SELECT team_id, competition_code, SUM(cnt) as total_matches
-                    FROM (
-                        SELECT home_team_id as team_id, competition_code, COUNT(*) as cnt
-                        FROM matches WHERE competition_code IN ('PL', 'PD', 'BL1', 'SA', 'FL1')
-                        GROUP BY home_team_id, competition_code
-                        UNION ALL
-                        SELECT away_team_id as team_id, competition_code, COUNT(*) as cnt
-                        FROM matches WHERE competition_code IN ('PL', 'PD', 'BL1', 'SA', 'FL1')
-                        GROUP BY away_team_id, competition_code
-                    ) m
-                    GROUP BY team_id, competition_code
-                ),
-                primary_league AS (
-                    SELECT DISTINCT ON (team_id) team_id, competition_code
-                    FROM team_leagues
-                    ORDER BY team_id, total_matches DESC
+            team_ids: list[int] | None = None
+            if since is not None:
+                changed = await session.execute(
+                    text(
+                        """
+                    SELECT home_team_id AS team_id FROM matches
+                    WHERE status = 'FINISHED' AND updated_at >= :since
+                    UNION
+                    SELECT away_team_id AS team_id FROM matches
+                    WHERE status = 'FINISHED' AND updated_at >= :since
+                """
+                    ),
+                    {"since": since},
                 )
-                UPDATE teams t
-                SET country = CASE pl.competition_code
-                    WHEN 'PL' THEN 'England'
-                    WHEN 'PD' THEN 'Spain'
-                    WHEN 'BL1' THEN 'Germany'
-                    WHEN 'SA' THEN 'Italy'
-                    WHEN 'FL1' THEN 'France'
-                END,
-                updated_at = NOW()
-                FROM primary_league pl
-                WHERE t.id = pl.team_id AND (t.country IS NULL OR t.country = '')
-            """
+                team_ids = [row.team_id for row in changed.fetchall()]
+                logger.info(f"Team data incremental since {since}: {len(team_ids)} teams")
+
+            # Restrict the per-team aggregates to the changed teams
+            home_filter = "AND home_team_id = ANY(:team_ids)" if team_ids is not None else ""
+            away_filter = "AND away_team_id = ANY(:team_ids)" if team_ids is not None else ""
+            params = {"team_ids": team_ids}
+
+            if team_ids is None or team_ids:
+                # 1. Fill country from competition
+                country_result = await session.execute(
+                    text(
+                        f"""
+                    WITH team_leagues AS (
+                        SELECT team_id, competition_code, SUM(cnt) as total_matches
+                        FROM (
+                            SELECT home_team_id as team_id, competition_code, COUNT(*) as cnt
+                            FROM matches
+                            WHERE competition_code IN ('PL', 'PD', 'BL1', 'SA', 'FL1')
+                                {home_filter}
+                            GROUP BY home_team_id, competition_code
+                            UNION ALL
+                            SELECT away_team_id as team_id, competition_code, COUNT(*) as cnt
+                            FROM matches
+                            WHERE competition_code IN ('PL', 'PD', 'BL1', 'SA', 'FL1')
+                                {away_filter}
+                            GROUP BY away_team_id, competition_code
+                        ) m
+                        GROUP BY team_id, competition_code
+                    ),
+                    primary_league AS (
+                        SELECT DISTINCT ON (team_id) team_id, competition_code
+                        FROM team_leagues
+                        ORDER BY team_id, total_matches DESC
+                    )
+                    UPDATE teams t
+                    SET country = CASE pl.competition_code
+                        WHEN 'PL' THEN 'England'
+                        WHEN 'PD' THEN 'Spain'
+                        WHEN 'BL1' THEN 'Germany'
+                        WHEN 'SA' THEN 'Italy'
+                        WHEN 'FL1' THEN 'France'
+                    END,
+                    updated_at = NOW()
+                    FROM primary_league pl
+                    WHERE t.id = pl.team_id AND (t.country IS NULL OR t.country = '')
+                """
+                    ),
+                    params,
                 )
-            )
-            results["country"] = country_result.rowcount
-            await session.commit()
+                results["country"] = country_result.rowcount
+                await session.commit()
 
-            # 2. Fill form from last 5 matches
-            form_result = await session.execute(
-                text(
-                    """
-                WITH recent_matches AS (
-                    SELECT
-                        team_id,
-                        match_date,
-                        CASE
-                            WHEN goals_for > goals_against THEN 'W'
-                            WHEN goals_for = goals_against THEN 'D'
-                            ELSE 'L'
-                        END as result,
-                        ROW_NUMBER() OVER (PARTITION BY team_id ORDER BY match_date DESC) as rn
-                    FROM (
-                        SELECT home_team_id as team_id, match_date,
-                            home_score as goals_for, away_score as goals_against
+                # 2. Fill form from last 5 matches
+                form_result = await session.execute(
+                    text(
+                        f"""
+                    WITH recent_matches AS (
+                        SELECT
+                            team_id,
+                            match_date,
+                            CASE
+                                WHEN goals_for > goals_against THEN 'W'
+                                WHEN goals_for = goals_against THEN 'D'
+                                ELSE 'L'
+                            END as result,
+                            ROW_NUMBER() OVER (PARTITION BY team_id ORDER BY match_date DESC) as rn
+                        FROM (
+                            SELECT home_team_id as team_id, match_date,
+                                home_score as goals_for, away_score as goals_against
+                            FROM matches
+                            WHERE status = 'FINISHED' AND home_score IS NOT NULL {home_filter}
+                            UNION ALL
+                            SELECT away_team_id as team_id, match_date,
+                                away_score as goals_for, home_score as goals_against
+                            FROM matches
+                            WHERE status = 'FINISHED' AND away_score IS NOT NULL {away_filter}
+                        ) all_matches
+                    ),
+                    team_form AS (
+                        SELECT team_id, STRING_AGG(result, '' ORDER BY match_date DESC) as form
+                        FROM recent_matches
+                        WHERE rn <= 5
+                        GROUP BY team_id
+                    )
+                    UPDATE teams t
+                    SET
+                        form = tf.form,
+                        form_score = (
+                            (LENGTH(tf.form) - LENGTH(REPLACE(tf.form, 'W', ''))) * 3 +
+                            (LENGTH(tf.form) - LENGTH(REPLACE(tf.form, 'D', ''))) * 1
+                        ) / 15.0,
+                        updated_at = NOW()
+                    FROM team_form tf
+                    WHERE t.id = tf.team_id
+                """
+                    ),
+                    params,
+                )
+                results["form"] = form_result.rowcount
+                await session.commit()
+
+                # 3a. Last match date
+                await session.execute(
+                    text(
+                        f"""
+                    WITH last_match AS (
+                        SELECT team_id, MAX(match_date) as last_date
+                        FROM (
+                            SELECT home_team_id as team_id, match_date
+                            FROM matches WHERE status = 'FINISHED' {home_filter}
+                            UNION ALL
+                            SELECT away_team_id as team_id, match_date
+                            FROM matches WHERE status = 'FINISHED' {away_filter}
+                        ) all_matches
+                        GROUP BY team_id
+                    )
+                    UPDATE teams t
+                    SET last_match_date = lm.last_date, updated_at = NOW()
+                    FROM last_match lm
+                    WHERE t.id = lm.team_id
+                        AND t.last_match_date IS DISTINCT FROM lm.last_date
+                """
+                    ),
+                    params,
+                )
+
+                # 4. Fill avg_goals from match history
+                goals_result = await session.execute(
+                    text(
+                        f"""
+                    WITH home_stats AS (
+                        SELECT
+                            home_team_id as team_id,
+                            AVG(home_score) as avg_scored,
+                            AVG(away_score) as avg_conceded
                         FROM matches
-                        WHERE status = 'FINISHED' AND home_score IS NOT NULL
-                        UNION ALL
-                        SELECT away_team_id as team_id, match_date,
-                            away_score as goals_for, home_score as goals_against
+                        WHERE status = 'FINISHED' AND home_score IS NOT NULL {home_filter}
+                        GROUP BY home_team_id
+                    ),
+                    away_stats AS (
+                        SELECT
+                            away_team_id as team_id,
+                            AVG(away_score) as avg_scored,
+                            AVG(home_score) as avg_conceded
                         FROM matches
-                        WHERE status = 'FINISHED' AND away_score IS NOT NULL
-                    ) all_matches
-                ),
-                team_form AS (
-                    SELECT team_id, STRING_AGG(result, '' ORDER BY match_date DESC) as form
-                    FROM recent_matches
-                    WHERE rn <= 5
-                    GROUP BY team_id
-                )
-                UPDATE teams t
-                SET
-                    form = tf.form,
-                    form_score = (
-                        (LENGTH(tf.form) - LENGTH(REPLACE(tf.form, 'W', ''))) * 3 +
-                        (LENGTH(tf.form) - LENGTH(REPLACE(tf.form, 'D', ''))) * 1
-                    ) / 15.0,
-                    updated_at = NOW()
-                FROM team_form tf
-                WHERE t.id = tf.team_id
-            """
+                        WHERE status = 'FINISHED' AND away_score IS NOT NULL {away_filter}
+                        GROUP BY away_team_id
+                    )
+                    UPDATE teams t
+                    SET
+                        avg_goals_scored_home = COALESCE(h.avg_scored, 1.0),
+                        avg_goals_conceded_home = COALESCE(h.avg_conceded, 1.0),
+                        avg_goals_scored_away = COALESCE(a.avg_scored, 1.0),
+                        avg_goals_conceded_away = COALESCE(a.avg_conceded, 1.0),
+                        updated_at = NOW()
+                    FROM home_stats h
+                    FULL OUTER JOIN away_stats a ON h.team_id = a.team_id
+                    WHERE t.id = COALESCE(h.team_id, a.team_id)
+                """
+                    ),
+                    params,
                 )
-            )
-            results["form"] = form_result.rowcount
-            await session.commit()
+                results["avg_goals"] = goals_result.rowcount
+                await session.commit()
 
-            # 3. Fill rest_days and fixture_congestion
+            # 3b. rest_days and fixture_congestion move with the clock, so they are
+            # refreshed for every team, from teams.last_match_date and a 14-day
+            # range of matches only; unchanged rows are not rewritten
             rest_result = await session.execute(
                 text(
                     """
-                WITH last_match AS (
-                    SELECT team_id, MAX(match_date) as last_date
-                    FROM (
-                        SELECT home_team_id as team_id, match_date
-                        FROM matches WHERE status = 'FINISHED'
-                        UNION ALL
-                        SELECT away_team_id as team_id, match_date
-                        FROM matches WHERE status = 'FINISHED'
-                    ) all_matches
-                    GROUP BY team_id
-                ),
-                congestion AS (
+                WITH congestion AS (
                     SELECT team_id, COUNT(*) as matches_14d
                     FROM (
                         SELECT home_team_id as team_id FROM matches
@@ -476,144 +749,106 @@ class DataPrefillService:
                         WHERE status = 'FINISHED' AND match_date >= NOW() - INTERVAL '14 days'
                     ) recent
                     GROUP BY team_id
-                )
-                UPDATE teams t
-                SET
-                    last_match_date = lm.last_date,
-                    rest_days = COALESCE(EXTRACT(DAY FROM NOW() - lm.last_date)::INTEGER, 7),
-                    fixture_congestion = LEAST(1.0, COALESCE(c.matches_14d, 0) / 4.0),
-                    updated_at = NOW()
-                FROM last_match lm
-                LEFT JOIN congestion c ON lm.team_id = c.team_id
-                WHERE t.id = lm.team_id
-            """
-                )
-            )
-            results["rest_days"] = rest_result.rowcount
-            await session.commit()
-
-            # 4. Fill avg_goals from match history
-            goals_result = await session.execute(
-                text(
-                    """
-                WITH home_stats AS (
-                    SELECT
-                        home_team_id as team_id,
-                        AVG(home_score) as avg_scored,
-                        AVG(away_score) as avg_conceded
-                    FROM matches
-                    WHERE status = 'FINISHED' AND home_score IS NOT NULL
-                    GROUP BY home_team_id
                 ),
-                away_stats AS (
+                fatigue AS (
                     SELECT
-                        away_team_id as team_id,
-                        AVG(away_score) as avg_scored,
-                        AVG(home_score) as avg_conceded
-                    FROM matches
-                    WHERE status = 'FINISHED' AND away_score IS NOT NULL
-                    GROUP BY away_team_id
+                        t.id as team_id,
+                        COALESCE(EXTRACT(DAY FROM NOW() - t.last_match_date)::INTEGER, 7)
+                            as rest_days,
+                        LEAST(1.0, COALESCE(c.matches_14d, 0) / 4.0) as congestion
+                    FROM teams t
+                    LEFT JOIN congestion c ON t.id = c.team_id
+                    WHERE t.last_match_date IS NOT NULL
                 )
                 UPDATE teams t
                 SET
-                    avg_goals_scored_home = COALESCE(h.avg_scored, 1.0),
-                    avg_goals_conceded_home = COALESCE(h.avg_conceded, 1.0),
-                    avg_goals_scored_away = COALESCE(a.avg_scored, 1.0),
-                    avg_goals_conceded_away = COALESCE(a.avg_conceded, 1.0),
+                    rest_days = f.rest_days,
+                    fixture_congestion = f.congestion,
                     updated_at = NOW()
-                FROM home_stats h
-                FULL OUTER JOIN away_stats a ON h.team_id = a.team_id
-                WHERE t.id = COALESCE(h.team_id, a.team_id)
+                FROM fatigue f
+                WHERE t.id = f.team_id
+                    AND (
+                        t.rest_days IS DISTINCT FROM f.rest_days
+                        OR t.fixture_congestion IS DISTINCT FROM f.congestion
+                    )
             """
                 )
             )
-            results["avg_goals"] = goals_result.rowcount
+            results["rest_days"] = rest_result.rowcount
             await session.commit()
 
+        from src.services.team_snapshot_cache import team_snapshot_cache
+
+        team_snapshot_cache.invalidate()
         logger.info(f"Team data prefill complete: {results}")
         return results
 
     @staticmethod
-    async def calculate_elo_ratings() -> int:
-        """Calculate proper ELO ratings from match history."""
-        from src.prediction_engine.models.elo import ELOSystem
+    async def calculate_elo_ratings(full_rebuild: bool = False) -> int:
+        """Apply newly finished matches to the persisted ELO ratings.
 
-        elo_system = ELOSystem(k_factor=20.0, home_advantage=100.0)
-        team_ratings: dict[int, float] = {}
+        Incremental from the stored watermark; see EloRatingService.
 
-        async with get_async_session() as session:
-            # Get all finished matches ordered by date
-            result = await session.execute(
-                text(
-                    """
-                SELECT id, home_team_id, away_team_id, home_score, away_score, match_date
-                FROM matches
-                WHERE status = 'FINISHED'
-                    AND home_score IS NOT NULL
-                    AND away_score IS NOT NULL
-                ORDER BY match_date ASC
-            """
-                )
-            )
-            matches = result.fetchall()
-
-            logger.info(f"Processing {len(matches)} matches for ELO calculation")
-
-            for match in matches:
-                home_id = match.home_team_id
-                away_id = match.away_team_id
-
-                # Initialize at 1500 if new
-                if home_id not in team_ratings:
-                    team_ratings[home_id] = 1500.0
-                if away_id not in team_ratings:
-                    team_ratings[away_id] = 1500.0
-
-                # Calculate new ratings
-                new_home, new_away = elo_system.update_ratings(
-                    home_rating=team_ratings[home_id],
-                    away_rating=team_ratings[away_id],
-                    home_goals=match.home_score,
-                    away_goals=match.away_score,
-                )
+        Args:
+            full_rebuild: Replay the whole match history instead.
 
-                team_ratings[home_id] = new_home
-                team_ratings[away_id] = new_away
+        Returns:
+            Number of teams whose rating changed.
+        """
+        from src.services.elo_service import EloRatingService
 
-            # Update database
-            updated = 0
-            for team_id, elo in team_ratings.items():
-                clamped_elo = max(1000.0, min(2500.0, elo))
-                await session.execute(
-                    text("UPDATE teams SET elo_rating = :elo, updated_at = NOW() WHERE id = :id"),
-                    {"elo": clamped_elo, "id": team_id},
-                )
-                updated += 1
+        result = await EloRatingService.update_ratings(full_rebuild=full_rebuild)
+        return result.teams_updated
 
-            await session.commit()
-            logger.info(f"Updated ELO for {updated} teams")
-            return updated
+    @staticmethod
+    async def update_team_features(full_rebuild: bool = False) -> int:
+        """Apply newly finished matches to the team feature store.
+
+        Incremental from the latest snapshots; see TeamFeatureStore.
+
+        Args:
+            full_rebuild: Replay the whole match history instead.
+
+        Returns:
+            Number of matches applied.
+        """
+        from src.services.team_feature_store import TeamFeatureStore
+
+        result = await TeamFeatureStore.update(full_rebuild=full_rebuild)
+        return result.matches_processed
 
     @staticmethod
-    async def prefill_predictions_for_upcoming(days: int = 30) -> int:
+    async def prefill_predictions_for_upcoming(days: int = 30, force: bool = False) -> int:
         """Pre-generate predictions with full AI enrichment for upcoming matches.
 
-        Pipeline per match:
-        1. Run 6-model ensemble predictor
-        2. Calculate multi-markets (O/U 1.5/2.5/3.5, BTTS, DC, correct score)
-        3. Fetch match-day weather from Open-Meteo
+        Matches whose stored prediction is complete and was computed from the
+        same inputs (see _prediction_input_fingerprint) are skipped: no
+        ensemble run, no LLM calls, no write.
+
+        Pipeline:
+        1. Run 6-model ensemble predictor for all matches in one batch
+        2. Price multi-markets (O/U, BTTS, DC, correct score, AH, team totals) in one batch
+        Then per match, all matches concurrently with a bounded number per stage:
+        3. Fetch match-day weather from Open-Meteo and injury news
         4. Generate LLM analysis via Groq (None if LLM unavailable)
         5. Generate news context summary via LLM
-        6. Persist everything (model_details JSON, explanation, factors)
+        6. Persist everything (model_details JSON, explanation, factors), in bulk
+           batches via PredictionService.save_predictions_bulk
         7. After all matches: mark top 5 daily picks
 
+        Groq calls are paced by the shared token-bucket limiter
+        (src.llm.rate_limiter) to the configured requests/tokens per minute.
+
         Args:
             days: Number of days ahead to look for matches (default 30, use 7 for hourly cron).
+            force: Recompute every upcoming match, ignoring fingerprints.
         """
         from src.data.data_enrichment import WeatherClient
         from src.db.services.prediction_service import PredictionService
         from src.prediction_engine.ensemble_advanced import advanced_ensemble_predictor
-        from src.prediction_engine.multi_markets import get_multi_markets_prediction
+        from src.prediction_engine.multi_markets import get_multi_markets_predictions_batch
+        from src.services.team_feature_store import TeamFeatureStore
+        from src.services.team_snapshot_cache import load_team_stats
 
         weather_client = WeatherClient()
 
@@ -625,7 +860,16 @@ class DataPrefillService:
                     """
                 SELECT m.id, m.external_id, m.home_team_id, m.away_team_id,
                        m.competition_code, m.match_date,
-                       ht.name as home_team, at.name as away_team
+                       m.odds_home, m.odds_draw, m.odds_away,
+                       ht.name as home_team, at.name as away_team,
+                       p.input_fingerprint, p.value_score, p.confidence,
+                       (
+                        p.id IS NULL
+                        OR p.value_score IS NULL
+                        OR p.key_factors IS NULL
+                        OR p.model_details IS NULL
+                        OR p.explanation LIKE 'Prédiction pré-calculée%%'
+                       ) AS incomplete
                 FROM matches m
                 JOIN teams ht ON m.home_team_id = ht.id
                 JOIN teams at ON m.away_team_id = at.id
@@ -633,13 +877,6 @@ class DataPrefillService:
                 WHERE m.status IN ('SCHEDULED', 'TIMED')
                     AND m.match_date > NOW()
                     AND m.match_date < :cutoff
-                    AND (
-                        p.id IS NULL
-                        OR p.value_score IS NULL
-                        OR p.key_factors IS NULL
-                        OR p.model_details IS NULL
-                        OR p.explanation LIKE 'Prédiction pré-calculée%%'
-                    )
                 ORDER BY m.match_date
             """
                 ),
@@ -647,62 +884,106 @@ class DataPrefillService:
             )
             upcoming = result.fetchall()
 
-            logger.info(f"Found {len(upcoming)} upcoming matches needing predictions")
-
-            generated = 0
-            prediction_scores: list[dict[str, Any]] = []
-
+            # 1. Get team stats from DB, every team of the window in one query
+            teams = await load_team_stats(
+                session,
+                [m.home_team_id for m in upcoming] + [m.away_team_id for m in upcoming],
+            )
+            batch: list[tuple[Any, Any, Any]] = []
             for match in upcoming:
-                try:
-                    # 1. Get team stats from DB
-                    team_result = await session.execute(
-                        text(
-                            """
-                        SELECT t.id, t.elo_rating, t.avg_goals_scored_home,
-                               t.avg_goals_scored_away,
-                               t.avg_goals_conceded_home, t.avg_goals_conceded_away,
-                               t.form_score, t.rest_days, t.fixture_congestion
-                        FROM teams t WHERE t.id IN (:home_id, :away_id)
-                    """
-                        ),
-                        {"home_id": match.home_team_id, "away_id": match.away_team_id},
-                    )
-                    teams = {t.id: t for t in team_result.fetchall()}
-
-                    home = teams.get(match.home_team_id)
-                    away = teams.get(match.away_team_id)
-
-                    if not home or not away:
-                        continue
-
-                    # 2. Run 6-model ensemble prediction
-                    pred = advanced_ensemble_predictor.predict(
-                        home_attack=float(home.avg_goals_scored_home or 1.3),
-                        home_defense=float(home.avg_goals_conceded_home or 1.3),
-                        away_attack=float(away.avg_goals_scored_away or 1.3),
-                        away_defense=float(away.avg_goals_conceded_away or 1.3),
-                        home_elo=float(home.elo_rating or 1500),
-                        away_elo=float(away.elo_rating or 1500),
-                        home_team_id=match.home_team_id,
-                        away_team_id=match.away_team_id,
-                        home_form_score=float(home.form_score or 0.5) * 100,
-                        away_form_score=float(away.form_score or 0.5) * 100,
-                        home_rest_days=float(home.rest_days or 0.5),
-                        away_rest_days=float(away.rest_days or 0.5),
-                        home_congestion=float(home.fixture_congestion or 0.5),
-                        away_congestion=float(away.fixture_congestion or 0.5),
+                home = teams.get(match.home_team_id)
+                away = teams.get(match.away_team_id)
+
+                if home and away:
+                    batch.append((match, home, away))
+
+            # 2. Run 6-model ensemble prediction for all matches in one vectorized call
+            # 3. Price multi-markets (O/U, BTTS, DC, correct score, AH, team totals)
+            #    for the whole batch; same rho as Dixon-Coles so the cached grids are reused
+            # Rolling team features for every team in the batch, one query
+            try:
+                feature_states = await TeamFeatureStore.get_states(
+                    [m.home_team_id for m, _, _ in batch] + [m.away_team_id for m, _, _ in batch]
+                )
+            except Exception as e:
+                logger.warning(f"Team feature store unavailable: {e}")
+                feature_states = {}
+
+            # Skip matches whose complete prediction was computed from the same inputs
+            model_version = _prefill_model_version()
+            prompt_version = _prefill_prompt_version()
+            fingerprints: dict[int, str] = {}
+            unchanged_scores: list[dict[str, Any]] = []
+            changed: list[tuple[Any, Any, Any]] = []
+            for match, home, away in batch:
+                fingerprint = _prediction_input_fingerprint(
+                    match, home, away, feature_states, model_version, prompt_version
+                )
+                fingerprints[match.id] = fingerprint
+                if not force and not match.incomplete and match.input_fingerprint == fingerprint:
+                    unchanged_scores.append(
+                        {
+                            "match_id": match.id,
+                            "value_score": float(match.value_score),
+                            "confidence": float(match.confidence),
+                        }
                     )
+                else:
+                    changed.append((match, home, away))
+            batch = changed
 
-                    # 3. Calculate multi-markets (O/U, BTTS, DC, correct score)
-                    multi_markets = get_multi_markets_prediction(
-                        expected_home_goals=pred.expected_home_goals or 1.3,
-                        expected_away_goals=pred.expected_away_goals or 1.0,
-                        home_win_prob=pred.home_win_prob,
-                        draw_prob=pred.draw_prob,
-                        away_win_prob=pred.away_win_prob,
-                    )
+            logger.info(
+                f"Found {len(upcoming)} upcoming matches, {len(batch)} needing predictions "
+                f"({len(unchanged_scores)} with unchanged inputs)"
+            )
 
-                    # 4. Fetch weather from Open-Meteo (free, no key needed)
+            try:
+                # In a worker thread: local ML inference and any HuggingFace
+                # fallback calls must not block the event loop
+                batch_preds = await asyncio.to_thread(
+                    _predict_ensemble_batch, advanced_ensemble_predictor, batch, feature_states
+                )
+                batch_markets = get_multi_markets_predictions_batch(
+                    expected_home_goals=[p.expected_home_goals or 1.3 for p in batch_preds],
+                    expected_away_goals=[p.expected_away_goals or 1.0 for p in batch_preds],
+                    home_win_probs=[p.home_win_prob for p in batch_preds],
+                    draw_probs=[p.draw_prob for p in batch_preds],
+                    away_win_probs=[p.away_win_prob for p in batch_preds],
+                    rho=advanced_ensemble_predictor.dixon_coles.rho,
+                )
+            except Exception as e:
+                logger.warning(f"Batch ensemble prediction failed: {e}")
+                batch_preds, batch_markets = [], []
+
+        # Numeric stage is done for every match; the enrichment below only does I/O.
+        # Each match runs as its own task, with bounded concurrency per stage; Groq
+        # calls are paced by the shared RPM/TPM limiter instead of fixed sleeps.
+        io_slots = asyncio.Semaphore(_PREFILL_IO_CONCURRENCY)
+        llm_slots = asyncio.Semaphore(_PREFILL_LLM_CONCURRENCY)
+        save_lock = asyncio.Lock()
+        pending_saves: list[tuple[dict[str, Any], dict[str, Any]]] = []  # (payload, score)
+        prediction_scores: list[dict[str, Any]] = []
+
+        async def flush_saves() -> None:
+            # Take the queued rows before awaiting; tasks finishing meanwhile start a new batch
+            batch_to_save = pending_saves[:]
+            pending_saves.clear()
+            if not batch_to_save:
+                return
+            async with save_lock:
+                saved = await PredictionService.save_predictions_bulk(
+                    [payload for payload, _ in batch_to_save]
+                )
+            if saved:
+                prediction_scores.extend(score for _, score in batch_to_save)
+
+        async def enrich_and_save(
+            match: Any, home: Any, away: Any, pred: Any, multi_markets: Any
+        ) -> None:
+            try:
+                # 4. Fetch weather from Open-Meteo (free, no key needed)
+                # 5b. Injury news (DB, no LLM)
+                async with io_slots:
                     weather_data: dict[str, Any] | None = None
                     try:
                         weather_data = await weather_client.get_match_weather(
@@ -711,41 +992,47 @@ class DataPrefillService:
                     except Exception as we:
                         logger.debug(f"Weather fetch failed for {match.home_team}: {we}")
 
-                    # 5. Serialize model_details (contributions + multi-markets + weather + fatigue)
-                    model_details = _serialize_model_details(
-                        pred, home, away, multi_markets, weather_data
-                    )
-
-                    # 5b. Add injury news and match importance (no LLM, DB/algorithmic)
-                    home_elo = float(home.elo_rating or 1500)
-                    away_elo = float(away.elo_rating or 1500)
+                    home_injuries: list[dict[str, str]] = []
+                    away_injuries: list[dict[str, str]] = []
                     try:
-                        home_injuries = await _get_team_injury_news(match.home_team)
-                        away_injuries = await _get_team_injury_news(match.away_team)
-                        if home_injuries or away_injuries:
-                            model_details["injuries"] = {
-                                "home": home_injuries,
-                                "away": away_injuries,
-                            }
+                        home_injuries, away_injuries = await asyncio.gather(
+                            _get_team_injury_news(match.home_team),
+                            _get_team_injury_news(match.away_team),
+                        )
                     except Exception as ie:
                         logger.debug(f"Injury news fetch failed: {ie}")
 
-                    model_details["importance"] = _calculate_match_importance(
-                        match.competition_code or "", home_elo, away_elo
-                    )
+                # 5. Serialize model_details (contributions + multi-markets + weather + fatigue)
+                model_details = _serialize_model_details(
+                    pred, home, away, multi_markets, weather_data
+                )
 
-                    # 6. LLM analysis via Groq (None if unavailable, no fallback)
-                    home_form = float(home.form_score or 0.5)
-                    away_form = float(away.form_score or 0.5)
-                    home_attack = float(home.avg_goals_scored_home or 1.3)
-                    away_attack = float(away.avg_goals_scored_away or 1.0)
+                # 5b. Add injury news and match importance (no LLM, DB/algorithmic)
+                home_elo = float(home.elo_rating or 1500)
+                away_elo = float(away.elo_rating or 1500)
+                if home_injuries or away_injuries:
+                    model_details["injuries"] = {
+                        "home": home_injuries,
+                        "away": away_injuries,
+                    }
 
-                    match_date_str = (
-                        match.match_date.strftime("%Y-%m-%d %H:%M")
-                        if hasattr(match.match_date, "strftime")
-                        else str(match.match_date)
-                    )
+                model_details["importance"] = _calculate_match_importance(
+                    match.competition_code or "", home_elo, away_elo
+                )
+
+                # 6. LLM analysis via Groq (None if unavailable, no fallback)
+                home_form = float(home.form_score or 0.5)
+                away_form = float(away.form_score or 0.5)
+                home_attack = float(home.avg_goals_scored_home or 1.3)
+                away_attack = float(away.avg_goals_scored_away or 1.0)
+
+                match_date_str = (
+                    match.match_date.strftime("%Y-%m-%d %H:%M")
+                    if hasattr(match.match_date, "strftime")
+                    else str(match.match_date)
+                )
 
+                async with llm_slots:
                     explanation, key_factors, risk_factors = await _generate_llm_analysis(
                         home_team=match.home_team,
                         away_team=match.away_team,
@@ -759,14 +1046,6 @@ class DataPrefillService:
                         home_attack=home_attack,
                         away_attack=away_attack,
                     )
-                    # Rate limit: Groq 30 req/min
-                    await asyncio.sleep(2)
-
-                    # 7. Calculate value_score
-                    confidence_val = float(pred.confidence)
-                    max_prob = max(pred.home_win_prob, pred.draw_prob, pred.away_win_prob)
-                    base_value = max_prob * 0.5 + confidence_val * 0.5
-                    value_score = round(base_value + (confidence_val * 0.03), 4)
 
                     # 8. News context summary via LLM
                     match_context_summary = ""
@@ -779,12 +1058,18 @@ class DataPrefillService:
                             draw_prob=pred.draw_prob,
                             away_win_prob=pred.away_win_prob,
                         )
-                        await asyncio.sleep(2)
                     except Exception as ne:
                         logger.warning(f"News summary failed for match {match.id}: {ne}")
 
-                    # 9. Save prediction with full enrichment
-                    await PredictionService.save_prediction_from_api(
+                # 7. Calculate value_score
+                confidence_val = float(pred.confidence)
+                max_prob = max(pred.home_win_prob, pred.draw_prob, pred.away_win_prob)
+                base_value = max_prob * 0.5 + confidence_val * 0.5
+                value_score = round(base_value + (confidence_val * 0.03), 4)
+
+                # 9. Queue prediction with full enrichment for the next bulk save
+                pending_saves.append(
+                    (
                         {
                             "match_id": match.id,
                             "match_external_id": match.external_id,
@@ -804,24 +1089,35 @@ class DataPrefillService:
                             "model_details": model_details,
                             "match_context_summary": match_context_summary or None,
                             "news_sources": news_sources or None,
-                        }
-                    )
-
-                    prediction_scores.append(
+                            "input_fingerprint": fingerprints[match.id],
+                        },
                         {
                             "match_id": match.id,
                             "value_score": value_score,
                             "confidence": confidence_val,
-                        }
+                        },
                     )
-                    generated += 1
+                )
+                if len(pending_saves) >= _PREFILL_SAVE_BATCH_SIZE:
+                    await flush_saves()
 
-                except Exception as e:
-                    logger.warning(f"Failed to generate prediction for match {match.id}: {e}")
+            except Exception as e:
+                logger.warning(f"Failed to generate prediction for match {match.id}: {e}")
+
+        await asyncio.gather(
+            *(
+                enrich_and_save(match, home, away, pred, multi_markets)
+                for (match, home, away), pred, multi_markets in zip(
+                    batch, batch_preds, batch_markets
+                )
+            )
+        )
+        await flush_saves()
+        generated = len(prediction_scores)
 
-        # 10. Mark daily picks (top 5 by combined score)
+        # 10. Mark daily picks (top 5 by combined score, unchanged predictions included)
         if prediction_scores:
-            await DataPrefillService._mark_daily_picks(prediction_scores)
+            await DataPrefillService._mark_daily_picks(prediction_scores + unchanged_scores)
 
         logger.info(f"Pre-generated {generated} predictions with full AI enrichment")
         return generated
@@ -961,8 +1257,15 @@ class DataPrefillService:
         """Compare predictions with actual results for recently finished matches.
 
         Updates model_details with post-match data (was_correct, margin, etc.).
-        No LLM call — purely algorithmic retrospective.
+        No LLM call — purely algorithmic retrospective. Per-model outcomes also
+        feed the adaptive ensemble weights.
         """
+        from src.prediction_engine.adaptive_weights import (
+            adaptive_weight_calculator,
+            model_name_for_contribution,
+        )
+        from src.services.adaptive_weights_service import AdaptiveWeightStore
+
         count = 0
         async with get_async_session() as session:
             result = await session.execute(
@@ -970,7 +1273,7 @@ class DataPrefillService:
                     """
                     SELECT p.id as pred_id, p.match_id, p.predicted_outcome,
                            p.home_prob, p.draw_prob, p.away_prob,
-                           p.confidence, p.model_details,
+                           p.confidence, p.model_details, p.created_at,
                            m.home_score, m.away_score,
                            ht.name as home_team, at.name as away_team,
                            m.competition_code
@@ -1034,6 +1337,23 @@ class DataPrefillService:
 
                     existing_details["post_match"] = post_match
 
+                    # Per-model outcomes for the adaptive ensemble weights
+                    for contribution in existing_details.get("model_contributions") or []:
+                        model_name = model_name_for_contribution(contribution["name"])
+                        if model_name is None:
+                            continue
+                        adaptive_weight_calculator.record_prediction(
+                            model_name=model_name,
+                            match_id=row.match_id,
+                            predicted_probs=(
+                                float(contribution["home_prob"]),
+                                float(contribution["draw_prob"]),
+                                float(contribution["away_prob"]),
+                            ),
+                            actual_outcome=actual,
+                            prediction_date=row.created_at,
+                        )
+
                     await session.execute(
                         text(
                             """
@@ -1055,6 +1375,11 @@ class DataPrefillService:
 
             await session.commit()
 
+        try:
+            await AdaptiveWeightStore.flush(adaptive_weight_calculator)
+        except Exception as e:
+            logger.warning(f"Could not persist adaptive weight records: {e}")
+
         logger.info(f"Post-match analysis completed for {count} predictions")
         return count
 
@@ -1117,9 +1442,8 @@ class DataPrefillService:
     @staticmethod
     async def warm_redis_cache() -> int:
         """Pre-warm Redis cache with predictions and stats."""
-        import json
-
-        from src.core.cache import cache_set
+        from src.core.cache import cache_set_many
+        from src.core.codec import encode
 
         cached = 0
         async with get_async_session() as session:
@@ -1142,6 +1466,8 @@ class DataPrefillService:
             )
             predictions = result.fetchall()
 
+            entries: dict[str, str | bytes] = {}
+            tags: dict[str, list[str]] = {}
             for pred in predictions:
                 # Handle datetime fields that might already be strings
                 match_date_str = (
@@ -1173,16 +1499,21 @@ class DataPrefillService:
                     "created_at": created_at_str,
                 }
 
+                key = f"prediction:{pred.match_id}"
                 try:
-                    await cache_set(
-                        f"prediction:{pred.match_id}",
-                        json.dumps(cache_data, default=str),
-                        ttl=3600,  # 1 hour
-                    )
-                    cached += 1
+                    entries[key] = encode(cache_data)
+                    tags[key] = [
+                        "matches",
+                        f"match:{pred.match_id}",
+                        f"competition:{pred.competition_code}",
+                    ]
                 except Exception as e:
                     logger.warning(f"Failed to cache prediction {pred.match_id}: {e}")
 
+            # One pipelined round trip for all predictions
+            if await cache_set_many(entries, ttl=3600, tags=tags):  # 1 hour
+                cached = len(entries)
+
             logger.info(f"Cached {cached} predictions in Redis")
             return cached
 
@@ -1275,18 +1606,26 @@ class DataPrefillService:
         results: dict[str, Any] = {
             "team_data": {},
             "elo_ratings": 0,
+            "team_features": 0,
             "predictions": 0,
             "match_odds": 0,
             "redis_cache": 0,
             "news_items": 0,
         }
 
-        # 1. Fill team data
+        # 1. Fill team data (only teams with newly finished matches after the first run)
         try:
-            results["team_data"] = await DataPrefillService.fill_all_team_data()
+            team_data_started, team_data_since = await sync_watermark("team_data")
+            results["team_data"] = await DataPrefillService.fill_all_team_data(
+                since=team_data_since
+            )
             total_team_updates = sum(results["team_data"].values())
             await log_sync_operation(
-                "team_data", "success", total_team_updates, triggered_by=triggered_by
+                "team_data",
+                "success",
+                total_team_updates,
+                triggered_by=triggered_by,
+                started_at=team_data_started,
             )
         except Exception as e:
             logger.error(f"Team data prefill failed: {e}")
@@ -1304,6 +1643,17 @@ class DataPrefillService:
             errors.append(f"elo_ratings: {str(e)}")
             await log_sync_operation("elo_ratings", "failed", 0, str(e), triggered_by)
 
+        # 2b. Update the team feature store
+        try:
+            results["team_features"] = await DataPrefillService.update_team_features()
+            await log_sync_operation(
+                "team_features", "success", results["team_features"], triggered_by=triggered_by
+            )
+        except Exception as e:
+            logger.error(f"Team feature store update failed: {e}")
+            errors.append(f"team_features: {str(e)}")
+            await log_sync_operation("team_features", "failed", 0, str(e), triggered_by)
+
         # 3. Pre-generate predictions
         try:
             results["predictions"] = await DataPrefillService.prefill_predictions_for_upcoming()
@@ -1376,6 +1726,7 @@ class DataPrefillService:
         total_records = (
             sum(results["team_data"].values())
             + results["elo_ratings"]
+            + results["team_features"]
             + results["predictions"]
             + results["match_odds"]
             + results["redis_cache"]
@@ -0,0 +1,301 @@
+"""Incremental ELO ratings for football teams.
+
+Ratings used to be replayed from 1500 over the whole match history on every
+run, followed by one UPDATE per team. This service persists each team's raw
+(unclamped) rating in ``elo_ratings`` plus a watermark of the last applied
+finished match in ``elo_state``, so a run only applies matches that finished
+since the previous one and writes every changed rating with one set-based
+UPDATE.
+
+A full rebuild happens when asked for (``full_rebuild=True``) or when
+finished matches show up behind the watermark (historical imports, late
+results): the count of finished matches up to the watermark no longer
+equals the number processed.
+
+Runs are serialized across workers with a transaction-level advisory lock
+taken before the watermark is read: two runs reading the same watermark
+would otherwise apply the same matches twice.
+"""
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db import async_session_factory
+from src.prediction_engine.models.elo import ELOSystem
+from src.prediction_engine.models.elo_replay import EloReplayKernel, build_match_array
+from src.services.team_snapshot_cache import team_snapshot_cache
+
+logger = logging.getLogger(__name__)
+
+ELO_STATE_KEY = "football"
+# pg_advisory_xact_lock key held while ratings are updated
+ELO_LOCK_KEY = 5_130_001
+DEFAULT_RATING = 1500.0
+ELO_K_FACTOR = 20.0
+ELO_HOME_ADVANTAGE = 100.0
+
+# Sanity bounds for the rating exposed on teams.elo_rating
+MIN_TEAM_RATING = 1000.0
+MAX_TEAM_RATING = 2500.0
+
+# Finished matches usable for ELO, in replay order
+_FINISHED_MATCHES_WHERE = """
+    status = 'FINISHED'
+    AND home_score IS NOT NULL
+    AND away_score IS NOT NULL
+    AND home_team_id IS NOT NULL
+    AND away_team_id IS NOT NULL
+"""
+
+
+@dataclass
+class EloUpdateResult:
+    """Outcome of an incremental (or full) ELO run."""
+
+    matches_processed: int
+    full_rebuild: bool
+    ratings: dict[int, float] = field(default_factory=dict)  # Clamped, changed teams only
+
+    @property
+    def teams_updated(self) -> int:
+        return len(self.ratings)
+
+
+def clamp_team_rating(rating: float) -> float:
+    """Clamp a raw rating to the range stored on teams.elo_rating."""
+    return max(MIN_TEAM_RATING, min(MAX_TEAM_RATING, rating))
+
+
+def apply_matches(
+    ratings: dict[int, float],
+    matches: Iterable[Any],
+    elo_system: ELOSystem,
+) -> set[int]:
+    """
+    Apply finished matches in order, updating ratings in place.
+
+    Runs on the array-backed replay kernel; teams not yet in ``ratings``
+    start at DEFAULT_RATING.
+
+    Args:
+        ratings: Raw ratings by team id (mutated)
+        matches: Rows with match_date, home_team_id, away_team_id,
+            home_score, away_score
+        elo_system: ELO system providing k_factor and home_advantage
+
+    Returns:
+        Ids of the teams whose rating changed
+    """
+    match_array, team_ids = build_match_array(matches)
+    kernel = EloReplayKernel(
+        k_factor=elo_system.k_factor,
+        home_advantage=elo_system.home_advantage,
+        initial_rating=DEFAULT_RATING,
+    )
+    updated = kernel.replay(match_array, team_ids, initial_ratings=ratings).ratings()
+    ratings.update(updated)
+    return set(updated)
+
+
+class EloRatingService:
+    """Incremental ELO engine backed by elo_ratings / elo_state."""
+
+    @staticmethod
+    async def _lock(session: AsyncSession) -> None:
+        """Wait for other update runs; released when the transaction ends."""
+        await session.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": ELO_LOCK_KEY})
+
+    @staticmethod
+    async def _load_watermark(session: AsyncSession) -> tuple[datetime | None, int | None, int]:
+        result = await session.execute(
+            text(
+                """
+                SELECT last_match_date, last_match_id, matches_processed
+                FROM elo_state WHERE key = :key
+            """
+            ),
+            {"key": ELO_STATE_KEY},
+        )
+        row = result.fetchone()
+        if row is None or row.last_match_date is None:
+            return None, None, 0
+        return row.last_match_date, row.last_match_id, row.matches_processed or 0
+
+    @staticmethod
+    async def _watermark_is_consistent(
+        session: AsyncSession, last_date: datetime, last_id: int, processed: int
+    ) -> bool:
+        """True if no finished match appeared at or behind the watermark since last run."""
+        result = await session.execute(
+            text(
+                f"""
+                SELECT COUNT(*) FROM matches
+                WHERE {_FINISHED_MATCHES_WHERE}
+                    AND (match_date, id) <= (:last_date, :last_id)
+            """
+            ),
+            {"last_date": last_date, "last_id": last_id},
+        )
+        return (result.scalar() or 0) == processed
+
+    @staticmethod
+    async def _fetch_matches(
+        session: AsyncSession, last_date: datetime | None, last_id: int | None
+    ) -> list[Any]:
+        after_watermark = "AND (match_date, id) > (:last_date, :last_id)" if last_date else ""
+        result = await session.execute(
+            text(
+                f"""
+                SELECT id, home_team_id, away_team_id, home_score, away_score, match_date
+                FROM matches
+                WHERE {_FINISHED_MATCHES_WHERE}
+                    {after_watermark}
+                ORDER BY match_date ASC, id ASC
+            """
+            ),
+            {"last_date": last_date, "last_id": last_id},
+        )
+        return list(result.fetchall())
+
+    @staticmethod
+    async def _load_ratings(session: AsyncSession, team_ids: list[int]) -> dict[int, float]:
+        if not team_ids:
+            return {}
+        result = await session.execute(
+            text("SELECT team_id, rating FROM elo_ratings WHERE team_id = ANY(:ids)"),
+            {"ids": team_ids},
+        )
+        return {row.team_id: float(row.rating) for row in result.fetchall()}
+
+    @staticmethod
+    async def _save(
+        session: AsyncSession,
+        ratings: dict[int, float],
+        last_match: Any,
+        matches_processed: int,
+        full_rebuild: bool,
+    ) -> None:
+        """Persist raw ratings, the exposed team ratings and the watermark."""
+        team_ids = list(ratings)
+        raw = [ratings[team_id] for team_id in team_ids]
+        clamped = [clamp_team_rating(rating) for rating in raw]
+
+        if full_rebuild:
+            await session.execute(text("DELETE FROM elo_ratings"))
+
+        await session.execute(
+            text(
+                """
+                INSERT INTO elo_ratings (team_id, rating, updated_at)
+                SELECT v.team_id, v.rating, NOW()
+                FROM unnest(CAST(:ids AS integer[]), CAST(:ratings AS double precision[]))
+                    AS v(team_id, rating)
+                ON CONFLICT (team_id) DO UPDATE SET
+                    rating = EXCLUDED.rating,
+                    updated_at = EXCLUDED.updated_at
+            """
+            ),
+            {"ids": team_ids, "ratings": raw},
+        )
+
+        # One set-based UPDATE instead of one statement per team
+        await session.execute(
+            text(
+                """
+                UPDATE teams AS t
+                SET elo_rating = v.elo, updated_at = NOW()
+                FROM unnest(CAST(:ids AS integer[]), CAST(:elos AS double precision[]))
+                    AS v(id, elo)
+                WHERE t.id = v.id
+            """
+            ),
+            {"ids": team_ids, "elos": clamped},
+        )
+
+        await session.execute(
+            text(
+                """
+                INSERT INTO elo_state (key, last_match_date, last_match_id,
+                                       matches_processed, updated_at)
+                VALUES (:key, :last_date, :last_id, :processed, NOW())
+                ON CONFLICT (key) DO UPDATE SET
+                    last_match_date = EXCLUDED.last_match_date,
+                    last_match_id = EXCLUDED.last_match_id,
+                    matches_processed = EXCLUDED.matches_processed,
+                    updated_at = EXCLUDED.updated_at
+            """
+            ),
+            {
+                "key": ELO_STATE_KEY,
+                "last_date": last_match.match_date,
+                "last_id": last_match.id,
+                "processed": matches_processed,
+            },
+        )
+
+    @staticmethod
+    async def update_ratings(full_rebuild: bool = False) -> EloUpdateResult:
+        """
+        Apply newly finished matches to the persisted ELO ratings.
+
+        Args:
+            full_rebuild: Replay the whole history from DEFAULT_RATING instead
+                of continuing from the watermark.
+
+        Returns:
+            EloUpdateResult with the clamped ratings of the teams that changed
+        """
+        elo_system = ELOSystem(k_factor=ELO_K_FACTOR, home_advantage=ELO_HOME_ADVANTAGE)
+
+        async with async_session_factory() as session:
+            await EloRatingService._lock(session)
+            last_date, last_id, processed = await EloRatingService._load_watermark(session)
+
+            if not full_rebuild and last_date is not None:
+                consistent = await EloRatingService._watermark_is_consistent(
+                    session, last_date, last_id, processed
+                )
+                if not consistent:
+                    logger.info("Finished matches found behind the ELO watermark, rebuilding")
+                    full_rebuild = True
+
+            if full_rebuild or last_date is None:
+                full_rebuild = True
+                last_date, last_id, processed = None, None, 0
+
+            matches = await EloRatingService._fetch_matches(session, last_date, last_id)
+            if not matches:
+                logger.info("ELO ratings up to date, no new finished matches")
+                return EloUpdateResult(matches_processed=0, full_rebuild=full_rebuild)
+
+            team_ids = {m.home_team_id for m in matches} | {m.away_team_id for m in matches}
+            ratings = (
+                {}
+                if full_rebuild
+                else await EloRatingService._load_ratings(session, list(team_ids))
+            )
+
+            touched = apply_matches(ratings, matches, elo_system)
+            changed = {team_id: ratings[team_id] for team_id in touched}
+
+            await EloRatingService._save(
+                session, changed, matches[-1], processed + len(matches), full_rebuild
+            )
+            await session.commit()
+
+        # Predictions read teams.elo_rating through the snapshot cache
+        team_snapshot_cache.invalidate(None if full_rebuild else changed)
+
+        mode = "full rebuild" if full_rebuild else "incremental"
+        logger.info(f"ELO {mode}: applied {len(matches)} matches, updated {len(changed)} teams")
+        return EloUpdateResult(
+            matches_processed=len(matches),
+            full_rebuild=full_rebuild,
+            ratings={team_id: clamp_team_rating(r) for team_id, r in changed.items()},
+        )
@@ -0,0 +1,341 @@
+"""Versioned team feature store.
+
+Per-team features (attack/defense, form, rest and congestion, ELO, xG) are
+stored in ``team_feature_snapshots``: one row per team and finished match,
+holding the features after that match plus the rolling state
+(TeamFeatureState) they were computed from. Prediction code reads the
+latest snapshot before a match date for all its teams in one query, and the
+values come from the same definitions the trainers use
+(src.prediction_engine.team_features).
+
+Updates are incremental: only finished matches at or after the newest
+snapshot are applied, continuing from each team's latest stored state. If
+finished matches show up behind that point (historical imports, late
+results), the snapshots are rebuilt by replaying the whole history, as for
+the ELO watermark. Like ELO updates, runs are serialized across workers
+with a transaction-level advisory lock.
+"""
+
+import json
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db import async_session_factory
+from src.prediction_engine.team_features import (
+    FEATURE_VERSION,
+    TeamFeatures,
+    TeamFeatureState,
+    TeamFeatureTracker,
+)
+
+logger = logging.getLogger(__name__)
+
+# pg_advisory_xact_lock key held while snapshots are updated
+FEATURE_STORE_LOCK_KEY = 5_130_002
+
+# Rows per INSERT when writing snapshots (a full rebuild writes two per match)
+_SAVE_CHUNK_SIZE = 5000
+
+_FINISHED_MATCHES_WHERE = """
+    status = 'FINISHED'
+    AND home_score IS NOT NULL
+    AND away_score IS NOT NULL
+    AND home_team_id IS NOT NULL
+    AND away_team_id IS NOT NULL
+"""
+
+
+def to_naive_utc(when: datetime) -> datetime:
+    """Snapshot dates are naive UTC; convert aware datetimes accordingly."""
+    if when.tzinfo is None:
+        return when
+    return when.astimezone(UTC).replace(tzinfo=None)
+
+
+@dataclass
+class TeamFeatureUpdateResult:
+    """Outcome of an incremental (or full) feature store run."""
+
+    matches_processed: int
+    snapshots_written: int
+    full_rebuild: bool
+
+
+class TeamFeatureStore:
+    """Maintains and reads team_feature_snapshots."""
+
+    @staticmethod
+    async def _load_states(
+        session: AsyncSession, team_ids: list[int] | None, before: datetime | None = None
+    ) -> dict[int, TeamFeatureState]:
+        """Latest state per team (optionally only snapshots strictly before ``before``)."""
+        team_filter = "AND team_id = ANY(:ids)" if team_ids is not None else ""
+        before_filter = "AND as_of < :before" if before is not None else ""
+        result = await session.execute(
+            text(
+                f"""
+                SELECT DISTINCT ON (team_id) team_id, state
+                FROM team_feature_snapshots
+                WHERE feature_version = :version
+                    {team_filter}
+                    {before_filter}
+                ORDER BY team_id, as_of DESC
+            """
+            ),
+            {"version": FEATURE_VERSION, "ids": team_ids, "before": before},
+        )
+        return {
+            row.team_id: TeamFeatureState.from_dict(json.loads(row.state))
+            for row in result.fetchall()
+        }
+
+    @staticmethod
+    async def _lock(session: AsyncSession) -> None:
+        """Wait for other update runs; released when the transaction ends."""
+        await session.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"), {"key": FEATURE_STORE_LOCK_KEY}
+        )
+
+    @staticmethod
+    async def _watermark(session: AsyncSession) -> datetime | None:
+        result = await session.execute(
+            text("SELECT MAX(as_of) FROM team_feature_snapshots WHERE feature_version = :version"),
+            {"version": FEATURE_VERSION},
+        )
+        return result.scalar()
+
+    @staticmethod
+    async def _applied_match_count(session: AsyncSession) -> int:
+        """Team-matches already applied: sum of every team's latest matches_played."""
+        result = await session.execute(
+            text(
+                """
+                SELECT COALESCE(SUM(matches_played), 0) FROM (
+                    SELECT DISTINCT ON (team_id) matches_played
+                    FROM team_feature_snapshots
+                    WHERE feature_version = :version
+                    ORDER BY team_id, as_of DESC
+                ) AS latest
+            """
+            ),
+            {"version": FEATURE_VERSION},
+        )
+        return int(result.scalar() or 0)
+
+    @staticmethod
+    async def _finished_count_until(session: AsyncSession, until: datetime) -> int:
+        result = await session.execute(
+            text(
+                f"""
+                SELECT COUNT(*) FROM matches
+                WHERE {_FINISHED_MATCHES_WHERE}
+                    AND match_date <= :until
+            """
+            ),
+            {"until": until},
+        )
+        return int(result.scalar() or 0)
+
+    @staticmethod
+    async def _fetch_matches(session: AsyncSession, since: datetime | None) -> list[Any]:
+        since_filter = "AND match_date >= :since" if since else ""
+        result = await session.execute(
+            text(
+                f"""
+                SELECT id, home_team_id, away_team_id, home_score, away_score,
+                       home_xg, away_xg, match_date
+                FROM matches
+                WHERE {_FINISHED_MATCHES_WHERE}
+                    {since_filter}
+                ORDER BY match_date ASC, id ASC
+            """
+            ),
+            {"since": since},
+        )
+        return list(result.fetchall())
+
+    @staticmethod
+    def _apply(tracker: TeamFeatureTracker, matches: Iterable[Any]) -> list[dict[str, Any]]:
+        """Apply matches in order; returns one snapshot row per team and match."""
+        rows = []
+        for match in matches:
+            match_date = to_naive_utc(match.match_date)
+            tracker.update(
+                match.home_team_id,
+                match.away_team_id,
+                match.home_score,
+                match.away_score,
+                match_date,
+                home_xg=float(match.home_xg) if match.home_xg is not None else None,
+                away_xg=float(match.away_xg) if match.away_xg is not None else None,
+            )
+            for team_id in (match.home_team_id, match.away_team_id):
+                state = tracker.state(team_id)
+                # Features after this match (as seen by the team's next match)
+                features = state.features(team_id, datetime.max)
+                rows.append(
+                    {
+                        "team_id": team_id,
+                        "as_of": match_date,
+                        "matches_played": features.matches_played,
+                        "attack": features.attack_strength,
+                        "defense": features.defense_strength,
+                        "form": features.form,
+                        "elo": features.elo_rating,
+                        "xg_for": features.xg_for,
+                        "xg_against": features.xg_against,
+                        "state": json.dumps(state.to_dict()),
+                    }
+                )
+        return rows
+
+    @staticmethod
+    async def _save(session: AsyncSession, rows: list[dict[str, Any]]) -> None:
+        for start in range(0, len(rows), _SAVE_CHUNK_SIZE):
+            chunk = rows[start : start + _SAVE_CHUNK_SIZE]
+            await session.execute(
+                text(
+                    """
+                    INSERT INTO team_feature_snapshots
+                        (feature_version, team_id, as_of, matches_played, attack_strength,
+                         defense_strength, form, elo_rating, xg_for, xg_against, state,
+                         updated_at)
+                    SELECT :version, v.team_id, v.as_of, v.matches_played, v.attack,
+                           v.defense, v.form, v.elo, v.xg_for, v.xg_against, v.state, NOW()
+                    FROM unnest(
+                        CAST(:team_ids AS integer[]),
+                        CAST(:as_of AS timestamp[]),
+                        CAST(:matches_played AS integer[]),
+                        CAST(:attack AS double precision[]),
+                        CAST(:defense AS double precision[]),
+                        CAST(:form AS double precision[]),
+                        CAST(:elo AS double precision[]),
+                        CAST(:xg_for AS double precision[]),
+                        CAST(:xg_against AS double precision[]),
+                        CAST(:state AS text[])
+                    ) AS v(team_id, as_of, matches_played, attack, defense, form, elo,
+                           xg_for, xg_against, state)
+                    ON CONFLICT (feature_version, team_id, as_of) DO UPDATE SET
+                        matches_played = EXCLUDED.matches_played,
+                        attack_strength = EXCLUDED.attack_strength,
+                        defense_strength = EXCLUDED.defense_strength,
+                        form = EXCLUDED.form,
+                        elo_rating = EXCLUDED.elo_rating,
+                        xg_for = EXCLUDED.xg_for,
+                        xg_against = EXCLUDED.xg_against,
+                        state = EXCLUDED.state,
+                        updated_at = EXCLUDED.updated_at
+                """
+                ),
+                {
+                    "version": FEATURE_VERSION,
+                    "team_ids": [r["team_id"] for r in chunk],
+                    "as_of": [r["as_of"] for r in chunk],
+                    "matches_played": [r["matches_played"] for r in chunk],
+                    "attack": [r["attack"] for r in chunk],
+                    "defense": [r["defense"] for r in chunk],
+                    "form": [r["form"] for r in chunk],
+                    "elo": [r["elo"] for r in chunk],
+                    "xg_for": [r["xg_for"] for r in chunk],
+                    "xg_against": [r["xg_against"] for r in chunk],
+                    "state": [r["state"] for r in chunk],
+                },
+            )
+
+    @staticmethod
+    async def update(full_rebuild: bool = False) -> TeamFeatureUpdateResult:
+        """
+        Apply newly finished matches to the stored team snapshots.
+
+        Args:
+            full_rebuild: Replay the whole history instead of continuing
+                from the latest snapshots.
+
+        Returns:
+            TeamFeatureUpdateResult with the number of matches applied
+        """
+        async with async_session_factory() as session:
+            await TeamFeatureStore._lock(session)
+            watermark = None if full_rebuild else await TeamFeatureStore._watermark(session)
+            states: dict[int, TeamFeatureState] = {}
+            matches: list[Any] = []
+
+            if watermark is not None:
+                matches = await TeamFeatureStore._fetch_matches(session, watermark)
+                team_ids = {m.home_team_id for m in matches} | {m.away_team_id for m in matches}
+                states = await TeamFeatureStore._load_states(session, list(team_ids))
+
+                # Matches at the watermark itself may already be applied (same kickoff time)
+                def applied(match: Any) -> bool:
+                    state = states.get(match.home_team_id)
+                    last = state.last_match_date if state else None
+                    return last is not None and last >= to_naive_utc(match.match_date)
+
+                pending_at_watermark = sum(
+                    1 for m in matches if to_naive_utc(m.match_date) == watermark and not applied(m)
+                )
+                matches = [m for m in matches if not applied(m)]
+
+                expected = await TeamFeatureStore._finished_count_until(session, watermark)
+                applied_count = await TeamFeatureStore._applied_match_count(session)
+                if applied_count != 2 * (expected - pending_at_watermark):
+                    logger.info("Finished matches found behind the feature store, rebuilding")
+                    full_rebuild = True
+            else:
+                full_rebuild = True
+
+            if full_rebuild:
+                states = {}
+                matches = await TeamFeatureStore._fetch_matches(session, None)
+                await session.execute(
+                    text("DELETE FROM team_feature_snapshots WHERE feature_version = :version"),
+                    {"version": FEATURE_VERSION},
+                )
+
+            if not matches:
+                logger.info("Team feature store up to date, no new finished matches")
+                return TeamFeatureUpdateResult(0, 0, full_rebuild)
+
+            rows = TeamFeatureStore._apply(TeamFeatureTracker(states), matches)
+            await TeamFeatureStore._save(session, rows)
+            await session.commit()
+
+        mode = "full rebuild" if full_rebuild else "incremental"
+        logger.info(f"Team features {mode}: applied {len(matches)} matches, {len(rows)} snapshots")
+        return TeamFeatureUpdateResult(len(matches), len(rows), full_rebuild)
+
+    @staticmethod
+    async def get_states(
+        team_ids: Iterable[int], before: datetime | None = None
+    ) -> dict[int, TeamFeatureState]:
+        """
+        Latest stored state of each team, in one query.
+
+        Args:
+            team_ids: Teams to read
+            before: Only use snapshots of matches strictly before this date
+                (None = latest)
+
+        Returns:
+            State by team id; teams without snapshots are missing
+        """
+        ids = list(set(team_ids))
+        if not ids:
+            return {}
+        async with async_session_factory() as session:
+            return await TeamFeatureStore._load_states(
+                session, ids, to_naive_utc(before) if before else None
+            )
+
+    @staticmethod
+    async def get_features(team_ids: Iterable[int], as_of: datetime) -> dict[int, TeamFeatures]:
+        """Features of each team for a match on ``as_of``."""
+        as_of = to_naive_utc(as_of)
+        states = await TeamFeatureStore.get_states(team_ids, before=as_of)
+        return {team_id: state.features(team_id, as_of) for team_id, state in states.items()}
@@ -0,0 +1,123 @@
+"""Team stats lookups for prediction generation.
+
+The prefill and on-demand prediction paths both need the same team columns
+(ELO, goal averages, form, rest, congestion) and used to query them one
+match at a time. ``load_team_stats`` reads any number of teams in a single
+query; ``team_snapshot_cache`` keeps the rows in process for a short TTL so
+repeated on-demand requests for matches of the same teams skip the database.
+"""
+
+import logging
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db import async_session_factory
+
+logger = logging.getLogger(__name__)
+
+TEAM_SNAPSHOT_TTL = 120  # 2 minutes; team stats change with post-match syncs only
+TEAM_SNAPSHOT_MAX = 2000
+
+
+async def load_team_stats(session: AsyncSession, team_ids: Iterable[int]) -> dict[int, Any]:
+    """
+    Team stats rows for every given team, in one query.
+
+    Returns:
+        Row by team id; unknown teams are missing
+    """
+    ids = list(set(team_ids))
+    if not ids:
+        return {}
+    result = await session.execute(
+        text(
+            """
+            SELECT t.id, t.elo_rating, t.avg_goals_scored_home,
+                   t.avg_goals_scored_away,
+                   t.avg_goals_conceded_home, t.avg_goals_conceded_away,
+                   t.form_score, t.rest_days, t.fixture_congestion
+            FROM teams t WHERE t.id = ANY(:ids)
+        """
+        ),
+        {"ids": ids},
+    )
+    return {row.id: row for row in result.fetchall()}
+
+
+class TeamSnapshotCache:
+    """Process-local TTL cache of team stats rows."""
+
+    def __init__(
+        self, ttl_seconds: float = TEAM_SNAPSHOT_TTL, max_entries: int = TEAM_SNAPSHOT_MAX
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: How long a row is served before it is read again
+            max_entries: Oldest entries are dropped beyond this size
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[int, tuple[Any, float]] = {}  # team_id -> (row, loaded_at)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_many(
+        self, team_ids: Iterable[int], session: AsyncSession | None = None
+    ) -> dict[int, Any]:
+        """
+        Team stats rows, loading expired or missing teams in one query.
+
+        Args:
+            team_ids: Teams to read
+            session: Session to load misses with (a new one if None)
+
+        Returns:
+            Row by team id; unknown teams are missing
+        """
+        now = time.monotonic()
+        found: dict[int, Any] = {}
+        missing: list[int] = []
+        for team_id in set(team_ids):
+            entry = self._entries.get(team_id)
+            if entry is not None and now - entry[1] < self.ttl_seconds:
+                found[team_id] = entry[0]
+            else:
+                missing.append(team_id)
+
+        if missing:
+            if session is not None:
+                loaded = await load_team_stats(session, missing)
+            else:
+                async with async_session_factory() as own_session:
+                    loaded = await load_team_stats(own_session, missing)
+            for team_id, row in loaded.items():
+                self._entries[team_id] = (row, now)
+            found.update(loaded)
+            self._evict()
+
+        return found
+
+    def invalidate(self, team_ids: Iterable[int] | None = None) -> None:
+        """Drop the given teams (all teams if None), e.g. after a stats sync."""
+        if team_ids is None:
+            self._entries.clear()
+            return
+        for team_id in team_ids:
+            self._entries.pop(team_id, None)
+
+    def _evict(self) -> None:
+        if len(self._entries) <= self.max_entries:
+            return
+        oldest = sorted(self._entries, key=lambda k: self._entries[k][1])
+        for team_id in oldest[: len(self._entries) - self.max_entries]:
+            del self._entries[team_id]
+
+
+team_snapshot_cache = TeamSnapshotCache()
@@ -1,6 +1,10 @@
 """Tests for adaptive ensemble weights module."""
 
+import json
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import numpy as np
 import pytest
@@ -254,7 +258,7 @@ class TestAdaptiveWeightCalculator:
         removed = calculator.clear_old_records(days_to_keep=30)
 
         assert removed == 1
-        assert len(calculator._records) == 1
+        assert len(calculator) == 1
 
     def test_export_import_records(self, calculator):
         """Test exporting and importing records."""
@@ -275,7 +279,58 @@ class TestAdaptiveWeightCalculator:
         count = new_calc.import_records(exported)
 
         assert count == 1
-        assert len(new_calc._records) == 1
+        assert len(new_calc) == 1
+
+    def test_running_sums_match_recomputed_metrics(self, calculator):
+        """Window metrics from running sums equal a recomputation over the records."""
+        rng = np.random.default_rng(7)
+        now = datetime.now()
+        outcomes = ["home", "draw", "away"]
+        # Out-of-order dates, some outside the 30-day window
+        for i in range(200):
+            probs = rng.dirichlet([2.0, 1.0, 1.5])
+            calculator.record_prediction(
+                model_name="poisson",
+                match_id=i,
+                predicted_probs=tuple(float(p) for p in probs),
+                actual_outcome=outcomes[int(rng.integers(3))],
+                prediction_date=now - timedelta(days=float(rng.uniform(0, 60))),
+            )
+
+        records = calculator._get_records_in_window("poisson")
+        metrics = calculator.calculate_model_metrics("poisson")
+
+        assert metrics is not None
+        assert metrics.n_predictions == len(records)
+        assert metrics.accuracy == pytest.approx(np.mean([r.was_correct for r in records]))
+        brier = []
+        log_loss = []
+        for r in records:
+            actual = np.zeros(3)
+            actual[outcomes.index(r.actual_outcome)] = 1.0
+            brier.append(np.mean((np.array(r.predicted_probs) - actual) ** 2))
+            log_loss.append(
+                -np.log(max(r.predicted_probs[outcomes.index(r.actual_outcome)], 1e-10))
+            )
+        assert metrics.brier_score == pytest.approx(np.mean(brier))
+        assert metrics.log_loss == pytest.approx(np.mean(log_loss))
+        assert metrics.period_start == min(r.prediction_date for r in records)
+        assert metrics.period_end == max(r.prediction_date for r in records)
+
+    def test_drain_pending(self, calculator):
+        """Recorded predictions are pending until drained; imported ones are not."""
+        calculator.record_prediction(
+            model_name="poisson",
+            match_id=1,
+            predicted_probs=(0.6, 0.2, 0.2),
+            actual_outcome="home",
+        )
+        calculator.import_records(calculator.export_records())
+
+        pending = calculator.drain_pending()
+        assert [p["match_id"] for p in pending] == [1]
+        assert calculator.drain_pending() == []
+        assert len(calculator) == 2
 
     def test_get_weight(self, calculator):
         """Test getting weight for a specific model."""
@@ -398,3 +453,61 @@ class TestEnsembleIntegration:
         # Check that contributions have correct default weights
         assert prediction.poisson_contribution.weight == 0.25
         assert prediction.elo_contribution.weight == 0.15
+
+
+class TestPostMatchRecording:
+    """Test that verified prefill predictions feed the adaptive weights."""
+
+    @staticmethod
+    def _row(match_id: int) -> SimpleNamespace:
+        """A verified home win whose prediction holds advanced-ensemble contributions."""
+        contributions = [
+            {"name": "Poisson", "home_prob": 0.6, "draw_prob": 0.2, "away_prob": 0.2},
+            {"name": "Basic ELO", "home_prob": 0.2, "draw_prob": 0.2, "away_prob": 0.6},
+            {"name": "Dixon-Coles", "home_prob": 0.5, "draw_prob": 0.3, "away_prob": 0.2},
+        ]
+        return SimpleNamespace(
+            pred_id=match_id,
+            match_id=match_id,
+            predicted_outcome="home",
+            home_prob=0.5,
+            draw_prob=0.25,
+            away_prob=0.25,
+            confidence=0.6,
+            model_details=json.dumps({"model_contributions": contributions}),
+            created_at=datetime.now() - timedelta(days=1),
+            home_score=2,
+            away_score=0,
+        )
+
+    async def test_verified_predictions_change_weights(self, monkeypatch):
+        """Test that contribution names are mapped to the ensemble's model names."""
+        from src.prediction_engine import adaptive_weights
+        from src.services import data_prefill_service
+        from src.services.adaptive_weights_service import AdaptiveWeightStore
+
+        calculator = AdaptiveWeightCalculator()
+        monkeypatch.setattr(adaptive_weights, "adaptive_weight_calculator", calculator)
+        monkeypatch.setattr(AdaptiveWeightStore, "flush", AsyncMock(return_value=0))
+
+        session = MagicMock()
+        session.commit = AsyncMock()
+        rows = MagicMock()
+        rows.fetchall.return_value = [self._row(match_id) for match_id in range(1, 13)]
+        session.execute = AsyncMock(return_value=rows)
+
+        @asynccontextmanager
+        async def fake_session():
+            yield session
+
+        monkeypatch.setattr(data_prefill_service, "get_async_session", fake_session)
+
+        before = calculator.calculate_weights()
+        count = await data_prefill_service.DataPrefillService.run_post_match_analysis()
+        after = calculator.calculate_weights()
+
+        assert count == 12
+        assert before.method == "default"
+        assert after.method == "softmax_accuracy"
+        assert set(after.weights) == {"poisson", "elo"}
+        assert after.get_weight("poisson") > after.get_weight("elo")
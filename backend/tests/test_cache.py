@@ -0,0 +1,404 @@
+"""Tests for the Redis cache helpers."""
+
+import asyncio
+import json
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+import redis.asyncio as aioredis
+
+from src.core import cache, codec
+
+
+def _client(mget_result=None, error: Exception | None = None) -> MagicMock:
+    """Redis client mock with MGET and a pipeline."""
+    client = MagicMock()
+    client.mget = AsyncMock(return_value=mget_result, side_effect=error)
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[True], side_effect=error)
+    client.pipeline.return_value = pipe
+    return client
+
+
+class TestCacheGetMany:
+    """Tests for cache_get_many."""
+
+    async def test_values_in_key_order(self):
+        """Should return values in key order with None for misses, in one MGET."""
+        client = _client(mget_result=["a", None, "c"])
+        with patch.object(cache, "get_redis_client", AsyncMock(return_value=client)):
+            values = await cache.cache_get_many(["k1", "k2", "k3"])
+
+        assert values == ["a", None, "c"]
+        client.mget.assert_awaited_once_with(["k1", "k2", "k3"])
+
+    async def test_empty_keys_skip_redis(self):
+        """Should not call Redis without keys."""
+        get_client = AsyncMock()
+        with patch.object(cache, "get_redis_client", get_client):
+            assert await cache.cache_get_many([]) == []
+        get_client.assert_not_awaited()
+
+    async def test_redis_error_returns_misses(self):
+        """Should treat every key as a miss when Redis fails."""
+        client = _client(error=aioredis.RedisError("down"))
+        with patch.object(cache, "get_redis_client", AsyncMock(return_value=client)):
+            assert await cache.cache_get_many(["k1", "k2"]) == [None, None]
+
+
+class TestCacheSetMany:
+    """Tests for cache_set_many."""
+
+    async def test_pipelined_setex(self):
+        """Should queue one SETEX per key and execute the pipeline once."""
+        client = _client()
+        with patch.object(cache, "get_redis_client", AsyncMock(return_value=client)):
+            assert await cache.cache_set_many({"k1": "a", "k2": "b"}, 60)
+
+        pipe = client.pipeline.return_value
+        client.pipeline.assert_called_once_with(transaction=False)
+        assert [c.args for c in pipe.setex.call_args_list] == [("k1", 60, "a"), ("k2", 60, "b")]
+        pipe.execute.assert_awaited_once()
+
+    async def test_per_key_ttl(self):
+        """Should use the TTL given for each key."""
+        client = _client()
+        with patch.object(cache, "get_redis_client", AsyncMock(return_value=client)):
+            await cache.cache_set_many({"k1": "a", "k2": "b"}, {"k1": 10, "k2": 20})
+
+        pipe = client.pipeline.return_value
+        assert [c.args[1] for c in pipe.setex.call_args_list] == [10, 20]
+
+    async def test_redis_error_returns_false(self):
+        """Should report failure instead of raising."""
+        client = _client(error=aioredis.RedisError("down"))
+        with patch.object(cache, "get_redis_client", AsyncMock(return_value=client)):
+            assert not await cache.cache_set_many({"k1": "a"}, 60)
+
+
+class TestLocalCache:
+    """Tests for the in-process L1 cache."""
+
+    @staticmethod
+    def _cache(max_entries: int = 10, max_ttl: float = 300) -> cache.LocalCache:
+        local = cache.LocalCache(max_entries, max_ttl)
+        local.active = True
+        return local
+
+    def test_lru_eviction(self):
+        """Should drop the least recently used entry beyond max_entries."""
+        local = self._cache(max_entries=2)
+        local.set("a", 1, 60)
+        local.set("b", 2, 60)
+        local.get("a")
+        local.set("c", 3, 60)
+
+        assert local.get("b") is cache._MISSING
+        assert local.get("a") == 1
+        assert local.get("c") == 3
+
+    def test_ttl_capped(self, monkeypatch):
+        """Should expire entries at the Redis TTL, capped at max_ttl."""
+        now = [1000.0]
+        monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+        local = self._cache(max_ttl=10)
+        local.set("short", 1, 5)
+        local.set("long", 2, 3600)
+
+        now[0] += 6
+        assert local.get("short") is cache._MISSING
+        assert local.get("long") == 2
+        now[0] += 5
+        assert local.get("long") is cache._MISSING
+
+    def test_inactive_cache_stores_nothing(self):
+        """Should not store values while the invalidation listener is down."""
+        local = cache.LocalCache(10, 300)
+        local.set("a", 1, 60)
+        assert len(local) == 0
+
+    def test_stale_read_not_stored(self):
+        """Should skip a value read before an invalidation arrived."""
+        local = self._cache()
+        generation = local.generation
+        local.delete(["a"])
+        local.set("a", "stale", 60, generation=generation)
+        assert local.get("a") is cache._MISSING
+
+    def test_pattern_delete(self):
+        """Should evict keys matching a Redis glob pattern."""
+        local = self._cache()
+        local.set("daily_picks:2026-10-16", 1, 60)
+        local.set("prediction:1", 2, 60)
+        local.delete_pattern("daily_picks:*")
+
+        assert local.get("daily_picks:2026-10-16") is cache._MISSING
+        assert local.get("prediction:1") == 2
+
+
+class TestCacheInvalidation:
+    """Tests for two-tier reads and cross-worker invalidation."""
+
+    @staticmethod
+    def _active_l1(monkeypatch) -> cache.LocalCache:
+        local = cache.LocalCache(10, 300)
+        local.active = True
+        monkeypatch.setattr(cache, "local_cache", local)
+        return local
+
+    async def test_l1_hit_skips_redis(self, monkeypatch):
+        """Should serve a hot key from L1 after the first Redis read."""
+        self._active_l1(monkeypatch)
+        client = _client()
+        client.pipeline.return_value.execute = AsyncMock(return_value=['{"v": 1}', 60000])
+        get_client = AsyncMock(return_value=client)
+        with patch.object(cache, "get_redis_binary_client", get_client):
+            first = await cache.cache_get_json("daily_picks:2026-10-16")
+            second = await cache.cache_get_json("daily_picks:2026-10-16")
+
+        assert first == second == {"v": 1}
+        assert get_client.await_count == 1
+
+    async def test_writes_publish_invalidation(self, monkeypatch):
+        """Should evict locally and publish the key to the other workers."""
+        local = self._active_l1(monkeypatch)
+        local.set("prediction:1", {"old": True}, 60)
+        client = _client()
+        with patch.object(cache, "get_redis_client", AsyncMock(return_value=client)):
+            await cache.cache_delete("prediction:1")
+
+        assert local.get("prediction:1") is cache._MISSING
+        channel, message = client.pipeline.return_value.publish.call_args.args
+        assert channel == cache.INVALIDATION_CHANNEL
+        assert json.loads(message)["keys"] == ["prediction:1"]
+
+    def test_remote_invalidation_evicts(self, monkeypatch):
+        """Should evict keys named by another worker and ignore its own messages."""
+        local = self._active_l1(monkeypatch)
+        local.set("a", 1, 60)
+        local.set("b", 2, 60)
+
+        cache._apply_invalidation(json.dumps({"origin": cache._WORKER_ID, "keys": ["a"]}))
+        cache._apply_invalidation(json.dumps({"origin": "other-worker", "keys": ["b"]}))
+
+        assert local.get("a") == 1
+        assert local.get("b") is cache._MISSING
+
+
+class TestStampedeProtection:
+    """Tests for single-flight and early refresh in the cache decorators."""
+
+    @staticmethod
+    def _patch_store(monkeypatch, entry=None) -> AsyncMock:
+        monkeypatch.setattr(cache, "cache_get_json", AsyncMock(return_value=entry))
+        store = AsyncMock(return_value=True)
+        monkeypatch.setattr(cache, "cache_set_json", store)
+        return store
+
+    async def test_concurrent_misses_share_one_call(self, monkeypatch):
+        """Should run the function once for concurrent misses on the same key."""
+        store = self._patch_store(monkeypatch)
+        calls = []
+
+        @cache.cached(ttl=60, prefix="test")
+        async def compute(x: int) -> dict:
+            calls.append(x)
+            await asyncio.sleep(0.01)
+            return {"x": x}
+
+        results = await asyncio.gather(*(compute(1) for _ in range(5)))
+
+        assert calls == [1]
+        assert results == [{"x": 1}] * 5
+        key, envelope, ttl = store.await_args.args
+        assert envelope["value"] == {"x": 1} and ttl == 60
+        assert not cache._inflight
+
+    async def test_fresh_entry_is_served(self, monkeypatch):
+        """Should return a cached value far from expiry without calling the function."""
+        entry = cache._envelope({"x": "cached"}, delta=0.5, ttl=300)
+        self._patch_store(monkeypatch, entry)
+        compute = AsyncMock()
+
+        wrapped = cache.cached(ttl=300, prefix="test")(compute)
+
+        assert await wrapped() == {"x": "cached"}
+        compute.assert_not_awaited()
+
+    async def test_early_refresh_serves_stale_to_others(self, monkeypatch):
+        """Should let one caller refresh a nearly expired entry while others get the old value."""
+        entry = cache._envelope({"x": "old"}, delta=5.0, ttl=1)
+        self._patch_store(monkeypatch, entry)
+        monkeypatch.setattr(cache.random, "random", lambda: 0.99)
+        release = asyncio.Event()
+
+        @cache.cached(ttl=60, prefix="test")
+        async def compute() -> dict:
+            await release.wait()
+            return {"x": "new"}
+
+        refresher = asyncio.create_task(compute())
+        await asyncio.sleep(0)
+        assert await compute() == {"x": "old"}
+        release.set()
+        assert await refresher == {"x": "new"}
+
+    async def test_waits_for_other_worker(self, monkeypatch):
+        """Should use the value stored by the worker holding the lock."""
+        entry = cache._envelope({"x": "remote"}, delta=0.1, ttl=60)
+        monkeypatch.setattr(cache, "cache_get_json", AsyncMock(side_effect=[None, None, entry]))
+        monkeypatch.setattr(cache, "_acquire_lock", AsyncMock(return_value=None))
+        monkeypatch.setattr(cache, "LOCK_POLL_INTERVAL", 0)
+        compute = AsyncMock()
+
+        wrapped = cache.cached(ttl=60, prefix="test", distributed_lock=True)(compute)
+
+        assert await wrapped() == {"x": "remote"}
+        compute.assert_not_awaited()
+
+    async def test_error_reaches_waiters(self, monkeypatch):
+        """Should raise the function's error in every coalesced caller."""
+        self._patch_store(monkeypatch)
+
+        @cache.cached(ttl=60, prefix="test")
+        async def compute() -> dict:
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(compute(), compute(), return_exceptions=True)
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert not cache._inflight
+        with pytest.raises(ValueError):
+            await compute()
+
+
+class TestTagInvalidation:
+    """Tests for tag-based invalidation."""
+
+    async def test_set_registers_tags(self):
+        """Should add the key to each tag set, kept at least as long as the value."""
+        client = _client()
+        with patch.object(cache, "get_redis_client", AsyncMock(return_value=client)):
+            await cache.cache_set("prediction:1", "{}", 1800, tags=["matches", "match:1"])
+
+        pipe = client.pipeline.return_value
+        assert [c.args[0] for c in pipe.zadd.call_args_list] == ["tag:matches", "tag:match:1"]
+        assert all(list(c.args[1]) == ["prediction:1"] for c in pipe.zadd.call_args_list)
+        assert all(c.args[1] >= 1800 for c in pipe.expire.call_args_list)
+
+    async def test_set_prunes_expired_tag_members(self):
+        """Should drop tag members whose expiry has passed, scoring the new key by its own."""
+        client = _client()
+        with (
+            patch.object(cache, "get_redis_client", AsyncMock(return_value=client)),
+            patch.object(cache.time, "time", return_value=1000.0),
+        ):
+            await cache.cache_set("prediction:1", "{}", 1800, tags=["matches"])
+
+        pipe = client.pipeline.return_value
+        pipe.zremrangebyscore.assert_called_once_with("tag:matches", "-inf", 1000.0)
+        pipe.zadd.assert_called_once_with("tag:matches", {"prediction:1": 2800.0})
+
+    async def test_invalidate_deletes_tagged_keys(self, monkeypatch):
+        """Should read and drop the tag sets atomically, then delete their keys."""
+        client = _client()
+        client.pipeline.return_value.execute = AsyncMock(
+            return_value=[{"prediction:1", "daily_picks:2026-10-16"}, 1, {"prediction:1"}, 1]
+        )
+        delete_many = AsyncMock(return_value=2)
+        monkeypatch.setattr(cache, "cache_delete_many", delete_many)
+        with patch.object(cache, "get_redis_client", AsyncMock(return_value=client)):
+            deleted = await cache.cache_invalidate_tags(["match:1", "matches"])
+
+        assert deleted == 2
+        client.pipeline.assert_called_once_with(transaction=True)
+        delete_many.assert_awaited_once_with(["daily_picks:2026-10-16", "prediction:1"])
+
+    async def test_match_invalidation_uses_tags(self, monkeypatch):
+        """Should invalidate by tag instead of scanning key patterns."""
+        invalidate = AsyncMock(return_value=3)
+        monkeypatch.setattr(cache, "cache_invalidate_tags", invalidate)
+
+        assert await cache.invalidate_match_cache(42) == 3
+        await cache.invalidate_match_cache()
+
+        assert [c.args[0] for c in invalidate.await_args_list] == [["match:42"], ["matches"]]
+
+    async def test_decorator_tags_from_arguments(self, monkeypatch):
+        """Should tag decorated results using the tag function."""
+        monkeypatch.setattr(cache, "cache_get_json", AsyncMock(return_value=None))
+        store = AsyncMock(return_value=True)
+        monkeypatch.setattr(cache, "cache_set_json", store)
+
+        @cache.cached(ttl=60, prefix="test", tags=lambda match_id: [f"match:{match_id}"])
+        async def get_match(match_id: int) -> dict:
+            return {"id": match_id}
+
+        await get_match(7)
+
+        assert store.await_args.kwargs["tags"] == ["match:7"]
+
+
+class TestCodec:
+    """Tests for the cached payload codec."""
+
+    def test_small_payload_not_compressed(self):
+        """Should write the header and plain JSON below the size threshold."""
+        payload = codec.encode({"v": 1}, min_size=1024)
+
+        assert payload[:2] == bytes((codec.CODEC_VERSION, codec.COMPRESSION_NONE))
+        assert codec.decode(payload) == {"v": 1}
+
+    @pytest.mark.parametrize("compression", ["auto", "zlib"])
+    def test_large_payload_compressed(self, compression):
+        """Should compress large payloads and decode them back."""
+        value = {"matches": [{"id": i, "home_team": "Paris Saint-Germain"} for i in range(200)]}
+        payload = codec.encode(value, compression=compression, min_size=1024)
+
+        assert payload[1] != codec.COMPRESSION_NONE
+        assert len(payload) < len(json.dumps(value)) / 4
+        assert codec.decode(payload) == value
+
+    def test_plain_json_still_decoded(self):
+        """Should read values written as JSON text before the codec existed."""
+        assert codec.decode('{"v": 1}') == {"v": 1}
+        assert codec.decode(b"[1, 2]") == [1, 2]
+
+    def test_serializes_like_json_default_str(self):
+        """Should keep numpy numbers numeric and format other types with str()."""
+        created = datetime(2026, 10, 16, 6, 0, tzinfo=UTC)
+        value = {"prob": np.float64(0.5), 1: "a", "created_at": created}
+
+        assert codec.decode(codec.encode(value)) == {
+            "prob": 0.5,
+            "1": "a",
+            "created_at": str(created),
+        }
+
+    @pytest.mark.parametrize(
+        "payload",
+        [bytes((99, 0)) + b"{}", bytes((codec.CODEC_VERSION, 42)) + b"{}", b"\x01\x01garbage"],
+    )
+    def test_undecodable_payload(self, payload):
+        """Should raise CodecError on unknown versions, compressions or corrupt data."""
+        with pytest.raises(codec.CodecError):
+            codec.decode(payload)
+
+    async def test_json_helpers_round_trip(self):
+        """Should store encoded bytes and read them back through the binary client."""
+        value = {"teams": [{"id": i, "name": f"Team {i}"} for i in range(100)]}
+        client = _client()
+        with patch.object(cache, "get_redis_client", AsyncMock(return_value=client)):
+            await cache.cache_set_json("teams", value, 60)
+        stored = client.pipeline.return_value.setex.call_args.args[2]
+
+        reader = MagicMock()
+        reader.get = AsyncMock(return_value=stored)
+        with patch.object(cache, "get_redis_binary_client", AsyncMock(return_value=reader)):
+            assert await cache.cache_get_json("teams") == value
+
+        assert isinstance(stored, bytes)
+        assert stored[0] == codec.CODEC_VERSION
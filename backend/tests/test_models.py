@@ -25,14 +25,22 @@ from src.llm.adjustments import (
     validate_h2h_analysis,
     validate_injury_analysis,
 )
+from src.prediction_engine import score_distribution
 from src.prediction_engine.ensemble import (
     EnsemblePrediction,
     EnsemblePredictor,
     LLMAdjustments,
 )
+from src.prediction_engine.models.dixon_coles import DixonColesModel, DixonColesPrediction
 from src.prediction_engine.models.elo import ELOPrediction, ELOSystem
+from src.prediction_engine.models.elo_replay import EloReplayKernel, build_match_array
 from src.prediction_engine.models.poisson import PoissonModel, PoissonPrediction
 from src.prediction_engine.models.xgboost_model import XGBoostModel, XGBoostPrediction
+from src.prediction_engine.score_distribution import (
+    clear_score_distribution_cache,
+    get_score_distribution,
+    low_score_correction,
+)
 
 # =============================================================================
 # Poisson Model Tests
@@ -195,6 +203,271 @@ class TestPoissonModel:
         assert 0 <= btts_prob <= 1
 
 
+# =============================================================================
+# Dixon-Coles Model Tests
+# =============================================================================
+
+
+class TestDixonColesModel:
+    """Test cases for the vectorized Dixon-Coles model."""
+
+    @pytest.fixture
+    def model(self) -> DixonColesModel:
+        """Create a Dixon-Coles model instance."""
+        return DixonColesModel()
+
+    def test_score_matrix_matches_scalar_correction(self, model: DixonColesModel):
+        """Test the NumPy grid against per-cell Poisson x low-score correction."""
+        from math import exp, factorial
+
+        lambda_home, lambda_away = 1.6, 1.1
+        matrix = model.score_matrix(lambda_home, lambda_away)
+        correction = low_score_correction(
+            np.array([lambda_home]), np.array([lambda_away]), model.rho
+        )[0]
+
+        assert matrix.shape == (model.MAX_GOALS + 1, model.MAX_GOALS + 1)
+        for home_goals in range(model.MAX_GOALS + 1):
+            for away_goals in range(model.MAX_GOALS + 1):
+                expected = (
+                    exp(-lambda_home)
+                    * lambda_home**home_goals
+                    / factorial(home_goals)
+                    * exp(-lambda_away)
+                    * lambda_away**away_goals
+                    / factorial(away_goals)
+                    * (
+                        correction[home_goals, away_goals]
+                        if home_goals < 2 and away_goals < 2
+                        else 1.0
+                    )
+                )
+                assert matrix[home_goals, away_goals] == pytest.approx(expected, rel=1e-12)
+
+    def test_predict_returns_valid_probabilities(self, model: DixonColesModel):
+        """Test that predict returns normalized outcome probabilities."""
+        prediction = model.predict(1.8, 1.0, 1.2, 1.4)
+
+        assert isinstance(prediction, DixonColesPrediction)
+        total = prediction.home_win_prob + prediction.draw_prob + prediction.away_win_prob
+        assert abs(total - 1.0) < 1e-9
+        assert prediction.home_win_prob > prediction.away_win_prob
+        assert prediction.score_probabilities[prediction.most_likely_score] == max(
+            prediction.score_probabilities.values()
+        )
+
+    def test_predict_batch_matches_predict(self, model: DixonColesModel):
+        """Test that batch predictions agree with single-match predictions."""
+        stats = np.array(
+            [
+                [1.8, 1.0, 1.2, 1.4],
+                [0.9, 1.6, 2.1, 0.8],
+                [1.3, 1.3, 1.3, 1.3],
+            ]
+        )
+        lambdas_home, lambdas_away = model.calculate_expected_goals_batch(*stats.T)
+        batch = model.predict_batch(lambdas_home, lambdas_away)
+
+        assert len(batch) == 3
+        assert batch.score_matrices.shape == (3, model.MAX_GOALS + 1, model.MAX_GOALS + 1)
+        for i, row in enumerate(stats):
+            single = model.predict(*row)
+            assert batch.expected_home_goals[i] == pytest.approx(single.expected_home_goals)
+            assert batch.home_win_probs[i] == pytest.approx(single.home_win_prob)
+            assert batch.draw_probs[i] == pytest.approx(single.draw_prob)
+            assert batch.away_win_probs[i] == pytest.approx(single.away_win_prob)
+
+    def test_predict_batch_rejects_mismatched_shapes(self, model: DixonColesModel):
+        """Test that lambda arrays must line up."""
+        with pytest.raises(ValueError):
+            model.predict_batch(np.array([1.2, 1.5]), np.array([1.0]))
+
+
+# =============================================================================
+# Score Distribution Tests
+# =============================================================================
+
+
+class TestScoreDistribution:
+    """Test cases for the shared, cached score distribution."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start every test with an empty distribution cache."""
+        clear_score_distribution_cache()
+        yield
+        clear_score_distribution_cache()
+
+    def test_cache_reuses_quantized_entry(self):
+        """Test that near-identical lambdas share one cached distribution."""
+        first = get_score_distribution(1.50001, 1.2, -0.065)
+        second = get_score_distribution(1.50002, 1.2, -0.065)
+
+        assert first is second
+        assert first.lambda_home == 1.5
+
+    def test_cache_is_bounded(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that the least recently used entry is evicted."""
+        monkeypatch.setattr(score_distribution, "CACHE_MAX_ENTRIES", 2)
+
+        oldest = get_score_distribution(1.1, 1.0)
+        get_score_distribution(1.2, 1.0)
+        get_score_distribution(1.3, 1.0)
+
+        assert get_score_distribution(1.1, 1.0) is not oldest
+
+    def test_dixon_coles_only_changes_low_score_corner(self):
+        """Test that the rho grid differs from Poisson only in the 2x2 corner."""
+        poisson = get_score_distribution(1.4, 1.1)
+        dixon_coles = get_score_distribution(1.4, 1.1, -0.065)
+
+        diff = np.abs(dixon_coles.matrix - poisson.matrix) > 0
+        assert diff[:2, :2].all()
+        assert not diff[2:, :].any() and not diff[:, 2:].any()
+
+    def test_markets_match_brute_force(self):
+        """Test cumulative-sum markets against summing the grid cell by cell."""
+        distribution = get_score_distribution(1.7, 0.9, -0.065)
+        matrix = distribution.matrix
+        size = matrix.shape[0]
+        cells = [(h, a, matrix[h, a]) for h in range(size) for a in range(size)]
+
+        for line in (0.5, 1.5, 2.5, 3.5, 5.5):
+            over = sum(p for h, a, p in cells if h + a > line)
+            under = sum(p for h, a, p in cells if h + a < line)
+            over_prob, under_prob = distribution.over_under(line)
+            assert over_prob == pytest.approx(over / (over + under))
+            assert under_prob == pytest.approx(under / (over + under))
+
+        from src.prediction_engine.multi_markets import OVER_UNDER_LINES, price_markets
+
+        prices = price_markets(matrix[None], top_n=3)
+        for i, line in enumerate(OVER_UNDER_LINES):
+            assert prices.over[0, i] == pytest.approx(distribution.over_under(line)[0])
+
+        yes = sum(p for h, a, p in cells if h > 0 and a > 0)
+        assert prices.btts_yes[0] == pytest.approx(yes / matrix.sum())
+
+        assert tuple(prices.top_scores[0, 0]) == distribution.most_likely_score
+        assert prices.top_score_probs[0].tolist() == pytest.approx(
+            sorted((p for _, _, p in cells), reverse=True)[:3]
+        )
+
+    def test_zero_lambda_has_no_nan(self):
+        """Test that a zero lambda puts all its mass on 0 goals instead of NaN."""
+        distribution = get_score_distribution(0.0, 1.2)
+
+        assert not np.isnan(distribution.matrix).any()
+        assert distribution.matrix[1:, :].sum() == 0.0
+        over_prob, under_prob = PoissonModel().over_under_probability(0.0, 1.2)
+        assert over_prob == pytest.approx(0.1205, abs=1e-4)
+        assert under_prob == pytest.approx(0.8795, abs=1e-4)
+        assert score_distribution.poisson_pmf_matrix(np.array([0.0]), 3).tolist() == [
+            [1.0, 0.0, 0.0, 0.0]
+        ]
+
+    def test_models_share_distribution(self):
+        """Test that Poisson and multi-markets read the same cached grid."""
+        from src.prediction_engine.multi_markets import get_multi_markets_prediction
+
+        poisson = PoissonModel().predict(1.5, 1.2, 1.3, 1.4)
+        distribution = get_score_distribution(
+            poisson.expected_home_goals, poisson.expected_away_goals
+        )
+        markets = get_multi_markets_prediction(
+            expected_home_goals=poisson.expected_home_goals,
+            expected_away_goals=poisson.expected_away_goals,
+            home_win_prob=poisson.home_win_prob,
+            draw_prob=poisson.draw_prob,
+            away_win_prob=poisson.away_win_prob,
+        )
+
+        assert poisson.score_probabilities == distribution.score_probabilities
+        assert markets.over_under_25.over_prob == pytest.approx(
+            distribution.over_under(2.5)[0], abs=1e-4
+        )
+        home, away = poisson.most_likely_score
+        assert markets.correct_score.most_likely == f"{home}-{away}"
+
+
+# =============================================================================
+# Multi-Markets Tests
+# =============================================================================
+
+
+class TestMultiMarketsPricing:
+    """Test cases for the vectorized multi-market pricing engine."""
+
+    def test_asian_handicap_and_team_totals_match_brute_force(self):
+        """Test diagonal/cumsum pricing against summing grid cells."""
+        from src.prediction_engine.multi_markets import (
+            ASIAN_HANDICAP_LINES,
+            TEAM_TOTAL_LINES,
+            price_markets,
+        )
+
+        matrix = get_score_distribution(1.7, 0.9, -0.065).matrix
+        size = matrix.shape[0]
+        cells = [(h, a, matrix[h, a]) for h in range(size) for a in range(size)]
+        prices = price_markets(matrix[None])
+
+        for i, line in enumerate(ASIAN_HANDICAP_LINES):
+            home = sum(p for h, a, p in cells if h - a + line > 0)
+            away = sum(p for h, a, p in cells if h - a + line < 0)
+            assert prices.handicap_home[0, i] == pytest.approx(home / (home + away))
+            assert prices.handicap_away[0, i] == pytest.approx(away / (home + away))
+
+        for i, line in enumerate(TEAM_TOTAL_LINES):
+            home_over = sum(p for h, _, p in cells if h > line)
+            away_over = sum(p for _, a, p in cells if a > line)
+            assert prices.home_over[0, i] == pytest.approx(home_over / matrix.sum())
+            assert prices.away_over[0, i] == pytest.approx(away_over / matrix.sum())
+
+    def test_predict_batch_matches_predict(self):
+        """Test that batch pricing equals pricing fixtures one by one."""
+        from dataclasses import asdict
+
+        from src.prediction_engine.multi_markets import multi_markets_predictor
+
+        exp_home = np.array([1.7, 0.6, 2.9])
+        exp_away = np.array([0.9, 1.4, 2.2])
+        home = np.array([0.55, 0.25, 0.4])
+        draw = np.array([0.25, 0.3, 0.25])
+        away = 1 - home - draw
+
+        batch = multi_markets_predictor.predict_batch(exp_home, exp_away, home, draw, away, -0.065)
+
+        assert len(batch) == 3
+        for i, prediction in enumerate(batch):
+            single = multi_markets_predictor.predict(
+                exp_home[i], exp_away[i], home[i], draw[i], away[i], rho=-0.065
+            )
+            assert asdict(prediction) == asdict(single)
+            assert [ou.line for ou in prediction.over_under] == [0.5, 1.5, 2.5, 3.5, 4.5, 5.5]
+            assert prediction.over_under_25 is prediction.over_under[2]
+
+    def test_bookmaker_odds_add_value(self):
+        """Test that supplied odds replace fair odds and produce a value score."""
+        from src.prediction_engine.multi_markets import get_multi_markets_prediction
+
+        prediction = get_multi_markets_prediction(
+            expected_home_goals=1.6,
+            expected_away_goals=1.2,
+            home_win_prob=0.45,
+            draw_prob=0.28,
+            away_win_prob=0.27,
+            odds_over_25=2.1,
+            odds_btts_yes=1.8,
+        )
+
+        assert prediction.over_under_25.over_odds == 2.1
+        assert prediction.over_under_25.over_value == pytest.approx(
+            prediction.over_under_25.over_prob * 2.1 - 1, abs=1e-4
+        )
+        assert prediction.btts.yes_odds == 1.8
+        assert prediction.btts.no_value is None
+
+
 # =============================================================================
 # ELO Model Tests
 # =============================================================================
@@ -309,6 +582,236 @@ class TestELOSystem:
         assert 0.4 <= prediction.expected_away_score <= 3.5
 
 
+class TestIncrementalElo:
+    """Test cases for the incremental ELO replay used by EloRatingService."""
+
+    @pytest.fixture
+    def matches(self) -> list:
+        """Deterministic finished-match history across six teams."""
+        from datetime import datetime, timedelta
+        from types import SimpleNamespace
+
+        rng = np.random.default_rng(7)
+        history = []
+        for day in range(120):
+            home, away = rng.choice(6, size=2, replace=False) + 1
+            history.append(
+                SimpleNamespace(
+                    match_date=datetime(2024, 8, 1) + timedelta(days=day),
+                    home_team_id=int(home),
+                    away_team_id=int(away),
+                    home_score=int(rng.poisson(1.5)),
+                    away_score=int(rng.poisson(1.1)),
+                )
+            )
+        return history
+
+    def test_incremental_matches_full_replay(self, matches: list):
+        """Test that applying history in chunks equals one full replay."""
+        from src.services.elo_service import apply_matches
+
+        system = ELOSystem(k_factor=20.0, home_advantage=100.0)
+
+        full: dict[int, float] = {}
+        apply_matches(full, matches, system)
+
+        incremental: dict[int, float] = {}
+        for start in range(0, len(matches), 17):
+            apply_matches(incremental, matches[start : start + 17], system)
+
+        assert incremental.keys() == full.keys()
+        for team_id, rating in full.items():
+            assert incremental[team_id] == pytest.approx(rating, abs=1e-9)
+
+    def test_apply_returns_touched_teams(self, matches: list):
+        """Test that only teams in the applied matches are reported as changed."""
+        from src.services.elo_service import DEFAULT_RATING, apply_matches
+
+        ratings = {99: 1620.0}
+        touched = apply_matches(ratings, matches[:1], ELOSystem())
+
+        assert touched == {matches[0].home_team_id, matches[0].away_team_id}
+        assert ratings[99] == 1620.0
+        assert sum(ratings[t] for t in touched) == pytest.approx(2 * DEFAULT_RATING)
+
+    def test_team_rating_is_clamped(self):
+        """Test the bounds applied to teams.elo_rating."""
+        from src.services.elo_service import clamp_team_rating
+
+        assert clamp_team_rating(900.0) == 1000.0
+        assert clamp_team_rating(2600.0) == 2500.0
+        assert clamp_team_rating(1634.2) == 1634.2
+
+    @staticmethod
+    def _session_factory(statements: list[str]):
+        """async_session_factory stand-in recording the SQL it executes (empty tables)."""
+        from contextlib import asynccontextmanager
+        from unittest.mock import AsyncMock, MagicMock
+
+        session = MagicMock()
+        session.commit = AsyncMock()
+
+        async def execute(statement, params=None):
+            statements.append(str(statement))
+            result = MagicMock()
+            result.fetchone.return_value = None
+            result.fetchall.return_value = []
+            result.scalar.return_value = None
+            return result
+
+        session.execute = execute
+
+        @asynccontextmanager
+        async def factory():
+            yield session
+
+        return factory
+
+    async def test_updates_take_advisory_lock_first(self, monkeypatch):
+        """Test that ELO and feature store runs lock before reading their watermark."""
+        from src.services import elo_service, team_feature_store
+
+        statements: list[str] = []
+        factory = self._session_factory(statements)
+        monkeypatch.setattr(elo_service, "async_session_factory", factory)
+        monkeypatch.setattr(team_feature_store, "async_session_factory", factory)
+
+        await elo_service.EloRatingService.update_ratings()
+        elo_statements, statements[:] = list(statements), []
+        await team_feature_store.TeamFeatureStore.update()
+
+        assert "pg_advisory_xact_lock" in elo_statements[0]
+        assert "elo_state" in elo_statements[1]
+        assert "pg_advisory_xact_lock" in statements[0]
+        assert "team_feature_snapshots" in statements[1]
+
+    async def test_update_invalidates_team_snapshots(self, monkeypatch, matches: list):
+        """Test that an ELO update drops the changed teams from the snapshot cache."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from src.services import elo_service
+
+        monkeypatch.setattr(elo_service, "async_session_factory", self._session_factory([]))
+        service = elo_service.EloRatingService
+        monkeypatch.setattr(service, "_lock", AsyncMock())
+        monkeypatch.setattr(
+            service, "_load_watermark", AsyncMock(return_value=(matches[0].match_date, 1, 1))
+        )
+        monkeypatch.setattr(service, "_watermark_is_consistent", AsyncMock(return_value=True))
+        monkeypatch.setattr(service, "_fetch_matches", AsyncMock(return_value=matches[1:2]))
+        monkeypatch.setattr(service, "_load_ratings", AsyncMock(return_value={}))
+        monkeypatch.setattr(service, "_save", AsyncMock())
+        cache = MagicMock()
+        monkeypatch.setattr(elo_service, "team_snapshot_cache", cache)
+
+        result = await service.update_ratings()
+
+        invalidated = cache.invalidate.call_args.args[0]
+        assert set(invalidated) == set(result.ratings)
+        assert set(invalidated) == {matches[1].home_team_id, matches[1].away_team_id}
+
+
+class TestEloReplayKernel:
+    """Test cases for the array-backed ELO replay kernel."""
+
+    @pytest.fixture
+    def history(self) -> list:
+        """Finished matches over ten teams, several per day."""
+        from datetime import datetime, timedelta
+        from types import SimpleNamespace
+
+        rng = np.random.default_rng(11)
+        rows = []
+        for i in range(300):
+            home, away = rng.choice(10, size=2, replace=False) + 100
+            rows.append(
+                SimpleNamespace(
+                    match_date=datetime(2024, 1, 1) + timedelta(days=i // 3),
+                    home_team_id=int(home),
+                    away_team_id=int(away),
+                    home_score=int(rng.poisson(1.5)),
+                    away_score=int(rng.poisson(1.1)),
+                )
+            )
+        return rows
+
+    @staticmethod
+    def _dict_replay(rows: list, system: ELOSystem) -> dict[int, float]:
+        ratings: dict[int, float] = {}
+        for row in rows:
+            home = ratings.get(row.home_team_id, 1500.0)
+            away = ratings.get(row.away_team_id, 1500.0)
+            ratings[row.home_team_id], ratings[row.away_team_id] = system.update_ratings(
+                home, away, row.home_score, row.away_score
+            )
+        return ratings
+
+    def test_replay_matches_elo_system(self, history: list):
+        """Test that the kernel reproduces ELOSystem.update_ratings."""
+        matches, team_ids = build_match_array(history)
+        replay = EloReplayKernel(k_factor=25.0, home_advantage=80.0).replay(matches, team_ids)
+
+        expected = self._dict_replay(history, ELOSystem(k_factor=25.0, home_advantage=80.0))
+        ratings = replay.ratings()
+        assert ratings.keys() == expected.keys()
+        for team_id, rating in expected.items():
+            assert ratings[team_id] == pytest.approx(rating, abs=1e-9)
+
+    def test_build_sorts_by_date(self, history: list):
+        """Test that rows are sorted by date with ties in input order."""
+        matches, team_ids = build_match_array(list(reversed(history)))
+
+        assert np.all(np.diff(matches["date"].astype(np.int64)) >= 0)
+        assert len(team_ids) == 10
+
+    def test_ratings_at_equals_partial_replay(self, history: list):
+        """Test that snapshots read from the log equal replaying up to that date."""
+        from datetime import datetime
+
+        matches, team_ids = build_match_array(history)
+        replay = EloReplayKernel().replay(matches, team_ids)
+
+        cutoff = datetime(2024, 2, 10)
+        expected = self._dict_replay([r for r in history if r.match_date < cutoff], ELOSystem())
+        snapshot = replay.ratings_at(cutoff)
+        for team_id, rating in snapshot.items():
+            assert rating == pytest.approx(expected.get(team_id, 1500.0), abs=1e-9)
+
+        assert set(replay.ratings_at(datetime(2023, 1, 1)).values()) == {1500.0}
+        assert replay.ratings_at(datetime(2030, 1, 1)) == pytest.approx(replay.ratings())
+
+    def test_initial_ratings_continue_a_replay(self, history: list):
+        """Test that seeding with earlier ratings equals one full replay."""
+        kernel = EloReplayKernel()
+        full = kernel.replay(*build_match_array(history)).ratings()
+
+        first = kernel.replay(*build_match_array(history[:150])).ratings()
+        second = kernel.replay(*build_match_array(history[150:]), initial_ratings=first)
+        combined = {**first, **second.ratings()}
+
+        assert combined == pytest.approx(full)
+
+    def test_sweep_matches_single_replays(self, history: list):
+        """Test that each sweep variant equals a replay with the same parameters."""
+        matches, team_ids = build_match_array(history)
+        k_factors = [10.0, 20.0, 32.0]
+        home_advantages = [50.0, 100.0, 65.0]
+
+        sweep = EloReplayKernel.sweep(matches, team_ids, k_factors, home_advantages)
+
+        assert sweep.final_ratings.shape == (3, len(team_ids))
+        assert sweep.expected_home.shape == (len(matches), 3)
+        for v, (k, ha) in enumerate(zip(k_factors, home_advantages, strict=True)):
+            replay = EloReplayKernel(k_factor=k, home_advantage=ha).replay(matches, team_ids)
+            np.testing.assert_allclose(sweep.final_ratings[v], replay.final_ratings, atol=1e-9)
+
+    def test_sweep_rejects_mismatched_parameters(self, history: list):
+        """Test that K and home advantage must have one value per variant."""
+        matches, team_ids = build_match_array(history)
+        with pytest.raises(ValueError):
+            EloReplayKernel.sweep(matches, team_ids, [10.0, 20.0], [100.0])
+
+
 # =============================================================================
 # XGBoost Model Tests
 # =============================================================================
@@ -560,6 +1063,304 @@ class TestEnsemblePredictor:
         assert agreement_low < 0.8
 
 
+class TestAdvancedEnsembleBatch:
+    """Test cases for AdvancedEnsemblePredictor.predict_batch."""
+
+    @pytest.fixture
+    def predictor(self, monkeypatch: pytest.MonkeyPatch):
+        """Advanced ensemble with remote ML disabled for deterministic results."""
+        import src.prediction_engine.ensemble_advanced as ensemble_advanced
+
+        monkeypatch.setattr(ensemble_advanced, "HF_ML_AVAILABLE", False)
+        return ensemble_advanced.AdvancedEnsemblePredictor()
+
+    def test_batch_matches_single_predictions(self, predictor):
+        """Test that each batch row equals the corresponding predict() call."""
+        rows = [
+            {"home_attack": 1.8, "home_defense": 0.9, "away_attack": 1.1, "away_defense": 1.5},
+            {"home_attack": 1.0, "home_defense": 1.6, "away_attack": 1.9, "away_defense": 0.8},
+            {"home_attack": 1.3, "home_defense": 1.3, "away_attack": 1.3, "away_defense": 1.3},
+        ]
+        elos = [(1750.0, 1450.0), (1400.0, 1680.0), (1500.0, 1500.0)]
+        forms = [["W", "W", "D"], None, ["L", "D", "L", "W"]]
+
+        batch = predictor.predict_batch(
+            home_attack=np.array([r["home_attack"] for r in rows]),
+            home_defense=np.array([r["home_defense"] for r in rows]),
+            away_attack=np.array([r["away_attack"] for r in rows]),
+            away_defense=np.array([r["away_defense"] for r in rows]),
+            home_elo=np.array([e[0] for e in elos]),
+            away_elo=np.array([e[1] for e in elos]),
+            home_recent_form=forms,
+            odds_home=np.array([1.6, np.nan, 2.5]),
+            home_team_ids=[1, 2, 3],
+            away_team_ids=[4, 5, 6],
+        )
+
+        assert len(batch) == 3
+        for i, row in enumerate(rows):
+            single = predictor.predict(
+                **row,
+                home_elo=elos[i][0],
+                away_elo=elos[i][1],
+                home_recent_form=forms[i],
+                odds_home=[1.6, None, 2.5][i],
+                home_team_id=i + 1,
+                away_team_id=i + 4,
+            )
+            assert batch[i].home_win_prob == pytest.approx(single.home_win_prob)
+            assert batch[i].draw_prob == pytest.approx(single.draw_prob)
+            assert batch[i].away_win_prob == pytest.approx(single.away_win_prob)
+            assert batch[i].confidence == pytest.approx(single.confidence)
+            assert batch[i].recommended_bet == single.recommended_bet
+            assert [c.name for c in batch[i].model_contributions] == [
+                c.name for c in single.model_contributions
+            ]
+
+    def test_batch_uses_xg_per_row(self, predictor):
+        """Test that xG replaces goal stats only on rows where all xG values are positive."""
+        batch = predictor.predict_batch(
+            home_attack=np.array([1.3, 1.3]),
+            home_defense=np.array([1.3, 1.3]),
+            away_attack=np.array([1.3, 1.3]),
+            away_defense=np.array([1.3, 1.3]),
+            home_elo=np.array([1500.0, 1500.0]),
+            away_elo=np.array([1500.0, 1500.0]),
+            home_xg_for=np.array([2.2, 0.0]),
+            home_xg_against=np.array([0.8, 1.0]),
+            away_xg_for=np.array([0.9, 1.0]),
+            away_xg_against=np.array([1.7, 1.0]),
+        )
+
+        dc_weights = [
+            c.weight for p in batch for c in p.model_contributions if c.name == "Dixon-Coles"
+        ]
+        assert dc_weights[0] == pytest.approx(dc_weights[1] * 1.25)
+        assert batch[0].expected_home_goals > batch[1].expected_home_goals
+
+    def test_empty_batch(self, predictor):
+        """Test that an empty batch returns an empty list."""
+        empty = np.array([])
+        assert predictor.predict_batch(empty, empty, empty, empty, empty, empty) == []
+
+
+class TestHuggingFaceMLClient:
+    """Test cases for the non-blocking HuggingFace ML client."""
+
+    @staticmethod
+    def _http(response=None, error: Exception | None = None):
+        from unittest.mock import AsyncMock, MagicMock
+
+        http = MagicMock()
+        http.post = AsyncMock(return_value=response, side_effect=error)
+        http.get = AsyncMock(return_value=response, side_effect=error)
+        return http
+
+    @staticmethod
+    def _response(status_code: int, payload: dict):
+        from unittest.mock import MagicMock
+
+        response = MagicMock(status_code=status_code)
+        response.json.return_value = payload
+        return response
+
+    def test_circuit_breaker_cycle(self):
+        """Test closed -> open -> half-open (single trial) -> closed."""
+        from src.ml.huggingface_client import CircuitBreaker
+
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60.0)
+        breaker.record_failure()
+        assert breaker.state == "closed" and breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == "open" and not breaker.allow() and breaker.is_open()
+
+        breaker.opened_at -= 61.0
+        assert breaker.state == "half_open" and not breaker.is_open()
+        assert breaker.allow()
+        assert not breaker.allow()  # Only one trial call
+        breaker.record_success()
+        assert breaker.state == "closed" and breaker.failures == 0
+
+    def test_failed_trial_reopens(self):
+        """Test that a failing half-open trial opens the circuit again."""
+        from src.ml.huggingface_client import CircuitBreaker
+
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60.0)
+        breaker.record_failure()
+        breaker.opened_at -= 61.0
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == "open"
+
+    async def test_availability_comes_from_health_state(self, monkeypatch):
+        """Test that is_available needs a healthy probe and never calls the service."""
+        import src.ml.huggingface_client as hf
+
+        http = self._http(self._response(200, {"status": "healthy"}))
+        monkeypatch.setattr(hf, "get_http_client", lambda: http)
+        client = hf.HuggingFaceMLClient(base_url="http://hf.test")
+
+        assert not client.is_available()
+        await client.health_check()
+        assert client.is_available()
+        assert http.get.await_count == 1
+
+    async def test_predict_opens_circuit_after_failures(self, monkeypatch):
+        """Test that repeated failures stop further calls."""
+        import httpx
+
+        import src.ml.huggingface_client as hf
+
+        http = self._http(error=httpx.ConnectError("down"))
+        monkeypatch.setattr(hf, "get_http_client", lambda: http)
+        client = hf.HuggingFaceMLClient(base_url="http://hf.test")
+        client.healthy = True
+
+        for _ in range(hf.BREAKER_FAILURE_THRESHOLD):
+            assert await client.predict(1.5, 1.0, 1.2, 1.3) is None
+        assert not client.is_available()
+        assert await client.predict(1.5, 1.0, 1.2, 1.3) is None
+        assert http.post.await_count == hf.BREAKER_FAILURE_THRESHOLD
+
+    async def test_predict_async_awaits_remote_fallback(self, monkeypatch):
+        """Test that predict_async uses the async client instead of predict_sync."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        import src.prediction_engine.ensemble_advanced as ensemble_advanced
+
+        hf_client = MagicMock()
+        hf_client.is_available.return_value = True
+        hf_client.predict = AsyncMock(
+            return_value={
+                "ensemble": {"home_win": 0.5, "draw": 0.3, "away_win": 0.2},
+                "confidence": 0.8,
+            }
+        )
+        monkeypatch.setattr(ensemble_advanced, "LOCAL_ML_AVAILABLE", False)
+        monkeypatch.setattr(ensemble_advanced, "HF_ML_AVAILABLE", True)
+        monkeypatch.setattr(ensemble_advanced, "get_hf_ml_client", lambda: hf_client)
+
+        predictor = ensemble_advanced.AdvancedEnsemblePredictor()
+        pred = await predictor.predict_async(
+            home_attack=1.6,
+            home_defense=1.0,
+            away_attack=1.1,
+            away_defense=1.4,
+            home_elo=1600.0,
+            away_elo=1500.0,
+            home_form_score=80.0,
+        )
+
+        assert "ML (HuggingFace)" in [c.name for c in pred.model_contributions]
+        features = hf_client.predict.await_args.kwargs
+        assert features["home_form"] == pytest.approx(0.8)
+        assert features["home_rest_days"] == pytest.approx(3.5)
+        hf_client.predict_sync.assert_not_called()
+
+    async def test_predict_batch_chunks_rows_in_order(self, monkeypatch):
+        """Test that predict_batch sends PREDICT_BATCH_SIZE rows per call, in order."""
+        import src.ml.huggingface_client as hf
+
+        def batch_response(url, json, timeout):
+            rows = json["rows"]
+            return self._response(
+                200,
+                {"predictions": [{"ensemble": {"home_win": r["home_attack"]}} for r in rows]},
+            )
+
+        http = self._http()
+        http.post.side_effect = batch_response
+        monkeypatch.setattr(hf, "get_http_client", lambda: http)
+        monkeypatch.setattr(hf, "PREDICT_BATCH_SIZE", 2)
+        client = hf.HuggingFaceMLClient(base_url="http://hf.test")
+
+        rows = [{"home_attack": float(i)} for i in range(5)]
+        results = await client.predict_batch(rows)
+
+        assert [r["ensemble"]["home_win"] for r in results] == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert http.post.await_count == 3
+        assert http.post.await_args.args[0] == "http://hf.test/predict/batch"
+
+    async def test_predict_batch_falls_back_per_row_without_endpoint(self, monkeypatch):
+        """Test that a Space without /predict/batch is called per row."""
+        import src.ml.huggingface_client as hf
+
+        http = self._http()
+        http.post.side_effect = [
+            self._response(404, {}),
+            self._response(200, {"ensemble": {"home_win": 0.5}}),
+            self._response(200, {"ensemble": {"home_win": 0.6}}),
+        ]
+        monkeypatch.setattr(hf, "get_http_client", lambda: http)
+        client = hf.HuggingFaceMLClient(base_url="http://hf.test")
+
+        rows = [{"home_attack": 1.5, "home_defense": 1.0, "away_attack": 1.2, "away_defense": 1.3}]
+        results = await client.predict_batch(rows * 2)
+
+        assert not client.batch_supported
+        assert [r["ensemble"]["home_win"] for r in results] == [0.5, 0.6]
+        assert client.breaker.state == "closed"
+
+    @pytest.mark.parametrize("status_code", [404, 422])
+    async def test_half_open_trial_released_on_client_error(self, monkeypatch, status_code):
+        """Test that a half-open trial answered with a 4xx closes the circuit."""
+        import src.ml.huggingface_client as hf
+
+        http = self._http()
+        http.post.side_effect = [
+            self._response(status_code, {}),
+            self._response(200, {"ensemble": {"home_win": 0.5}}),
+        ]
+        monkeypatch.setattr(hf, "get_http_client", lambda: http)
+        client = hf.HuggingFaceMLClient(base_url="http://hf.test")
+        client.healthy = True
+        for _ in range(hf.BREAKER_FAILURE_THRESHOLD):
+            client.breaker.record_failure()
+        client.breaker.opened_at -= hf.BREAKER_RESET_TIMEOUT + 1.0
+
+        rows = [{"home_attack": 1.5, "home_defense": 1.0, "away_attack": 1.2, "away_defense": 1.3}]
+        results = await client.predict_batch(rows)
+
+        assert client.breaker.state == "closed" and client.breaker.allow()
+        assert client.is_available()
+        if status_code == 404:
+            # The per-row fallback is not rejected by a stuck trial slot
+            assert results[0]["ensemble"]["home_win"] == 0.5
+        else:
+            assert results == [None]
+
+    def test_predict_batch_uses_one_remote_call(self, monkeypatch):
+        """Test that the ensemble's batch path sends all HuggingFace rows at once."""
+        from unittest.mock import MagicMock
+
+        import src.prediction_engine.ensemble_advanced as ensemble_advanced
+
+        hf_client = MagicMock()
+        hf_client.is_available.return_value = True
+        hf_client.predict_batch_sync.side_effect = lambda rows: [
+            {"ensemble": {"home_win": 0.5, "draw": 0.3, "away_win": 0.2}} for _ in rows
+        ]
+        monkeypatch.setattr(ensemble_advanced, "LOCAL_ML_AVAILABLE", False)
+        monkeypatch.setattr(ensemble_advanced, "HF_ML_AVAILABLE", True)
+        monkeypatch.setattr(ensemble_advanced, "get_hf_ml_client", lambda: hf_client)
+
+        predictor = ensemble_advanced.AdvancedEnsemblePredictor()
+        preds = predictor.predict_batch(
+            home_attack=np.array([1.6, 1.2, 1.0]),
+            home_defense=np.array([1.0, 1.1, 1.3]),
+            away_attack=np.array([1.1, 1.2, 1.5]),
+            away_defense=np.array([1.4, 1.2, 0.9]),
+            home_elo=np.array([1600.0, 1500.0, 1450.0]),
+            away_elo=np.array([1500.0, 1500.0, 1600.0]),
+        )
+
+        assert hf_client.predict_batch_sync.call_count == 1
+        assert len(hf_client.predict_batch_sync.call_args.args[0]) == 3
+        hf_client.predict_sync.assert_not_called()
+        for pred in preds:
+            assert "ML (HuggingFace)" in [c.name for c in pred.model_contributions]
+
+
 # =============================================================================
 # LLM Adjustments Validation Tests
 # =============================================================================
@@ -973,8 +1774,10 @@ class TestIntegration:
 
 from datetime import date, timedelta
 
+from src.prediction_engine.backtest_cache import BacktestCache
 from src.prediction_engine.backtesting import (
     BacktestMetrics,
+    BacktestPredictions,
     BacktestResults,
     CalibrationBin,
     MatchData,
@@ -1212,6 +2015,88 @@ class TestWalkForwardBacktest:
                 assert isinstance(entry_date, date)
                 assert 0 <= value <= 1
 
+    def test_pre_match_elo_filled_from_history(
+        self, backtest: WalkForwardBacktest, sample_matches: list[MatchData]
+    ):
+        """Test that missing ELO is filled with ratings from before each match."""
+        filled = backtest._fill_pre_match_elo(sample_matches)
+
+        assert filled[0].home_elo == 1500.0
+        assert filled[0].away_elo == 1500.0
+        assert sample_matches[0].home_elo is None  # Inputs are not mutated
+
+        system = ELOSystem(k_factor=20.0, home_advantage=100.0)
+        ratings: dict[str, float] = {}
+        for original, match in zip(sample_matches, filled, strict=True):
+            home = ratings.get(original.home_team, 1500.0)
+            away = ratings.get(original.away_team, 1500.0)
+            assert match.home_elo == pytest.approx(home)
+            assert match.away_elo == pytest.approx(away)
+            ratings[original.home_team], ratings[original.away_team] = system.update_ratings(
+                home, away, original.home_goals, original.away_goals
+            )
+
+    def test_fold_windows_match_date_filters(
+        self, backtest: WalkForwardBacktest, sample_matches: list[MatchData]
+    ):
+        """Test that bisected fold slices select the same matches as date filters."""
+        match_dates = [m.match_date for m in sample_matches]
+        windows = backtest._plan_folds(match_dates)
+
+        assert windows
+        for window in windows:
+            train = [
+                m for m in sample_matches if window.train_start <= m.match_date <= window.train_end
+            ]
+            test = [
+                m for m in sample_matches if window.test_start <= m.match_date <= window.test_end
+            ]
+            assert sample_matches[window.train_slice] == train
+            assert sample_matches[window.test_slice] == test
+
+    def test_parallel_folds_match_sequential(self, sample_matches: list[MatchData]):
+        """Test that running folds in worker processes gives identical, ordered results."""
+        sequential = WalkForwardBacktest(train_window_days=30, test_window_days=7).run(
+            sample_matches, retrain_ml=False
+        )
+        parallel = WalkForwardBacktest(train_window_days=30, test_window_days=7, n_workers=2).run(
+            sample_matches, retrain_ml=False
+        )
+
+        assert len(parallel.folds) == len(sequential.folds) > 1
+        assert [f.fold_number for f in parallel.folds] == [f.fold_number for f in sequential.folds]
+        assert parallel.overall_metrics == sequential.overall_metrics
+        assert parallel.rolling_brier == sequential.rolling_brier
+
+    def test_cache_reuses_unchanged_folds(
+        self, sample_matches: list[MatchData], tmp_path, monkeypatch
+    ):
+        """Test that reruns hit the cache and an extended run computes only new folds."""
+        cache = BacktestCache(tmp_path)
+        params = {"train_window_days": 30, "test_window_days": 7, "cache": cache}
+        first = WalkForwardBacktest(**params).run(sample_matches[:120], retrain_ml=False)
+
+        computed: list[int] = []
+        run_fold = WalkForwardBacktest._run_fold
+
+        def counting_run_fold(self, window, *args):
+            computed.append(window.fold_number)
+            return run_fold(self, window, *args)
+
+        monkeypatch.setattr(WalkForwardBacktest, "_run_fold", counting_run_fold)
+
+        again = WalkForwardBacktest(**params).run(sample_matches[:120], retrain_ml=False)
+        assert computed == []
+        assert again.overall_metrics == first.overall_metrics
+
+        extended = WalkForwardBacktest(**params).run(sample_matches, retrain_ml=False)
+        assert computed == [f.fold_number for f in extended.folds[len(first.folds) :]]
+        assert computed
+
+        # Evaluation settings are part of the key
+        WalkForwardBacktest(**params, betting_threshold=0.7).run(sample_matches, retrain_ml=False)
+        assert len(computed) == len(extended.folds) + len(extended.folds) - len(first.folds)
+
     def test_insufficient_data_returns_empty(self, backtest: WalkForwardBacktest):
         """Test insufficient data returns empty results."""
         # Create too few matches
@@ -1248,6 +2133,135 @@ class TestCalibrationBin:
         assert bin_data.count == 25
 
 
+class TestBacktestCache:
+    """Test cases for the content-addressed backtest cache."""
+
+    def test_key_is_content_addressed(self):
+        """Test that keys depend on content, not identity."""
+        match = MatchData(
+            match_id="1",
+            match_date=date(2024, 1, 1),
+            home_team="A",
+            away_team="B",
+            home_attack=1.4,
+            home_defense=1.2,
+            away_attack=1.3,
+            away_defense=1.1,
+        )
+        same = MatchData(**{**match.__dict__})
+        changed = MatchData(**{**match.__dict__, "home_goals": 2})
+
+        assert BacktestCache.key("fold", {"a": 1}, [match]) == BacktestCache.key(
+            "fold", {"a": 1}, [same]
+        )
+        assert BacktestCache.key("fold", {"a": 1}, [match]) != BacktestCache.key(
+            "fold", {"a": 1}, [changed]
+        )
+        assert BacktestCache.key("fold", {"a": 1}) != BacktestCache.key("fold", {"a": 2})
+
+    def test_roundtrip_and_size_eviction(self, tmp_path):
+        """Test storage and least-recently-used eviction by total size."""
+        import os
+
+        cache = BacktestCache(tmp_path, max_bytes=10_000)
+        for i in range(3):
+            cache.set(f"k{i}", np.zeros(500))  # ~4KB each
+            os.utime(tmp_path / f"k{i}.pkl", (1_000 + i, 1_000 + i))
+
+        assert cache.get("missing") is None
+        np.testing.assert_array_equal(cache.get("k0"), np.zeros(500))  # k0 now most recent
+
+        assert cache.evict() == 1
+        assert cache.get("k1") is None
+        assert cache.get("k0") is not None and cache.get("k2") is not None
+        assert cache.size_bytes() <= 10_000
+
+    def test_refuses_shared_directory(self, tmp_path):
+        """Test that a directory writable by other users is not used."""
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        shared.chmod(0o777)
+
+        with pytest.raises(PermissionError):
+            BacktestCache(shared)
+        assert (BacktestCache(tmp_path / "private").cache_dir.stat().st_mode & 0o777) == 0o700
+
+    def test_evict_and_clear_remove_orphaned_tmp_files(self, tmp_path):
+        """Test that temp files left by killed writers are deleted."""
+        import os
+
+        cache = BacktestCache(tmp_path)
+        stale = tmp_path / "stale.tmp"
+        fresh = tmp_path / "fresh.tmp"
+        stale.write_bytes(b"partial")
+        fresh.write_bytes(b"in progress")
+        os.utime(stale, (1_000, 1_000))
+
+        cache.evict()
+        assert not stale.exists() and fresh.exists()
+        cache.clear()
+        assert not fresh.exists()
+
+
+class TestBacktestPredictions:
+    """Test cases for columnar backtest predictions and vectorized metrics."""
+
+    @pytest.fixture
+    def predictions(self) -> BacktestPredictions:
+        """Four predictions: two hits, one miss, one with missing odds."""
+        return BacktestPredictions.from_columns(
+            match_ids=["1", "2", "3", "4"],
+            match_dates=[date(2024, 1, d) for d in (1, 2, 3, 4)],
+            probs=[(0.6, 0.3, 0.1), (0.2, 0.3, 0.5), (0.7, 0.2, 0.1), (0.3, 0.4, 0.3)],
+            actual=[0, 2, 1, 1],
+            confidence=[0.8, 0.6, 0.9, 0.2],
+            model_agreement=[0.9, 0.7, 0.8, 0.5],
+            odds=[(2.0, 3.5, 5.0), (4.0, 3.4, 2.5), (1.5, 4.0, 6.0), (None, None, None)],
+        )
+
+    def test_concat_and_select(self, predictions: BacktestPredictions):
+        """Test concatenation order and boolean selection."""
+        merged = BacktestPredictions.concat([predictions, predictions.select([False] * 3 + [True])])
+
+        assert len(merged) == 5
+        assert merged.match_ids.tolist() == ["1", "2", "3", "4", "4"]
+        assert np.isnan(merged.odds[-1]).all()
+        assert len(BacktestPredictions.concat([])) == 0
+
+    def test_metrics_values(self, predictions: BacktestPredictions):
+        """Test accuracy, Brier, log loss and RPS against hand-computed values."""
+        metrics = WalkForwardBacktest(betting_threshold=0.55)._calculate_metrics(predictions)
+
+        assert metrics.correct_predictions == 3
+        assert metrics.accuracy == pytest.approx(0.75)
+        assert metrics.draw_accuracy == pytest.approx(0.5)
+        assert metrics.brier_score == pytest.approx((0.26 + 0.38 + 1.14 + 0.54) / 4)
+        assert metrics.log_loss == pytest.approx(-np.mean(np.log([0.6, 0.5, 0.2, 0.4])), rel=1e-12)
+        assert metrics.rps == pytest.approx((0.17 + 0.29 + 0.5 + 0.18) / 12)
+
+    def test_roi_bets_best_positive_value(self, predictions: BacktestPredictions):
+        """Test that only value bets above the threshold are placed."""
+        roi = WalkForwardBacktest(betting_threshold=0.55)._calculate_roi(predictions)
+
+        # Match 1: home 0.6 vs 1/2.0 -> bet, wins at 2.0; match 3: home 0.7 vs 1/1.5 -> bet, loses
+        assert roi["stake"] == 2.0
+        assert roi["profit"] == pytest.approx(0.0)
+        assert roi["win_rate"] == pytest.approx(50.0)
+        assert roi["avg_odds"] == pytest.approx(1.75)
+
+    def test_rolling_metrics_use_window_means(self, predictions: BacktestPredictions):
+        """Test rolling values against explicit window averages."""
+        backtest = WalkForwardBacktest()
+        rolling = backtest._calculate_rolling_metrics(predictions, metric="accuracy", window_size=2)
+
+        assert rolling == [
+            (date(2024, 1, 2), 1.0),
+            (date(2024, 1, 3), 0.5),
+            (date(2024, 1, 4), 0.5),
+        ]
+        assert backtest._calculate_rolling_metrics(predictions, window_size=5) == []
+
+
 class TestFormatBacktestReport:
     """Test cases for report formatting."""
 
@@ -2129,6 +3143,192 @@ class TestModelLoaderGetExpectedFeatureCount:
         assert loader._get_expected_feature_count() == 19
 
 
+class TestModelLoaderPredictEnsembleBatch:
+    """Test predict_ensemble_batch stacks rows into one predict_proba call."""
+
+    def test_single_call_per_model(self):
+        """Test that each model is called once with all rows."""
+        from unittest.mock import MagicMock
+
+        from src.ml.model_loader import FEATURE_SET_LEGACY, TrainedModelLoader
+
+        loader = object.__new__(TrainedModelLoader)
+        loader.feature_state = None
+
+        mock_xgb = MagicMock()
+        mock_xgb.n_features_in_ = FEATURE_SET_LEGACY
+        mock_xgb.predict_proba.return_value = np.array([[0.5, 0.3, 0.2], [0.2, 0.3, 0.5]])
+        mock_rf = MagicMock()
+        mock_rf.n_features_in_ = FEATURE_SET_LEGACY
+        mock_rf.predict_proba.return_value = np.array([[0.4, 0.4, 0.2], [0.3, 0.3, 0.4]])
+        loader.xgb_model = mock_xgb
+        loader.rf_model = mock_rf
+
+        results = loader.predict_ensemble_batch(
+            [1, 2],
+            [3, 4],
+            home_attack=np.array([1.5, 1.0]),
+            home_defense=np.array([1.2, 1.4]),
+            away_attack=np.array([1.1, 1.6]),
+            away_defense=np.array([1.3, 1.0]),
+            home_form=np.array([60.0, 40.0]),
+            away_form=np.array([50.0, 70.0]),
+        )
+
+        assert mock_xgb.predict_proba.call_count == 1
+        assert mock_rf.predict_proba.call_count == 1
+        assert mock_xgb.predict_proba.call_args[0][0].shape == (2, FEATURE_SET_LEGACY)
+        assert len(results) == 2
+        assert results[0]["model_used"] == "ensemble"
+        assert results[0]["home_win"] == pytest.approx(0.5 * 0.7 + 0.4 * 0.3)
+        assert results[1]["away_win"] == pytest.approx(0.5 * 0.7 + 0.4 * 0.3)
+
+    def test_returns_none_per_row_without_models(self):
+        """Test that rows come back as None when no model can predict."""
+        from src.ml.model_loader import TrainedModelLoader
+
+        loader = object.__new__(TrainedModelLoader)
+        loader.feature_state = None
+        loader.xgb_model = None
+        loader.rf_model = None
+
+        ones = np.ones(2)
+        results = loader.predict_ensemble_batch([1, 2], [3, 4], ones, ones, ones, ones, ones, ones)
+        assert results == [None, None]
+
+
+class TestModelLoaderMicroBatcher:
+    """Test MicroBatcher groups concurrent predictions into one batch."""
+
+    @staticmethod
+    def _loader():
+        from unittest.mock import MagicMock
+
+        from src.ml.model_loader import FEATURE_SET_LEGACY, TrainedModelLoader
+
+        loader = object.__new__(TrainedModelLoader)
+        loader.feature_state = None
+        mock_xgb = MagicMock()
+        mock_xgb.n_features_in_ = FEATURE_SET_LEGACY
+        # Home win probability follows the home attack feature (column 0)
+        mock_xgb.predict_proba.side_effect = lambda features: np.array(
+            [[row[0] / 10, 0.3, 0.7 - row[0] / 10] for row in features]
+        )
+        loader.xgb_model = mock_xgb
+        loader.rf_model = None
+        return loader
+
+    async def test_concurrent_requests_share_one_call(self):
+        """Test that concurrent callers get their own rows from a single predict_proba."""
+        import asyncio
+
+        from src.ml.model_loader import MicroBatcher
+
+        loader = self._loader()
+        batcher = MicroBatcher(loader, max_batch_size=10, max_wait=0.01)
+
+        results = await asyncio.gather(
+            *(batcher.predict(i, 100 + i, home_attack=float(i)) for i in range(1, 5))
+        )
+
+        assert loader.xgb_model.predict_proba.call_count == 1
+        assert [r["home_win"] for r in results] == pytest.approx([0.1, 0.2, 0.3, 0.4])
+
+    async def test_full_batch_runs_without_waiting(self):
+        """Test that a batch runs as soon as max_batch_size requests are queued."""
+        import asyncio
+
+        from src.ml.model_loader import MicroBatcher
+
+        loader = self._loader()
+        batcher = MicroBatcher(loader, max_batch_size=2, max_wait=60.0)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.predict(1, 2, home_attack=1.0), batcher.predict(3, 4)),
+            timeout=5,
+        )
+
+        assert len(results) == 2
+        assert loader.xgb_model.predict_proba.call_count == 1
+
+    async def test_failed_batch_returns_none(self):
+        """Test that an inference error resolves every caller with None."""
+        from src.ml.model_loader import MicroBatcher
+
+        loader = self._loader()
+        loader.predict_ensemble_batch = lambda *args, **kwargs: 1 / 0
+        batcher = MicroBatcher(loader, max_batch_size=10, max_wait=0.001)
+
+        assert await batcher.predict(1, 2) is None
+
+    async def test_predict_async_uses_batched_local_models(self, monkeypatch):
+        """Test that the ensemble's predict_async awaits the local models asynchronously."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        import src.prediction_engine.ensemble_advanced as ensemble_advanced
+
+        local = AsyncMock(
+            return_value={"home_win": 0.5, "draw": 0.3, "away_win": 0.2, "model_used": "xgboost"}
+        )
+        sync_local = MagicMock()
+        monkeypatch.setattr(ensemble_advanced, "LOCAL_ML_AVAILABLE", True)
+        monkeypatch.setattr(ensemble_advanced, "get_ml_prediction_async", local)
+        monkeypatch.setattr(ensemble_advanced, "get_ml_prediction", sync_local)
+
+        predictor = ensemble_advanced.AdvancedEnsemblePredictor()
+        pred = await predictor.predict_async(
+            home_attack=1.6,
+            home_defense=1.0,
+            away_attack=1.1,
+            away_defense=1.4,
+            home_elo=1600.0,
+            away_elo=1500.0,
+            home_team_id=1,
+            away_team_id=2,
+        )
+
+        assert "ML Local (xgboost)" in [c.name for c in pred.model_contributions]
+        assert local.await_args.kwargs["home_team_id"] == 1
+        sync_local.assert_not_called()
+
+    async def test_predict_async_falls_back_to_remote(self, monkeypatch):
+        """Test that predict_async awaits HuggingFace when the local models return nothing."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        import src.prediction_engine.ensemble_advanced as ensemble_advanced
+
+        hf_client = MagicMock()
+        hf_client.is_available.return_value = True
+        hf_client.predict = AsyncMock(
+            return_value={
+                "ensemble": {"home_win": 0.5, "draw": 0.3, "away_win": 0.2},
+                "confidence": 0.8,
+            }
+        )
+        monkeypatch.setattr(ensemble_advanced, "LOCAL_ML_AVAILABLE", True)
+        monkeypatch.setattr(
+            ensemble_advanced, "get_ml_prediction_async", AsyncMock(return_value=None)
+        )
+        monkeypatch.setattr(ensemble_advanced, "HF_ML_AVAILABLE", True)
+        monkeypatch.setattr(ensemble_advanced, "get_hf_ml_client", lambda: hf_client)
+
+        predictor = ensemble_advanced.AdvancedEnsemblePredictor()
+        pred = await predictor.predict_async(
+            home_attack=1.6,
+            home_defense=1.0,
+            away_attack=1.1,
+            away_defense=1.4,
+            home_elo=1600.0,
+            away_elo=1500.0,
+            home_team_id=1,
+            away_team_id=2,
+        )
+
+        assert "ML (HuggingFace)" in [c.name for c in pred.model_contributions]
+        hf_client.predict.assert_awaited_once()
+        hf_client.predict_sync.assert_not_called()
+
+
 class TestModelLoaderPredictEnsembleMetadata:
     """Test predict_ensemble returns metadata about features."""
 
@@ -2182,3 +3382,99 @@ class TestModelLoaderPredictEnsembleMetadata:
         assert result is not None
         assert "uses_fatigue_features" in result
         assert result["uses_fatigue_features"] is True
+
+
+class TestTeamFeatureTracker:
+    """Tests for the shared per-team feature definitions (feature store)."""
+
+    @staticmethod
+    def _matches(n: int = 300, teams: int = 8, seed: int = 3):
+        from datetime import datetime, timedelta
+
+        rng = np.random.default_rng(seed)
+        start = datetime(2024, 8, 1)
+        matches = []
+        for i in range(n):
+            home, away = rng.choice(teams, size=2, replace=False)
+            matches.append(
+                (
+                    int(home),
+                    int(away),
+                    int(rng.poisson(1.5)),
+                    int(rng.poisson(1.1)),
+                    start + timedelta(hours=8 * i + int(rng.integers(0, 4))),
+                )
+            )
+        return matches
+
+    def test_matches_training_feature_engineer(self):
+        """Tracker features equal the extended trainer's features before each match."""
+        from src.ml.trainer_extended import ExtendedFeatureEngineer
+        from src.prediction_engine.team_features import TeamFeatureTracker
+
+        engineer = ExtendedFeatureEngineer()
+        tracker = TeamFeatureTracker()
+
+        for home, away, home_goals, away_goals, match_date in self._matches():
+            expected = engineer.create_features(home, away, match_date)
+            h = tracker.features(home, match_date)
+            a = tracker.features(away, match_date)
+            actual = [
+                h.attack_strength,
+                h.defense_strength,
+                a.attack_strength,
+                a.defense_strength,
+                h.form / 100,
+                a.form / 100,
+            ]
+            np.testing.assert_allclose(actual, expected[:6])
+            np.testing.assert_allclose(
+                [h.rest_score, h.congestion_score, a.rest_score, a.congestion_score],
+                expected[7:11],
+            )
+
+            result = 0 if home_goals > away_goals else (2 if home_goals < away_goals else 1)
+            engineer.update_after_match(home, away, home_goals, away_goals, result, match_date)
+            tracker.update(home, away, home_goals, away_goals, match_date)
+
+    def test_elo_matches_elo_system(self):
+        """Tracker ELO follows ELOSystem.update_ratings with K=20, home advantage 100."""
+        from src.prediction_engine.models.elo import ELOSystem
+        from src.prediction_engine.team_features import TeamFeatureTracker
+
+        elo = ELOSystem(k_factor=20.0, home_advantage=100.0)
+        ratings: dict[int, float] = {}
+        tracker = TeamFeatureTracker()
+        for home, away, home_goals, away_goals, match_date in self._matches(n=50):
+            ratings[home], ratings[away] = elo.update_ratings(
+                ratings.get(home, 1500.0), ratings.get(away, 1500.0), home_goals, away_goals
+            )
+            tracker.update(home, away, home_goals, away_goals, match_date)
+
+        for team_id, rating in ratings.items():
+            assert tracker.state(team_id).elo_rating == pytest.approx(rating)
+
+    def test_state_round_trip_continues_identically(self):
+        """A state restored from its stored form continues exactly like the original."""
+        from src.prediction_engine.team_features import TeamFeatureState, TeamFeatureTracker
+
+        matches = self._matches(n=120)
+        full = TeamFeatureTracker()
+        for match in matches:
+            full.update(*match)
+
+        partial = TeamFeatureTracker()
+        for match in matches[:60]:
+            partial.update(*match)
+        restored = TeamFeatureTracker(
+            {
+                team_id: TeamFeatureState.from_dict(state.to_dict())
+                for team_id, state in partial.states.items()
+            }
+        )
+        for match in matches[60:]:
+            restored.update(*match)
+
+        as_of = matches[-1][4]
+        for team_id in full.states:
+            assert restored.features(team_id, as_of) == full.features(team_id, as_of)
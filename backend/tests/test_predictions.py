@@ -1,8 +1,11 @@
 """Integration tests for prediction endpoints."""
 
+import asyncio
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from fastapi.testclient import TestClient
 
 from src.data.sources.football_data import MatchData
@@ -568,3 +571,491 @@ class TestVerifyPrediction:
         data = response.json()
         assert data["actual_result"] == "draw"
         assert data["was_correct"] is True
+
+
+class TestGetCalibration:
+    """Test suite for GET /predictions/calibration endpoint."""
+
+    @staticmethod
+    def _cells() -> list[Any]:
+        from src.services.calibration_service import NO_BUCKET, CalibrationCell
+
+        return [
+            CalibrationCell("PL", "home_win", 2, 10, 7, 6.2),  # 60-65%
+            CalibrationCell("PL", "away_win", 2, 5, 2, 3.1),
+            CalibrationCell("SA", "home_win", 7, 4, 4, 3.6),  # 85-100%
+            CalibrationCell("", "draw", NO_BUCKET, 1, 0, 0.45),  # below 50%, no competition
+        ]
+
+    @patch(
+        "src.api.routes.predictions.CalibrationSummaryService.get_cells",
+        new_callable=AsyncMock,
+    )
+    def test_get_calibration_aggregates_summary(self, mock_cells: AsyncMock, client: TestClient):
+        """Test that the response is assembled from pre-aggregated cells."""
+        mock_cells.return_value = self._cells()
+
+        response = client.get("/api/v1/predictions/calibration", params={"days": 30})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_verified"] == 20
+        assert data["overall_accuracy"] == 13 / 20
+
+        home = next(b for b in data["by_bet_type"] if b["bet_type"] == "home_win")
+        assert home["total_predictions"] == 14
+        assert home["correct"] == 11
+        assert home["avg_confidence"] == (6.2 + 3.6) / 14
+
+        buckets = {b["confidence_range"]: b for b in data["by_confidence"]}
+        assert sum(b["count"] for b in buckets.values()) == 19
+        assert buckets["60-65%"]["count"] == 15
+        assert buckets["60-65%"]["actual_win_rate"] == 9 / 15
+        assert buckets["50-55%"]["count"] == 0
+
+        assert set(data["by_competition"]) == {"PL", "SA"}
+        assert data["by_competition"]["PL"]["total"] == 15
+        assert data["by_competition"]["SA"]["accuracy"] == 1.0
+
+    @patch(
+        "src.api.routes.predictions.CalibrationSummaryService.get_cells",
+        new_callable=AsyncMock,
+    )
+    def test_get_calibration_empty_period(self, mock_cells: AsyncMock, client: TestClient):
+        """Test 404 when no verified predictions fall in the period."""
+        mock_cells.return_value = []
+
+        response = client.get("/api/v1/predictions/calibration")
+
+        assert response.status_code == 404
+
+    def test_bucket_case_matches_bucket_ranges(self):
+        """Test the SQL bucket expression against the Python bucket bounds."""
+        import sqlite3
+
+        from src.services.calibration_service import (
+            CALIBRATION_BUCKETS,
+            NO_BUCKET,
+            bucket_case_sql,
+        )
+
+        def python_bucket(confidence: float) -> int:
+            for index, (low, high, _) in enumerate(CALIBRATION_BUCKETS):
+                if low <= confidence < high:
+                    return index
+            return NO_BUCKET
+
+        conn = sqlite3.connect(":memory:")
+        for confidence in [0.3, 0.5, 0.549, 0.55, 0.7, 0.8499, 0.85, 0.99, 1.0]:
+            (bucket,) = conn.execute(
+                f"SELECT {bucket_case_sql('c')} FROM (SELECT ? AS c)", (confidence,)
+            ).fetchone()
+            assert bucket == python_bucket(confidence), confidence
+
+
+class TestTeamSnapshotCache:
+    """Tests for the process-local team stats cache used on demand."""
+
+    @staticmethod
+    def _session(rows: list[Any]) -> MagicMock:
+        result = MagicMock()
+        result.fetchall.return_value = rows
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+        return session
+
+    async def test_loads_misses_in_one_query_and_serves_hits(self):
+        """Should read both teams in one query, then serve them from memory."""
+        from src.services.team_snapshot_cache import TeamSnapshotCache
+
+        cache = TeamSnapshotCache(ttl_seconds=60)
+        session = self._session([MagicMock(id=1), MagicMock(id=2)])
+
+        teams = await cache.get_many((1, 2), session=session)
+        assert set(teams) == {1, 2}
+        assert session.execute.await_count == 1
+        assert session.execute.await_args.args[1] == {"ids": [1, 2]}
+
+        teams = await cache.get_many((2, 1), session=session)
+        assert set(teams) == {1, 2}
+        assert session.execute.await_count == 1
+
+    async def test_expired_and_invalidated_entries_are_reloaded(self):
+        """Should query again once entries expire or are invalidated."""
+        from src.services.team_snapshot_cache import TeamSnapshotCache
+
+        cache = TeamSnapshotCache(ttl_seconds=0)
+        session = self._session([MagicMock(id=1)])
+        await cache.get_many([1], session=session)
+        await cache.get_many([1], session=session)
+        assert session.execute.await_count == 2
+
+        cache = TeamSnapshotCache(ttl_seconds=60)
+        await cache.get_many([1], session=session)
+        cache.invalidate([1])
+        assert len(cache) == 0
+        await cache.get_many([1], session=session)
+        assert session.execute.await_count == 4
+
+    async def test_size_limit(self):
+        """Should drop the oldest entries beyond max_entries."""
+        from src.services.team_snapshot_cache import TeamSnapshotCache
+
+        cache = TeamSnapshotCache(ttl_seconds=60, max_entries=2)
+        await cache.get_many([1, 2, 3], session=self._session([MagicMock(id=i) for i in (1, 2, 3)]))
+        assert len(cache) == 2
+
+
+class TestPredictionInputFingerprint:
+    """Tests for the prefill input fingerprint."""
+
+    @staticmethod
+    def _inputs() -> tuple[Any, Any, Any]:
+        from collections import namedtuple
+        from datetime import datetime
+        from decimal import Decimal
+
+        Match = namedtuple(
+            "Match",
+            "id home_team_id away_team_id match_date competition_code "
+            "odds_home odds_draw odds_away",
+        )
+        Team = namedtuple("Team", "id elo_rating form_score rest_days fixture_congestion")
+        match = Match(1, 10, 20, datetime(2026, 10, 20, 20), "PL", Decimal("2.10"), None, None)
+        return (
+            match,
+            Team(10, Decimal("1550.0"), 0.6, 0.4, 0.2),
+            Team(20, Decimal("1480.0"), 0.4, 0.6, 0.1),
+        )
+
+    def test_same_inputs_same_fingerprint(self):
+        """Should be stable for identical inputs."""
+        from src.services.data_prefill_service import _prediction_input_fingerprint
+
+        match, home, away = self._inputs()
+        first = _prediction_input_fingerprint(match, home, away, {}, "1:1:abc", "p1")
+        again = _prediction_input_fingerprint(match, home, away, {}, "1:1:abc", "p1")
+        assert first == again
+        assert len(first) == 64
+
+    def test_changed_inputs_change_fingerprint(self):
+        """Should change with team stats, odds, feature state and versions."""
+        from datetime import datetime
+
+        from src.prediction_engine.team_features import TeamFeatureState
+        from src.services.data_prefill_service import _prediction_input_fingerprint
+
+        match, home, away = self._inputs()
+        base = _prediction_input_fingerprint(match, home, away, {}, "1:1:abc", "p1")
+
+        state = TeamFeatureState()
+        state.add_match(2, 1, datetime(2026, 10, 17, 20))
+        variants = [
+            (match, home._replace(elo_rating=1551), away, {}, "1:1:abc", "p1"),
+            (match._replace(odds_draw=3.4), home, away, {}, "1:1:abc", "p1"),
+            (match, home, away, {10: state}, "1:1:abc", "p1"),
+            (match, home, away, {}, "1:1:def", "p1"),
+            (match, home, away, {}, "1:1:abc", "p2"),
+        ]
+        fingerprints = {_prediction_input_fingerprint(*args) for args in variants}
+        assert base not in fingerprints
+        assert len(fingerprints) == len(variants)
+
+    def test_daily_rest_refresh_keeps_fingerprint(self):
+        """Should ignore the NOW()-based rest columns when feature states exist."""
+        from datetime import datetime
+
+        from src.prediction_engine.team_features import TeamFeatureState
+        from src.services.data_prefill_service import _prediction_input_fingerprint
+
+        match, home, away = self._inputs()
+        states = {10: TeamFeatureState(), 20: TeamFeatureState()}
+        states[10].add_match(2, 1, datetime(2026, 10, 17, 20))
+        states[20].add_match(0, 0, datetime(2026, 10, 15, 20))
+        today = _prediction_input_fingerprint(match, home, away, states, "1:1:abc", "p1")
+
+        # Next day, no new matches: fill_all_team_data only moved rest/congestion
+        home_tomorrow = home._replace(rest_days=0.5, fixture_congestion=0.3)
+        away_tomorrow = away._replace(rest_days=0.7, fixture_congestion=0.0)
+        tomorrow = _prediction_input_fingerprint(
+            match, home_tomorrow, away_tomorrow, states, "1:1:abc", "p1"
+        )
+        assert tomorrow == today
+
+    def test_prompt_version_tracks_templates(self):
+        """Should hash the prompt templates used by the prefill."""
+        from src.services import data_prefill_service
+
+        version = data_prefill_service._prefill_prompt_version()
+        assert version == data_prefill_service._prefill_prompt_version()
+        original = data_prefill_service._NEWS_SUMMARY_PROMPT
+        try:
+            data_prefill_service._NEWS_SUMMARY_PROMPT = original + " "
+            assert data_prefill_service._prefill_prompt_version() != version
+        finally:
+            data_prefill_service._NEWS_SUMMARY_PROMPT = original
+
+
+class TestSavePredictionsBulk:
+    """Tests for PredictionService.save_predictions_bulk."""
+
+    @staticmethod
+    def _payload(match_id: int, **extra: Any) -> dict[str, Any]:
+        return {
+            "match_id": match_id,
+            "home_win_prob": 0.5,
+            "draw_prob": 0.3,
+            "away_win_prob": 0.2,
+            "confidence": 0.6,
+            "recommendation": "home",
+            **extra,
+        }
+
+    @staticmethod
+    def _uow(known_ids: list[int]) -> MagicMock:
+        known = MagicMock()
+        known.scalars.return_value.all.return_value = known_ids
+        uow = MagicMock()
+        uow.session.execute = AsyncMock(return_value=known)
+        uow.commit = AsyncMock()
+        uow.__aenter__ = AsyncMock(return_value=uow)
+        uow.__aexit__ = AsyncMock(return_value=None)
+        return uow
+
+    def test_values_match_single_save_format(self):
+        """Should map the route format to prediction columns."""
+        from src.db.services.prediction_service import _api_prediction_values
+
+        values = _api_prediction_values(
+            self._payload(1, recommendation="away_win", key_factors=["a"], value_score=0.7)
+        )
+        assert values["predicted_outcome"] == "away"
+        assert values["key_factors"] == '["a"]'
+        assert values["risk_factors"] is None
+        assert str(values["value_score"]) == "0.7"
+        assert values["input_fingerprint"] is None
+
+    async def test_chunked_upsert_single_commit_and_cache_invalidation(self):
+        """Should upsert per chunk, commit once and drop the cached keys together."""
+        from sqlalchemy.dialects import postgresql
+
+        from src.db.services import prediction_service
+        from src.db.services.prediction_service import PredictionService
+
+        uow = self._uow([1, 2, 3])
+        payloads = [self._payload(i) for i in (1, 2, 3)] + [self._payload(2, confidence=0.9)]
+        with (
+            patch.object(prediction_service, "get_uow", return_value=uow),
+            patch.object(prediction_service, "BULK_SAVE_CHUNK_SIZE", 2),
+            patch.object(prediction_service, "cache_delete_many", AsyncMock()) as delete_many,
+        ):
+            saved = await PredictionService.save_predictions_bulk(payloads)
+
+        assert saved == 3  # Duplicate match 2 collapsed, last payload wins
+        # 1 lookup + 2 INSERT ... ON CONFLICT chunks
+        assert uow.session.execute.await_count == 3
+        statement = uow.session.execute.await_args_list[1].args[0]
+        assert "ON CONFLICT" in str(statement.compile(dialect=postgresql.dialect()))
+        uow.commit.assert_awaited_once()
+        delete_many.assert_awaited_once_with(["prediction:1", "prediction:2", "prediction:3"])
+
+    async def test_unknown_matches_are_skipped(self):
+        """Should skip payloads whose match does not exist."""
+        from src.db.services import prediction_service
+        from src.db.services.prediction_service import PredictionService
+
+        uow = self._uow([1])
+        with (
+            patch.object(prediction_service, "get_uow", return_value=uow),
+            patch.object(prediction_service, "cache_delete_many", AsyncMock()) as delete_many,
+        ):
+            saved = await PredictionService.save_predictions_bulk(
+                [self._payload(1), self._payload(99)]
+            )
+
+        assert saved == 1
+        delete_many.assert_awaited_once_with(["prediction:1"])
+
+
+class TestPredictionCacheCoalescing:
+    """Concurrent cache misses on the prediction handlers share one load."""
+
+    @staticmethod
+    def _patch_cache(monkeypatch) -> AsyncMock:
+        """Empty Redis cache whose lock is always free; returns the store mock."""
+        from src.core import cache
+
+        store = AsyncMock(return_value=True)
+        monkeypatch.setattr(cache, "cache_get_json", AsyncMock(return_value=None))
+        monkeypatch.setattr(cache, "cache_set_json", store)
+        monkeypatch.setattr(cache, "_acquire_lock", AsyncMock(return_value="token"))
+        monkeypatch.setattr(cache, "_release_lock", AsyncMock())
+        return store
+
+    async def test_daily_picks_built_once(self, monkeypatch):
+        """Should build concurrent daily picks misses once and tag the picked matches."""
+        from src.api.routes import predictions
+
+        store = self._patch_cache(monkeypatch)
+
+        async def stored_predictions(target_date: Any) -> list[dict[str, Any]]:
+            await asyncio.sleep(0.01)
+            return [
+                {
+                    "match_id": 12345,
+                    "competition_code": "PL",
+                    "match_date": "2026-10-16T20:00:00+00:00",
+                    "home_win_prob": 0.5,
+                    "draw_prob": 0.25,
+                    "away_win_prob": 0.25,
+                    "confidence": 0.7,
+                    "recommendation": "home",
+                    "created_at": "2026-10-16T06:00:00+00:00",
+                }
+            ]
+
+        load = AsyncMock(side_effect=stored_predictions)
+        monkeypatch.setattr(
+            predictions.PredictionService, "get_predictions_for_date_with_details", load
+        )
+
+        handler = predictions.get_daily_picks.__wrapped__
+        results = await asyncio.gather(
+            *(
+                handler(request=SimpleNamespace(headers={}), user={}, query_date="2026-10-16")
+                for _ in range(5)
+            )
+        )
+
+        assert load.await_count == 1
+        assert all(r.picks[0].prediction.match_id == 12345 for r in results)
+        assert store.await_args.kwargs["tags"] == ["matches", "match:12345"]
+
+    async def test_prediction_loaded_once(self, monkeypatch):
+        """Should run one DB read or ensemble for concurrent misses on a match."""
+        from src.api.routes import predictions
+
+        self._patch_cache(monkeypatch)
+        response = MagicMock(spec=predictions.PredictionResponse)
+        response.model_dump.return_value = {"match_id": 7}
+
+        async def load_prediction(match_id: int, include_model_details: bool) -> Any:
+            await asyncio.sleep(0.01)
+            return response
+
+        load = AsyncMock(side_effect=load_prediction)
+        monkeypatch.setattr(predictions, "_load_prediction", load)
+
+        handler = predictions.get_prediction.__wrapped__
+        results = await asyncio.gather(
+            *(
+                handler(
+                    request=SimpleNamespace(headers={}),
+                    match_id=7,
+                    user={},
+                    include_model_details=False,
+                )
+                for _ in range(5)
+            )
+        )
+
+        assert load.await_count == 1
+        assert all(r is response for r in results)
+
+    async def test_unavailable_prediction_not_cached(self, monkeypatch):
+        """Should answer 404 without caching when no prediction can be produced."""
+        from fastapi import HTTPException
+
+        from src.api.routes import predictions
+
+        store = self._patch_cache(monkeypatch)
+        monkeypatch.setattr(
+            predictions,
+            "_load_prediction",
+            AsyncMock(side_effect=predictions._PredictionUnavailableError(7)),
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await predictions.get_prediction.__wrapped__(
+                request=SimpleNamespace(headers={}), match_id=7, user={}
+            )
+
+        assert exc_info.value.status_code == 404
+        store.assert_not_awaited()
+
+
+class TestOnDemandPrediction:
+    """Tests for predictions generated on request."""
+
+    async def test_fatigue_from_feature_store(self, monkeypatch):
+        """Should use the feature store's rest and congestion scores, like the prefill."""
+        from contextlib import asynccontextmanager
+        from datetime import datetime
+
+        import src.db
+        from src.api.routes import predictions
+        from src.prediction_engine.ensemble_advanced import advanced_ensemble_predictor
+        from src.prediction_engine.team_features import TeamFeatureState
+        from src.services.team_feature_store import TeamFeatureStore
+        from src.services.team_snapshot_cache import team_snapshot_cache
+
+        kickoff = datetime(2026, 10, 18, 20, 0)
+        match = SimpleNamespace(
+            id=1,
+            external_id="fd_1",
+            home_team_id=10,
+            away_team_id=20,
+            competition_code="PL",
+            match_date=kickoff,
+            home_team="Arsenal",
+            away_team="Chelsea",
+        )
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=MagicMock(fetchone=MagicMock(return_value=match)))
+
+        @asynccontextmanager
+        async def session_factory():
+            yield session
+
+        team_row = SimpleNamespace(
+            avg_goals_scored_home=1.5,
+            avg_goals_conceded_home=1.0,
+            avg_goals_scored_away=1.2,
+            avg_goals_conceded_away=1.1,
+            elo_rating=1600,
+            form_score=0.6,
+            rest_days=9.0,  # Raw column values, not model inputs
+            fixture_congestion=4.0,
+        )
+        home_state = TeamFeatureState()
+        home_state.add_match(2, 1, datetime(2026, 10, 15, 20, 0))
+
+        monkeypatch.setattr(src.db, "async_session_factory", session_factory)
+        monkeypatch.setattr(
+            team_snapshot_cache, "get_many", AsyncMock(return_value={10: team_row, 20: team_row})
+        )
+        monkeypatch.setattr(
+            TeamFeatureStore, "get_states", AsyncMock(return_value={10: home_state})
+        )
+        predict = AsyncMock(
+            return_value=SimpleNamespace(
+                recommended_bet="home",
+                home_win_prob=0.5,
+                draw_prob=0.3,
+                away_win_prob=0.2,
+                confidence=0.6,
+            )
+        )
+        monkeypatch.setattr(advanced_ensemble_predictor, "predict_async", predict)
+        monkeypatch.setattr(predictions.PredictionService, "save_prediction_from_api", AsyncMock())
+
+        response = await predictions._generate_prediction_on_demand(1)
+
+        expected = home_state.features(10, kickoff)
+        kwargs = predict.await_args.kwargs
+        assert response is not None
+        assert kwargs["home_rest_days"] == expected.rest_score
+        assert kwargs["home_congestion"] == expected.congestion_score
+        # No stored state for the away team: teams row fallback
+        assert kwargs["away_rest_days"] == 9.0
+        assert kwargs["away_congestion"] == 4.0
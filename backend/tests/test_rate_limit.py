@@ -1,5 +1,7 @@
 """Tests for rate limiting configuration."""
 
+import pytest
+
 from src.core.rate_limit import parse_redis_url
 
 
@@ -64,3 +66,63 @@ class TestParseRedisUrl:
         """Should return original string if no valid URL found."""
         invalid = "some random string"
         assert parse_redis_url(invalid) == invalid
+
+
+class TestGroqRateLimiter:
+    """Tests for the Groq token-bucket limiter."""
+
+    def test_bucket_wait_time(self):
+        """Should report the refill time for missing tokens."""
+        from src.llm.rate_limiter import TokenBucket
+
+        bucket = TokenBucket(capacity=60, per_minute=60)
+        now = bucket.updated
+        assert bucket.wait_time(60, now) == 0.0
+        bucket.take(60)
+        assert bucket.wait_time(2, now) == pytest.approx(2.0)
+        assert bucket.wait_time(2, now + 1.0) == pytest.approx(1.0)
+
+    def test_oversized_request_waits_for_full_bucket(self):
+        """Should not wait forever for more tokens than the bucket holds."""
+        from src.llm.rate_limiter import TokenBucket
+
+        bucket = TokenBucket(capacity=60, per_minute=60)
+        now = bucket.updated
+        assert bucket.wait_time(1000, now) == 0.0
+        bucket.take(1000)
+        assert bucket.tokens == 0
+        assert bucket.wait_time(1000, now) == pytest.approx(60.0)
+
+    def test_estimate_tokens(self):
+        """Should count prompt characters / 4 plus the completion limit."""
+        from src.llm.rate_limiter import GroqRateLimiter
+
+        assert GroqRateLimiter.estimate_tokens(4000, 400) == 1400
+
+    @pytest.mark.asyncio
+    async def test_burst_within_budget_does_not_wait(self):
+        """Should let requests through immediately while the budget lasts."""
+        from src.llm.rate_limiter import GroqRateLimiter
+
+        limiter = GroqRateLimiter(requests_per_minute=30, tokens_per_minute=12000)
+        waits = [await limiter.acquire(1000) for _ in range(10)]
+        assert waits == [0.0] * 10
+
+    @pytest.mark.asyncio
+    async def test_waits_for_token_refill(self):
+        """Should wait until the token bucket has refilled enough."""
+        from src.llm.rate_limiter import GroqRateLimiter
+
+        limiter = GroqRateLimiter(requests_per_minute=6000, tokens_per_minute=600)
+        assert await limiter.acquire(600) == 0.0
+        waited = await limiter.acquire(1)  # 10 tokens/s
+        assert 0.05 < waited < 0.5
+
+    @pytest.mark.asyncio
+    async def test_pause_holds_callers(self):
+        """Should hold requests after a Retry-After pause."""
+        from src.llm.rate_limiter import GroqRateLimiter
+
+        limiter = GroqRateLimiter(requests_per_minute=30, tokens_per_minute=12000)
+        limiter.pause(0.1)
+        assert await limiter.acquire(10) >= 0.05
@@ -0,0 +1,41 @@
+"""Integration tests for data sync endpoints."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from src.core.config import settings
+
+ELO_URL = f"{settings.api_v1_prefix}/sync/elo"
+
+
+class TestSyncEloRatings:
+    """Test suite for the manual ELO sync endpoint."""
+
+    @patch("src.api.routes.sync.SyncServiceAsync.log_sync", new_callable=AsyncMock)
+    @patch("src.services.elo_service.EloRatingService.update_ratings", new_callable=AsyncMock)
+    def test_sync_elo_success(
+        self, mock_update: AsyncMock, mock_log_sync: AsyncMock, client_admin: TestClient
+    ):
+        """Test that updated teams are counted and logged as a successful sync."""
+        mock_update.return_value = MagicMock(ratings={1: 1520.0, 2: 1480.0})
+
+        response = client_admin.post(ELO_URL)
+
+        assert response.status_code == 200
+        assert response.json()["message"] == "Updated ELO ratings for 2 teams"
+        mock_log_sync.assert_awaited_once_with("elo_ratings", "success", 2)
+
+    @patch("src.api.routes.sync.SyncServiceAsync.log_sync", new_callable=AsyncMock)
+    @patch("src.services.elo_service.EloRatingService.update_ratings", new_callable=AsyncMock)
+    def test_sync_elo_failure(
+        self, mock_update: AsyncMock, mock_log_sync: AsyncMock, client_admin: TestClient
+    ):
+        """Test that a failed update is logged as an error and returns 500."""
+        mock_update.side_effect = RuntimeError("database unavailable")
+
+        response = client_admin.post(ELO_URL)
+
+        assert response.status_code == 500
+        assert "database unavailable" in response.json()["detail"]
+        mock_log_sync.assert_awaited_once_with("elo_ratings", "error", 0, "database unavailable")
@@ -21,6 +21,9 @@ logger = logging.getLogger(__name__)
 BACKEND_API_URL = os.getenv("BACKEND_API_URL", "https://paris-sportif-api.onrender.com")
 HF_TRAINING_API_KEY = os.getenv("HF_TRAINING_API_KEY", "")
 
+# Maximum rows accepted by POST /predict/batch
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "200"))
+
 app = FastAPI(
     title="Paris Sportif ML Service",
     description="XGBoost and Random Forest predictions for football matches",
@@ -57,6 +60,27 @@ class PredictResponse(BaseModel):
     predicted_at: str
 
 
+class BatchPrediction(BaseModel):
+    """Prediction results for one row of a batch."""
+    xgboost: dict[str, Any]
+    random_forest: dict[str, Any]
+    ensemble: dict[str, Any]
+
+
+class PredictBatchRequest(BaseModel):
+    """Feature rows for a batch prediction."""
+    rows: list[PredictRequest] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_SIZE, description="Matches to predict"
+    )
+
+
+class PredictBatchResponse(BaseModel):
+    """Prediction results, one per request row and in the same order."""
+    predictions: list[BatchPrediction]
+    count: int
+    predicted_at: str
+
+
 @app.on_event("startup")
 async def load_models():
     """Load ML models on startup."""
@@ -144,6 +168,51 @@ async def models_status():
     }
 
 
+FEATURE_NAMES = [
+    "home_attack",
+    "home_defense",
+    "away_attack",
+    "away_defense",
+    "home_elo",
+    "away_elo",
+    "home_form",
+    "away_form",
+    "home_rest_days",
+    "away_rest_days",
+    "home_fixture_congestion",
+    "away_fixture_congestion",
+]
+
+
+def _outcome_probabilities(proba: np.ndarray) -> dict[str, float]:
+    """home_win/draw/away_win from one predict_proba row."""
+    return {
+        "home_win": float(proba[0]),
+        "draw": float(proba[1]) if len(proba) > 1 else 0.0,
+        "away_win": float(proba[2]) if len(proba) > 2 else 0.0,
+    }
+
+
+def _predict_rows(rows: list[PredictRequest]) -> list[dict[str, dict[str, float]]]:
+    """Run both models once on the stacked feature matrix; one result per row, in order."""
+    features = np.array(
+        [[getattr(row, name) for name in FEATURE_NAMES] for row in rows], dtype=np.float64
+    )
+    xgb_proba = xgboost_model.predict_proba(features)
+    rf_proba = random_forest_model.predict_proba(features)
+
+    results = []
+    for xgb_row, rf_row in zip(xgb_proba, rf_proba):
+        xgb_pred = _outcome_probabilities(xgb_row)
+        rf_pred = _outcome_probabilities(rf_row)
+        # Ensemble (average of both models)
+        ensemble_pred = {key: (xgb_pred[key] + rf_pred[key]) / 2 for key in xgb_pred}
+        results.append(
+            {"xgboost": xgb_pred, "random_forest": rf_pred, "ensemble": ensemble_pred}
+        )
+    return results
+
+
 @app.post("/predict", response_model=PredictResponse)
 async def predict(request: PredictRequest):
     """
@@ -154,56 +223,37 @@ async def predict(request: PredictRequest):
     if xgboost_model is None or random_forest_model is None:
         raise HTTPException(status_code=503, detail="Models not loaded")
 
-    # Prepare features
-    features = np.array([[
-        request.home_attack,
-        request.home_defense,
-        request.away_attack,
-        request.away_defense,
-        request.home_elo,
-        request.away_elo,
-        request.home_form,
-        request.away_form,
-        request.home_rest_days,
-        request.away_rest_days,
-        request.home_fixture_congestion,
-        request.away_fixture_congestion,
-    ]])
-
     try:
-        # XGBoost prediction
-        xgb_proba = xgboost_model.predict_proba(features)[0]
-        xgb_pred = {
-            "home_win": float(xgb_proba[0]),
-            "draw": float(xgb_proba[1]) if len(xgb_proba) > 1 else 0.0,
-            "away_win": float(xgb_proba[2]) if len(xgb_proba) > 2 else 0.0,
-        }
-
-        # Random Forest prediction
-        rf_proba = random_forest_model.predict_proba(features)[0]
-        rf_pred = {
-            "home_win": float(rf_proba[0]),
-            "draw": float(rf_proba[1]) if len(rf_proba) > 1 else 0.0,
-            "away_win": float(rf_proba[2]) if len(rf_proba) > 2 else 0.0,
-        }
+        result = _predict_rows([request])[0]
+        return PredictResponse(**result, predicted_at=datetime.utcnow().isoformat())
 
-        # Ensemble (average of both models)
-        ensemble_pred = {
-            "home_win": (xgb_pred["home_win"] + rf_pred["home_win"]) / 2,
-            "draw": (xgb_pred["draw"] + rf_pred["draw"]) / 2,
-            "away_win": (xgb_pred["away_win"] + rf_pred["away_win"]) / 2,
-        }
-
-        return PredictResponse(
-            xgboost=xgb_pred,
-            random_forest=rf_pred,
-            ensemble=ensemble_pred,
+    except Exception as e:
+        logger.error(f"Prediction error: {e}")
+        raise HTTPException(status_code=500, detail=f"Prediction failed: {str(e)}")
+
+
+@app.post("/predict/batch", response_model=PredictBatchResponse)
+async def predict_batch(request: PredictBatchRequest):
+    """
+    Generate predictions for many matches in one call.
+
+    Both models run once on the stacked feature matrix; predictions are
+    returned in the order of the request rows.
+    """
+    if xgboost_model is None or random_forest_model is None:
+        raise HTTPException(status_code=503, detail="Models not loaded")
+
+    try:
+        results = _predict_rows(request.rows)
+        return PredictBatchResponse(
+            predictions=[BatchPrediction(**result) for result in results],
+            count=len(results),
             predicted_at=datetime.utcnow().isoformat(),
         )
 
     except Exception as e:
-        logger.error(f"Prediction error: {e}")
-        raise HTTPException(status_code=500, detail=f"Prediction failed: {str(e)}")
+        logger.error(f"Batch prediction error: {e}")
+        raise HTTPException(status_code=500, detail=f"Batch prediction failed: {str(e)}")
 
 
 class TrainingData(BaseModel):